@@ -19,6 +19,13 @@ import sys
 import numpy as np
 import yaml
 from figpack_experimental.views import ClusterLens
+from realtime512b.helpers.spike_times import spike_times_to_frames
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 
 def load_config():
@@ -36,6 +43,12 @@ def load_config():
     return config
 
 
+def _open_shifted(shifted_path, n_channels):
+    """Memory-map a shifted int16 file as (num_frames, n_channels)."""
+    num_frames = os.path.getsize(shifted_path) // (n_channels * 2)
+    return np.memmap(shifted_path, dtype=np.int16, mode='r', shape=(num_frames, n_channels))
+
+
 def extract_event_frames(
     shifted_path,
     spike_times_path,
@@ -87,33 +100,55 @@ def extract_event_frames(
     spike_labels = np.load(spike_labels_path)
     print(f"  Found {len(spike_labels)} labels")
     
-    # Convert spike times to frame indices
-    spike_inds = (spike_times * sampling_frequency).astype(int)
+    # Convert spike times to frame indices, rounding to the nearest sample
+    spike_inds = spike_times_to_frames(spike_times, sampling_frequency)
     
-    # Load shifted data
+    # Memory-map shifted data so only the rows at spike times get paged in
     print(f"Loading shifted data from {shifted_path}...")
-    shifted_data = np.fromfile(shifted_path, dtype=np.int16)
-    num_frames = len(shifted_data) // n_channels
-    shifted_data = shifted_data.reshape(num_frames, n_channels)
+    shifted_data = _open_shifted(shifted_path, n_channels)
+    num_frames = shifted_data.shape[0]
     print(f"  Shifted data shape: {shifted_data.shape}")
     
     # Validate spike indices
     valid_mask = (spike_inds >= 0) & (spike_inds < num_frames)
-    if not np.all(valid_mask):
-        num_invalid = np.sum(~valid_mask)
+    if not valid_mask.all():
+        num_invalid = len(valid_mask) - np.count_nonzero(valid_mask)
         print(f"  Warning: {num_invalid} spikes are out of bounds and will be skipped")
         spike_inds = spike_inds[valid_mask]
         spike_labels = spike_labels[valid_mask]
     
     # Extract frames at spike times
+    # Gather in increasing frame order so the memmap is swept sequentially,
+    # then restore the original spike order. Rows are cast to float32 one
+    # chunk at a time so only a small int16 buffer is alive at once.
     print(f"Extracting {len(spike_inds)} event frames...")
-    frames = shifted_data[spike_inds, :].astype(np.float32)
+    order = np.argsort(spike_inds, kind='stable')
+    sorted_inds = spike_inds[order]
+    frames = np.empty((len(spike_inds), n_channels), dtype=np.float32)
+    if HAVE_NUMBA:
+        _gather_frames_numba(shifted_data, sorted_inds, order, frames)
+    else:
+        chunk_size = 4096
+        for i in range(0, len(sorted_inds), chunk_size):
+            frames[order[i:i + chunk_size]] = shifted_data[sorted_inds[i:i + chunk_size], :]
+    del shifted_data
     print(f"  Event frames shape: {frames.shape}")
     print(f"  Data type: {frames.dtype}")
     
     return frames, spike_labels
 
 
+if HAVE_NUMBA:
+    @njit(parallel=True)
+    def _gather_frames_numba(shifted_data, sorted_inds, order, frames):
+        """Copy rows sorted_inds[i] of shifted_data into frames[order[i]] as float32."""
+        for i in prange(sorted_inds.shape[0]):
+            row = sorted_inds[i]
+            out_row = order[i]
+            for c in range(shifted_data.shape[1]):
+                frames[out_row, c] = np.float32(shifted_data[row, c])
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Visualize detected event frames using ClusterLens",
@@ -214,8 +249,10 @@ Examples:
         print(f"Data shape: {frames.shape}")
         print(f"Number of spikes: {frames.shape[0]}")
         print(f"Number of channels (dimensions): {frames.shape[1]}")
-        print(f"Number of unique clusters: {len(np.unique(labels))}")
-        print(f"Cluster labels range: {np.min(labels)} to {np.max(labels)}")
+        # Sorted unique labels also give the min and max without extra passes
+        unique_labels = np.unique(labels)
+        print(f"Number of unique clusters: {len(unique_labels)}")
+        print(f"Cluster labels range: {unique_labels[0]} to {unique_labels[-1]}")
         print()
         
         # Create ClusterLens view with cluster labels
@@ -133,13 +133,26 @@ export class MEASpikeFramesMovieClient {
   }
 
   async #loadSpikeTimesAndLabels(): Promise<void> {
-    // Load spike times
-    const spikeTimesDataset = await this.#zarrGroup.getDataset("spike_times_sec");
-    if (!spikeTimesDataset) {
-      throw new Error("No spike_times_sec dataset found");
+    // Load spike times, stored as deltas between consecutive sample indices
+    const spikeDeltasDataset = await this.#zarrGroup.getDataset("spike_sample_deltas");
+    if (spikeDeltasDataset) {
+      const deltas = (await spikeDeltasDataset.getData({})) as Int32Array;
+      const spikeTimesSec = new Float32Array(deltas.length);
+      let sampleIndex = 0;
+      for (let i = 0; i < deltas.length; i++) {
+        sampleIndex += deltas[i];
+        spikeTimesSec[i] = sampleIndex / this.#samplingFrequencyHz;
+      }
+      this.#spikeTimesSec = spikeTimesSec;
+    } else {
+      // Older figures store spike times directly in seconds
+      const spikeTimesDataset = await this.#zarrGroup.getDataset("spike_times_sec");
+      if (!spikeTimesDataset) {
+        throw new Error("No spike_sample_deltas or spike_times_sec dataset found");
+      }
+      const timesData = await spikeTimesDataset.getData({});
+      this.#spikeTimesSec = timesData as Float32Array;
     }
-    const timesData = await spikeTimesDataset.getData({});
-    this.#spikeTimesSec = timesData as Float32Array;
 
     // Load spike labels
     const spikeLabelsDataset = await this.#zarrGroup.getDataset("spike_labels");
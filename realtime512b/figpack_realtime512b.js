@@ -46,4 +46,4 @@ var Ym=bt=>{throw TypeError(bt)};var ks=(bt,Dt,Ct)=>Dt.has(bt)||Ym("Cannot "+Ct)
 `+f[a].replace(" at new "," at ");return t.displayName&&g.includes("<anonymous>")&&(g=g.replace("<anonymous>",t.displayName)),g}while(1<=a&&0<=n);break}}}finally{gc=!1,Error.prepareStackTrace=e}return(e=t?t.displayName||t.name:"")?Te(e):""}function hh(t,l){switch(t.tag){case 26:case 27:case 5:return Te(t.type);case 16:return Te("Lazy");case 13:return t.child!==l&&l!==null?Te("Suspense Fallback"):Te("Suspense");case 19:return Te("SuspenseList");case 0:case 15:return vc(t.type,!1);case 11:return vc(t.type.render,!1);case 1:return vc(t.type,!0);case 31:return Te("Activity");default:return""}}function zo(t){try{var l="",e=null;do l+=hh(t,e),e=t,t=t.return;while(t);return l}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var Sc=Object.prototype.hasOwnProperty,pc=xt.unstable_scheduleCallback,bc=xt.unstable_cancelCallback,yh=xt.unstable_shouldYield,gh=xt.unstable_requestPaint,Kt=xt.unstable_now,vh=xt.unstable_getCurrentPriorityLevel,Ao=xt.unstable_ImmediatePriority,Mo=xt.unstable_UserBlockingPriority,Du=xt.unstable_NormalPriority,Sh=xt.unstable_LowPriority,_o=xt.unstable_IdlePriority,ph=xt.log,bh=xt.unstable_setDisableYieldValue,nn=null,wt=null;function Wl(t){if(typeof ph=="function"&&bh(t),wt&&typeof wt.setStrictMode=="function")try{wt.setStrictMode(nn,t)}catch(l){}}var Jt=Math.clz32?Math.clz32:Th,xh=Math.log,Eh=Math.LN2;function Th(t){return t>>>=0,t===0?32:31-(xh(t)/Eh|0)|0}var Cu=256,ju=262144,Uu=4194304;function ze(t){var l=t&42;if(l!==0)return l;switch(t&-t){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return t&261888;case 262144:case 524288:case 1048576:case 2097152:return t&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return t&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return t}}function Ou(t,l,e){var a=t.pendingLanes;if(a===0)return 0;var n=0,u=t.suspendedLanes,i=t.pingedLanes;t=t.warmLanes;var c=a&134217727;return c!==0?(a=c&~u,a!==0?n=ze(a):(i&=c,i!==0?n=ze(i):e||(e=c&~t,e!==0&&(n=ze(e))))):(c=a&~u,c!==0?n=ze(c):i!==0?n=ze(i):e||(e=a&~t,e!==0&&(n=ze(e)))),n===0?0:l!==0&&l!==n&&!(l&u)&&(u=n&-n,e=l&-l,u>=e||u===32&&(e&4194048)!==0)?l:n}function un(t,l){return(t.pendingLanes&~(t.suspendedLanes&~t.pingedLanes)&l)===0}function zh(t,l){switch(t){case 1:case 2:case 4:case 8:case 64:return l+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return l+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Do(){var t=Uu;return Uu<<=1,!(Uu&62914560)&&(Uu=4194304),t}function xc(t){for(var l=[],e=0;31>e;e++)l.push(t);return l}function cn(t,l){t.pendingLanes|=l,l!==268435456&&(t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0)}function Ah(t,l,e,a,n,u){var i=t.pendingLanes;t.pendingLanes=e,t.suspendedLanes=0,t.pingedLanes=0,t.warmLanes=0,t.expiredLanes&=e,t.entangledLanes&=e,t.errorRecoveryDisabledLanes&=e,t.shellSuspendCounter=0;var c=t.entanglements,f=t.expirationTimes,s=t.hiddenUpdates;for(e=i&~e;0<e;){var g=31-Jt(e),v=1<<g;c[g]=0,f[g]=-1;var d=s[g];if(d!==null)for(s[g]=null,g=0;g<d.length;g++){var y=d[g];y!==null&&(y.lane&=-536870913)}e&=~v}a!==0&&Co(t,a,0),u!==0&&n===0&&t.tag!==0&&(t.suspendedLanes|=u&~(i&~l))}function Co(t,l,e){t.pendingLanes|=l,t.suspendedLanes&=~l;var a=31-Jt(l);t.entangledLanes|=l,t.entanglements[a]=t.entanglements[a]|1073741824|e&261930}function jo(t,l){var e=t.entangledLanes|=l;for(t=t.entanglements;e;){var a=31-Jt(e),n=1<<a;n&l|t[a]&l&&(t[a]|=l),e&=~n}}function Uo(t,l){var e=l&-l;return e=e&42?1:Ec(e),e&(t.suspendedLanes|l)?0:e}function Ec(t){switch(t){case 2:t=1;break;case 8:t=4;break;case 32:t=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:t=128;break;case 268435456:t=134217728;break;default:t=0}return t}function Tc(t){return t&=-t,2<t?8<t?t&134217727?32:268435456:8:2}function Oo(){var t=W.p;return t!==0?t:(t=window.event,t===void 0?32:vm(t.type))}function Ro(t,l){var e=W.p;try{return W.p=t,l()}finally{W.p=e}}var $l=Math.random().toString(36).slice(2),jt="__reactFiber$"+$l,qt="__reactProps$"+$l,ea="__reactContainer$"+$l,zc="__reactEvents$"+$l,Mh="__reactListeners$"+$l,_h="__reactHandles$"+$l,Ho="__reactResources$"+$l,fn="__reactMarker$"+$l;function Ac(t){delete t[jt],delete t[qt],delete t[zc],delete t[Mh],delete t[_h]}function aa(t){var l=t[jt];if(l)return l;for(var e=t.parentNode;e;){if(l=e[ea]||e[jt]){if(e=l.alternate,l.child!==null||e!==null&&e.child!==null)for(t=lm(t);t!==null;){if(e=t[jt])return e;t=lm(t)}return l}t=e,e=t.parentNode}return null}function na(t){if(t=t[jt]||t[ea]){var l=t.tag;if(l===5||l===6||l===13||l===31||l===26||l===27||l===3)return t}return null}function sn(t){var l=t.tag;if(l===5||l===26||l===27||l===6)return t.stateNode;throw Error(x(33))}function ua(t){var l=t[Ho];return l||(l=t[Ho]={hoistableStyles:new Map,hoistableScripts:new Map}),l}function zt(t){t[fn]=!0}var No=new Set,Bo={};function Ae(t,l){ia(t,l),ia(t+"Capture",l)}function ia(t,l){for(Bo[t]=l,t=0;t<l.length;t++)No.add(l[t])}var Dh=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Yo={},qo={};function Ch(t){return Sc.call(qo,t)?!0:Sc.call(Yo,t)?!1:Dh.test(t)?qo[t]=!0:(Yo[t]=!0,!1)}function Ru(t,l,e){if(Ch(l))if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":t.removeAttribute(l);return;case"boolean":var a=l.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){t.removeAttribute(l);return}}t.setAttribute(l,""+e)}}function Hu(t,l,e){if(e===null)t.removeAttribute(l);else{switch(typeof e){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(l);return}t.setAttribute(l,""+e)}}function zl(t,l,e,a){if(a===null)t.removeAttribute(e);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":t.removeAttribute(e);return}t.setAttributeNS(l,e,""+a)}}function ll(t){switch(typeof t){case"bigint":case"boolean":case"number":case"string":case"undefined":return t;case"object":return t;default:return""}}function Go(t){var l=t.type;return(t=t.nodeName)&&t.toLowerCase()==="input"&&(l==="checkbox"||l==="radio")}function jh(t,l,e){var a=Object.getOwnPropertyDescriptor(t.constructor.prototype,l);if(!t.hasOwnProperty(l)&&typeof a!="undefined"&&typeof a.get=="function"&&typeof a.set=="function"){var n=a.get,u=a.set;return Object.defineProperty(t,l,{configurable:!0,get:function(){return n.call(this)},set:function(i){e=""+i,u.call(this,i)}}),Object.defineProperty(t,l,{enumerable:a.enumerable}),{getValue:function(){return e},setValue:function(i){e=""+i},stopTracking:function(){t._valueTracker=null,delete t[l]}}}}function Mc(t){if(!t._valueTracker){var l=Go(t)?"checked":"value";t._valueTracker=jh(t,l,""+t[l])}}function Xo(t){if(!t)return!1;var l=t._valueTracker;if(!l)return!0;var e=l.getValue(),a="";return t&&(a=Go(t)?t.checked?"true":"false":t.value),t=a,t!==e?(l.setValue(t),!0):!1}function Nu(t){if(t=t||(typeof document!="undefined"?document:void 0),typeof t=="undefined")return null;try{return t.activeElement||t.body}catch(l){return t.body}}var Uh=/[\n"\\]/g;function el(t){return t.replace(Uh,function(l){return"\\"+l.charCodeAt(0).toString(16)+" "})}function _c(t,l,e,a,n,u,i,c){t.name="",i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"?t.type=i:t.removeAttribute("type"),l!=null?i==="number"?(l===0&&t.value===""||t.value!=l)&&(t.value=""+ll(l)):t.value!==""+ll(l)&&(t.value=""+ll(l)):i!=="submit"&&i!=="reset"||t.removeAttribute("value"),l!=null?Dc(t,i,ll(l)):e!=null?Dc(t,i,ll(e)):a!=null&&t.removeAttribute("value"),n==null&&u!=null&&(t.defaultChecked=!!u),n!=null&&(t.checked=n&&typeof n!="function"&&typeof n!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?t.name=""+ll(c):t.removeAttribute("name")}function Qo(t,l,e,a,n,u,i,c){if(u!=null&&typeof u!="function"&&typeof u!="symbol"&&typeof u!="boolean"&&(t.type=u),l!=null||e!=null){if(!(u!=="submit"&&u!=="reset"||l!=null)){Mc(t);return}e=e!=null?""+ll(e):"",l=l!=null?""+ll(l):e,c||l===t.value||(t.value=l),t.defaultValue=l}a=a!=null?a:n,a=typeof a!="function"&&typeof a!="symbol"&&!!a,t.checked=c?t.checked:!!a,t.defaultChecked=!!a,i!=null&&typeof i!="function"&&typeof i!="symbol"&&typeof i!="boolean"&&(t.name=i),Mc(t)}function Dc(t,l,e){l==="number"&&Nu(t.ownerDocument)===t||t.defaultValue===""+e||(t.defaultValue=""+e)}function ca(t,l,e,a){if(t=t.options,l){l={};for(var n=0;n<e.length;n++)l["$"+e[n]]=!0;for(e=0;e<t.length;e++)n=l.hasOwnProperty("$"+t[e].value),t[e].selected!==n&&(t[e].selected=n),n&&a&&(t[e].defaultSelected=!0)}else{for(e=""+ll(e),l=null,n=0;n<t.length;n++){if(t[n].value===e){t[n].selected=!0,a&&(t[n].defaultSelected=!0);return}l!==null||t[n].disabled||(l=t[n])}l!==null&&(l.selected=!0)}}function Vo(t,l,e){if(l!=null&&(l=""+ll(l),l!==t.value&&(t.value=l),e==null)){t.defaultValue!==l&&(t.defaultValue=l);return}t.defaultValue=e!=null?""+ll(e):""}function Zo(t,l,e,a){if(l==null){if(a!=null){if(e!=null)throw Error(x(92));if(en(a)){if(1<a.length)throw Error(x(93));a=a[0]}e=a}e==null&&(e=""),l=e}e=ll(l),t.defaultValue=e,a=t.textContent,a===e&&a!==""&&a!==null&&(t.value=a),Mc(t)}function fa(t,l){if(l){var e=t.firstChild;if(e&&e===t.lastChild&&e.nodeType===3){e.nodeValue=l;return}}t.textContent=l}var Oh=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Lo(t,l,e){var a=l.indexOf("--")===0;e==null||typeof e=="boolean"||e===""?a?t.setProperty(l,""):l==="float"?t.cssFloat="":t[l]="":a?t.setProperty(l,e):typeof e!="number"||e===0||Oh.has(l)?l==="float"?t.cssFloat=e:t[l]=(""+e).trim():t[l]=e+"px"}function Ko(t,l,e){if(l!=null&&typeof l!="object")throw Error(x(62));if(t=t.style,e!=null){for(var a in e)!e.hasOwnProperty(a)||l!=null&&l.hasOwnProperty(a)||(a.indexOf("--")===0?t.setProperty(a,""):a==="float"?t.cssFloat="":t[a]="");for(var n in l)a=l[n],l.hasOwnProperty(n)&&e[n]!==a&&Lo(t,n,a)}else for(var u in l)l.hasOwnProperty(u)&&Lo(t,u,l[u])}function Cc(t){if(t.indexOf("-")===-1)return!1;switch(t){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Rh=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Hh=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Bu(t){return Hh.test(""+t)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":t}function Al(){}var jc=null;function Uc(t){return t=t.target||t.srcElement||window,t.correspondingUseElement&&(t=t.correspondingUseElement),t.nodeType===3?t.parentNode:t}var sa=null,oa=null;function wo(t){var l=na(t);if(l&&(t=l.stateNode)){var e=t[qt]||null;t:switch(t=l.stateNode,l.type){case"input":if(_c(t,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name),l=e.name,e.type==="radio"&&l!=null){for(e=t;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll('input[name="'+el(""+l)+'"][type="radio"]'),l=0;l<e.length;l++){var a=e[l];if(a!==t&&a.form===t.form){var n=a[qt]||null;if(!n)throw Error(x(90));_c(a,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name)}}for(l=0;l<e.length;l++)a=e[l],a.form===t.form&&Xo(a)}break t;case"textarea":Vo(t,e.value,e.defaultValue);break t;case"select":l=e.value,l!=null&&ca(t,!!e.multiple,l,!1)}}}var Oc=!1;function Jo(t,l,e){if(Oc)return t(l,e);Oc=!0;try{var a=t(l);return a}finally{if(Oc=!1,(sa!==null||oa!==null)&&(Ti(),sa&&(l=sa,t=oa,oa=sa=null,wo(l),t)))for(l=0;l<t.length;l++)wo(t[l])}}function on(t,l){var e=t.stateNode;if(e===null)return null;var a=e[qt]||null;if(a===null)return null;e=a[l];t:switch(l){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(t=t.type,a=!(t==="button"||t==="input"||t==="select"||t==="textarea")),t=!a;break t;default:t=!1}if(t)return null;if(e&&typeof e!="function")throw Error(x(231,l,typeof e));return e}var Ml=!(typeof window=="undefined"||typeof window.document=="undefined"||typeof window.document.createElement=="undefined"),Rc=!1;if(Ml)try{var rn={};Object.defineProperty(rn,"passive",{get:function(){Rc=!0}}),window.addEventListener("test",rn,rn),window.removeEventListener("test",rn,rn)}catch(t){Rc=!1}var Il=null,Hc=null,Yu=null;function ko(){if(Yu)return Yu;var t,l=Hc,e=l.length,a,n="value"in Il?Il.value:Il.textContent,u=n.length;for(t=0;t<e&&l[t]===n[t];t++);var i=e-t;for(a=1;a<=i&&l[e-a]===n[u-a];a++);return Yu=n.slice(t,1<a?1-a:void 0)}function qu(t){var l=t.keyCode;return"charCode"in t?(t=t.charCode,t===0&&l===13&&(t=13)):t=l,t===10&&(t=13),32<=t||t===13?t:0}function Gu(){return!0}function Fo(){return!1}function Gt(t){function l(e,a,n,u,i){this._reactName=e,this._targetInst=n,this.type=a,this.nativeEvent=u,this.target=i,this.currentTarget=null;for(var c in t)t.hasOwnProperty(c)&&(e=t[c],this[c]=e?e(u):u[c]);return this.isDefaultPrevented=(u.defaultPrevented!=null?u.defaultPrevented:u.returnValue===!1)?Gu:Fo,this.isPropagationStopped=Fo,this}return ct(l.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=Gu)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=Gu)},persist:function(){},isPersistent:Gu}),l}var Me={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(t){return t.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Xu=Gt(Me),dn=ct({},Me,{view:0,detail:0}),Nh=Gt(dn),Nc,Bc,mn,Qu=ct({},dn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:qc,button:0,buttons:0,relatedTarget:function(t){return t.relatedTarget===void 0?t.fromElement===t.srcElement?t.toElement:t.fromElement:t.relatedTarget},movementX:function(t){return"movementX"in t?t.movementX:(t!==mn&&(mn&&t.type==="mousemove"?(Nc=t.screenX-mn.screenX,Bc=t.screenY-mn.screenY):Bc=Nc=0,mn=t),Nc)},movementY:function(t){return"movementY"in t?t.movementY:Bc}}),Wo=Gt(Qu),Bh=ct({},Qu,{dataTransfer:0}),Yh=Gt(Bh),qh=ct({},dn,{relatedTarget:0}),Yc=Gt(qh),Gh=ct({},Me,{animationName:0,elapsedTime:0,pseudoElement:0}),Xh=Gt(Gh),Qh=ct({},Me,{clipboardData:function(t){return"clipboardData"in t?t.clipboardData:window.clipboardData}}),Vh=Gt(Qh),Zh=ct({},Me,{data:0}),$o=Gt(Zh),Lh={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Kh={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},wh={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Jh(t){var l=this.nativeEvent;return l.getModifierState?l.getModifierState(t):(t=wh[t])?!!l[t]:!1}function qc(){return Jh}var kh=ct({},dn,{key:function(t){if(t.key){var l=Lh[t.key]||t.key;if(l!=="Unidentified")return l}return t.type==="keypress"?(t=qu(t),t===13?"Enter":String.fromCharCode(t)):t.type==="keydown"||t.type==="keyup"?Kh[t.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:qc,charCode:function(t){return t.type==="keypress"?qu(t):0},keyCode:function(t){return t.type==="keydown"||t.type==="keyup"?t.keyCode:0},which:function(t){return t.type==="keypress"?qu(t):t.type==="keydown"||t.type==="keyup"?t.keyCode:0}}),Fh=Gt(kh),Wh=ct({},Qu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Io=Gt(Wh),$h=ct({},dn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:qc}),Ih=Gt($h),Ph=ct({},Me,{propertyName:0,elapsedTime:0,pseudoElement:0}),ty=Gt(Ph),ly=ct({},Qu,{deltaX:function(t){return"deltaX"in t?t.deltaX:"wheelDeltaX"in t?-t.wheelDeltaX:0},deltaY:function(t){return"deltaY"in t?t.deltaY:"wheelDeltaY"in t?-t.wheelDeltaY:"wheelDelta"in t?-t.wheelDelta:0},deltaZ:0,deltaMode:0}),ey=Gt(ly),ay=ct({},Me,{newState:0,oldState:0}),ny=Gt(ay),uy=[9,13,27,32],Gc=Ml&&"CompositionEvent"in window,hn=null;Ml&&"documentMode"in document&&(hn=document.documentMode);var iy=Ml&&"TextEvent"in window&&!hn,Po=Ml&&(!Gc||hn&&8<hn&&11>=hn),tr=" ",lr=!1;function er(t,l){switch(t){case"keyup":return uy.indexOf(l.keyCode)!==-1;case"keydown":return l.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function ar(t){return t=t.detail,typeof t=="object"&&"data"in t?t.data:null}var ra=!1;function cy(t,l){switch(t){case"compositionend":return ar(l);case"keypress":return l.which!==32?null:(lr=!0,tr);case"textInput":return t=l.data,t===tr&&lr?null:t;default:return null}}function fy(t,l){if(ra)return t==="compositionend"||!Gc&&er(t,l)?(t=ko(),Yu=Hc=Il=null,ra=!1,t):null;switch(t){case"paste":return null;case"keypress":if(!(l.ctrlKey||l.altKey||l.metaKey)||l.ctrlKey&&l.altKey){if(l.char&&1<l.char.length)return l.char;if(l.which)return String.fromCharCode(l.which)}return null;case"compositionend":return Po&&l.locale!=="ko"?null:l.data;default:return null}}var sy={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function nr(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l==="input"?!!sy[t.type]:l==="textarea"}function ur(t,l,e,a){sa?oa?oa.push(a):oa=[a]:sa=a,l=ji(l,"onChange"),0<l.length&&(e=new Xu("onChange","change",null,e,a),t.push({event:e,listeners:l}))}var yn=null,gn=null;function oy(t){Q0(t,0)}function Vu(t){var l=sn(t);if(Xo(l))return t}function ir(t,l){if(t==="change")return l}var cr=!1;if(Ml){var Xc;if(Ml){var Qc="oninput"in document;if(!Qc){var fr=document.createElement("div");fr.setAttribute("oninput","return;"),Qc=typeof fr.oninput=="function"}Xc=Qc}else Xc=!1;cr=Xc&&(!document.documentMode||9<document.documentMode)}function sr(){yn&&(yn.detachEvent("onpropertychange",or),gn=yn=null)}function or(t){if(t.propertyName==="value"&&Vu(gn)){var l=[];ur(l,gn,t,Uc(t)),Jo(oy,l)}}function ry(t,l,e){t==="focusin"?(sr(),yn=l,gn=e,yn.attachEvent("onpropertychange",or)):t==="focusout"&&sr()}function dy(t){if(t==="selectionchange"||t==="keyup"||t==="keydown")return Vu(gn)}function my(t,l){if(t==="click")return Vu(l)}function hy(t,l){if(t==="input"||t==="change")return Vu(l)}function yy(t,l){return t===l&&(t!==0||1/t===1/l)||t!==t&&l!==l}var kt=typeof Object.is=="function"?Object.is:yy;function vn(t,l){if(kt(t,l))return!0;if(typeof t!="object"||t===null||typeof l!="object"||l===null)return!1;var e=Object.keys(t),a=Object.keys(l);if(e.length!==a.length)return!1;for(a=0;a<e.length;a++){var n=e[a];if(!Sc.call(l,n)||!kt(t[n],l[n]))return!1}return!0}function rr(t){for(;t&&t.firstChild;)t=t.firstChild;return t}function dr(t,l){var e=rr(t);t=0;for(var a;e;){if(e.nodeType===3){if(a=t+e.textContent.length,t<=l&&a>=l)return{node:e,offset:l-t};t=a}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=rr(e)}}function mr(t,l){return t&&l?t===l?!0:t&&t.nodeType===3?!1:l&&l.nodeType===3?mr(t,l.parentNode):"contains"in t?t.contains(l):t.compareDocumentPosition?!!(t.compareDocumentPosition(l)&16):!1:!1}function hr(t){t=t!=null&&t.ownerDocument!=null&&t.ownerDocument.defaultView!=null?t.ownerDocument.defaultView:window;for(var l=Nu(t.document);l instanceof t.HTMLIFrameElement;){try{var e=typeof l.contentWindow.location.href=="string"}catch(a){e=!1}if(e)t=l.contentWindow;else break;l=Nu(t.document)}return l}function Vc(t){var l=t&&t.nodeName&&t.nodeName.toLowerCase();return l&&(l==="input"&&(t.type==="text"||t.type==="search"||t.type==="tel"||t.type==="url"||t.type==="password")||l==="textarea"||t.contentEditable==="true")}var gy=Ml&&"documentMode"in document&&11>=document.documentMode,da=null,Zc=null,Sn=null,Lc=!1;function yr(t,l,e){var a=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;Lc||da==null||da!==Nu(a)||(a=da,"selectionStart"in a&&Vc(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Sn&&vn(Sn,a)||(Sn=a,a=ji(Zc,"onSelect"),0<a.length&&(l=new Xu("onSelect","select",null,l,e),t.push({event:l,listeners:a}),l.target=da)))}function _e(t,l){var e={};return e[t.toLowerCase()]=l.toLowerCase(),e["Webkit"+t]="webkit"+l,e["Moz"+t]="moz"+l,e}var ma={animationend:_e("Animation","AnimationEnd"),animationiteration:_e("Animation","AnimationIteration"),animationstart:_e("Animation","AnimationStart"),transitionrun:_e("Transition","TransitionRun"),transitionstart:_e("Transition","TransitionStart"),transitioncancel:_e("Transition","TransitionCancel"),transitionend:_e("Transition","TransitionEnd")},Kc={},gr={};Ml&&(gr=document.createElement("div").style,"AnimationEvent"in window||(delete ma.animationend.animation,delete ma.animationiteration.animation,delete ma.animationstart.animation),"TransitionEvent"in window||delete ma.transitionend.transition);function De(t){if(Kc[t])return Kc[t];if(!ma[t])return t;var l=ma[t],e;for(e in l)if(l.hasOwnProperty(e)&&e in gr)return Kc[t]=l[e];return t}var vr=De("animationend"),Sr=De("animationiteration"),pr=De("animationstart"),vy=De("transitionrun"),Sy=De("transitionstart"),py=De("transitioncancel"),br=De("transitionend"),xr=new Map,wc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");wc.push("scrollEnd");function rl(t,l){xr.set(t,l),Ae(l,[t])}var Zu=typeof reportError=="function"?reportError:function(t){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var l=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof t=="object"&&t!==null&&typeof t.message=="string"?String(t.message):String(t),error:t});if(!window.dispatchEvent(l))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",t);return}console.error(t)},al=[],ha=0,Jc=0;function Lu(){for(var t=ha,l=Jc=ha=0;l<t;){var e=al[l];al[l++]=null;var a=al[l];al[l++]=null;var n=al[l];al[l++]=null;var u=al[l];if(al[l++]=null,a!==null&&n!==null){var i=a.pending;i===null?n.next=n:(n.next=i.next,i.next=n),a.pending=n}u!==0&&Er(e,n,u)}}function Ku(t,l,e,a){al[ha++]=t,al[ha++]=l,al[ha++]=e,al[ha++]=a,Jc|=a,t.lanes|=a,t=t.alternate,t!==null&&(t.lanes|=a)}function kc(t,l,e,a){return Ku(t,l,e,a),wu(t)}function Ce(t,l){return Ku(t,null,null,l),wu(t)}function Er(t,l,e){t.lanes|=e;var a=t.alternate;a!==null&&(a.lanes|=e);for(var n=!1,u=t.return;u!==null;)u.childLanes|=e,a=u.alternate,a!==null&&(a.childLanes|=e),u.tag===22&&(t=u.stateNode,t===null||t._visibility&1||(n=!0)),t=u,u=u.return;return t.tag===3?(u=t.stateNode,n&&l!==null&&(n=31-Jt(e),t=u.hiddenUpdates,a=t[n],a===null?t[n]=[l]:a.push(l),l.lane=e|536870912),u):null}function wu(t){if(50<Xn)throw Xn=0,ns=null,Error(x(185));for(var l=t.return;l!==null;)t=l,l=t.return;return t.tag===3?t.stateNode:null}var ya={};function by(t,l,e,a){this.tag=t,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=l,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ft(t,l,e,a){return new by(t,l,e,a)}function Fc(t){return t=t.prototype,!(!t||!t.isReactComponent)}function _l(t,l){var e=t.alternate;return e===null?(e=Ft(t.tag,l,t.key,t.mode),e.elementType=t.elementType,e.type=t.type,e.stateNode=t.stateNode,e.alternate=t,t.alternate=e):(e.pendingProps=l,e.type=t.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=t.flags&65011712,e.childLanes=t.childLanes,e.lanes=t.lanes,e.child=t.child,e.memoizedProps=t.memoizedProps,e.memoizedState=t.memoizedState,e.updateQueue=t.updateQueue,l=t.dependencies,e.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext},e.sibling=t.sibling,e.index=t.index,e.ref=t.ref,e.refCleanup=t.refCleanup,e}function Tr(t,l){t.flags&=65011714;var e=t.alternate;return e===null?(t.childLanes=0,t.lanes=l,t.child=null,t.subtreeFlags=0,t.memoizedProps=null,t.memoizedState=null,t.updateQueue=null,t.dependencies=null,t.stateNode=null):(t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.subtreeFlags=0,t.deletions=null,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,t.type=e.type,l=e.dependencies,t.dependencies=l===null?null:{lanes:l.lanes,firstContext:l.firstContext}),t}function Ju(t,l,e,a,n,u){var i=0;if(a=t,typeof t=="function")Fc(t)&&(i=1);else if(typeof t=="string")i=Ag(t,e,gl.current)?26:t==="html"||t==="head"||t==="body"?27:5;else t:switch(t){case rc:return t=Ft(31,e,l,n),t.elementType=rc,t.lanes=u,t;case Pe:return je(e.children,n,u,l);case bo:i=8,n|=24;break;case ic:return t=Ft(12,e,l,n|2),t.elementType=ic,t.lanes=u,t;case fc:return t=Ft(13,e,l,n),t.elementType=fc,t.lanes=u,t;case sc:return t=Ft(19,e,l,n),t.elementType=sc,t.lanes=u,t;default:if(typeof t=="object"&&t!==null)switch(t.$$typeof){case Tl:i=10;break t;case xo:i=9;break t;case cc:i=11;break t;case oc:i=14;break t;case kl:i=16,a=null;break t}i=29,e=Error(x(130,t===null?"null":typeof t,"")),a=null}return l=Ft(i,e,l,n),l.elementType=t,l.type=a,l.lanes=u,l}function je(t,l,e,a){return t=Ft(7,t,a,l),t.lanes=e,t}function Wc(t,l,e){return t=Ft(6,t,null,l),t.lanes=e,t}function zr(t){var l=Ft(18,null,null,0);return l.stateNode=t,l}function $c(t,l,e){return l=Ft(4,t.children!==null?t.children:[],t.key,l),l.lanes=e,l.stateNode={containerInfo:t.containerInfo,pendingChildren:null,implementation:t.implementation},l}var Ar=new WeakMap;function nl(t,l){if(typeof t=="object"&&t!==null){var e=Ar.get(t);return e!==void 0?e:(l={value:t,source:l,stack:zo(l)},Ar.set(t,l),l)}return{value:t,source:l,stack:zo(l)}}var ga=[],va=0,ku=null,pn=0,ul=[],il=0,Pl=null,vl=1,Sl="";function Dl(t,l){ga[va++]=pn,ga[va++]=ku,ku=t,pn=l}function Mr(t,l,e){ul[il++]=vl,ul[il++]=Sl,ul[il++]=Pl,Pl=t;var a=vl;t=Sl;var n=32-Jt(a)-1;a&=~(1<<n),e+=1;var u=32-Jt(l)+n;if(30<u){var i=n-n%5;u=(a&(1<<i)-1).toString(32),a>>=i,n-=i,vl=1<<32-Jt(l)+n|e<<n|a,Sl=u+t}else vl=1<<u|e<<n|a,Sl=t}function Ic(t){t.return!==null&&(Dl(t,1),Mr(t,1,0))}function Pc(t){for(;t===ku;)ku=ga[--va],ga[va]=null,pn=ga[--va],ga[va]=null;for(;t===Pl;)Pl=ul[--il],ul[il]=null,Sl=ul[--il],ul[il]=null,vl=ul[--il],ul[il]=null}function _r(t,l){ul[il++]=vl,ul[il++]=Sl,ul[il++]=Pl,vl=l.id,Sl=l.overflow,Pl=t}var Ut=null,ft=null,F=!1,te=null,cl=!1,tf=Error(x(519));function le(t){var l=Error(x(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw bn(nl(l,t)),tf}function Dr(t){var l=t.stateNode,e=t.type,a=t.memoizedProps;switch(l[jt]=t,l[qt]=a,e){case"dialog":w("cancel",l),w("close",l);break;case"iframe":case"object":case"embed":w("load",l);break;case"video":case"audio":for(e=0;e<Vn.length;e++)w(Vn[e],l);break;case"source":w("error",l);break;case"img":case"image":case"link":w("error",l),w("load",l);break;case"details":w("toggle",l);break;case"input":w("invalid",l),Qo(l,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":w("invalid",l);break;case"textarea":w("invalid",l),Zo(l,a.value,a.defaultValue,a.children)}e=a.children,typeof e!="string"&&typeof e!="number"&&typeof e!="bigint"||l.textContent===""+e||a.suppressHydrationWarning===!0||K0(l.textContent,e)?(a.popover!=null&&(w("beforetoggle",l),w("toggle",l)),a.onScroll!=null&&w("scroll",l),a.onScrollEnd!=null&&w("scrollend",l),a.onClick!=null&&(l.onclick=Al),l=!0):l=!1,l||le(t,!0)}function Cr(t){for(Ut=t.return;Ut;)switch(Ut.tag){case 5:case 31:case 13:cl=!1;return;case 27:case 3:cl=!0;return;default:Ut=Ut.return}}function Sa(t){if(t!==Ut)return!1;if(!F)return Cr(t),F=!0,!1;var l=t.tag,e;if((e=l!==3&&l!==27)&&((e=l===5)&&(e=t.type,e=!(e!=="form"&&e!=="button")||ps(t.type,t.memoizedProps)),e=!e),e&&ft&&le(t),Cr(t),l===13){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(x(317));ft=tm(t)}else if(l===31){if(t=t.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(x(317));ft=tm(t)}else l===27?(l=ft,ye(t.type)?(t=zs,zs=null,ft=t):ft=l):ft=Ut?sl(t.stateNode.nextSibling):null;return!0}function Ue(){ft=Ut=null,F=!1}function lf(){var t=te;return t!==null&&(Zt===null?Zt=t:Zt.push.apply(Zt,t),te=null),t}function bn(t){te===null?te=[t]:te.push(t)}var ef=yl(null),Oe=null,Cl=null;function ee(t,l,e){nt(ef,l._currentValue),l._currentValue=e}function jl(t){t._currentValue=ef.current,Tt(ef)}function af(t,l,e){for(;t!==null;){var a=t.alternate;if((t.childLanes&l)!==l?(t.childLanes|=l,a!==null&&(a.childLanes|=l)):a!==null&&(a.childLanes&l)!==l&&(a.childLanes|=l),t===e)break;t=t.return}}function nf(t,l,e,a){var n=t.child;for(n!==null&&(n.return=t);n!==null;){var u=n.dependencies;if(u!==null){var i=n.child;u=u.firstContext;t:for(;u!==null;){var c=u;u=n;for(var f=0;f<l.length;f++)if(c.context===l[f]){u.lanes|=e,c=u.alternate,c!==null&&(c.lanes|=e),af(u.return,e,t),a||(i=null);break t}u=c.next}}else if(n.tag===18){if(i=n.return,i===null)throw Error(x(341));i.lanes|=e,u=i.alternate,u!==null&&(u.lanes|=e),af(i,e,t),i=null}else i=n.child;if(i!==null)i.return=n;else for(i=n;i!==null;){if(i===t){i=null;break}if(n=i.sibling,n!==null){n.return=i.return,i=n;break}i=i.return}n=i}}function pa(t,l,e,a){t=null;for(var n=l,u=!1;n!==null;){if(!u){if(n.flags&524288)u=!0;else if(n.flags&262144)break}if(n.tag===10){var i=n.alternate;if(i===null)throw Error(x(387));if(i=i.memoizedProps,i!==null){var c=n.type;kt(n.pendingProps.value,i.value)||(t!==null?t.push(c):t=[c])}}else if(n===Au.current){if(i=n.alternate,i===null)throw Error(x(387));i.memoizedState.memoizedState!==n.memoizedState.memoizedState&&(t!==null?t.push(Jn):t=[Jn])}n=n.return}t!==null&&nf(l,t,e,a),l.flags|=262144}function Fu(t){for(t=t.firstContext;t!==null;){if(!kt(t.context._currentValue,t.memoizedValue))return!0;t=t.next}return!1}function Re(t){Oe=t,Cl=null,t=t.dependencies,t!==null&&(t.firstContext=null)}function Ot(t){return jr(Oe,t)}function Wu(t,l){return Oe===null&&Re(t),jr(t,l)}function jr(t,l){var e=l._currentValue;if(l={context:l,memoizedValue:e,next:null},Cl===null){if(t===null)throw Error(x(308));Cl=l,t.dependencies={lanes:0,firstContext:l},t.flags|=524288}else Cl=Cl.next=l;return e}var xy=typeof AbortController!="undefined"?AbortController:function(){var t=[],l=this.signal={aborted:!1,addEventListener:function(e,a){t.push(a)}};this.abort=function(){l.aborted=!0,t.forEach(function(e){return e()})}},Ey=xt.unstable_scheduleCallback,Ty=xt.unstable_NormalPriority,gt={$$typeof:Tl,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function uf(){return{controller:new xy,data:new Map,refCount:0}}function xn(t){t.refCount--,t.refCount===0&&Ey(Ty,function(){t.controller.abort()})}var En=null,cf=0,ba=0,xa=null;function zy(t,l){if(En===null){var e=En=[];cf=0,ba=os(),xa={status:"pending",value:void 0,then:function(a){e.push(a)}}}return cf++,l.then(Ur,Ur),l}function Ur(){if(--cf===0&&En!==null){xa!==null&&(xa.status="fulfilled");var t=En;En=null,ba=0,xa=null;for(var l=0;l<t.length;l++)(0,t[l])()}}function Ay(t,l){var e=[],a={status:"pending",value:null,reason:null,then:function(n){e.push(n)}};return t.then(function(){a.status="fulfilled",a.value=l;for(var n=0;n<e.length;n++)(0,e[n])(l)},function(n){for(a.status="rejected",a.reason=n,n=0;n<e.length;n++)(0,e[n])(void 0)}),a}var Or=Y.S;Y.S=function(t,l){y0=Kt(),typeof l=="object"&&l!==null&&typeof l.then=="function"&&zy(t,l),Or!==null&&Or(t,l)};var He=yl(null);function ff(){var t=He.current;return t!==null?t:at.pooledCache}function $u(t,l){l===null?nt(He,He.current):nt(He,l.pool)}function Rr(){var t=ff();return t===null?null:{parent:gt._currentValue,pool:t}}var Ea=Error(x(460)),sf=Error(x(474)),Iu=Error(x(542)),Pu={then:function(){}};function Hr(t){return t=t.status,t==="fulfilled"||t==="rejected"}function Nr(t,l,e){switch(e=t[e],e===void 0?t.push(l):e!==l&&(l.then(Al,Al),l=e),l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Yr(t),t;default:if(typeof l.status=="string")l.then(Al,Al);else{if(t=at,t!==null&&100<t.shellSuspendCounter)throw Error(x(482));t=l,t.status="pending",t.then(function(a){if(l.status==="pending"){var n=l;n.status="fulfilled",n.value=a}},function(a){if(l.status==="pending"){var n=l;n.status="rejected",n.reason=a}})}switch(l.status){case"fulfilled":return l.value;case"rejected":throw t=l.reason,Yr(t),t}throw Be=l,Ea}}function Ne(t){try{var l=t._init;return l(t._payload)}catch(e){throw e!==null&&typeof e=="object"&&typeof e.then=="function"?(Be=e,Ea):e}}var Be=null;function Br(){if(Be===null)throw Error(x(459));var t=Be;return Be=null,t}function Yr(t){if(t===Ea||t===Iu)throw Error(x(483))}var Ta=null,Tn=0;function ti(t){var l=Tn;return Tn+=1,Ta===null&&(Ta=[]),Nr(Ta,t,l)}function zn(t,l){l=l.props.ref,t.ref=l!==void 0?l:null}function li(t,l){throw l.$$typeof===rh?Error(x(525)):(t=Object.prototype.toString.call(l),Error(x(31,t==="[object Object]"?"object with keys {"+Object.keys(l).join(", ")+"}":t)))}function qr(t){function l(r,o){if(t){var h=r.deletions;h===null?(r.deletions=[o],r.flags|=16):h.push(o)}}function e(r,o){if(!t)return null;for(;o!==null;)l(r,o),o=o.sibling;return null}function a(r){for(var o=new Map;r!==null;)r.key!==null?o.set(r.key,r):o.set(r.index,r),r=r.sibling;return o}function n(r,o){return r=_l(r,o),r.index=0,r.sibling=null,r}function u(r,o,h){return r.index=h,t?(h=r.alternate,h!==null?(h=h.index,h<o?(r.flags|=67108866,o):h):(r.flags|=67108866,o)):(r.flags|=1048576,o)}function i(r){return t&&r.alternate===null&&(r.flags|=67108866),r}function c(r,o,h,S){return o===null||o.tag!==6?(o=Wc(h,r.mode,S),o.return=r,o):(o=n(o,h),o.return=r,o)}function f(r,o,h,S){var b=h.type;return b===Pe?g(r,o,h.props.children,S,h.key):o!==null&&(o.elementType===b||typeof b=="object"&&b!==null&&b.$$typeof===kl&&Ne(b)===o.type)?(o=n(o,h.props),zn(o,h),o.return=r,o):(o=Ju(h.type,h.key,h.props,null,r.mode,S),zn(o,h),o.return=r,o)}function s(r,o,h,S){return o===null||o.tag!==4||o.stateNode.containerInfo!==h.containerInfo||o.stateNode.implementation!==h.implementation?(o=$c(h,r.mode,S),o.return=r,o):(o=n(o,h.children||[]),o.return=r,o)}function g(r,o,h,S,b){return o===null||o.tag!==7?(o=je(h,r.mode,S,b),o.return=r,o):(o=n(o,h),o.return=r,o)}function v(r,o,h){if(typeof o=="string"&&o!==""||typeof o=="number"||typeof o=="bigint")return o=Wc(""+o,r.mode,h),o.return=r,o;if(typeof o=="object"&&o!==null){switch(o.$$typeof){case zu:return h=Ju(o.type,o.key,o.props,null,r.mode,h),zn(h,o),h.return=r,h;case tn:return o=$c(o,r.mode,h),o.return=r,o;case kl:return o=Ne(o),v(r,o,h)}if(en(o)||ln(o))return o=je(o,r.mode,h,null),o.return=r,o;if(typeof o.then=="function")return v(r,ti(o),h);if(o.$$typeof===Tl)return v(r,Wu(r,o),h);li(r,o)}return null}function d(r,o,h,S){var b=o!==null?o.key:null;if(typeof h=="string"&&h!==""||typeof h=="number"||typeof h=="bigint")return b!==null?null:c(r,o,""+h,S);if(typeof h=="object"&&h!==null){switch(h.$$typeof){case zu:return h.key===b?f(r,o,h,S):null;case tn:return h.key===b?s(r,o,h,S):null;case kl:return h=Ne(h),d(r,o,h,S)}if(en(h)||ln(h))return b!==null?null:g(r,o,h,S,null);if(typeof h.then=="function")return d(r,o,ti(h),S);if(h.$$typeof===Tl)return d(r,o,Wu(r,h),S);li(r,h)}return null}function y(r,o,h,S,b){if(typeof S=="string"&&S!==""||typeof S=="number"||typeof S=="bigint")return r=r.get(h)||null,c(o,r,""+S,b);if(typeof S=="object"&&S!==null){switch(S.$$typeof){case zu:return r=r.get(S.key===null?h:S.key)||null,f(o,r,S,b);case tn:return r=r.get(S.key===null?h:S.key)||null,s(o,r,S,b);case kl:return S=Ne(S),y(r,o,h,S,b)}if(en(S)||ln(S))return r=r.get(h)||null,g(o,r,S,b,null);if(typeof S.then=="function")return y(r,o,h,ti(S),b);if(S.$$typeof===Tl)return y(r,o,h,Wu(o,S),b);li(o,S)}return null}function p(r,o,h,S){for(var b=null,A=null,T=o,C=o=0,j=null;T!==null&&C<h.length;C++){T.index>C?(j=T,T=null):j=T.sibling;var H=d(r,T,h[C],S);if(H===null){T===null&&(T=j);break}t&&T&&H.alternate===null&&l(r,T),o=u(H,o,C),A===null?b=H:A.sibling=H,A=H,T=j}if(C===h.length)return e(r,T),F&&Dl(r,C),b;if(T===null){for(;C<h.length;C++)T=v(r,h[C],S),T!==null&&(o=u(T,o,C),A===null?b=T:A.sibling=T,A=T);return F&&Dl(r,C),b}for(T=a(T);C<h.length;C++)j=y(T,r,C,h[C],S),j!==null&&(t&&j.alternate!==null&&T.delete(j.key===null?C:j.key),o=u(j,o,C),A===null?b=j:A.sibling=j,A=j);return t&&T.forEach(function(L){return l(r,L)}),F&&Dl(r,C),b}function D(r,o,h,S){if(h==null)throw Error(x(151));for(var b=null,A=null,T=o,C=o=0,j=null,H=h.next();T!==null&&!H.done;C++,H=h.next()){T.index>C?(j=T,T=null):j=T.sibling;var L=d(r,T,H.value,S);if(L===null){T===null&&(T=j);break}t&&T&&L.alternate===null&&l(r,T),o=u(L,o,C),A===null?b=L:A.sibling=L,A=L,T=j}if(H.done)return e(r,T),F&&Dl(r,C),b;if(T===null){for(;!H.done;C++,H=h.next())H=v(r,H.value,S),H!==null&&(o=u(H,o,C),A===null?b=H:A.sibling=H,A=H);return F&&Dl(r,C),b}for(T=a(T);!H.done;C++,H=h.next())H=y(T,r,C,H.value,S),H!==null&&(t&&H.alternate!==null&&T.delete(H.key===null?C:H.key),o=u(H,o,C),A===null?b=H:A.sibling=H,A=H);return t&&T.forEach(function(Z){return l(r,Z)}),F&&Dl(r,C),b}function O(r,o,h,S){if(typeof h=="object"&&h!==null&&h.type===Pe&&h.key===null&&(h=h.props.children),typeof h=="object"&&h!==null){switch(h.$$typeof){case zu:t:{for(var b=h.key;o!==null;){if(o.key===b){if(b=h.type,b===Pe){if(o.tag===7){e(r,o.sibling),S=n(o,h.props.children),S.return=r,r=S;break t}}else if(o.elementType===b||typeof b=="object"&&b!==null&&b.$$typeof===kl&&Ne(b)===o.type){e(r,o.sibling),S=n(o,h.props),zn(S,h),S.return=r,r=S;break t}e(r,o);break}else l(r,o);o=o.sibling}h.type===Pe?(S=je(h.props.children,r.mode,S,h.key),S.return=r,r=S):(S=Ju(h.type,h.key,h.props,null,r.mode,S),zn(S,h),S.return=r,r=S)}return i(r);case tn:t:{for(b=h.key;o!==null;){if(o.key===b)if(o.tag===4&&o.stateNode.containerInfo===h.containerInfo&&o.stateNode.implementation===h.implementation){e(r,o.sibling),S=n(o,h.children||[]),S.return=r,r=S;break t}else{e(r,o);break}else l(r,o);o=o.sibling}S=$c(h,r.mode,S),S.return=r,r=S}return i(r);case kl:return h=Ne(h),O(r,o,h,S)}if(en(h))return p(r,o,h,S);if(ln(h)){if(b=ln(h),typeof b!="function")throw Error(x(150));return h=b.call(h),D(r,o,h,S)}if(typeof h.then=="function")return O(r,o,ti(h),S);if(h.$$typeof===Tl)return O(r,o,Wu(r,h),S);li(r,h)}return typeof h=="string"&&h!==""||typeof h=="number"||typeof h=="bigint"?(h=""+h,o!==null&&o.tag===6?(e(r,o.sibling),S=n(o,h),S.return=r,r=S):(e(r,o),S=Wc(h,r.mode,S),S.return=r,r=S),i(r)):e(r,o)}return function(r,o,h,S){try{Tn=0;var b=O(r,o,h,S);return Ta=null,b}catch(T){if(T===Ea||T===Iu)throw T;var A=Ft(29,T,null,r.mode);return A.lanes=S,A.return=r,A}finally{}}}var Ye=qr(!0),Gr=qr(!1),ae=!1;function of(t){t.updateQueue={baseState:t.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function rf(t,l){t=t.updateQueue,l.updateQueue===t&&(l.updateQueue={baseState:t.baseState,firstBaseUpdate:t.firstBaseUpdate,lastBaseUpdate:t.lastBaseUpdate,shared:t.shared,callbacks:null})}function ne(t){return{lane:t,tag:0,payload:null,callback:null,next:null}}function ue(t,l,e){var a=t.updateQueue;if(a===null)return null;if(a=a.shared,$&2){var n=a.pending;return n===null?l.next=l:(l.next=n.next,n.next=l),a.pending=l,l=wu(t),Er(t,null,e),l}return Ku(t,a,l,e),wu(t)}function An(t,l,e){if(l=l.updateQueue,l!==null&&(l=l.shared,(e&4194048)!==0)){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,jo(t,e)}}function df(t,l){var e=t.updateQueue,a=t.alternate;if(a!==null&&(a=a.updateQueue,e===a)){var n=null,u=null;if(e=e.firstBaseUpdate,e!==null){do{var i={lane:e.lane,tag:e.tag,payload:e.payload,callback:null,next:null};u===null?n=u=i:u=u.next=i,e=e.next}while(e!==null);u===null?n=u=l:u=u.next=l}else n=u=l;e={baseState:a.baseState,firstBaseUpdate:n,lastBaseUpdate:u,shared:a.shared,callbacks:a.callbacks},t.updateQueue=e;return}t=e.lastBaseUpdate,t===null?e.firstBaseUpdate=l:t.next=l,e.lastBaseUpdate=l}var mf=!1;function Mn(){if(mf){var t=xa;if(t!==null)throw t}}function _n(t,l,e,a){mf=!1;var n=t.updateQueue;ae=!1;var u=n.firstBaseUpdate,i=n.lastBaseUpdate,c=n.shared.pending;if(c!==null){n.shared.pending=null;var f=c,s=f.next;f.next=null,i===null?u=s:i.next=s,i=f;var g=t.alternate;g!==null&&(g=g.updateQueue,c=g.lastBaseUpdate,c!==i&&(c===null?g.firstBaseUpdate=s:c.next=s,g.lastBaseUpdate=f))}if(u!==null){var v=n.baseState;i=0,g=s=f=null,c=u;do{var d=c.lane&-536870913,y=d!==c.lane;if(y?(J&d)===d:(a&d)===d){d!==0&&d===ba&&(mf=!0),g!==null&&(g=g.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});t:{var p=t,D=c;d=l;var O=e;switch(D.tag){case 1:if(p=D.payload,typeof p=="function"){v=p.call(O,v,d);break t}v=p;break t;case 3:p.flags=p.flags&-65537|128;case 0:if(p=D.payload,d=typeof p=="function"?p.call(O,v,d):p,d==null)break t;v=ct({},v,d);break t;case 2:ae=!0}}d=c.callback,d!==null&&(t.flags|=64,y&&(t.flags|=8192),y=n.callbacks,y===null?n.callbacks=[d]:y.push(d))}else y={lane:d,tag:c.tag,payload:c.payload,callback:c.callback,next:null},g===null?(s=g=y,f=v):g=g.next=y,i|=d;if(c=c.next,c===null){if(c=n.shared.pending,c===null)break;y=c,c=y.next,y.next=null,n.lastBaseUpdate=y,n.shared.pending=null}}while(!0);g===null&&(f=v),n.baseState=f,n.firstBaseUpdate=s,n.lastBaseUpdate=g,u===null&&(n.shared.lanes=0),oe|=i,t.lanes=i,t.memoizedState=v}}function Xr(t,l){if(typeof t!="function")throw Error(x(191,t));t.call(l)}function Qr(t,l){var e=t.callbacks;if(e!==null)for(t.callbacks=null,t=0;t<e.length;t++)Xr(e[t],l)}var za=yl(null),ei=yl(0);function Vr(t,l){t=Gl,nt(ei,t),nt(za,l),Gl=t|l.baseLanes}function hf(){nt(ei,Gl),nt(za,za.current)}function yf(){Gl=ei.current,Tt(za),Tt(ei)}var Wt=yl(null),fl=null;function ie(t){var l=t.alternate;nt(ht,ht.current&1),nt(Wt,t),fl===null&&(l===null||za.current!==null||l.memoizedState!==null)&&(fl=t)}function gf(t){nt(ht,ht.current),nt(Wt,t),fl===null&&(fl=t)}function Zr(t){t.tag===22?(nt(ht,ht.current),nt(Wt,t),fl===null&&(fl=t)):ce()}function ce(){nt(ht,ht.current),nt(Wt,Wt.current)}function $t(t){Tt(Wt),fl===t&&(fl=null),Tt(ht)}var ht=yl(0);function ai(t){for(var l=t;l!==null;){if(l.tag===13){var e=l.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||Es(e)||Ts(e)))return l}else if(l.tag===19&&(l.memoizedProps.revealOrder==="forwards"||l.memoizedProps.revealOrder==="backwards"||l.memoizedProps.revealOrder==="unstable_legacy-backwards"||l.memoizedProps.revealOrder==="together")){if(l.flags&128)return l}else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return null;l=l.return}l.sibling.return=l.return,l=l.sibling}return null}var Ul=0,V=null,lt=null,vt=null,ni=!1,Aa=!1,qe=!1,ui=0,Dn=0,Ma=null,My=0;function dt(){throw Error(x(321))}function vf(t,l){if(l===null)return!1;for(var e=0;e<l.length&&e<t.length;e++)if(!kt(t[e],l[e]))return!1;return!0}function Sf(t,l,e,a,n,u){return Ul=u,V=l,l.memoizedState=null,l.updateQueue=null,l.lanes=0,Y.H=t===null||t.memoizedState===null?Md:Rf,qe=!1,u=e(a,n),qe=!1,Aa&&(u=Kr(l,e,a,n)),Lr(t),u}function Lr(t){Y.H=Un;var l=lt!==null&&lt.next!==null;if(Ul=0,vt=lt=V=null,ni=!1,Dn=0,Ma=null,l)throw Error(x(300));t===null||St||(t=t.dependencies,t!==null&&Fu(t)&&(St=!0))}function Kr(t,l,e,a){V=t;var n=0;do{if(Aa&&(Ma=null),Dn=0,Aa=!1,25<=n)throw Error(x(301));if(n+=1,vt=lt=null,t.updateQueue!=null){var u=t.updateQueue;u.lastEffect=null,u.events=null,u.stores=null,u.memoCache!=null&&(u.memoCache.index=0)}Y.H=_d,u=l(e,a)}while(Aa);return u}function _y(){var t=Y.H,l=t.useState()[0];return l=typeof l.then=="function"?Cn(l):l,t=t.useState()[0],(lt!==null?lt.memoizedState:null)!==t&&(V.flags|=1024),l}function pf(){var t=ui!==0;return ui=0,t}function bf(t,l,e){l.updateQueue=t.updateQueue,l.flags&=-2053,t.lanes&=~e}function xf(t){if(ni){for(t=t.memoizedState;t!==null;){var l=t.queue;l!==null&&(l.pending=null),t=t.next}ni=!1}Ul=0,vt=lt=V=null,Aa=!1,Dn=ui=0,Ma=null}function Yt(){var t={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return vt===null?V.memoizedState=vt=t:vt=vt.next=t,vt}function yt(){if(lt===null){var t=V.alternate;t=t!==null?t.memoizedState:null}else t=lt.next;var l=vt===null?V.memoizedState:vt.next;if(l!==null)vt=l,lt=t;else{if(t===null)throw V.alternate===null?Error(x(467)):Error(x(310));lt=t,t={memoizedState:lt.memoizedState,baseState:lt.baseState,baseQueue:lt.baseQueue,queue:lt.queue,next:null},vt===null?V.memoizedState=vt=t:vt=vt.next=t}return vt}function ii(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Cn(t){var l=Dn;return Dn+=1,Ma===null&&(Ma=[]),t=Nr(Ma,t,l),l=V,(vt===null?l.memoizedState:vt.next)===null&&(l=l.alternate,Y.H=l===null||l.memoizedState===null?Md:Rf),t}function ci(t){if(t!==null&&typeof t=="object"){if(typeof t.then=="function")return Cn(t);if(t.$$typeof===Tl)return Ot(t)}throw Error(x(438,String(t)))}function Ef(t){var l=null,e=V.updateQueue;if(e!==null&&(l=e.memoCache),l==null){var a=V.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(l={data:a.data.map(function(n){return n.slice()}),index:0})))}if(l==null&&(l={data:[],index:0}),e===null&&(e=ii(),V.updateQueue=e),e.memoCache=l,e=l.data[l.index],e===void 0)for(e=l.data[l.index]=Array(t),a=0;a<t;a++)e[a]=dh;return l.index++,e}function Ol(t,l){return typeof l=="function"?l(t):l}function fi(t){var l=yt();return Tf(l,lt,t)}function Tf(t,l,e){var a=t.queue;if(a===null)throw Error(x(311));a.lastRenderedReducer=e;var n=t.baseQueue,u=a.pending;if(u!==null){if(n!==null){var i=n.next;n.next=u.next,u.next=i}l.baseQueue=n=u,a.pending=null}if(u=t.baseState,n===null)t.memoizedState=u;else{l=n.next;var c=i=null,f=null,s=l,g=!1;do{var v=s.lane&-536870913;if(v!==s.lane?(J&v)===v:(Ul&v)===v){var d=s.revertLane;if(d===0)f!==null&&(f=f.next={lane:0,revertLane:0,gesture:null,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null}),v===ba&&(g=!0);else if((Ul&d)===d){s=s.next,d===ba&&(g=!0);continue}else v={lane:0,revertLane:s.revertLane,gesture:null,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null},f===null?(c=f=v,i=u):f=f.next=v,V.lanes|=d,oe|=d;v=s.action,qe&&e(u,v),u=s.hasEagerState?s.eagerState:e(u,v)}else d={lane:v,revertLane:s.revertLane,gesture:s.gesture,action:s.action,hasEagerState:s.hasEagerState,eagerState:s.eagerState,next:null},f===null?(c=f=d,i=u):f=f.next=d,V.lanes|=v,oe|=v;s=s.next}while(s!==null&&s!==l);if(f===null?i=u:f.next=c,!kt(u,t.memoizedState)&&(St=!0,g&&(e=xa,e!==null)))throw e;t.memoizedState=u,t.baseState=i,t.baseQueue=f,a.lastRenderedState=u}return n===null&&(a.lanes=0),[t.memoizedState,a.dispatch]}function zf(t){var l=yt(),e=l.queue;if(e===null)throw Error(x(311));e.lastRenderedReducer=t;var a=e.dispatch,n=e.pending,u=l.memoizedState;if(n!==null){e.pending=null;var i=n=n.next;do u=t(u,i.action),i=i.next;while(i!==n);kt(u,l.memoizedState)||(St=!0),l.memoizedState=u,l.baseQueue===null&&(l.baseState=u),e.lastRenderedState=u}return[u,a]}function wr(t,l,e){var a=V,n=yt(),u=F;if(u){if(e===void 0)throw Error(x(407));e=e()}else e=l();var i=!kt((lt||n).memoizedState,e);if(i&&(n.memoizedState=e,St=!0),n=n.queue,_f(Fr.bind(null,a,n,t),[t]),n.getSnapshot!==l||i||vt!==null&&vt.memoizedState.tag&1){if(a.flags|=2048,_a(9,{destroy:void 0},kr.bind(null,a,n,e,l),null),at===null)throw Error(x(349));u||Ul&127||Jr(a,l,e)}return e}function Jr(t,l,e){t.flags|=16384,t={getSnapshot:l,value:e},l=V.updateQueue,l===null?(l=ii(),V.updateQueue=l,l.stores=[t]):(e=l.stores,e===null?l.stores=[t]:e.push(t))}function kr(t,l,e,a){l.value=e,l.getSnapshot=a,Wr(l)&&$r(t)}function Fr(t,l,e){return e(function(){Wr(l)&&$r(t)})}function Wr(t){var l=t.getSnapshot;t=t.value;try{var e=l();return!kt(t,e)}catch(a){return!0}}function $r(t){var l=Ce(t,2);l!==null&&Lt(l,t,2)}function Af(t){var l=Yt();if(typeof t=="function"){var e=t;if(t=e(),qe){Wl(!0);try{e()}finally{Wl(!1)}}}return l.memoizedState=l.baseState=t,l.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ol,lastRenderedState:t},l}function Ir(t,l,e,a){return t.baseState=e,Tf(t,lt,typeof a=="function"?a:Ol)}function Dy(t,l,e,a,n){if(ri(t))throw Error(x(485));if(t=l.action,t!==null){var u={payload:n,action:t,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(i){u.listeners.push(i)}};Y.T!==null?e(!0):u.isTransition=!1,a(u),e=l.pending,e===null?(u.next=l.pending=u,Pr(l,u)):(u.next=e.next,l.pending=e.next=u)}}function Pr(t,l){var e=l.action,a=l.payload,n=t.state;if(l.isTransition){var u=Y.T,i={};Y.T=i;try{var c=e(n,a),f=Y.S;f!==null&&f(i,c),td(t,l,c)}catch(s){Mf(t,l,s)}finally{u!==null&&i.types!==null&&(u.types=i.types),Y.T=u}}else try{u=e(n,a),td(t,l,u)}catch(s){Mf(t,l,s)}}function td(t,l,e){e!==null&&typeof e=="object"&&typeof e.then=="function"?e.then(function(a){ld(t,l,a)},function(a){return Mf(t,l,a)}):ld(t,l,e)}function ld(t,l,e){l.status="fulfilled",l.value=e,ed(l),t.state=e,l=t.pending,l!==null&&(e=l.next,e===l?t.pending=null:(e=e.next,l.next=e,Pr(t,e)))}function Mf(t,l,e){var a=t.pending;if(t.pending=null,a!==null){a=a.next;do l.status="rejected",l.reason=e,ed(l),l=l.next;while(l!==a)}t.action=null}function ed(t){t=t.listeners;for(var l=0;l<t.length;l++)(0,t[l])()}function ad(t,l){return l}function nd(t,l){if(F){var e=at.formState;if(e!==null){t:{var a=V;if(F){if(ft){l:{for(var n=ft,u=cl;n.nodeType!==8;){if(!u){n=null;break l}if(n=sl(n.nextSibling),n===null){n=null;break l}}u=n.data,n=u==="F!"||u==="F"?n:null}if(n){ft=sl(n.nextSibling),a=n.data==="F!";break t}}le(a)}a=!1}a&&(l=e[0])}}return e=Yt(),e.memoizedState=e.baseState=l,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ad,lastRenderedState:l},e.queue=a,e=Td.bind(null,V,a),a.dispatch=e,a=Af(!1),u=Of.bind(null,V,!1,a.queue),a=Yt(),n={state:l,dispatch:null,action:t,pending:null},a.queue=n,e=Dy.bind(null,V,n,u,e),n.dispatch=e,a.memoizedState=t,[l,e,!1]}function ud(t){var l=yt();return id(l,lt,t)}function id(t,l,e){if(l=Tf(t,l,ad)[0],t=fi(Ol)[0],typeof l=="object"&&l!==null&&typeof l.then=="function")try{var a=Cn(l)}catch(i){throw i===Ea?Iu:i}else a=l;l=yt();var n=l.queue,u=n.dispatch;return e!==l.memoizedState&&(V.flags|=2048,_a(9,{destroy:void 0},Cy.bind(null,n,e),null)),[a,u,t]}function Cy(t,l){t.action=l}function cd(t){var l=yt(),e=lt;if(e!==null)return id(l,e,t);yt(),l=l.memoizedState,e=yt();var a=e.queue.dispatch;return e.memoizedState=t,[l,a,!1]}function _a(t,l,e,a){return t={tag:t,create:e,deps:a,inst:l,next:null},l=V.updateQueue,l===null&&(l=ii(),V.updateQueue=l),e=l.lastEffect,e===null?l.lastEffect=t.next=t:(a=e.next,e.next=t,t.next=a,l.lastEffect=t),t}function fd(){return yt().memoizedState}function si(t,l,e,a){var n=Yt();V.flags|=t,n.memoizedState=_a(1|l,{destroy:void 0},e,a===void 0?null:a)}function oi(t,l,e,a){var n=yt();a=a===void 0?null:a;var u=n.memoizedState.inst;lt!==null&&a!==null&&vf(a,lt.memoizedState.deps)?n.memoizedState=_a(l,u,e,a):(V.flags|=t,n.memoizedState=_a(1|l,u,e,a))}function sd(t,l){si(8390656,8,t,l)}function _f(t,l){oi(2048,8,t,l)}function jy(t){V.flags|=4;var l=V.updateQueue;if(l===null)l=ii(),V.updateQueue=l,l.events=[t];else{var e=l.events;e===null?l.events=[t]:e.push(t)}}function od(t){var l=yt().memoizedState;return jy({ref:l,nextImpl:t}),function(){if($&2)throw Error(x(440));return l.impl.apply(void 0,arguments)}}function rd(t,l){return oi(4,2,t,l)}function dd(t,l){return oi(4,4,t,l)}function md(t,l){if(typeof l=="function"){t=t();var e=l(t);return function(){typeof e=="function"?e():l(null)}}if(l!=null)return t=t(),l.current=t,function(){l.current=null}}function hd(t,l,e){e=e!=null?e.concat([t]):null,oi(4,4,md.bind(null,l,t),e)}function Df(){}function yd(t,l){var e=yt();l=l===void 0?null:l;var a=e.memoizedState;return l!==null&&vf(l,a[1])?a[0]:(e.memoizedState=[t,l],t)}function gd(t,l){var e=yt();l=l===void 0?null:l;var a=e.memoizedState;if(l!==null&&vf(l,a[1]))return a[0];if(a=t(),qe){Wl(!0);try{t()}finally{Wl(!1)}}return e.memoizedState=[a,l],a}function Cf(t,l,e){return e===void 0||Ul&1073741824&&!(J&261930)?t.memoizedState=l:(t.memoizedState=e,t=v0(),V.lanes|=t,oe|=t,e)}function vd(t,l,e,a){return kt(e,l)?e:za.current!==null?(t=Cf(t,e,a),kt(t,l)||(St=!0),t):!(Ul&42)||Ul&1073741824&&!(J&261930)?(St=!0,t.memoizedState=e):(t=v0(),V.lanes|=t,oe|=t,l)}function Sd(t,l,e,a,n){var u=W.p;W.p=u!==0&&8>u?u:8;var i=Y.T,c={};Y.T=c,Of(t,!1,l,e);try{var f=n(),s=Y.S;if(s!==null&&s(c,f),f!==null&&typeof f=="object"&&typeof f.then=="function"){var g=Ay(f,a);jn(t,l,g,tl(t))}else jn(t,l,a,tl(t))}catch(v){jn(t,l,{then:function(){},status:"rejected",reason:v},tl())}finally{W.p=u,i!==null&&c.types!==null&&(i.types=c.types),Y.T=i}}function Uy(){}function jf(t,l,e,a){if(t.tag!==5)throw Error(x(476));var n=pd(t).queue;Sd(t,n,l,Ee,e===null?Uy:function(){return bd(t),e(a)})}function pd(t){var l=t.memoizedState;if(l!==null)return l;l={memoizedState:Ee,baseState:Ee,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ol,lastRenderedState:Ee},next:null};var e={};return l.next={memoizedState:e,baseState:e,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ol,lastRenderedState:e},next:null},t.memoizedState=l,t=t.alternate,t!==null&&(t.memoizedState=l),l}function bd(t){var l=pd(t);l.next===null&&(l=t.alternate.memoizedState),jn(t,l.next.queue,{},tl())}function Uf(){return Ot(Jn)}function xd(){return yt().memoizedState}function Ed(){return yt().memoizedState}function Oy(t){for(var l=t.return;l!==null;){switch(l.tag){case 24:case 3:var e=tl();t=ne(e);var a=ue(l,t,e);a!==null&&(Lt(a,l,e),An(a,l,e)),l={cache:uf()},t.payload=l;return}l=l.return}}function Ry(t,l,e){var a=tl();e={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null},ri(t)?zd(l,e):(e=kc(t,l,e,a),e!==null&&(Lt(e,t,a),Ad(e,l,a)))}function Td(t,l,e){var a=tl();jn(t,l,e,a)}function jn(t,l,e,a){var n={lane:a,revertLane:0,gesture:null,action:e,hasEagerState:!1,eagerState:null,next:null};if(ri(t))zd(l,n);else{var u=t.alternate;if(t.lanes===0&&(u===null||u.lanes===0)&&(u=l.lastRenderedReducer,u!==null))try{var i=l.lastRenderedState,c=u(i,e);if(n.hasEagerState=!0,n.eagerState=c,kt(c,i))return Ku(t,l,n,0),at===null&&Lu(),!1}catch(f){}finally{}if(e=kc(t,l,n,a),e!==null)return Lt(e,t,a),Ad(e,l,a),!0}return!1}function Of(t,l,e,a){if(a={lane:2,revertLane:os(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},ri(t)){if(l)throw Error(x(479))}else l=kc(t,e,a,2),l!==null&&Lt(l,t,2)}function ri(t){var l=t.alternate;return t===V||l!==null&&l===V}function zd(t,l){Aa=ni=!0;var e=t.pending;e===null?l.next=l:(l.next=e.next,e.next=l),t.pending=l}function Ad(t,l,e){if(e&4194048){var a=l.lanes;a&=t.pendingLanes,e|=a,l.lanes=e,jo(t,e)}}var Un={readContext:Ot,use:ci,useCallback:dt,useContext:dt,useEffect:dt,useImperativeHandle:dt,useLayoutEffect:dt,useInsertionEffect:dt,useMemo:dt,useReducer:dt,useRef:dt,useState:dt,useDebugValue:dt,useDeferredValue:dt,useTransition:dt,useSyncExternalStore:dt,useId:dt,useHostTransitionStatus:dt,useFormState:dt,useActionState:dt,useOptimistic:dt,useMemoCache:dt,useCacheRefresh:dt};Un.useEffectEvent=dt;var Md={readContext:Ot,use:ci,useCallback:function(t,l){return Yt().memoizedState=[t,l===void 0?null:l],t},useContext:Ot,useEffect:sd,useImperativeHandle:function(t,l,e){e=e!=null?e.concat([t]):null,si(4194308,4,md.bind(null,l,t),e)},useLayoutEffect:function(t,l){return si(4194308,4,t,l)},useInsertionEffect:function(t,l){si(4,2,t,l)},useMemo:function(t,l){var e=Yt();l=l===void 0?null:l;var a=t();if(qe){Wl(!0);try{t()}finally{Wl(!1)}}return e.memoizedState=[a,l],a},useReducer:function(t,l,e){var a=Yt();if(e!==void 0){var n=e(l);if(qe){Wl(!0);try{e(l)}finally{Wl(!1)}}}else n=l;return a.memoizedState=a.baseState=n,t={pending:null,lanes:0,dispatch:null,lastRenderedReducer:t,lastRenderedState:n},a.queue=t,t=t.dispatch=Ry.bind(null,V,t),[a.memoizedState,t]},useRef:function(t){var l=Yt();return t={current:t},l.memoizedState=t},useState:function(t){t=Af(t);var l=t.queue,e=Td.bind(null,V,l);return l.dispatch=e,[t.memoizedState,e]},useDebugValue:Df,useDeferredValue:function(t,l){var e=Yt();return Cf(e,t,l)},useTransition:function(){var t=Af(!1);return t=Sd.bind(null,V,t.queue,!0,!1),Yt().memoizedState=t,[!1,t]},useSyncExternalStore:function(t,l,e){var a=V,n=Yt();if(F){if(e===void 0)throw Error(x(407));e=e()}else{if(e=l(),at===null)throw Error(x(349));J&127||Jr(a,l,e)}n.memoizedState=e;var u={value:e,getSnapshot:l};return n.queue=u,sd(Fr.bind(null,a,u,t),[t]),a.flags|=2048,_a(9,{destroy:void 0},kr.bind(null,a,u,e,l),null),e},useId:function(){var t=Yt(),l=at.identifierPrefix;if(F){var e=Sl,a=vl;e=(a&~(1<<32-Jt(a)-1)).toString(32)+e,l="_"+l+"R_"+e,e=ui++,0<e&&(l+="H"+e.toString(32)),l+="_"}else e=My++,l="_"+l+"r_"+e.toString(32)+"_";return t.memoizedState=l},useHostTransitionStatus:Uf,useFormState:nd,useActionState:nd,useOptimistic:function(t){var l=Yt();l.memoizedState=l.baseState=t;var e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return l.queue=e,l=Of.bind(null,V,!0,e),e.dispatch=l,[t,l]},useMemoCache:Ef,useCacheRefresh:function(){return Yt().memoizedState=Oy.bind(null,V)},useEffectEvent:function(t){var l=Yt(),e={impl:t};return l.memoizedState=e,function(){if($&2)throw Error(x(440));return e.impl.apply(void 0,arguments)}}},Rf={readContext:Ot,use:ci,useCallback:yd,useContext:Ot,useEffect:_f,useImperativeHandle:hd,useInsertionEffect:rd,useLayoutEffect:dd,useMemo:gd,useReducer:fi,useRef:fd,useState:function(){return fi(Ol)},useDebugValue:Df,useDeferredValue:function(t,l){var e=yt();return vd(e,lt.memoizedState,t,l)},useTransition:function(){var t=fi(Ol)[0],l=yt().memoizedState;return[typeof t=="boolean"?t:Cn(t),l]},useSyncExternalStore:wr,useId:xd,useHostTransitionStatus:Uf,useFormState:ud,useActionState:ud,useOptimistic:function(t,l){var e=yt();return Ir(e,lt,t,l)},useMemoCache:Ef,useCacheRefresh:Ed};Rf.useEffectEvent=od;var _d={readContext:Ot,use:ci,useCallback:yd,useContext:Ot,useEffect:_f,useImperativeHandle:hd,useInsertionEffect:rd,useLayoutEffect:dd,useMemo:gd,useReducer:zf,useRef:fd,useState:function(){return zf(Ol)},useDebugValue:Df,useDeferredValue:function(t,l){var e=yt();return lt===null?Cf(e,t,l):vd(e,lt.memoizedState,t,l)},useTransition:function(){var t=zf(Ol)[0],l=yt().memoizedState;return[typeof t=="boolean"?t:Cn(t),l]},useSyncExternalStore:wr,useId:xd,useHostTransitionStatus:Uf,useFormState:cd,useActionState:cd,useOptimistic:function(t,l){var e=yt();return lt!==null?Ir(e,lt,t,l):(e.baseState=t,[t,e.queue.dispatch])},useMemoCache:Ef,useCacheRefresh:Ed};_d.useEffectEvent=od;function Hf(t,l,e,a){l=t.memoizedState,e=e(a,l),e=e==null?l:ct({},l,e),t.memoizedState=e,t.lanes===0&&(t.updateQueue.baseState=e)}var Nf={enqueueSetState:function(t,l,e){t=t._reactInternals;var a=tl(),n=ne(a);n.payload=l,e!=null&&(n.callback=e),l=ue(t,n,a),l!==null&&(Lt(l,t,a),An(l,t,a))},enqueueReplaceState:function(t,l,e){t=t._reactInternals;var a=tl(),n=ne(a);n.tag=1,n.payload=l,e!=null&&(n.callback=e),l=ue(t,n,a),l!==null&&(Lt(l,t,a),An(l,t,a))},enqueueForceUpdate:function(t,l){t=t._reactInternals;var e=tl(),a=ne(e);a.tag=2,l!=null&&(a.callback=l),l=ue(t,a,e),l!==null&&(Lt(l,t,e),An(l,t,e))}};function Dd(t,l,e,a,n,u,i){return t=t.stateNode,typeof t.shouldComponentUpdate=="function"?t.shouldComponentUpdate(a,u,i):l.prototype&&l.prototype.isPureReactComponent?!vn(e,a)||!vn(n,u):!0}function Cd(t,l,e,a){t=l.state,typeof l.componentWillReceiveProps=="function"&&l.componentWillReceiveProps(e,a),typeof l.UNSAFE_componentWillReceiveProps=="function"&&l.UNSAFE_componentWillReceiveProps(e,a),l.state!==t&&Nf.enqueueReplaceState(l,l.state,null)}function Ge(t,l){var e=l;if("ref"in l){e={};for(var a in l)a!=="ref"&&(e[a]=l[a])}if(t=t.defaultProps){e===l&&(e=ct({},e));for(var n in t)e[n]===void 0&&(e[n]=t[n])}return e}function jd(t){Zu(t)}function Ud(t){console.error(t)}function Od(t){Zu(t)}function di(t,l){try{var e=t.onUncaughtError;e(l.value,{componentStack:l.stack})}catch(a){setTimeout(function(){throw a})}}function Rd(t,l,e){try{var a=t.onCaughtError;a(e.value,{componentStack:e.stack,errorBoundary:l.tag===1?l.stateNode:null})}catch(n){setTimeout(function(){throw n})}}function Bf(t,l,e){return e=ne(e),e.tag=3,e.payload={element:null},e.callback=function(){di(t,l)},e}function Hd(t){return t=ne(t),t.tag=3,t}function Nd(t,l,e,a){var n=e.type.getDerivedStateFromError;if(typeof n=="function"){var u=a.value;t.payload=function(){return n(u)},t.callback=function(){Rd(l,e,a)}}var i=e.stateNode;i!==null&&typeof i.componentDidCatch=="function"&&(t.callback=function(){Rd(l,e,a),typeof n!="function"&&(re===null?re=new Set([this]):re.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function Hy(t,l,e,a,n){if(e.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(l=e.alternate,l!==null&&pa(l,e,n,!0),e=Wt.current,e!==null){switch(e.tag){case 31:case 13:return fl===null?zi():e.alternate===null&&mt===0&&(mt=3),e.flags&=-257,e.flags|=65536,e.lanes=n,a===Pu?e.flags|=16384:(l=e.updateQueue,l===null?e.updateQueue=new Set([a]):l.add(a),cs(t,a,n)),!1;case 22:return e.flags|=65536,a===Pu?e.flags|=16384:(l=e.updateQueue,l===null?(l={transitions:null,markerInstances:null,retryQueue:new Set([a])},e.updateQueue=l):(e=l.retryQueue,e===null?l.retryQueue=new Set([a]):e.add(a)),cs(t,a,n)),!1}throw Error(x(435,e.tag))}return cs(t,a,n),zi(),!1}if(F)return l=Wt.current,l!==null?(!(l.flags&65536)&&(l.flags|=256),l.flags|=65536,l.lanes=n,a!==tf&&(t=Error(x(422),{cause:a}),bn(nl(t,e)))):(a!==tf&&(l=Error(x(423),{cause:a}),bn(nl(l,e))),t=t.current.alternate,t.flags|=65536,n&=-n,t.lanes|=n,a=nl(a,e),n=Bf(t.stateNode,a,n),df(t,n),mt!==4&&(mt=2)),!1;var u=Error(x(520),{cause:a});if(u=nl(u,e),Gn===null?Gn=[u]:Gn.push(u),mt!==4&&(mt=2),l===null)return!0;a=nl(a,e),e=l;do{switch(e.tag){case 3:return e.flags|=65536,t=n&-n,e.lanes|=t,t=Bf(e.stateNode,a,t),df(e,t),!1;case 1:if(l=e.type,u=e.stateNode,(e.flags&128)===0&&(typeof l.getDerivedStateFromError=="function"||u!==null&&typeof u.componentDidCatch=="function"&&(re===null||!re.has(u))))return e.flags|=65536,n&=-n,e.lanes|=n,n=Hd(n),Nd(n,t,e,a),df(e,n),!1}e=e.return}while(e!==null);return!1}var Yf=Error(x(461)),St=!1;function Rt(t,l,e,a){l.child=t===null?Gr(l,null,e,a):Ye(l,t.child,e,a)}function Bd(t,l,e,a,n){e=e.render;var u=l.ref;if("ref"in a){var i={};for(var c in a)c!=="ref"&&(i[c]=a[c])}else i=a;return Re(l),a=Sf(t,l,e,i,u,n),c=pf(),t!==null&&!St?(bf(t,l,n),Rl(t,l,n)):(F&&c&&Ic(l),l.flags|=1,Rt(t,l,a,n),l.child)}function Yd(t,l,e,a,n){if(t===null){var u=e.type;return typeof u=="function"&&!Fc(u)&&u.defaultProps===void 0&&e.compare===null?(l.tag=15,l.type=u,qd(t,l,u,a,n)):(t=Ju(e.type,null,a,l,l.mode,n),t.ref=l.ref,t.return=l,l.child=t)}if(u=t.child,!Kf(t,n)){var i=u.memoizedProps;if(e=e.compare,e=e!==null?e:vn,e(i,a)&&t.ref===l.ref)return Rl(t,l,n)}return l.flags|=1,t=_l(u,a),t.ref=l.ref,t.return=l,l.child=t}function qd(t,l,e,a,n){if(t!==null){var u=t.memoizedProps;if(vn(u,a)&&t.ref===l.ref)if(St=!1,l.pendingProps=a=u,Kf(t,n))t.flags&131072&&(St=!0);else return l.lanes=t.lanes,Rl(t,l,n)}return qf(t,l,e,a,n)}function Gd(t,l,e,a){var n=a.children,u=t!==null?t.memoizedState:null;if(t===null&&l.stateNode===null&&(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if(l.flags&128){if(u=u!==null?u.baseLanes|e:e,t!==null){for(a=l.child=t.child,n=0;a!==null;)n=n|a.lanes|a.childLanes,a=a.sibling;a=n&~u}else a=0,l.child=null;return Xd(t,l,u,e,a)}if(e&536870912)l.memoizedState={baseLanes:0,cachePool:null},t!==null&&$u(l,u!==null?u.cachePool:null),u!==null?Vr(l,u):hf(),Zr(l);else return a=l.lanes=536870912,Xd(t,l,u!==null?u.baseLanes|e:e,e,a)}else u!==null?($u(l,u.cachePool),Vr(l,u),ce(),l.memoizedState=null):(t!==null&&$u(l,null),hf(),ce());return Rt(t,l,n,e),l.child}function On(t,l){return t!==null&&t.tag===22||l.stateNode!==null||(l.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),l.sibling}function Xd(t,l,e,a,n){var u=ff();return u=u===null?null:{parent:gt._currentValue,pool:u},l.memoizedState={baseLanes:e,cachePool:u},t!==null&&$u(l,null),hf(),Zr(l),t!==null&&pa(t,l,a,!0),l.childLanes=n,null}function mi(t,l){return l=yi({mode:l.mode,children:l.children},t.mode),l.ref=t.ref,t.child=l,l.return=t,l}function Qd(t,l,e){return Ye(l,t.child,null,e),t=mi(l,l.pendingProps),t.flags|=2,$t(l),l.memoizedState=null,t}function Ny(t,l,e){var a=l.pendingProps,n=(l.flags&128)!==0;if(l.flags&=-129,t===null){if(F){if(a.mode==="hidden")return t=mi(l,a),l.lanes=536870912,On(null,t);if(gf(l),(t=ft)?(t=P0(t,cl),t=t!==null&&t.data==="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:Pl!==null?{id:vl,overflow:Sl}:null,retryLane:536870912,hydrationErrors:null},e=zr(t),e.return=l,l.child=e,Ut=l,ft=null)):t=null,t===null)throw le(l);return l.lanes=536870912,null}return mi(l,a)}var u=t.memoizedState;if(u!==null){var i=u.dehydrated;if(gf(l),n)if(l.flags&256)l.flags&=-257,l=Qd(t,l,e);else if(l.memoizedState!==null)l.child=t.child,l.flags|=128,l=null;else throw Error(x(558));else if(St||pa(t,l,e,!1),n=(e&t.childLanes)!==0,St||n){if(a=at,a!==null&&(i=Uo(a,e),i!==0&&i!==u.retryLane))throw u.retryLane=i,Ce(t,i),Lt(a,t,i),Yf;zi(),l=Qd(t,l,e)}else t=u.treeContext,ft=sl(i.nextSibling),Ut=l,F=!0,te=null,cl=!1,t!==null&&_r(l,t),l=mi(l,a),l.flags|=4096;return l}return t=_l(t.child,{mode:a.mode,children:a.children}),t.ref=l.ref,l.child=t,t.return=l,t}function hi(t,l){var e=l.ref;if(e===null)t!==null&&t.ref!==null&&(l.flags|=4194816);else{if(typeof e!="function"&&typeof e!="object")throw Error(x(284));(t===null||t.ref!==e)&&(l.flags|=4194816)}}function qf(t,l,e,a,n){return Re(l),e=Sf(t,l,e,a,void 0,n),a=pf(),t!==null&&!St?(bf(t,l,n),Rl(t,l,n)):(F&&a&&Ic(l),l.flags|=1,Rt(t,l,e,n),l.child)}function Vd(t,l,e,a,n,u){return Re(l),l.updateQueue=null,e=Kr(l,a,e,n),Lr(t),a=pf(),t!==null&&!St?(bf(t,l,u),Rl(t,l,u)):(F&&a&&Ic(l),l.flags|=1,Rt(t,l,e,u),l.child)}function Zd(t,l,e,a,n){if(Re(l),l.stateNode===null){var u=ya,i=e.contextType;typeof i=="object"&&i!==null&&(u=Ot(i)),u=new e(a,u),l.memoizedState=u.state!==null&&u.state!==void 0?u.state:null,u.updater=Nf,l.stateNode=u,u._reactInternals=l,u=l.stateNode,u.props=a,u.state=l.memoizedState,u.refs={},of(l),i=e.contextType,u.context=typeof i=="object"&&i!==null?Ot(i):ya,u.state=l.memoizedState,i=e.getDerivedStateFromProps,typeof i=="function"&&(Hf(l,e,i,a),u.state=l.memoizedState),typeof e.getDerivedStateFromProps=="function"||typeof u.getSnapshotBeforeUpdate=="function"||typeof u.UNSAFE_componentWillMount!="function"&&typeof u.componentWillMount!="function"||(i=u.state,typeof u.componentWillMount=="function"&&u.componentWillMount(),typeof u.UNSAFE_componentWillMount=="function"&&u.UNSAFE_componentWillMount(),i!==u.state&&Nf.enqueueReplaceState(u,u.state,null),_n(l,a,u,n),Mn(),u.state=l.memoizedState),typeof u.componentDidMount=="function"&&(l.flags|=4194308),a=!0}else if(t===null){u=l.stateNode;var c=l.memoizedProps,f=Ge(e,c);u.props=f;var s=u.context,g=e.contextType;i=ya,typeof g=="object"&&g!==null&&(i=Ot(g));var v=e.getDerivedStateFromProps;g=typeof v=="function"||typeof u.getSnapshotBeforeUpdate=="function",c=l.pendingProps!==c,g||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(c||s!==i)&&Cd(l,u,a,i),ae=!1;var d=l.memoizedState;u.state=d,_n(l,a,u,n),Mn(),s=l.memoizedState,c||d!==s||ae?(typeof v=="function"&&(Hf(l,e,v,a),s=l.memoizedState),(f=ae||Dd(l,e,f,a,d,s,i))?(g||typeof u.UNSAFE_componentWillMount!="function"&&typeof u.componentWillMount!="function"||(typeof u.componentWillMount=="function"&&u.componentWillMount(),typeof u.UNSAFE_componentWillMount=="function"&&u.UNSAFE_componentWillMount()),typeof u.componentDidMount=="function"&&(l.flags|=4194308)):(typeof u.componentDidMount=="function"&&(l.flags|=4194308),l.memoizedProps=a,l.memoizedState=s),u.props=a,u.state=s,u.context=i,a=f):(typeof u.componentDidMount=="function"&&(l.flags|=4194308),a=!1)}else{u=l.stateNode,rf(t,l),i=l.memoizedProps,g=Ge(e,i),u.props=g,v=l.pendingProps,d=u.context,s=e.contextType,f=ya,typeof s=="object"&&s!==null&&(f=Ot(s)),c=e.getDerivedStateFromProps,(s=typeof c=="function"||typeof u.getSnapshotBeforeUpdate=="function")||typeof u.UNSAFE_componentWillReceiveProps!="function"&&typeof u.componentWillReceiveProps!="function"||(i!==v||d!==f)&&Cd(l,u,a,f),ae=!1,d=l.memoizedState,u.state=d,_n(l,a,u,n),Mn();var y=l.memoizedState;i!==v||d!==y||ae||t!==null&&t.dependencies!==null&&Fu(t.dependencies)?(typeof c=="function"&&(Hf(l,e,c,a),y=l.memoizedState),(g=ae||Dd(l,e,g,a,d,y,f)||t!==null&&t.dependencies!==null&&Fu(t.dependencies))?(s||typeof u.UNSAFE_componentWillUpdate!="function"&&typeof u.componentWillUpdate!="function"||(typeof u.componentWillUpdate=="function"&&u.componentWillUpdate(a,y,f),typeof u.UNSAFE_componentWillUpdate=="function"&&u.UNSAFE_componentWillUpdate(a,y,f)),typeof u.componentDidUpdate=="function"&&(l.flags|=4),typeof u.getSnapshotBeforeUpdate=="function"&&(l.flags|=1024)):(typeof u.componentDidUpdate!="function"||i===t.memoizedProps&&d===t.memoizedState||(l.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&d===t.memoizedState||(l.flags|=1024),l.memoizedProps=a,l.memoizedState=y),u.props=a,u.state=y,u.context=f,a=g):(typeof u.componentDidUpdate!="function"||i===t.memoizedProps&&d===t.memoizedState||(l.flags|=4),typeof u.getSnapshotBeforeUpdate!="function"||i===t.memoizedProps&&d===t.memoizedState||(l.flags|=1024),a=!1)}return u=a,hi(t,l),a=(l.flags&128)!==0,u||a?(u=l.stateNode,e=a&&typeof e.getDerivedStateFromError!="function"?null:u.render(),l.flags|=1,t!==null&&a?(l.child=Ye(l,t.child,null,n),l.child=Ye(l,null,e,n)):Rt(t,l,e,n),l.memoizedState=u.state,t=l.child):t=Rl(t,l,n),t}function Ld(t,l,e,a){return Ue(),l.flags|=256,Rt(t,l,e,a),l.child}var Gf={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Xf(t){return{baseLanes:t,cachePool:Rr()}}function Qf(t,l,e){return t=t!==null?t.childLanes&~e:0,l&&(t|=Pt),t}function Kd(t,l,e){var a=l.pendingProps,n=!1,u=(l.flags&128)!==0,i;if((i=u)||(i=t!==null&&t.memoizedState===null?!1:(ht.current&2)!==0),i&&(n=!0,l.flags&=-129),i=(l.flags&32)!==0,l.flags&=-33,t===null){if(F){if(n?ie(l):ce(),(t=ft)?(t=P0(t,cl),t=t!==null&&t.data!=="&"?t:null,t!==null&&(l.memoizedState={dehydrated:t,treeContext:Pl!==null?{id:vl,overflow:Sl}:null,retryLane:536870912,hydrationErrors:null},e=zr(t),e.return=l,l.child=e,Ut=l,ft=null)):t=null,t===null)throw le(l);return Ts(t)?l.lanes=32:l.lanes=536870912,null}var c=a.children;return a=a.fallback,n?(ce(),n=l.mode,c=yi({mode:"hidden",children:c},n),a=je(a,n,e,null),c.return=l,a.return=l,c.sibling=a,l.child=c,a=l.child,a.memoizedState=Xf(e),a.childLanes=Qf(t,i,e),l.memoizedState=Gf,On(null,a)):(ie(l),Vf(l,c))}var f=t.memoizedState;if(f!==null&&(c=f.dehydrated,c!==null)){if(u)l.flags&256?(ie(l),l.flags&=-257,l=Zf(t,l,e)):l.memoizedState!==null?(ce(),l.child=t.child,l.flags|=128,l=null):(ce(),c=a.fallback,n=l.mode,a=yi({mode:"visible",children:a.children},n),c=je(c,n,e,null),c.flags|=2,a.return=l,c.return=l,a.sibling=c,l.child=a,Ye(l,t.child,null,e),a=l.child,a.memoizedState=Xf(e),a.childLanes=Qf(t,i,e),l.memoizedState=Gf,l=On(null,a));else if(ie(l),Ts(c)){if(i=c.nextSibling&&c.nextSibling.dataset,i)var s=i.dgst;i=s,a=Error(x(419)),a.stack="",a.digest=i,bn({value:a,source:null,stack:null}),l=Zf(t,l,e)}else if(St||pa(t,l,e,!1),i=(e&t.childLanes)!==0,St||i){if(i=at,i!==null&&(a=Uo(i,e),a!==0&&a!==f.retryLane))throw f.retryLane=a,Ce(t,a),Lt(i,t,a),Yf;Es(c)||zi(),l=Zf(t,l,e)}else Es(c)?(l.flags|=192,l.child=t.child,l=null):(t=f.treeContext,ft=sl(c.nextSibling),Ut=l,F=!0,te=null,cl=!1,t!==null&&_r(l,t),l=Vf(l,a.children),l.flags|=4096);return l}return n?(ce(),c=a.fallback,n=l.mode,f=t.child,s=f.sibling,a=_l(f,{mode:"hidden",children:a.children}),a.subtreeFlags=f.subtreeFlags&65011712,s!==null?c=_l(s,c):(c=je(c,n,e,null),c.flags|=2),c.return=l,a.return=l,a.sibling=c,l.child=a,On(null,a),a=l.child,c=t.child.memoizedState,c===null?c=Xf(e):(n=c.cachePool,n!==null?(f=gt._currentValue,n=n.parent!==f?{parent:f,pool:f}:n):n=Rr(),c={baseLanes:c.baseLanes|e,cachePool:n}),a.memoizedState=c,a.childLanes=Qf(t,i,e),l.memoizedState=Gf,On(t.child,a)):(ie(l),e=t.child,t=e.sibling,e=_l(e,{mode:"visible",children:a.children}),e.return=l,e.sibling=null,t!==null&&(i=l.deletions,i===null?(l.deletions=[t],l.flags|=16):i.push(t)),l.child=e,l.memoizedState=null,e)}function Vf(t,l){return l=yi({mode:"visible",children:l},t.mode),l.return=t,t.child=l}function yi(t,l){return t=Ft(22,t,null,l),t.lanes=0,t}function Zf(t,l,e){return Ye(l,t.child,null,e),t=Vf(l,l.pendingProps.children),t.flags|=2,l.memoizedState=null,t}function wd(t,l,e){t.lanes|=l;var a=t.alternate;a!==null&&(a.lanes|=l),af(t.return,l,e)}function Lf(t,l,e,a,n,u){var i=t.memoizedState;i===null?t.memoizedState={isBackwards:l,rendering:null,renderingStartTime:0,last:a,tail:e,tailMode:n,treeForkCount:u}:(i.isBackwards=l,i.rendering=null,i.renderingStartTime=0,i.last=a,i.tail=e,i.tailMode=n,i.treeForkCount=u)}function Jd(t,l,e){var a=l.pendingProps,n=a.revealOrder,u=a.tail;a=a.children;var i=ht.current,c=(i&2)!==0;if(c?(i=i&1|2,l.flags|=128):i&=1,nt(ht,i),Rt(t,l,a,e),a=F?pn:0,!c&&t!==null&&t.flags&128)t:for(t=l.child;t!==null;){if(t.tag===13)t.memoizedState!==null&&wd(t,e,l);else if(t.tag===19)wd(t,e,l);else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break t;for(;t.sibling===null;){if(t.return===null||t.return===l)break t;t=t.return}t.sibling.return=t.return,t=t.sibling}switch(n){case"forwards":for(e=l.child,n=null;e!==null;)t=e.alternate,t!==null&&ai(t)===null&&(n=e),e=e.sibling;e=n,e===null?(n=l.child,l.child=null):(n=e.sibling,e.sibling=null),Lf(l,!1,n,e,u,a);break;case"backwards":case"unstable_legacy-backwards":for(e=null,n=l.child,l.child=null;n!==null;){if(t=n.alternate,t!==null&&ai(t)===null){l.child=n;break}t=n.sibling,n.sibling=e,e=n,n=t}Lf(l,!0,e,null,u,a);break;case"together":Lf(l,!1,null,null,void 0,a);break;default:l.memoizedState=null}return l.child}function Rl(t,l,e){if(t!==null&&(l.dependencies=t.dependencies),oe|=l.lanes,!(e&l.childLanes))if(t!==null){if(pa(t,l,e,!1),(e&l.childLanes)===0)return null}else return null;if(t!==null&&l.child!==t.child)throw Error(x(153));if(l.child!==null){for(t=l.child,e=_l(t,t.pendingProps),l.child=e,e.return=l;t.sibling!==null;)t=t.sibling,e=e.sibling=_l(t,t.pendingProps),e.return=l;e.sibling=null}return l.child}function Kf(t,l){return t.lanes&l?!0:(t=t.dependencies,!!(t!==null&&Fu(t)))}function By(t,l,e){switch(l.tag){case 3:Mu(l,l.stateNode.containerInfo),ee(l,gt,t.memoizedState.cache),Ue();break;case 27:case 5:hc(l);break;case 4:Mu(l,l.stateNode.containerInfo);break;case 10:ee(l,l.type,l.memoizedProps.value);break;case 31:if(l.memoizedState!==null)return l.flags|=128,gf(l),null;break;case 13:var a=l.memoizedState;if(a!==null)return a.dehydrated!==null?(ie(l),l.flags|=128,null):e&l.child.childLanes?Kd(t,l,e):(ie(l),t=Rl(t,l,e),t!==null?t.sibling:null);ie(l);break;case 19:var n=(t.flags&128)!==0;if(a=(e&l.childLanes)!==0,a||(pa(t,l,e,!1),a=(e&l.childLanes)!==0),n){if(a)return Jd(t,l,e);l.flags|=128}if(n=l.memoizedState,n!==null&&(n.rendering=null,n.tail=null,n.lastEffect=null),nt(ht,ht.current),a)break;return null;case 22:return l.lanes=0,Gd(t,l,e,l.pendingProps);case 24:ee(l,gt,t.memoizedState.cache)}return Rl(t,l,e)}function kd(t,l,e){if(t!==null)if(t.memoizedProps!==l.pendingProps)St=!0;else{if(!Kf(t,e)&&!(l.flags&128))return St=!1,By(t,l,e);St=!!(t.flags&131072)}else St=!1,F&&l.flags&1048576&&Mr(l,pn,l.index);switch(l.lanes=0,l.tag){case 16:t:{var a=l.pendingProps;if(t=Ne(l.elementType),l.type=t,typeof t=="function")Fc(t)?(a=Ge(t,a),l.tag=1,l=Zd(null,l,t,a,e)):(l.tag=0,l=qf(null,l,t,a,e));else{if(t!=null){var n=t.$$typeof;if(n===cc){l.tag=11,l=Bd(null,l,t,a,e);break t}else if(n===oc){l.tag=14,l=Yd(null,l,t,a,e);break t}}throw l=dc(t)||t,Error(x(306,l,""))}}return l;case 0:return qf(t,l,l.type,l.pendingProps,e);case 1:return a=l.type,n=Ge(a,l.pendingProps),Zd(t,l,a,n,e);case 3:t:{if(Mu(l,l.stateNode.containerInfo),t===null)throw Error(x(387));a=l.pendingProps;var u=l.memoizedState;n=u.element,rf(t,l),_n(l,a,null,e);var i=l.memoizedState;if(a=i.cache,ee(l,gt,a),a!==u.cache&&nf(l,[gt],e,!0),Mn(),a=i.element,u.isDehydrated)if(u={element:a,isDehydrated:!1,cache:i.cache},l.updateQueue.baseState=u,l.memoizedState=u,l.flags&256){l=Ld(t,l,a,e);break t}else if(a!==n){n=nl(Error(x(424)),l),bn(n),l=Ld(t,l,a,e);break t}else{switch(t=l.stateNode.containerInfo,t.nodeType){case 9:t=t.body;break;default:t=t.nodeName==="HTML"?t.ownerDocument.body:t}for(ft=sl(t.firstChild),Ut=l,F=!0,te=null,cl=!0,e=Gr(l,null,a,e),l.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling}else{if(Ue(),a===n){l=Rl(t,l,e);break t}Rt(t,l,a,e)}l=l.child}return l;case 26:return hi(t,l),t===null?(e=um(l.type,null,l.pendingProps,null))?l.memoizedState=e:F||(e=l.type,t=l.pendingProps,a=Ui(Fl.current).createElement(e),a[jt]=l,a[qt]=t,Ht(a,e,t),zt(a),l.stateNode=a):l.memoizedState=um(l.type,t.memoizedProps,l.pendingProps,t.memoizedState),null;case 27:return hc(l),t===null&&F&&(a=l.stateNode=em(l.type,l.pendingProps,Fl.current),Ut=l,cl=!0,n=ft,ye(l.type)?(zs=n,ft=sl(a.firstChild)):ft=n),Rt(t,l,l.pendingProps.children,e),hi(t,l),t===null&&(l.flags|=4194304),l.child;case 5:return t===null&&F&&((n=a=ft)&&(a=dg(a,l.type,l.pendingProps,cl),a!==null?(l.stateNode=a,Ut=l,ft=sl(a.firstChild),cl=!1,n=!0):n=!1),n||le(l)),hc(l),n=l.type,u=l.pendingProps,i=t!==null?t.memoizedProps:null,a=u.children,ps(n,u)?a=null:i!==null&&ps(n,i)&&(l.flags|=32),l.memoizedState!==null&&(n=Sf(t,l,_y,null,null,e),Jn._currentValue=n),hi(t,l),Rt(t,l,a,e),l.child;case 6:return t===null&&F&&((t=e=ft)&&(e=mg(e,l.pendingProps,cl),e!==null?(l.stateNode=e,Ut=l,ft=null,t=!0):t=!1),t||le(l)),null;case 13:return Kd(t,l,e);case 4:return Mu(l,l.stateNode.containerInfo),a=l.pendingProps,t===null?l.child=Ye(l,null,a,e):Rt(t,l,a,e),l.child;case 11:return Bd(t,l,l.type,l.pendingProps,e);case 7:return Rt(t,l,l.pendingProps,e),l.child;case 8:return Rt(t,l,l.pendingProps.children,e),l.child;case 12:return Rt(t,l,l.pendingProps.children,e),l.child;case 10:return a=l.pendingProps,ee(l,l.type,a.value),Rt(t,l,a.children,e),l.child;case 9:return n=l.type._context,a=l.pendingProps.children,Re(l),n=Ot(n),a=a(n),l.flags|=1,Rt(t,l,a,e),l.child;case 14:return Yd(t,l,l.type,l.pendingProps,e);case 15:return qd(t,l,l.type,l.pendingProps,e);case 19:return Jd(t,l,e);case 31:return Ny(t,l,e);case 22:return Gd(t,l,e,l.pendingProps);case 24:return Re(l),a=Ot(gt),t===null?(n=ff(),n===null&&(n=at,u=uf(),n.pooledCache=u,u.refCount++,u!==null&&(n.pooledCacheLanes|=e),n=u),l.memoizedState={parent:a,cache:n},of(l),ee(l,gt,n)):(t.lanes&e&&(rf(t,l),_n(l,null,null,e),Mn()),n=t.memoizedState,u=l.memoizedState,n.parent!==a?(n={parent:a,cache:a},l.memoizedState=n,l.lanes===0&&(l.memoizedState=l.updateQueue.baseState=n),ee(l,gt,a)):(a=u.cache,ee(l,gt,a),a!==n.cache&&nf(l,[gt],e,!0))),Rt(t,l,l.pendingProps.children,e),l.child;case 29:throw l.pendingProps}throw Error(x(156,l.tag))}function Hl(t){t.flags|=4}function wf(t,l,e,a,n){if((l=(t.mode&32)!==0)&&(l=!1),l){if(t.flags|=16777216,(n&335544128)===n)if(t.stateNode.complete)t.flags|=8192;else if(x0())t.flags|=8192;else throw Be=Pu,sf}else t.flags&=-16777217}function Fd(t,l){if(l.type!=="stylesheet"||l.state.loading&4)t.flags&=-16777217;else if(t.flags|=16777216,!om(l))if(x0())t.flags|=8192;else throw Be=Pu,sf}function gi(t,l){l!==null&&(t.flags|=4),t.flags&16384&&(l=t.tag!==22?Do():536870912,t.lanes|=l,Ua|=l)}function Rn(t,l){if(!F)switch(t.tailMode){case"hidden":l=t.tail;for(var e=null;l!==null;)l.alternate!==null&&(e=l),l=l.sibling;e===null?t.tail=null:e.sibling=null;break;case"collapsed":e=t.tail;for(var a=null;e!==null;)e.alternate!==null&&(a=e),e=e.sibling;a===null?l||t.tail===null?t.tail=null:t.tail.sibling=null:a.sibling=null}}function st(t){var l=t.alternate!==null&&t.alternate.child===t.child,e=0,a=0;if(l)for(var n=t.child;n!==null;)e|=n.lanes|n.childLanes,a|=n.subtreeFlags&65011712,a|=n.flags&65011712,n.return=t,n=n.sibling;else for(n=t.child;n!==null;)e|=n.lanes|n.childLanes,a|=n.subtreeFlags,a|=n.flags,n.return=t,n=n.sibling;return t.subtreeFlags|=a,t.childLanes=e,l}function Yy(t,l,e){var a=l.pendingProps;switch(Pc(l),l.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return st(l),null;case 1:return st(l),null;case 3:return e=l.stateNode,a=null,t!==null&&(a=t.memoizedState.cache),l.memoizedState.cache!==a&&(l.flags|=2048),jl(gt),la(),e.pendingContext&&(e.context=e.pendingContext,e.pendingContext=null),(t===null||t.child===null)&&(Sa(l)?Hl(l):t===null||t.memoizedState.isDehydrated&&!(l.flags&256)||(l.flags|=1024,lf())),st(l),null;case 26:var n=l.type,u=l.memoizedState;return t===null?(Hl(l),u!==null?(st(l),Fd(l,u)):(st(l),wf(l,n,null,a,e))):u?u!==t.memoizedState?(Hl(l),st(l),Fd(l,u)):(st(l),l.flags&=-16777217):(t=t.memoizedProps,t!==a&&Hl(l),st(l),wf(l,n,t,a,e)),null;case 27:if(_u(l),e=Fl.current,n=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&Hl(l);else{if(!a){if(l.stateNode===null)throw Error(x(166));return st(l),null}t=gl.current,Sa(l)?Dr(l):(t=em(n,a,e),l.stateNode=t,Hl(l))}return st(l),null;case 5:if(_u(l),n=l.type,t!==null&&l.stateNode!=null)t.memoizedProps!==a&&Hl(l);else{if(!a){if(l.stateNode===null)throw Error(x(166));return st(l),null}if(u=gl.current,Sa(l))Dr(l);else{var i=Ui(Fl.current);switch(u){case 1:u=i.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:u=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":u=i.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":u=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":u=i.createElement("div"),u.innerHTML="<script><\/script>",u=u.removeChild(u.firstChild);break;case"select":u=typeof a.is=="string"?i.createElement("select",{is:a.is}):i.createElement("select"),a.multiple?u.multiple=!0:a.size&&(u.size=a.size);break;default:u=typeof a.is=="string"?i.createElement(n,{is:a.is}):i.createElement(n)}}u[jt]=l,u[qt]=a;t:for(i=l.child;i!==null;){if(i.tag===5||i.tag===6)u.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===l)break t;for(;i.sibling===null;){if(i.return===null||i.return===l)break t;i=i.return}i.sibling.return=i.return,i=i.sibling}l.stateNode=u;t:switch(Ht(u,n,a),n){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break t;case"img":a=!0;break t;default:a=!1}a&&Hl(l)}}return st(l),wf(l,l.type,t===null?null:t.memoizedProps,l.pendingProps,e),null;case 6:if(t&&l.stateNode!=null)t.memoizedProps!==a&&Hl(l);else{if(typeof a!="string"&&l.stateNode===null)throw Error(x(166));if(t=Fl.current,Sa(l)){if(t=l.stateNode,e=l.memoizedProps,a=null,n=Ut,n!==null)switch(n.tag){case 27:case 5:a=n.memoizedProps}t[jt]=l,t=!!(t.nodeValue===e||a!==null&&a.suppressHydrationWarning===!0||K0(t.nodeValue,e)),t||le(l,!0)}else t=Ui(t).createTextNode(a),t[jt]=l,l.stateNode=t}return st(l),null;case 31:if(e=l.memoizedState,t===null||t.memoizedState!==null){if(a=Sa(l),e!==null){if(t===null){if(!a)throw Error(x(318));if(t=l.memoizedState,t=t!==null?t.dehydrated:null,!t)throw Error(x(557));t[jt]=l}else Ue(),!(l.flags&128)&&(l.memoizedState=null),l.flags|=4;st(l),t=!1}else e=lf(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=e),t=!0;if(!t)return l.flags&256?($t(l),l):($t(l),null);if(l.flags&128)throw Error(x(558))}return st(l),null;case 13:if(a=l.memoizedState,t===null||t.memoizedState!==null&&t.memoizedState.dehydrated!==null){if(n=Sa(l),a!==null&&a.dehydrated!==null){if(t===null){if(!n)throw Error(x(318));if(n=l.memoizedState,n=n!==null?n.dehydrated:null,!n)throw Error(x(317));n[jt]=l}else Ue(),!(l.flags&128)&&(l.memoizedState=null),l.flags|=4;st(l),n=!1}else n=lf(),t!==null&&t.memoizedState!==null&&(t.memoizedState.hydrationErrors=n),n=!0;if(!n)return l.flags&256?($t(l),l):($t(l),null)}return $t(l),l.flags&128?(l.lanes=e,l):(e=a!==null,t=t!==null&&t.memoizedState!==null,e&&(a=l.child,n=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(n=a.alternate.memoizedState.cachePool.pool),u=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(u=a.memoizedState.cachePool.pool),u!==n&&(a.flags|=2048)),e!==t&&e&&(l.child.flags|=8192),gi(l,l.updateQueue),st(l),null);case 4:return la(),t===null&&hs(l.stateNode.containerInfo),st(l),null;case 10:return jl(l.type),st(l),null;case 19:if(Tt(ht),a=l.memoizedState,a===null)return st(l),null;if(n=(l.flags&128)!==0,u=a.rendering,u===null)if(n)Rn(a,!1);else{if(mt!==0||t!==null&&t.flags&128)for(t=l.child;t!==null;){if(u=ai(t),u!==null){for(l.flags|=128,Rn(a,!1),t=u.updateQueue,l.updateQueue=t,gi(l,t),l.subtreeFlags=0,t=e,e=l.child;e!==null;)Tr(e,t),e=e.sibling;return nt(ht,ht.current&1|2),F&&Dl(l,a.treeForkCount),l.child}t=t.sibling}a.tail!==null&&Kt()>xi&&(l.flags|=128,n=!0,Rn(a,!1),l.lanes=4194304)}else{if(!n)if(t=ai(u),t!==null){if(l.flags|=128,n=!0,t=t.updateQueue,l.updateQueue=t,gi(l,t),Rn(a,!0),a.tail===null&&a.tailMode==="hidden"&&!u.alternate&&!F)return st(l),null}else 2*Kt()-a.renderingStartTime>xi&&e!==536870912&&(l.flags|=128,n=!0,Rn(a,!1),l.lanes=4194304);a.isBackwards?(u.sibling=l.child,l.child=u):(t=a.last,t!==null?t.sibling=u:l.child=u,a.last=u)}return a.tail!==null?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Kt(),t.sibling=null,e=ht.current,nt(ht,n?e&1|2:e&1),F&&Dl(l,a.treeForkCount),t):(st(l),null);case 22:case 23:return $t(l),yf(),a=l.memoizedState!==null,t!==null?t.memoizedState!==null!==a&&(l.flags|=8192):a&&(l.flags|=8192),a?e&536870912&&!(l.flags&128)&&(st(l),l.subtreeFlags&6&&(l.flags|=8192)):st(l),e=l.updateQueue,e!==null&&gi(l,e.retryQueue),e=null,t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),a=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(a=l.memoizedState.cachePool.pool),a!==e&&(l.flags|=2048),t!==null&&Tt(He),null;case 24:return e=null,t!==null&&(e=t.memoizedState.cache),l.memoizedState.cache!==e&&(l.flags|=2048),jl(gt),st(l),null;case 25:return null;case 30:return null}throw Error(x(156,l.tag))}function qy(t,l){switch(Pc(l),l.tag){case 1:return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 3:return jl(gt),la(),t=l.flags,t&65536&&!(t&128)?(l.flags=t&-65537|128,l):null;case 26:case 27:case 5:return _u(l),null;case 31:if(l.memoizedState!==null){if($t(l),l.alternate===null)throw Error(x(340));Ue()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 13:if($t(l),t=l.memoizedState,t!==null&&t.dehydrated!==null){if(l.alternate===null)throw Error(x(340));Ue()}return t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 19:return Tt(ht),null;case 4:return la(),null;case 10:return jl(l.type),null;case 22:case 23:return $t(l),yf(),t!==null&&Tt(He),t=l.flags,t&65536?(l.flags=t&-65537|128,l):null;case 24:return jl(gt),null;case 25:return null;default:return null}}function Wd(t,l){switch(Pc(l),l.tag){case 3:jl(gt),la();break;case 26:case 27:case 5:_u(l);break;case 4:la();break;case 31:l.memoizedState!==null&&$t(l);break;case 13:$t(l);break;case 19:Tt(ht);break;case 10:jl(l.type);break;case 22:case 23:$t(l),yf(),t!==null&&Tt(He);break;case 24:jl(gt)}}function Hn(t,l){try{var e=l.updateQueue,a=e!==null?e.lastEffect:null;if(a!==null){var n=a.next;e=n;do{if((e.tag&t)===t){a=void 0;var u=e.create,i=e.inst;a=u(),i.destroy=a}e=e.next}while(e!==n)}}catch(c){P(l,l.return,c)}}function fe(t,l,e){try{var a=l.updateQueue,n=a!==null?a.lastEffect:null;if(n!==null){var u=n.next;a=u;do{if((a.tag&t)===t){var i=a.inst,c=i.destroy;if(c!==void 0){i.destroy=void 0,n=l;var f=e,s=c;try{s()}catch(g){P(n,f,g)}}}a=a.next}while(a!==u)}}catch(g){P(l,l.return,g)}}function $d(t){var l=t.updateQueue;if(l!==null){var e=t.stateNode;try{Qr(l,e)}catch(a){P(t,t.return,a)}}}function Id(t,l,e){e.props=Ge(t.type,t.memoizedProps),e.state=t.memoizedState;try{e.componentWillUnmount()}catch(a){P(t,l,a)}}function Nn(t,l){try{var e=t.ref;if(e!==null){switch(t.tag){case 26:case 27:case 5:var a=t.stateNode;break;case 30:a=t.stateNode;break;default:a=t.stateNode}typeof e=="function"?t.refCleanup=e(a):e.current=a}}catch(n){P(t,l,n)}}function pl(t,l){var e=t.ref,a=t.refCleanup;if(e!==null)if(typeof a=="function")try{a()}catch(n){P(t,l,n)}finally{t.refCleanup=null,t=t.alternate,t!=null&&(t.refCleanup=null)}else if(typeof e=="function")try{e(null)}catch(n){P(t,l,n)}else e.current=null}function Pd(t){var l=t.type,e=t.memoizedProps,a=t.stateNode;try{t:switch(l){case"button":case"input":case"select":case"textarea":e.autoFocus&&a.focus();break t;case"img":e.src?a.src=e.src:e.srcSet&&(a.srcset=e.srcSet)}}catch(n){P(t,t.return,n)}}function Jf(t,l,e){try{var a=t.stateNode;ig(a,t.type,e,l),a[qt]=l}catch(n){P(t,t.return,n)}}function t0(t){return t.tag===5||t.tag===3||t.tag===26||t.tag===27&&ye(t.type)||t.tag===4}function kf(t){t:for(;;){for(;t.sibling===null;){if(t.return===null||t0(t.return))return null;t=t.return}for(t.sibling.return=t.return,t=t.sibling;t.tag!==5&&t.tag!==6&&t.tag!==18;){if(t.tag===27&&ye(t.type)||t.flags&2||t.child===null||t.tag===4)continue t;t.child.return=t,t=t.child}if(!(t.flags&2))return t.stateNode}}function Ff(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e).insertBefore(t,l):(l=e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.appendChild(t),e=e._reactRootContainer,e!=null||l.onclick!==null||(l.onclick=Al));else if(a!==4&&(a===27&&ye(t.type)&&(e=t.stateNode,l=null),t=t.child,t!==null))for(Ff(t,l,e),t=t.sibling;t!==null;)Ff(t,l,e),t=t.sibling}function vi(t,l,e){var a=t.tag;if(a===5||a===6)t=t.stateNode,l?e.insertBefore(t,l):e.appendChild(t);else if(a!==4&&(a===27&&ye(t.type)&&(e=t.stateNode),t=t.child,t!==null))for(vi(t,l,e),t=t.sibling;t!==null;)vi(t,l,e),t=t.sibling}function l0(t){var l=t.stateNode,e=t.memoizedProps;try{for(var a=t.type,n=l.attributes;n.length;)l.removeAttributeNode(n[0]);Ht(l,a,e),l[jt]=t,l[qt]=e}catch(u){P(t,t.return,u)}}var Nl=!1,pt=!1,Wf=!1,e0=typeof WeakSet=="function"?WeakSet:Set,At=null;function Gy(t,l){if(t=t.containerInfo,vs=qi,t=hr(t),Vc(t)){if("selectionStart"in t)var e={start:t.selectionStart,end:t.selectionEnd};else t:{e=(e=t.ownerDocument)&&e.defaultView||window;var a=e.getSelection&&e.getSelection();if(a&&a.rangeCount!==0){e=a.anchorNode;var n=a.anchorOffset,u=a.focusNode;a=a.focusOffset;try{e.nodeType,u.nodeType}catch(D){e=null;break t}var i=0,c=-1,f=-1,s=0,g=0,v=t,d=null;l:for(;;){for(var y;v!==e||n!==0&&v.nodeType!==3||(c=i+n),v!==u||a!==0&&v.nodeType!==3||(f=i+a),v.nodeType===3&&(i+=v.nodeValue.length),(y=v.firstChild)!==null;)d=v,v=y;for(;;){if(v===t)break l;if(d===e&&++s===n&&(c=i),d===u&&++g===a&&(f=i),(y=v.nextSibling)!==null)break;v=d,d=v.parentNode}v=y}e=c===-1||f===-1?null:{start:c,end:f}}else e=null}e=e||{start:0,end:0}}else e=null;for(Ss={focusedElem:t,selectionRange:e},qi=!1,At=l;At!==null;)if(l=At,t=l.child,(l.subtreeFlags&1028)!==0&&t!==null)t.return=l,At=t;else for(;At!==null;){switch(l=At,u=l.alternate,t=l.flags,l.tag){case 0:if(t&4&&(t=l.updateQueue,t=t!==null?t.events:null,t!==null))for(e=0;e<t.length;e++)n=t[e],n.ref.impl=n.nextImpl;break;case 11:case 15:break;case 1:if(t&1024&&u!==null){t=void 0,e=l,n=u.memoizedProps,u=u.memoizedState,a=e.stateNode;try{var p=Ge(e.type,n);t=a.getSnapshotBeforeUpdate(p,u),a.__reactInternalSnapshotBeforeUpdate=t}catch(D){P(e,e.return,D)}}break;case 3:if(t&1024){if(t=l.stateNode.containerInfo,e=t.nodeType,e===9)xs(t);else if(e===1)switch(t.nodeName){case"HEAD":case"HTML":case"BODY":xs(t);break;default:t.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if(t&1024)throw Error(x(163))}if(t=l.sibling,t!==null){t.return=l.return,At=t;break}At=l.return}}function a0(t,l,e){var a=e.flags;switch(e.tag){case 0:case 11:case 15:Yl(t,e),a&4&&Hn(5,e);break;case 1:if(Yl(t,e),a&4)if(t=e.stateNode,l===null)try{t.componentDidMount()}catch(i){P(e,e.return,i)}else{var n=Ge(e.type,l.memoizedProps);l=l.memoizedState;try{t.componentDidUpdate(n,l,t.__reactInternalSnapshotBeforeUpdate)}catch(i){P(e,e.return,i)}}a&64&&$d(e),a&512&&Nn(e,e.return);break;case 3:if(Yl(t,e),a&64&&(t=e.updateQueue,t!==null)){if(l=null,e.child!==null)switch(e.child.tag){case 27:case 5:l=e.child.stateNode;break;case 1:l=e.child.stateNode}try{Qr(t,l)}catch(i){P(e,e.return,i)}}break;case 27:l===null&&a&4&&l0(e);case 26:case 5:Yl(t,e),l===null&&a&4&&Pd(e),a&512&&Nn(e,e.return);break;case 12:Yl(t,e);break;case 31:Yl(t,e),a&4&&i0(t,e);break;case 13:Yl(t,e),a&4&&c0(t,e),a&64&&(t=e.memoizedState,t!==null&&(t=t.dehydrated,t!==null&&(e=ky.bind(null,e),hg(t,e))));break;case 22:if(a=e.memoizedState!==null||Nl,!a){l=l!==null&&l.memoizedState!==null||pt,n=Nl;var u=pt;Nl=a,(pt=l)&&!u?ql(t,e,(e.subtreeFlags&8772)!==0):Yl(t,e),Nl=n,pt=u}break;case 30:break;default:Yl(t,e)}}function n0(t){var l=t.alternate;l!==null&&(t.alternate=null,n0(l)),t.child=null,t.deletions=null,t.sibling=null,t.tag===5&&(l=t.stateNode,l!==null&&Ac(l)),t.stateNode=null,t.return=null,t.dependencies=null,t.memoizedProps=null,t.memoizedState=null,t.pendingProps=null,t.stateNode=null,t.updateQueue=null}var ot=null,Xt=!1;function Bl(t,l,e){for(e=e.child;e!==null;)u0(t,l,e),e=e.sibling}function u0(t,l,e){if(wt&&typeof wt.onCommitFiberUnmount=="function")try{wt.onCommitFiberUnmount(nn,e)}catch(u){}switch(e.tag){case 26:pt||pl(e,l),Bl(t,l,e),e.memoizedState?e.memoizedState.count--:e.stateNode&&(e=e.stateNode,e.parentNode.removeChild(e));break;case 27:pt||pl(e,l);var a=ot,n=Xt;ye(e.type)&&(ot=e.stateNode,Xt=!1),Bl(t,l,e),Ln(e.stateNode),ot=a,Xt=n;break;case 5:pt||pl(e,l);case 6:if(a=ot,n=Xt,ot=null,Bl(t,l,e),ot=a,Xt=n,ot!==null)if(Xt)try{(ot.nodeType===9?ot.body:ot.nodeName==="HTML"?ot.ownerDocument.body:ot).removeChild(e.stateNode)}catch(u){P(e,l,u)}else try{ot.removeChild(e.stateNode)}catch(u){P(e,l,u)}break;case 18:ot!==null&&(Xt?(t=ot,$0(t.nodeType===9?t.body:t.nodeName==="HTML"?t.ownerDocument.body:t,e.stateNode),Ga(t)):$0(ot,e.stateNode));break;case 4:a=ot,n=Xt,ot=e.stateNode.containerInfo,Xt=!0,Bl(t,l,e),ot=a,Xt=n;break;case 0:case 11:case 14:case 15:fe(2,e,l),pt||fe(4,e,l),Bl(t,l,e);break;case 1:pt||(pl(e,l),a=e.stateNode,typeof a.componentWillUnmount=="function"&&Id(e,l,a)),Bl(t,l,e);break;case 21:Bl(t,l,e);break;case 22:pt=(a=pt)||e.memoizedState!==null,Bl(t,l,e),pt=a;break;default:Bl(t,l,e)}}function i0(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null))){t=t.dehydrated;try{Ga(t)}catch(e){P(l,l.return,e)}}}function c0(t,l){if(l.memoizedState===null&&(t=l.alternate,t!==null&&(t=t.memoizedState,t!==null&&(t=t.dehydrated,t!==null))))try{Ga(t)}catch(e){P(l,l.return,e)}}function Xy(t){switch(t.tag){case 31:case 13:case 19:var l=t.stateNode;return l===null&&(l=t.stateNode=new e0),l;case 22:return t=t.stateNode,l=t._retryCache,l===null&&(l=t._retryCache=new e0),l;default:throw Error(x(435,t.tag))}}function Si(t,l){var e=Xy(t);l.forEach(function(a){if(!e.has(a)){e.add(a);var n=Fy.bind(null,t,a);a.then(n,n)}})}function Qt(t,l){var e=l.deletions;if(e!==null)for(var a=0;a<e.length;a++){var n=e[a],u=t,i=l,c=i;t:for(;c!==null;){switch(c.tag){case 27:if(ye(c.type)){ot=c.stateNode,Xt=!1;break t}break;case 5:ot=c.stateNode,Xt=!1;break t;case 3:case 4:ot=c.stateNode.containerInfo,Xt=!0;break t}c=c.return}if(ot===null)throw Error(x(160));u0(u,i,n),ot=null,Xt=!1,u=n.alternate,u!==null&&(u.return=null),n.return=null}if(l.subtreeFlags&13886)for(l=l.child;l!==null;)f0(l,t),l=l.sibling}var dl=null;function f0(t,l){var e=t.alternate,a=t.flags;switch(t.tag){case 0:case 11:case 14:case 15:Qt(l,t),Vt(t),a&4&&(fe(3,t,t.return),Hn(3,t),fe(5,t,t.return));break;case 1:Qt(l,t),Vt(t),a&512&&(pt||e===null||pl(e,e.return)),a&64&&Nl&&(t=t.updateQueue,t!==null&&(a=t.callbacks,a!==null&&(e=t.shared.hiddenCallbacks,t.shared.hiddenCallbacks=e===null?a:e.concat(a))));break;case 26:var n=dl;if(Qt(l,t),Vt(t),a&512&&(pt||e===null||pl(e,e.return)),a&4){var u=e!==null?e.memoizedState:null;if(a=t.memoizedState,e===null)if(a===null)if(t.stateNode===null){t:{a=t.type,e=t.memoizedProps,n=n.ownerDocument||n;l:switch(a){case"title":u=n.getElementsByTagName("title")[0],(!u||u[fn]||u[jt]||u.namespaceURI==="http://www.w3.org/2000/svg"||u.hasAttribute("itemprop"))&&(u=n.createElement(a),n.head.insertBefore(u,n.querySelector("head > title"))),Ht(u,a,e),u[jt]=t,zt(u),a=u;break t;case"link":var i=fm("link","href",n).get(a+(e.href||""));if(i){for(var c=0;c<i.length;c++)if(u=i[c],u.getAttribute("href")===(e.href==null||e.href===""?null:e.href)&&u.getAttribute("rel")===(e.rel==null?null:e.rel)&&u.getAttribute("title")===(e.title==null?null:e.title)&&u.getAttribute("crossorigin")===(e.crossOrigin==null?null:e.crossOrigin)){i.splice(c,1);break l}}u=n.createElement(a),Ht(u,a,e),n.head.appendChild(u);break;case"meta":if(i=fm("meta","content",n).get(a+(e.content||""))){for(c=0;c<i.length;c++)if(u=i[c],u.getAttribute("content")===(e.content==null?null:""+e.content)&&u.getAttribute("name")===(e.name==null?null:e.name)&&u.getAttribute("property")===(e.property==null?null:e.property)&&u.getAttribute("http-equiv")===(e.httpEquiv==null?null:e.httpEquiv)&&u.getAttribute("charset")===(e.charSet==null?null:e.charSet)){i.splice(c,1);break l}}u=n.createElement(a),Ht(u,a,e),n.head.appendChild(u);break;default:throw Error(x(468,a))}u[jt]=t,zt(u),a=u}t.stateNode=a}else sm(n,t.type,t.stateNode);else t.stateNode=cm(n,a,t.memoizedProps);else u!==a?(u===null?e.stateNode!==null&&(e=e.stateNode,e.parentNode.removeChild(e)):u.count--,a===null?sm(n,t.type,t.stateNode):cm(n,a,t.memoizedProps)):a===null&&t.stateNode!==null&&Jf(t,t.memoizedProps,e.memoizedProps)}break;case 27:Qt(l,t),Vt(t),a&512&&(pt||e===null||pl(e,e.return)),e!==null&&a&4&&Jf(t,t.memoizedProps,e.memoizedProps);break;case 5:if(Qt(l,t),Vt(t),a&512&&(pt||e===null||pl(e,e.return)),t.flags&32){n=t.stateNode;try{fa(n,"")}catch(p){P(t,t.return,p)}}a&4&&t.stateNode!=null&&(n=t.memoizedProps,Jf(t,n,e!==null?e.memoizedProps:n)),a&1024&&(Wf=!0);break;case 6:if(Qt(l,t),Vt(t),a&4){if(t.stateNode===null)throw Error(x(162));a=t.memoizedProps,e=t.stateNode;try{e.nodeValue=a}catch(p){P(t,t.return,p)}}break;case 3:if(Hi=null,n=dl,dl=Oi(l.containerInfo),Qt(l,t),dl=n,Vt(t),a&4&&e!==null&&e.memoizedState.isDehydrated)try{Ga(l.containerInfo)}catch(p){P(t,t.return,p)}Wf&&(Wf=!1,s0(t));break;case 4:a=dl,dl=Oi(t.stateNode.containerInfo),Qt(l,t),Vt(t),dl=a;break;case 12:Qt(l,t),Vt(t);break;case 31:Qt(l,t),Vt(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Si(t,a)));break;case 13:Qt(l,t),Vt(t),t.child.flags&8192&&t.memoizedState!==null!=(e!==null&&e.memoizedState!==null)&&(bi=Kt()),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Si(t,a)));break;case 22:n=t.memoizedState!==null;var f=e!==null&&e.memoizedState!==null,s=Nl,g=pt;if(Nl=s||n,pt=g||f,Qt(l,t),pt=g,Nl=s,Vt(t),a&8192)t:for(l=t.stateNode,l._visibility=n?l._visibility&-2:l._visibility|1,n&&(e===null||f||Nl||pt||Xe(t)),e=null,l=t;;){if(l.tag===5||l.tag===26){if(e===null){f=e=l;try{if(u=f.stateNode,n)i=u.style,typeof i.setProperty=="function"?i.setProperty("display","none","important"):i.display="none";else{c=f.stateNode;var v=f.memoizedProps.style,d=v!=null&&v.hasOwnProperty("display")?v.display:null;c.style.display=d==null||typeof d=="boolean"?"":(""+d).trim()}}catch(p){P(f,f.return,p)}}}else if(l.tag===6){if(e===null){f=l;try{f.stateNode.nodeValue=n?"":f.memoizedProps}catch(p){P(f,f.return,p)}}}else if(l.tag===18){if(e===null){f=l;try{var y=f.stateNode;n?I0(y,!0):I0(f.stateNode,!1)}catch(p){P(f,f.return,p)}}}else if((l.tag!==22&&l.tag!==23||l.memoizedState===null||l===t)&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break t;for(;l.sibling===null;){if(l.return===null||l.return===t)break t;e===l&&(e=null),l=l.return}e===l&&(e=null),l.sibling.return=l.return,l=l.sibling}a&4&&(a=t.updateQueue,a!==null&&(e=a.retryQueue,e!==null&&(a.retryQueue=null,Si(t,e))));break;case 19:Qt(l,t),Vt(t),a&4&&(a=t.updateQueue,a!==null&&(t.updateQueue=null,Si(t,a)));break;case 30:break;case 21:break;default:Qt(l,t),Vt(t)}}function Vt(t){var l=t.flags;if(l&2){try{for(var e,a=t.return;a!==null;){if(t0(a)){e=a;break}a=a.return}if(e==null)throw Error(x(160));switch(e.tag){case 27:var n=e.stateNode,u=kf(t);vi(t,u,n);break;case 5:var i=e.stateNode;e.flags&32&&(fa(i,""),e.flags&=-33);var c=kf(t);vi(t,c,i);break;case 3:case 4:var f=e.stateNode.containerInfo,s=kf(t);Ff(t,s,f);break;default:throw Error(x(161))}}catch(g){P(t,t.return,g)}t.flags&=-3}l&4096&&(t.flags&=-4097)}function s0(t){if(t.subtreeFlags&1024)for(t=t.child;t!==null;){var l=t;s0(l),l.tag===5&&l.flags&1024&&l.stateNode.reset(),t=t.sibling}}function Yl(t,l){if(l.subtreeFlags&8772)for(l=l.child;l!==null;)a0(t,l.alternate,l),l=l.sibling}function Xe(t){for(t=t.child;t!==null;){var l=t;switch(l.tag){case 0:case 11:case 14:case 15:fe(4,l,l.return),Xe(l);break;case 1:pl(l,l.return);var e=l.stateNode;typeof e.componentWillUnmount=="function"&&Id(l,l.return,e),Xe(l);break;case 27:Ln(l.stateNode);case 26:case 5:pl(l,l.return),Xe(l);break;case 22:l.memoizedState===null&&Xe(l);break;case 30:Xe(l);break;default:Xe(l)}t=t.sibling}}function ql(t,l,e){for(e=e&&(l.subtreeFlags&8772)!==0,l=l.child;l!==null;){var a=l.alternate,n=t,u=l,i=u.flags;switch(u.tag){case 0:case 11:case 15:ql(n,u,e),Hn(4,u);break;case 1:if(ql(n,u,e),a=u,n=a.stateNode,typeof n.componentDidMount=="function")try{n.componentDidMount()}catch(s){P(a,a.return,s)}if(a=u,n=a.updateQueue,n!==null){var c=a.stateNode;try{var f=n.shared.hiddenCallbacks;if(f!==null)for(n.shared.hiddenCallbacks=null,n=0;n<f.length;n++)Xr(f[n],c)}catch(s){P(a,a.return,s)}}e&&i&64&&$d(u),Nn(u,u.return);break;case 27:l0(u);case 26:case 5:ql(n,u,e),e&&a===null&&i&4&&Pd(u),Nn(u,u.return);break;case 12:ql(n,u,e);break;case 31:ql(n,u,e),e&&i&4&&i0(n,u);break;case 13:ql(n,u,e),e&&i&4&&c0(n,u);break;case 22:u.memoizedState===null&&ql(n,u,e),Nn(u,u.return);break;case 30:break;default:ql(n,u,e)}l=l.sibling}}function $f(t,l){var e=null;t!==null&&t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),t=null,l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(t=l.memoizedState.cachePool.pool),t!==e&&(t!=null&&t.refCount++,e!=null&&xn(e))}function If(t,l){t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&xn(t))}function ml(t,l,e,a){if(l.subtreeFlags&10256)for(l=l.child;l!==null;)o0(t,l,e,a),l=l.sibling}function o0(t,l,e,a){var n=l.flags;switch(l.tag){case 0:case 11:case 15:ml(t,l,e,a),n&2048&&Hn(9,l);break;case 1:ml(t,l,e,a);break;case 3:ml(t,l,e,a),n&2048&&(t=null,l.alternate!==null&&(t=l.alternate.memoizedState.cache),l=l.memoizedState.cache,l!==t&&(l.refCount++,t!=null&&xn(t)));break;case 12:if(n&2048){ml(t,l,e,a),t=l.stateNode;try{var u=l.memoizedProps,i=u.id,c=u.onPostCommit;typeof c=="function"&&c(i,l.alternate===null?"mount":"update",t.passiveEffectDuration,-0)}catch(f){P(l,l.return,f)}}else ml(t,l,e,a);break;case 31:ml(t,l,e,a);break;case 13:ml(t,l,e,a);break;case 23:break;case 22:u=l.stateNode,i=l.alternate,l.memoizedState!==null?u._visibility&2?ml(t,l,e,a):Bn(t,l):u._visibility&2?ml(t,l,e,a):(u._visibility|=2,Da(t,l,e,a,(l.subtreeFlags&10256)!==0||!1)),n&2048&&$f(i,l);break;case 24:ml(t,l,e,a),n&2048&&If(l.alternate,l);break;default:ml(t,l,e,a)}}function Da(t,l,e,a,n){for(n=n&&((l.subtreeFlags&10256)!==0||!1),l=l.child;l!==null;){var u=t,i=l,c=e,f=a,s=i.flags;switch(i.tag){case 0:case 11:case 15:Da(u,i,c,f,n),Hn(8,i);break;case 23:break;case 22:var g=i.stateNode;i.memoizedState!==null?g._visibility&2?Da(u,i,c,f,n):Bn(u,i):(g._visibility|=2,Da(u,i,c,f,n)),n&&s&2048&&$f(i.alternate,i);break;case 24:Da(u,i,c,f,n),n&&s&2048&&If(i.alternate,i);break;default:Da(u,i,c,f,n)}l=l.sibling}}function Bn(t,l){if(l.subtreeFlags&10256)for(l=l.child;l!==null;){var e=t,a=l,n=a.flags;switch(a.tag){case 22:Bn(e,a),n&2048&&$f(a.alternate,a);break;case 24:Bn(e,a),n&2048&&If(a.alternate,a);break;default:Bn(e,a)}l=l.sibling}}var Yn=8192;function Ca(t,l,e){if(t.subtreeFlags&Yn)for(t=t.child;t!==null;)r0(t,l,e),t=t.sibling}function r0(t,l,e){switch(t.tag){case 26:Ca(t,l,e),t.flags&Yn&&t.memoizedState!==null&&Mg(e,dl,t.memoizedState,t.memoizedProps);break;case 5:Ca(t,l,e);break;case 3:case 4:var a=dl;dl=Oi(t.stateNode.containerInfo),Ca(t,l,e),dl=a;break;case 22:t.memoizedState===null&&(a=t.alternate,a!==null&&a.memoizedState!==null?(a=Yn,Yn=16777216,Ca(t,l,e),Yn=a):Ca(t,l,e));break;default:Ca(t,l,e)}}function d0(t){var l=t.alternate;if(l!==null&&(t=l.child,t!==null)){l.child=null;do l=t.sibling,t.sibling=null,t=l;while(t!==null)}}function qn(t){var l=t.deletions;if(t.flags&16){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];At=a,h0(a,t)}d0(t)}if(t.subtreeFlags&10256)for(t=t.child;t!==null;)m0(t),t=t.sibling}function m0(t){switch(t.tag){case 0:case 11:case 15:qn(t),t.flags&2048&&fe(9,t,t.return);break;case 3:qn(t);break;case 12:qn(t);break;case 22:var l=t.stateNode;t.memoizedState!==null&&l._visibility&2&&(t.return===null||t.return.tag!==13)?(l._visibility&=-3,pi(t)):qn(t);break;default:qn(t)}}function pi(t){var l=t.deletions;if(t.flags&16){if(l!==null)for(var e=0;e<l.length;e++){var a=l[e];At=a,h0(a,t)}d0(t)}for(t=t.child;t!==null;){switch(l=t,l.tag){case 0:case 11:case 15:fe(8,l,l.return),pi(l);break;case 22:e=l.stateNode,e._visibility&2&&(e._visibility&=-3,pi(l));break;default:pi(l)}t=t.sibling}}function h0(t,l){for(;At!==null;){var e=At;switch(e.tag){case 0:case 11:case 15:fe(8,e,l);break;case 23:case 22:if(e.memoizedState!==null&&e.memoizedState.cachePool!==null){var a=e.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:xn(e.memoizedState.cache)}if(a=e.child,a!==null)a.return=e,At=a;else t:for(e=t;At!==null;){a=At;var n=a.sibling,u=a.return;if(n0(a),a===e){At=null;break t}if(n!==null){n.return=u,At=n;break t}At=u}}}var Qy={getCacheForType:function(t){var l=Ot(gt),e=l.data.get(t);return e===void 0&&(e=t(),l.data.set(t,e)),e},cacheSignal:function(){return Ot(gt).controller.signal}},Vy=typeof WeakMap=="function"?WeakMap:Map,$=0,at=null,K=null,J=0,I=0,It=null,se=!1,ja=!1,Pf=!1,Gl=0,mt=0,oe=0,Qe=0,ts=0,Pt=0,Ua=0,Gn=null,Zt=null,ls=!1,bi=0,y0=0,xi=1/0,Ei=null,re=null,Et=0,de=null,Oa=null,Xl=0,es=0,as=null,g0=null,Xn=0,ns=null;function tl(){return $&2&&J!==0?J&-J:Y.T!==null?os():Oo()}function v0(){if(Pt===0)if(!(J&536870912)||F){var t=ju;ju<<=1,!(ju&3932160)&&(ju=262144),Pt=t}else Pt=536870912;return t=Wt.current,t!==null&&(t.flags|=32),Pt}function Lt(t,l,e){(t===at&&(I===2||I===9)||t.cancelPendingCommit!==null)&&(Ra(t,0),me(t,J,Pt,!1)),cn(t,e),(!($&2)||t!==at)&&(t===at&&(!($&2)&&(Qe|=e),mt===4&&me(t,J,Pt,!1)),bl(t))}function S0(t,l,e){if($&6)throw Error(x(327));var a=!e&&(l&127)===0&&(l&t.expiredLanes)===0||un(t,l),n=a?Ky(t,l):is(t,l,!0),u=a;do{if(n===0){ja&&!a&&me(t,l,0,!1);break}else{if(e=t.current.alternate,u&&!Zy(e)){n=is(t,l,!1),u=!1;continue}if(n===2){if(u=l,t.errorRecoveryDisabledLanes&u)var i=0;else i=t.pendingLanes&-536870913,i=i!==0?i:i&536870912?536870912:0;if(i!==0){l=i;t:{var c=t;n=Gn;var f=c.current.memoizedState.isDehydrated;if(f&&(Ra(c,i).flags|=256),i=is(c,i,!1),i!==2){if(Pf&&!f){c.errorRecoveryDisabledLanes|=u,Qe|=u,n=4;break t}u=Zt,Zt=n,u!==null&&(Zt===null?Zt=u:Zt.push.apply(Zt,u))}n=i}if(u=!1,n!==2)continue}}if(n===1){Ra(t,0),me(t,l,0,!0);break}t:{switch(a=t,u=n,u){case 0:case 1:throw Error(x(345));case 4:if((l&4194048)!==l)break;case 6:me(a,l,Pt,!se);break t;case 2:Zt=null;break;case 3:case 5:break;default:throw Error(x(329))}if((l&62914560)===l&&(n=bi+300-Kt(),10<n)){if(me(a,l,Pt,!se),Ou(a,0,!0)!==0)break t;Xl=l,a.timeoutHandle=F0(p0.bind(null,a,e,Zt,Ei,ls,l,Pt,Qe,Ua,se,u,"Throttled",-0,0),n);break t}p0(a,e,Zt,Ei,ls,l,Pt,Qe,Ua,se,u,null,-0,0)}}break}while(!0);bl(t)}function p0(t,l,e,a,n,u,i,c,f,s,g,v,d,y){if(t.timeoutHandle=-1,v=l.subtreeFlags,v&8192||(v&16785408)===16785408){v={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Al},r0(l,u,v);var p=(u&62914560)===u?bi-Kt():(u&4194048)===u?y0-Kt():0;if(p=_g(v,p),p!==null){Xl=u,t.cancelPendingCommit=p(_0.bind(null,t,l,u,e,a,n,i,c,f,g,v,null,d,y)),me(t,u,i,!s);return}}_0(t,l,u,e,a,n,i,c,f)}function Zy(t){for(var l=t;;){var e=l.tag;if((e===0||e===11||e===15)&&l.flags&16384&&(e=l.updateQueue,e!==null&&(e=e.stores,e!==null)))for(var a=0;a<e.length;a++){var n=e[a],u=n.getSnapshot;n=n.value;try{if(!kt(u(),n))return!1}catch(i){return!1}}if(e=l.child,l.subtreeFlags&16384&&e!==null)e.return=l,l=e;else{if(l===t)break;for(;l.sibling===null;){if(l.return===null||l.return===t)return!0;l=l.return}l.sibling.return=l.return,l=l.sibling}}return!0}function me(t,l,e,a){l&=~ts,l&=~Qe,t.suspendedLanes|=l,t.pingedLanes&=~l,a&&(t.warmLanes|=l),a=t.expirationTimes;for(var n=l;0<n;){var u=31-Jt(n),i=1<<u;a[u]=-1,n&=~i}e!==0&&Co(t,e,l)}function Ti(){return $&6?!0:(Qn(0),!1)}function us(){if(K!==null){if(I===0)var t=K.return;else t=K,Cl=Oe=null,xf(t),Ta=null,Tn=0,t=K;for(;t!==null;)Wd(t.alternate,t),t=t.return;K=null}}function Ra(t,l){var e=t.timeoutHandle;e!==-1&&(t.timeoutHandle=-1,sg(e)),e=t.cancelPendingCommit,e!==null&&(t.cancelPendingCommit=null,e()),Xl=0,us(),at=t,K=e=_l(t.current,null),J=l,I=0,It=null,se=!1,ja=un(t,l),Pf=!1,Ua=Pt=ts=Qe=oe=mt=0,Zt=Gn=null,ls=!1,l&8&&(l|=l&32);var a=t.entangledLanes;if(a!==0)for(t=t.entanglements,a&=l;0<a;){var n=31-Jt(a),u=1<<n;l|=t[n],a&=~u}return Gl=l,Lu(),e}function b0(t,l){V=null,Y.H=Un,l===Ea||l===Iu?(l=Br(),I=3):l===sf?(l=Br(),I=4):I=l===Yf?8:l!==null&&typeof l=="object"&&typeof l.then=="function"?6:1,It=l,K===null&&(mt=1,di(t,nl(l,t.current)))}function x0(){var t=Wt.current;return t===null?!0:(J&4194048)===J?fl===null:(J&62914560)===J||J&536870912?t===fl:!1}function E0(){var t=Y.H;return Y.H=Un,t===null?Un:t}function T0(){var t=Y.A;return Y.A=Qy,t}function zi(){mt=4,se||(J&4194048)!==J&&Wt.current!==null||(ja=!0),!(oe&134217727)&&!(Qe&134217727)||at===null||me(at,J,Pt,!1)}function is(t,l,e){var a=$;$|=2;var n=E0(),u=T0();(at!==t||J!==l)&&(Ei=null,Ra(t,l)),l=!1;var i=mt;t:do try{if(I!==0&&K!==null){var c=K,f=It;switch(I){case 8:us(),i=6;break t;case 3:case 2:case 9:case 6:Wt.current===null&&(l=!0);var s=I;if(I=0,It=null,Ha(t,c,f,s),e&&ja){i=0;break t}break;default:s=I,I=0,It=null,Ha(t,c,f,s)}}Ly(),i=mt;break}catch(g){b0(t,g)}while(!0);return l&&t.shellSuspendCounter++,Cl=Oe=null,$=a,Y.H=n,Y.A=u,K===null&&(at=null,J=0,Lu()),i}function Ly(){for(;K!==null;)z0(K)}function Ky(t,l){var e=$;$|=2;var a=E0(),n=T0();at!==t||J!==l?(Ei=null,xi=Kt()+500,Ra(t,l)):ja=un(t,l);t:do try{if(I!==0&&K!==null){l=K;var u=It;l:switch(I){case 1:I=0,It=null,Ha(t,l,u,1);break;case 2:case 9:if(Hr(u)){I=0,It=null,A0(l);break}l=function(){I!==2&&I!==9||at!==t||(I=7),bl(t)},u.then(l,l);break t;case 3:I=7;break t;case 4:I=5;break t;case 7:Hr(u)?(I=0,It=null,A0(l)):(I=0,It=null,Ha(t,l,u,7));break;case 5:var i=null;switch(K.tag){case 26:i=K.memoizedState;case 5:case 27:var c=K;if(i?om(i):c.stateNode.complete){I=0,It=null;var f=c.sibling;if(f!==null)K=f;else{var s=c.return;s!==null?(K=s,Ai(s)):K=null}break l}}I=0,It=null,Ha(t,l,u,5);break;case 6:I=0,It=null,Ha(t,l,u,6);break;case 8:us(),mt=6;break t;default:throw Error(x(462))}}wy();break}catch(g){b0(t,g)}while(!0);return Cl=Oe=null,Y.H=a,Y.A=n,$=e,K!==null?0:(at=null,J=0,Lu(),mt)}function wy(){for(;K!==null&&!yh();)z0(K)}function z0(t){var l=kd(t.alternate,t,Gl);t.memoizedProps=t.pendingProps,l===null?Ai(t):K=l}function A0(t){var l=t,e=l.alternate;switch(l.tag){case 15:case 0:l=Vd(e,l,l.pendingProps,l.type,void 0,J);break;case 11:l=Vd(e,l,l.pendingProps,l.type.render,l.ref,J);break;case 5:xf(l);default:Wd(e,l),l=K=Tr(l,Gl),l=kd(e,l,Gl)}t.memoizedProps=t.pendingProps,l===null?Ai(t):K=l}function Ha(t,l,e,a){Cl=Oe=null,xf(l),Ta=null,Tn=0;var n=l.return;try{if(Hy(t,n,l,e,J)){mt=1,di(t,nl(e,t.current)),K=null;return}}catch(u){if(n!==null)throw K=n,u;mt=1,di(t,nl(e,t.current)),K=null;return}l.flags&32768?(F||a===1?t=!0:ja||J&536870912?t=!1:(se=t=!0,(a===2||a===9||a===3||a===6)&&(a=Wt.current,a!==null&&a.tag===13&&(a.flags|=16384))),M0(l,t)):Ai(l)}function Ai(t){var l=t;do{if(l.flags&32768){M0(l,se);return}t=l.return;var e=Yy(l.alternate,l,Gl);if(e!==null){K=e;return}if(l=l.sibling,l!==null){K=l;return}K=l=t}while(l!==null);mt===0&&(mt=5)}function M0(t,l){do{var e=qy(t.alternate,t);if(e!==null){e.flags&=32767,K=e;return}if(e=t.return,e!==null&&(e.flags|=32768,e.subtreeFlags=0,e.deletions=null),!l&&(t=t.sibling,t!==null)){K=t;return}K=t=e}while(t!==null);mt=6,K=null}function _0(t,l,e,a,n,u,i,c,f){t.cancelPendingCommit=null;do Mi();while(Et!==0);if($&6)throw Error(x(327));if(l!==null){if(l===t.current)throw Error(x(177));if(u=l.lanes|l.childLanes,u|=Jc,Ah(t,e,u,i,c,f),t===at&&(K=at=null,J=0),Oa=l,de=t,Xl=e,es=u,as=n,g0=a,l.subtreeFlags&10256||l.flags&10256?(t.callbackNode=null,t.callbackPriority=0,Wy(Du,function(){return O0(),null})):(t.callbackNode=null,t.callbackPriority=0),a=(l.flags&13878)!==0,l.subtreeFlags&13878||a){a=Y.T,Y.T=null,n=W.p,W.p=2,i=$,$|=4;try{Gy(t,l,e)}finally{$=i,W.p=n,Y.T=a}}Et=1,D0(),C0(),j0()}}function D0(){if(Et===1){Et=0;var t=de,l=Oa,e=(l.flags&13878)!==0;if(l.subtreeFlags&13878||e){e=Y.T,Y.T=null;var a=W.p;W.p=2;var n=$;$|=4;try{f0(l,t);var u=Ss,i=hr(t.containerInfo),c=u.focusedElem,f=u.selectionRange;if(i!==c&&c&&c.ownerDocument&&mr(c.ownerDocument.documentElement,c)){if(f!==null&&Vc(c)){var s=f.start,g=f.end;if(g===void 0&&(g=s),"selectionStart"in c)c.selectionStart=s,c.selectionEnd=Math.min(g,c.value.length);else{var v=c.ownerDocument||document,d=v&&v.defaultView||window;if(d.getSelection){var y=d.getSelection(),p=c.textContent.length,D=Math.min(f.start,p),O=f.end===void 0?D:Math.min(f.end,p);!y.extend&&D>O&&(i=O,O=D,D=i);var r=dr(c,D),o=dr(c,O);if(r&&o&&(y.rangeCount!==1||y.anchorNode!==r.node||y.anchorOffset!==r.offset||y.focusNode!==o.node||y.focusOffset!==o.offset)){var h=v.createRange();h.setStart(r.node,r.offset),y.removeAllRanges(),D>O?(y.addRange(h),y.extend(o.node,o.offset)):(h.setEnd(o.node,o.offset),y.addRange(h))}}}}for(v=[],y=c;y=y.parentNode;)y.nodeType===1&&v.push({element:y,left:y.scrollLeft,top:y.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<v.length;c++){var S=v[c];S.element.scrollLeft=S.left,S.element.scrollTop=S.top}}qi=!!vs,Ss=vs=null}finally{$=n,W.p=a,Y.T=e}}t.current=l,Et=2}}function C0(){if(Et===2){Et=0;var t=de,l=Oa,e=(l.flags&8772)!==0;if(l.subtreeFlags&8772||e){e=Y.T,Y.T=null;var a=W.p;W.p=2;var n=$;$|=4;try{a0(t,l.alternate,l)}finally{$=n,W.p=a,Y.T=e}}Et=3}}function j0(){if(Et===4||Et===3){Et=0,gh();var t=de,l=Oa,e=Xl,a=g0;l.subtreeFlags&10256||l.flags&10256?Et=5:(Et=0,Oa=de=null,U0(t,t.pendingLanes));var n=t.pendingLanes;if(n===0&&(re=null),Tc(e),l=l.stateNode,wt&&typeof wt.onCommitFiberRoot=="function")try{wt.onCommitFiberRoot(nn,l,void 0,(l.current.flags&128)===128)}catch(f){}if(a!==null){l=Y.T,n=W.p,W.p=2,Y.T=null;try{for(var u=t.onRecoverableError,i=0;i<a.length;i++){var c=a[i];u(c.value,{componentStack:c.stack})}}finally{Y.T=l,W.p=n}}Xl&3&&Mi(),bl(t),n=t.pendingLanes,e&261930&&n&42?t===ns?Xn++:(Xn=0,ns=t):Xn=0,Qn(0)}}function U0(t,l){(t.pooledCacheLanes&=l)===0&&(l=t.pooledCache,l!=null&&(t.pooledCache=null,xn(l)))}function Mi(){return D0(),C0(),j0(),O0()}function O0(){if(Et!==5)return!1;var t=de,l=es;es=0;var e=Tc(Xl),a=Y.T,n=W.p;try{W.p=32>e?32:e,Y.T=null,e=as,as=null;var u=de,i=Xl;if(Et=0,Oa=de=null,Xl=0,$&6)throw Error(x(331));var c=$;if($|=4,m0(u.current),o0(u,u.current,i,e),$=c,Qn(0,!1),wt&&typeof wt.onPostCommitFiberRoot=="function")try{wt.onPostCommitFiberRoot(nn,u)}catch(f){}return!0}finally{W.p=n,Y.T=a,U0(t,l)}}function R0(t,l,e){l=nl(e,l),l=Bf(t.stateNode,l,2),t=ue(t,l,2),t!==null&&(cn(t,2),bl(t))}function P(t,l,e){if(t.tag===3)R0(t,t,e);else for(;l!==null;){if(l.tag===3){R0(l,t,e);break}else if(l.tag===1){var a=l.stateNode;if(typeof l.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(re===null||!re.has(a))){t=nl(e,t),e=Hd(2),a=ue(l,e,2),a!==null&&(Nd(e,a,l,t),cn(a,2),bl(a));break}}l=l.return}}function cs(t,l,e){var a=t.pingCache;if(a===null){a=t.pingCache=new Vy;var n=new Set;a.set(l,n)}else n=a.get(l),n===void 0&&(n=new Set,a.set(l,n));n.has(e)||(Pf=!0,n.add(e),t=Jy.bind(null,t,l,e),l.then(t,t))}function Jy(t,l,e){var a=t.pingCache;a!==null&&a.delete(l),t.pingedLanes|=t.suspendedLanes&e,t.warmLanes&=~e,at===t&&(J&e)===e&&(mt===4||mt===3&&(J&62914560)===J&&300>Kt()-bi?!($&2)&&Ra(t,0):ts|=e,Ua===J&&(Ua=0)),bl(t)}function H0(t,l){l===0&&(l=Do()),t=Ce(t,l),t!==null&&(cn(t,l),bl(t))}function ky(t){var l=t.memoizedState,e=0;l!==null&&(e=l.retryLane),H0(t,e)}function Fy(t,l){var e=0;switch(t.tag){case 31:case 13:var a=t.stateNode,n=t.memoizedState;n!==null&&(e=n.retryLane);break;case 19:a=t.stateNode;break;case 22:a=t.stateNode._retryCache;break;default:throw Error(x(314))}a!==null&&a.delete(l),H0(t,e)}function Wy(t,l){return pc(t,l)}var _i=null,Na=null,fs=!1,Di=!1,ss=!1,he=0;function bl(t){t!==Na&&t.next===null&&(Na===null?_i=Na=t:Na=Na.next=t),Di=!0,fs||(fs=!0,Iy())}function Qn(t,l){if(!ss&&Di){ss=!0;do for(var e=!1,a=_i;a!==null;){if(t!==0){var n=a.pendingLanes;if(n===0)var u=0;else{var i=a.suspendedLanes,c=a.pingedLanes;u=(1<<31-Jt(42|t)+1)-1,u&=n&~(i&~c),u=u&201326741?u&201326741|1:u?u|2:0}u!==0&&(e=!0,q0(a,u))}else u=J,u=Ou(a,a===at?u:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),!(u&3)||un(a,u)||(e=!0,q0(a,u));a=a.next}while(e);ss=!1}}function $y(){N0()}function N0(){Di=fs=!1;var t=0;he!==0&&fg()&&(t=he);for(var l=Kt(),e=null,a=_i;a!==null;){var n=a.next,u=B0(a,l);u===0?(a.next=null,e===null?_i=n:e.next=n,n===null&&(Na=e)):(e=a,(t!==0||u&3)&&(Di=!0)),a=n}Et!==0&&Et!==5||Qn(t),he!==0&&(he=0)}function B0(t,l){for(var e=t.suspendedLanes,a=t.pingedLanes,n=t.expirationTimes,u=t.pendingLanes&-62914561;0<u;){var i=31-Jt(u),c=1<<i,f=n[i];f===-1?(!(c&e)||c&a)&&(n[i]=zh(c,l)):f<=l&&(t.expiredLanes|=c),u&=~c}if(l=at,e=J,e=Ou(t,t===l?e:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a=t.callbackNode,e===0||t===l&&(I===2||I===9)||t.cancelPendingCommit!==null)return a!==null&&a!==null&&bc(a),t.callbackNode=null,t.callbackPriority=0;if(!(e&3)||un(t,e)){if(l=e&-e,l===t.callbackPriority)return l;switch(a!==null&&bc(a),Tc(e)){case 2:case 8:e=Mo;break;case 32:e=Du;break;case 268435456:e=_o;break;default:e=Du}return a=Y0.bind(null,t),e=pc(e,a),t.callbackPriority=l,t.callbackNode=e,l}return a!==null&&a!==null&&bc(a),t.callbackPriority=2,t.callbackNode=null,2}function Y0(t,l){if(Et!==0&&Et!==5)return t.callbackNode=null,t.callbackPriority=0,null;var e=t.callbackNode;if(Mi()&&t.callbackNode!==e)return null;var a=J;return a=Ou(t,t===at?a:0,t.cancelPendingCommit!==null||t.timeoutHandle!==-1),a===0?null:(S0(t,a,l),B0(t,Kt()),t.callbackNode!=null&&t.callbackNode===e?Y0.bind(null,t):null)}function q0(t,l){if(Mi())return null;S0(t,l,!0)}function Iy(){og(function(){$&6?pc(Ao,$y):N0()})}function os(){if(he===0){var t=ba;t===0&&(t=Cu,Cu<<=1,!(Cu&261888)&&(Cu=256)),he=t}return he}function G0(t){return t==null||typeof t=="symbol"||typeof t=="boolean"?null:typeof t=="function"?t:Bu(""+t)}function X0(t,l){var e=l.ownerDocument.createElement("input");return e.name=l.name,e.value=l.value,t.id&&e.setAttribute("form",t.id),l.parentNode.insertBefore(e,l),t=new FormData(t),e.parentNode.removeChild(e),t}function Py(t,l,e,a,n){if(l==="submit"&&e&&e.stateNode===n){var u=G0((n[qt]||null).action),i=a.submitter;i&&(l=(l=i[qt]||null)?G0(l.formAction):i.getAttribute("formAction"),l!==null&&(u=l,i=null));var c=new Xu("action","action",null,a,n);t.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(he!==0){var f=i?X0(n,i):new FormData(n);jf(e,{pending:!0,data:f,method:n.method,action:u},null,f)}}else typeof u=="function"&&(c.preventDefault(),f=i?X0(n,i):new FormData(n),jf(e,{pending:!0,data:f,method:n.method,action:u},u,f))},currentTarget:n}]})}}for(var rs=0;rs<wc.length;rs++){var ds=wc[rs],tg=ds.toLowerCase(),lg=ds[0].toUpperCase()+ds.slice(1);rl(tg,"on"+lg)}rl(vr,"onAnimationEnd"),rl(Sr,"onAnimationIteration"),rl(pr,"onAnimationStart"),rl("dblclick","onDoubleClick"),rl("focusin","onFocus"),rl("focusout","onBlur"),rl(vy,"onTransitionRun"),rl(Sy,"onTransitionStart"),rl(py,"onTransitionCancel"),rl(br,"onTransitionEnd"),ia("onMouseEnter",["mouseout","mouseover"]),ia("onMouseLeave",["mouseout","mouseover"]),ia("onPointerEnter",["pointerout","pointerover"]),ia("onPointerLeave",["pointerout","pointerover"]),Ae("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Ae("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Ae("onBeforeInput",["compositionend","keypress","textInput","paste"]),Ae("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Ae("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Ae("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Vn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),eg=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Vn));function Q0(t,l){l=(l&4)!==0;for(var e=0;e<t.length;e++){var a=t[e],n=a.event;a=a.listeners;t:{var u=void 0;if(l)for(var i=a.length-1;0<=i;i--){var c=a[i],f=c.instance,s=c.currentTarget;if(c=c.listener,f!==u&&n.isPropagationStopped())break t;u=c,n.currentTarget=s;try{u(n)}catch(g){Zu(g)}n.currentTarget=null,u=f}else for(i=0;i<a.length;i++){if(c=a[i],f=c.instance,s=c.currentTarget,c=c.listener,f!==u&&n.isPropagationStopped())break t;u=c,n.currentTarget=s;try{u(n)}catch(g){Zu(g)}n.currentTarget=null,u=f}}}}function w(t,l){var e=l[zc];e===void 0&&(e=l[zc]=new Set);var a=t+"__bubble";e.has(a)||(V0(l,t,2,!1),e.add(a))}function ms(t,l,e){var a=0;l&&(a|=4),V0(e,t,a,l)}var Ci="_reactListening"+Math.random().toString(36).slice(2);function hs(t){if(!t[Ci]){t[Ci]=!0,No.forEach(function(e){e!=="selectionchange"&&(eg.has(e)||ms(e,!1,t),ms(e,!0,t))});var l=t.nodeType===9?t:t.ownerDocument;l===null||l[Ci]||(l[Ci]=!0,ms("selectionchange",!1,l))}}function V0(t,l,e,a){switch(vm(l)){case 2:var n=jg;break;case 8:n=Ug;break;default:n=Cs}e=n.bind(null,l,e,t),n=void 0,!Rc||l!=="touchstart"&&l!=="touchmove"&&l!=="wheel"||(n=!0),a?n!==void 0?t.addEventListener(l,e,{capture:!0,passive:n}):t.addEventListener(l,e,!0):n!==void 0?t.addEventListener(l,e,{passive:n}):t.addEventListener(l,e,!1)}function ys(t,l,e,a,n){var u=a;if(!(l&1)&&!(l&2)&&a!==null)t:for(;;){if(a===null)return;var i=a.tag;if(i===3||i===4){var c=a.stateNode.containerInfo;if(c===n)break;if(i===4)for(i=a.return;i!==null;){var f=i.tag;if((f===3||f===4)&&i.stateNode.containerInfo===n)return;i=i.return}for(;c!==null;){if(i=aa(c),i===null)return;if(f=i.tag,f===5||f===6||f===26||f===27){a=u=i;continue t}c=c.parentNode}}a=a.return}Jo(function(){var s=u,g=Uc(e),v=[];t:{var d=xr.get(t);if(d!==void 0){var y=Xu,p=t;switch(t){case"keypress":if(qu(e)===0)break t;case"keydown":case"keyup":y=Fh;break;case"focusin":p="focus",y=Yc;break;case"focusout":p="blur",y=Yc;break;case"beforeblur":case"afterblur":y=Yc;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":y=Wo;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":y=Yh;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":y=Ih;break;case vr:case Sr:case pr:y=Xh;break;case br:y=ty;break;case"scroll":case"scrollend":y=Nh;break;case"wheel":y=ey;break;case"copy":case"cut":case"paste":y=Vh;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":y=Io;break;case"toggle":case"beforetoggle":y=ny}var D=(l&4)!==0,O=!D&&(t==="scroll"||t==="scrollend"),r=D?d!==null?d+"Capture":null:d;D=[];for(var o=s,h;o!==null;){var S=o;if(h=S.stateNode,S=S.tag,S!==5&&S!==26&&S!==27||h===null||r===null||(S=on(o,r),S!=null&&D.push(Zn(o,S,h))),O)break;o=o.return}0<D.length&&(d=new y(d,p,null,e,g),v.push({event:d,listeners:D}))}}if(!(l&7)){t:{if(d=t==="mouseover"||t==="pointerover",y=t==="mouseout"||t==="pointerout",d&&e!==jc&&(p=e.relatedTarget||e.fromElement)&&(aa(p)||p[ea]))break t;if((y||d)&&(d=g.window===g?g:(d=g.ownerDocument)?d.defaultView||d.parentWindow:window,y?(p=e.relatedTarget||e.toElement,y=s,p=p?aa(p):null,p!==null&&(O=Pa(p),D=p.tag,p!==O||D!==5&&D!==27&&D!==6)&&(p=null)):(y=null,p=s),y!==p)){if(D=Wo,S="onMouseLeave",r="onMouseEnter",o="mouse",(t==="pointerout"||t==="pointerover")&&(D=Io,S="onPointerLeave",r="onPointerEnter",o="pointer"),O=y==null?d:sn(y),h=p==null?d:sn(p),d=new D(S,o+"leave",y,e,g),d.target=O,d.relatedTarget=h,S=null,aa(g)===s&&(D=new D(r,o+"enter",p,e,g),D.target=h,D.relatedTarget=O,S=D),O=S,y&&p)l:{for(D=ag,r=y,o=p,h=0,S=r;S;S=D(S))h++;S=0;for(var b=o;b;b=D(b))S++;for(;0<h-S;)r=D(r),h--;for(;0<S-h;)o=D(o),S--;for(;h--;){if(r===o||o!==null&&r===o.alternate){D=r;break l}r=D(r),o=D(o)}D=null}else D=null;y!==null&&Z0(v,d,y,D,!1),p!==null&&O!==null&&Z0(v,O,p,D,!0)}}t:{if(d=s?sn(s):window,y=d.nodeName&&d.nodeName.toLowerCase(),y==="select"||y==="input"&&d.type==="file")var A=ir;else if(nr(d))if(cr)A=hy;else{A=dy;var T=ry}else y=d.nodeName,!y||y.toLowerCase()!=="input"||d.type!=="checkbox"&&d.type!=="radio"?s&&Cc(s.elementType)&&(A=ir):A=my;if(A&&(A=A(t,s))){ur(v,A,e,g);break t}T&&T(t,d,s),t==="focusout"&&s&&d.type==="number"&&s.memoizedProps.value!=null&&Dc(d,"number",d.value)}switch(T=s?sn(s):window,t){case"focusin":(nr(T)||T.contentEditable==="true")&&(da=T,Zc=s,Sn=null);break;case"focusout":Sn=Zc=da=null;break;case"mousedown":Lc=!0;break;case"contextmenu":case"mouseup":case"dragend":Lc=!1,yr(v,e,g);break;case"selectionchange":if(gy)break;case"keydown":case"keyup":yr(v,e,g)}var C;if(Gc)t:{switch(t){case"compositionstart":var j="onCompositionStart";break t;case"compositionend":j="onCompositionEnd";break t;case"compositionupdate":j="onCompositionUpdate";break t}j=void 0}else ra?er(t,e)&&(j="onCompositionEnd"):t==="keydown"&&e.keyCode===229&&(j="onCompositionStart");j&&(Po&&e.locale!=="ko"&&(ra||j!=="onCompositionStart"?j==="onCompositionEnd"&&ra&&(C=ko()):(Il=g,Hc="value"in Il?Il.value:Il.textContent,ra=!0)),T=ji(s,j),0<T.length&&(j=new $o(j,t,null,e,g),v.push({event:j,listeners:T}),C?j.data=C:(C=ar(e),C!==null&&(j.data=C)))),(C=iy?cy(t,e):fy(t,e))&&(j=ji(s,"onBeforeInput"),0<j.length&&(T=new $o("onBeforeInput","beforeinput",null,e,g),v.push({event:T,listeners:j}),T.data=C)),Py(v,t,s,e,g)}Q0(v,l)})}function Zn(t,l,e){return{instance:t,listener:l,currentTarget:e}}function ji(t,l){for(var e=l+"Capture",a=[];t!==null;){var n=t,u=n.stateNode;if(n=n.tag,n!==5&&n!==26&&n!==27||u===null||(n=on(t,e),n!=null&&a.unshift(Zn(t,n,u)),n=on(t,l),n!=null&&a.push(Zn(t,n,u))),t.tag===3)return a;t=t.return}return[]}function ag(t){if(t===null)return null;do t=t.return;while(t&&t.tag!==5&&t.tag!==27);return t||null}function Z0(t,l,e,a,n){for(var u=l._reactName,i=[];e!==null&&e!==a;){var c=e,f=c.alternate,s=c.stateNode;if(c=c.tag,f!==null&&f===a)break;c!==5&&c!==26&&c!==27||s===null||(f=s,n?(s=on(e,u),s!=null&&i.unshift(Zn(e,s,f))):n||(s=on(e,u),s!=null&&i.push(Zn(e,s,f)))),e=e.return}i.length!==0&&t.push({event:l,listeners:i})}var ng=/\r\n?/g,ug=/\u0000|\uFFFD/g;function L0(t){return(typeof t=="string"?t:""+t).replace(ng,`
-`).replace(ug,"")}function K0(t,l){return l=L0(l),L0(t)===l}function et(t,l,e,a,n,u){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||fa(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&fa(t,""+a);break;case"className":Hu(t,"class",a);break;case"tabIndex":Hu(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Hu(t,e,a);break;case"style":Ko(t,a,u);break;case"data":if(l!=="object"){Hu(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Bu(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof u=="function"&&(e==="formAction"?(l!=="input"&&et(t,l,"name",n.name,n,null),et(t,l,"formEncType",n.formEncType,n,null),et(t,l,"formMethod",n.formMethod,n,null),et(t,l,"formTarget",n.formTarget,n,null)):(et(t,l,"encType",n.encType,n,null),et(t,l,"method",n.method,n,null),et(t,l,"target",n.target,n,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Bu(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=Al);break;case"onScroll":a!=null&&w("scroll",t);break;case"onScrollEnd":a!=null&&w("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(x(61));if(e=a.__html,e!=null){if(n.children!=null)throw Error(x(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=Bu(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":w("beforetoggle",t),w("toggle",t),Ru(t,"popover",a);break;case"xlinkActuate":zl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":zl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":zl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":zl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":zl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":zl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":zl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":zl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":zl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Ru(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=Rh.get(e)||e,Ru(t,e,a))}}function gs(t,l,e,a,n,u){switch(e){case"style":Ko(t,a,u);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(x(61));if(e=a.__html,e!=null){if(n.children!=null)throw Error(x(60));t.innerHTML=e}}break;case"children":typeof a=="string"?fa(t,a):(typeof a=="number"||typeof a=="bigint")&&fa(t,""+a);break;case"onScroll":a!=null&&w("scroll",t);break;case"onScrollEnd":a!=null&&w("scrollend",t);break;case"onClick":a!=null&&(t.onclick=Al);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Bo.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(n=e.endsWith("Capture"),l=e.slice(2,n?e.length-7:void 0),u=t[qt]||null,u=u!=null?u[e]:null,typeof u=="function"&&t.removeEventListener(l,u,n),typeof a=="function")){typeof u!="function"&&u!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,n);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):Ru(t,e,a)}}}function Ht(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",t),w("load",t);var a=!1,n=!1,u;for(u in e)if(e.hasOwnProperty(u)){var i=e[u];if(i!=null)switch(u){case"src":a=!0;break;case"srcSet":n=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(x(137,l));default:et(t,l,u,i,e,null)}}n&&et(t,l,"srcSet",e.srcSet,e,null),a&&et(t,l,"src",e.src,e,null);return;case"input":w("invalid",t);var c=u=i=n=null,f=null,s=null;for(a in e)if(e.hasOwnProperty(a)){var g=e[a];if(g!=null)switch(a){case"name":n=g;break;case"type":i=g;break;case"checked":f=g;break;case"defaultChecked":s=g;break;case"value":u=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(x(137,l));break;default:et(t,l,a,g,e,null)}}Qo(t,u,c,f,s,i,n,!1);return;case"select":w("invalid",t),a=i=u=null;for(n in e)if(e.hasOwnProperty(n)&&(c=e[n],c!=null))switch(n){case"value":u=c;break;case"defaultValue":i=c;break;case"multiple":a=c;default:et(t,l,n,c,e,null)}l=u,e=i,t.multiple=!!a,l!=null?ca(t,!!a,l,!1):e!=null&&ca(t,!!a,e,!0);return;case"textarea":w("invalid",t),u=n=a=null;for(i in e)if(e.hasOwnProperty(i)&&(c=e[i],c!=null))switch(i){case"value":a=c;break;case"defaultValue":n=c;break;case"children":u=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(x(91));break;default:et(t,l,i,c,e,null)}Zo(t,a,n,u);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:et(t,l,f,a,e,null)}return;case"dialog":w("beforetoggle",t),w("toggle",t),w("cancel",t),w("close",t);break;case"iframe":case"object":w("load",t);break;case"video":case"audio":for(a=0;a<Vn.length;a++)w(Vn[a],t);break;case"image":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"embed":case"source":case"link":w("error",t),w("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(s in e)if(e.hasOwnProperty(s)&&(a=e[s],a!=null))switch(s){case"children":case"dangerouslySetInnerHTML":throw Error(x(137,l));default:et(t,l,s,a,e,null)}return;default:if(Cc(l)){for(g in e)e.hasOwnProperty(g)&&(a=e[g],a!==void 0&&gs(t,l,g,a,e,void 0));return}}for(c in e)e.hasOwnProperty(c)&&(a=e[c],a!=null&&et(t,l,c,a,e,null))}function ig(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var n=null,u=null,i=null,c=null,f=null,s=null,g=null;for(y in e){var v=e[y];if(e.hasOwnProperty(y)&&v!=null)switch(y){case"checked":break;case"value":break;case"defaultValue":f=v;default:a.hasOwnProperty(y)||et(t,l,y,null,a,v)}}for(var d in a){var y=a[d];if(v=e[d],a.hasOwnProperty(d)&&(y!=null||v!=null))switch(d){case"type":u=y;break;case"name":n=y;break;case"checked":s=y;break;case"defaultChecked":g=y;break;case"value":i=y;break;case"defaultValue":c=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(x(137,l));break;default:y!==v&&et(t,l,d,y,a,v)}}_c(t,i,c,f,s,g,u,n);return;case"select":y=i=c=d=null;for(u in e)if(f=e[u],e.hasOwnProperty(u)&&f!=null)switch(u){case"value":break;case"multiple":y=f;default:a.hasOwnProperty(u)||et(t,l,u,null,a,f)}for(n in a)if(u=a[n],f=e[n],a.hasOwnProperty(n)&&(u!=null||f!=null))switch(n){case"value":d=u;break;case"defaultValue":c=u;break;case"multiple":i=u;default:u!==f&&et(t,l,n,u,a,f)}l=c,e=i,a=y,d!=null?ca(t,!!e,d,!1):!!a!=!!e&&(l!=null?ca(t,!!e,l,!0):ca(t,!!e,e?[]:"",!1));return;case"textarea":y=d=null;for(c in e)if(n=e[c],e.hasOwnProperty(c)&&n!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:et(t,l,c,null,a,n)}for(i in a)if(n=a[i],u=e[i],a.hasOwnProperty(i)&&(n!=null||u!=null))switch(i){case"value":d=n;break;case"defaultValue":y=n;break;case"children":break;case"dangerouslySetInnerHTML":if(n!=null)throw Error(x(91));break;default:n!==u&&et(t,l,i,n,a,u)}Vo(t,d,y);return;case"option":for(var p in e)if(d=e[p],e.hasOwnProperty(p)&&d!=null&&!a.hasOwnProperty(p))switch(p){case"selected":t.selected=!1;break;default:et(t,l,p,null,a,d)}for(f in a)if(d=a[f],y=e[f],a.hasOwnProperty(f)&&d!==y&&(d!=null||y!=null))switch(f){case"selected":t.selected=d&&typeof d!="function"&&typeof d!="symbol";break;default:et(t,l,f,d,a,y)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var D in e)d=e[D],e.hasOwnProperty(D)&&d!=null&&!a.hasOwnProperty(D)&&et(t,l,D,null,a,d);for(s in a)if(d=a[s],y=e[s],a.hasOwnProperty(s)&&d!==y&&(d!=null||y!=null))switch(s){case"children":case"dangerouslySetInnerHTML":if(d!=null)throw Error(x(137,l));break;default:et(t,l,s,d,a,y)}return;default:if(Cc(l)){for(var O in e)d=e[O],e.hasOwnProperty(O)&&d!==void 0&&!a.hasOwnProperty(O)&&gs(t,l,O,void 0,a,d);for(g in a)d=a[g],y=e[g],!a.hasOwnProperty(g)||d===y||d===void 0&&y===void 0||gs(t,l,g,d,a,y);return}}for(var r in e)d=e[r],e.hasOwnProperty(r)&&d!=null&&!a.hasOwnProperty(r)&&et(t,l,r,null,a,d);for(v in a)d=a[v],y=e[v],!a.hasOwnProperty(v)||d===y||d==null&&y==null||et(t,l,v,d,a,y)}function w0(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function cg(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var n=e[a],u=n.transferSize,i=n.initiatorType,c=n.duration;if(u&&c&&w0(i)){for(i=0,c=n.responseEnd,a+=1;a<e.length;a++){var f=e[a],s=f.startTime;if(s>c)break;var g=f.transferSize,v=f.initiatorType;g&&w0(v)&&(f=f.responseEnd,i+=g*(f<c?1:(c-s)/(f-s)))}if(--a,l+=8*(u+i)/(n.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var vs=null,Ss=null;function Ui(t){return t.nodeType===9?t:t.ownerDocument}function J0(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function k0(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function ps(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var bs=null;function fg(){var t=window.event;return t&&t.type==="popstate"?t===bs?!1:(bs=t,!0):(bs=null,!1)}var F0=typeof setTimeout=="function"?setTimeout:void 0,sg=typeof clearTimeout=="function"?clearTimeout:void 0,W0=typeof Promise=="function"?Promise:void 0,og=typeof queueMicrotask=="function"?queueMicrotask:typeof W0!="undefined"?function(t){return W0.resolve(null).then(t).catch(rg)}:F0;function rg(t){setTimeout(function(){throw t})}function ye(t){return t==="head"}function $0(t,l){var e=l,a=0;do{var n=e.nextSibling;if(t.removeChild(e),n&&n.nodeType===8)if(e=n.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(n),Ga(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Ln(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Ln(e);for(var u=e.firstChild;u;){var i=u.nextSibling,c=u.nodeName;u[fn]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&u.rel.toLowerCase()==="stylesheet"||e.removeChild(u),u=i}}else e==="body"&&Ln(t.ownerDocument.body);e=n}while(e);Ga(l)}function I0(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function xs(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":xs(e),Ac(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function dg(t,l,e,a){for(;t.nodeType===1;){var n=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[fn])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(u=t.getAttribute("rel"),u==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(u!==n.rel||t.getAttribute("href")!==(n.href==null||n.href===""?null:n.href)||t.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin)||t.getAttribute("title")!==(n.title==null?null:n.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(u=t.getAttribute("src"),(u!==(n.src==null?null:n.src)||t.getAttribute("type")!==(n.type==null?null:n.type)||t.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin))&&u&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var u=n.name==null?null:""+n.name;if(n.type==="hidden"&&t.getAttribute("name")===u)return t}else return t;if(t=sl(t.nextSibling),t===null)break}return null}function mg(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=sl(t.nextSibling),t===null))return null;return t}function P0(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=sl(t.nextSibling),t===null))return null;return t}function Es(t){return t.data==="$?"||t.data==="$~"}function Ts(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function hg(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function sl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var zs=null;function tm(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return sl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function lm(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function em(t,l,e){switch(l=Ui(e),t){case"html":if(t=l.documentElement,!t)throw Error(x(452));return t;case"head":if(t=l.head,!t)throw Error(x(453));return t;case"body":if(t=l.body,!t)throw Error(x(454));return t;default:throw Error(x(451))}}function Ln(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);Ac(t)}var ol=new Map,am=new Set;function Oi(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var Ql=W.d;W.d={f:yg,r:gg,D:vg,C:Sg,L:pg,m:bg,X:Eg,S:xg,M:Tg};function yg(){var t=Ql.f(),l=Ti();return t||l}function gg(t){var l=na(t);l!==null&&l.tag===5&&l.type==="form"?bd(l):Ql.r(t)}var Ba=typeof document=="undefined"?null:document;function nm(t,l,e){var a=Ba;if(a&&typeof l=="string"&&l){var n=el(l);n='link[rel="'+t+'"][href="'+n+'"]',typeof e=="string"&&(n+='[crossorigin="'+e+'"]'),am.has(n)||(am.add(n),t={rel:t,crossOrigin:e,href:l},a.querySelector(n)===null&&(l=a.createElement("link"),Ht(l,"link",t),zt(l),a.head.appendChild(l)))}}function vg(t){Ql.D(t),nm("dns-prefetch",t,null)}function Sg(t,l){Ql.C(t,l),nm("preconnect",t,l)}function pg(t,l,e){Ql.L(t,l,e);var a=Ba;if(a&&t&&l){var n='link[rel="preload"][as="'+el(l)+'"]';l==="image"&&e&&e.imageSrcSet?(n+='[imagesrcset="'+el(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(n+='[imagesizes="'+el(e.imageSizes)+'"]')):n+='[href="'+el(t)+'"]';var u=n;switch(l){case"style":u=Ya(t);break;case"script":u=qa(t)}ol.has(u)||(t=ct({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),ol.set(u,t),a.querySelector(n)!==null||l==="style"&&a.querySelector(Kn(u))||l==="script"&&a.querySelector(wn(u))||(l=a.createElement("link"),Ht(l,"link",t),zt(l),a.head.appendChild(l)))}}function bg(t,l){Ql.m(t,l);var e=Ba;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",n='link[rel="modulepreload"][as="'+el(a)+'"][href="'+el(t)+'"]',u=n;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":u=qa(t)}if(!ol.has(u)&&(t=ct({rel:"modulepreload",href:t},l),ol.set(u,t),e.querySelector(n)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(wn(u)))return}a=e.createElement("link"),Ht(a,"link",t),zt(a),e.head.appendChild(a)}}}function xg(t,l,e){Ql.S(t,l,e);var a=Ba;if(a&&t){var n=ua(a).hoistableStyles,u=Ya(t);l=l||"default";var i=n.get(u);if(!i){var c={loading:0,preload:null};if(i=a.querySelector(Kn(u)))c.loading=5;else{t=ct({rel:"stylesheet",href:t,"data-precedence":l},e),(e=ol.get(u))&&As(t,e);var f=i=a.createElement("link");zt(f),Ht(f,"link",t),f._p=new Promise(function(s,g){f.onload=s,f.onerror=g}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Ri(i,l,a)}i={type:"stylesheet",instance:i,count:1,state:c},n.set(u,i)}}}function Eg(t,l){Ql.X(t,l);var e=Ba;if(e&&t){var a=ua(e).hoistableScripts,n=qa(t),u=a.get(n);u||(u=e.querySelector(wn(n)),u||(t=ct({src:t,async:!0},l),(l=ol.get(n))&&Ms(t,l),u=e.createElement("script"),zt(u),Ht(u,"link",t),e.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function Tg(t,l){Ql.M(t,l);var e=Ba;if(e&&t){var a=ua(e).hoistableScripts,n=qa(t),u=a.get(n);u||(u=e.querySelector(wn(n)),u||(t=ct({src:t,async:!0,type:"module"},l),(l=ol.get(n))&&Ms(t,l),u=e.createElement("script"),zt(u),Ht(u,"link",t),e.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function um(t,l,e,a){var n=(n=Fl.current)?Oi(n):null;if(!n)throw Error(x(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=Ya(e.href),e=ua(n).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=Ya(e.href);var u=ua(n).hoistableStyles,i=u.get(t);if(i||(n=n.ownerDocument||n,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(t,i),(u=n.querySelector(Kn(t)))&&!u._p&&(i.instance=u,i.state.loading=5),ol.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},ol.set(t,e),u||zg(n,t,e,i.state))),l&&a===null)throw Error(x(528,""));return i}if(l&&a!==null)throw Error(x(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=qa(e),e=ua(n).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(x(444,t))}}function Ya(t){return'href="'+el(t)+'"'}function Kn(t){return'link[rel="stylesheet"]['+t+"]"}function im(t){return ct({},t,{"data-precedence":t.precedence,precedence:null})}function zg(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),Ht(l,"link",e),zt(l),t.head.appendChild(l))}function qa(t){return'[src="'+el(t)+'"]'}function wn(t){return"script[async]"+t}function cm(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+el(e.href)+'"]');if(a)return l.instance=a,zt(a),a;var n=ct({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),zt(a),Ht(a,"style",n),Ri(a,e.precedence,t),l.instance=a;case"stylesheet":n=Ya(e.href);var u=t.querySelector(Kn(n));if(u)return l.state.loading|=4,l.instance=u,zt(u),u;a=im(e),(n=ol.get(n))&&As(a,n),u=(t.ownerDocument||t).createElement("link"),zt(u);var i=u;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Ht(u,"link",a),l.state.loading|=4,Ri(u,e.precedence,t),l.instance=u;case"script":return u=qa(e.src),(n=t.querySelector(wn(u)))?(l.instance=n,zt(n),n):(a=e,(n=ol.get(u))&&(a=ct({},e),Ms(a,n)),t=t.ownerDocument||t,n=t.createElement("script"),zt(n),Ht(n,"link",a),t.head.appendChild(n),l.instance=n);case"void":return null;default:throw Error(x(443,l.type))}else l.type==="stylesheet"&&!(l.state.loading&4)&&(a=l.instance,l.state.loading|=4,Ri(a,e.precedence,t));return l.instance}function Ri(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),n=a.length?a[a.length-1]:null,u=n,i=0;i<a.length;i++){var c=a[i];if(c.dataset.precedence===l)u=c;else if(u!==n)break}u?u.parentNode.insertBefore(t,u.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function As(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function Ms(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var Hi=null;function fm(t,l,e){if(Hi===null){var a=new Map,n=Hi=new Map;n.set(e,a)}else n=Hi,a=n.get(e),a||(a=new Map,n.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),n=0;n<e.length;n++){var u=e[n];if(!(u[fn]||u[jt]||t==="link"&&u.getAttribute("rel")==="stylesheet")&&u.namespaceURI!=="http://www.w3.org/2000/svg"){var i=u.getAttribute(l)||"";i=t+i;var c=a.get(i);c?c.push(u):a.set(i,[u])}}return a}function sm(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function Ag(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function om(t){return!(t.type==="stylesheet"&&!(t.state.loading&3))}function Mg(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&!(e.state.loading&4)){if(e.instance===null){var n=Ya(a.href),u=l.querySelector(Kn(n));if(u){l=u._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=Ni.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=u,zt(u);return}u=l.ownerDocument||l,a=im(a),(n=ol.get(n))&&As(a,n),u=u.createElement("link"),zt(u);var i=u;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Ht(u,"link",a),e.instance=u}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&!(e.state.loading&3)&&(t.count++,e=Ni.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var _s=0;function _g(t,l){return t.stylesheets&&t.count===0&&Yi(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&Yi(t,t.stylesheets),t.unsuspend){var u=t.unsuspend;t.unsuspend=null,u()}},6e4+l);0<t.imgBytes&&_s===0&&(_s=62500*cg());var n=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&Yi(t,t.stylesheets),t.unsuspend)){var u=t.unsuspend;t.unsuspend=null,u()}},(t.imgBytes>_s?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(n)}}:null}function Ni(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Yi(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var Bi=null;function Yi(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,Bi=new Map,l.forEach(Dg,t),Bi=null,Ni.call(t))}function Dg(t,l){if(!(l.state.loading&4)){var e=Bi.get(t);if(e)var a=e.get(null);else{e=new Map,Bi.set(t,e);for(var n=t.querySelectorAll("link[data-precedence],style[data-precedence]"),u=0;u<n.length;u++){var i=n[u];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(e.set(i.dataset.precedence,i),a=i)}a&&e.set(null,a)}n=l.instance,i=n.getAttribute("data-precedence"),u=e.get(i)||a,u===a&&e.set(null,n),e.set(i,n),this.count++,a=Ni.bind(this),n.addEventListener("load",a),n.addEventListener("error",a),u?u.parentNode.insertBefore(n,u.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(n,t.firstChild)),l.state.loading|=4}}var Jn={$$typeof:Tl,Provider:null,Consumer:null,_currentValue:Ee,_currentValue2:Ee,_threadCount:0};function Cg(t,l,e,a,n,u,i,c,f){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=xc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=xc(0),this.hiddenUpdates=xc(null),this.identifierPrefix=a,this.onUncaughtError=n,this.onCaughtError=u,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function rm(t,l,e,a,n,u,i,c,f,s,g,v){return t=new Cg(t,l,e,i,f,s,g,v,c),l=1,u===!0&&(l|=24),u=Ft(3,null,null,l),t.current=u,u.stateNode=t,l=uf(),l.refCount++,t.pooledCache=l,l.refCount++,u.memoizedState={element:a,isDehydrated:e,cache:l},of(u),t}function dm(t){return t?(t=ya,t):ya}function mm(t,l,e,a,n,u){n=dm(n),a.context===null?a.context=n:a.pendingContext=n,a=ne(l),a.payload={element:e},u=u===void 0?null:u,u!==null&&(a.callback=u),e=ue(t,a,l),e!==null&&(Lt(e,t,l),An(e,t,l))}function hm(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function Ds(t,l){hm(t,l),(t=t.alternate)&&hm(t,l)}function ym(t){if(t.tag===13||t.tag===31){var l=Ce(t,67108864);l!==null&&Lt(l,t,67108864),Ds(t,67108864)}}function gm(t){if(t.tag===13||t.tag===31){var l=tl();l=Ec(l);var e=Ce(t,l);e!==null&&Lt(e,t,l),Ds(t,l)}}var qi=!0;function jg(t,l,e,a){var n=Y.T;Y.T=null;var u=W.p;try{W.p=2,Cs(t,l,e,a)}finally{W.p=u,Y.T=n}}function Ug(t,l,e,a){var n=Y.T;Y.T=null;var u=W.p;try{W.p=8,Cs(t,l,e,a)}finally{W.p=u,Y.T=n}}function Cs(t,l,e,a){if(qi){var n=js(a);if(n===null)ys(t,l,a,Gi,e),Sm(t,a);else if(Rg(n,t,l,e,a))a.stopPropagation();else if(Sm(t,a),l&4&&-1<Og.indexOf(t)){for(;n!==null;){var u=na(n);if(u!==null)switch(u.tag){case 3:if(u=u.stateNode,u.current.memoizedState.isDehydrated){var i=ze(u.pendingLanes);if(i!==0){var c=u;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Jt(i);c.entanglements[1]|=f,i&=~f}bl(u),!($&6)&&(xi=Kt()+500,Qn(0))}}break;case 31:case 13:c=Ce(u,2),c!==null&&Lt(c,u,2),Ti(),Ds(u,2)}if(u=js(a),u===null&&ys(t,l,a,Gi,e),u===n)break;n=u}n!==null&&a.stopPropagation()}else ys(t,l,a,null,e)}}function js(t){return t=Uc(t),Us(t)}var Gi=null;function Us(t){if(Gi=null,t=aa(t),t!==null){var l=Pa(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=go(l),t!==null)return t;t=null}else if(e===31){if(t=vo(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return Gi=t,null}function vm(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(vh()){case Ao:return 2;case Mo:return 8;case Du:case Sh:return 32;case _o:return 268435456;default:return 32}default:return 32}}var Os=!1,ge=null,ve=null,Se=null,kn=new Map,Fn=new Map,pe=[],Og="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Sm(t,l){switch(t){case"focusin":case"focusout":ge=null;break;case"dragenter":case"dragleave":ve=null;break;case"mouseover":case"mouseout":Se=null;break;case"pointerover":case"pointerout":kn.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Fn.delete(l.pointerId)}}function Wn(t,l,e,a,n,u){return t===null||t.nativeEvent!==u?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:u,targetContainers:[n]},l!==null&&(l=na(l),l!==null&&ym(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,n!==null&&l.indexOf(n)===-1&&l.push(n),t)}function Rg(t,l,e,a,n){switch(l){case"focusin":return ge=Wn(ge,t,l,e,a,n),!0;case"dragenter":return ve=Wn(ve,t,l,e,a,n),!0;case"mouseover":return Se=Wn(Se,t,l,e,a,n),!0;case"pointerover":var u=n.pointerId;return kn.set(u,Wn(kn.get(u)||null,t,l,e,a,n)),!0;case"gotpointercapture":return u=n.pointerId,Fn.set(u,Wn(Fn.get(u)||null,t,l,e,a,n)),!0}return!1}function pm(t){var l=aa(t.target);if(l!==null){var e=Pa(l);if(e!==null){if(l=e.tag,l===13){if(l=go(e),l!==null){t.blockedOn=l,Ro(t.priority,function(){gm(e)});return}}else if(l===31){if(l=vo(e),l!==null){t.blockedOn=l,Ro(t.priority,function(){gm(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function Xi(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=js(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);jc=a,e.target.dispatchEvent(a),jc=null}else return l=na(e),l!==null&&ym(l),t.blockedOn=e,!1;l.shift()}return!0}function bm(t,l,e){Xi(t)&&e.delete(l)}function Hg(){Os=!1,ge!==null&&Xi(ge)&&(ge=null),ve!==null&&Xi(ve)&&(ve=null),Se!==null&&Xi(Se)&&(Se=null),kn.forEach(bm),Fn.forEach(bm)}function Qi(t,l){t.blockedOn===l&&(t.blockedOn=null,Os||(Os=!0,xt.unstable_scheduleCallback(xt.unstable_NormalPriority,Hg)))}var Vi=null;function xm(t){Vi!==t&&(Vi=t,xt.unstable_scheduleCallback(xt.unstable_NormalPriority,function(){Vi===t&&(Vi=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],n=t[l+2];if(typeof a!="function"){if(Us(a||e)===null)continue;break}var u=na(e);u!==null&&(t.splice(l,3),l-=3,jf(u,{pending:!0,data:n,method:e.method,action:a},a,n))}}))}function Ga(t){function l(f){return Qi(f,t)}ge!==null&&Qi(ge,t),ve!==null&&Qi(ve,t),Se!==null&&Qi(Se,t),kn.forEach(l),Fn.forEach(l);for(var e=0;e<pe.length;e++){var a=pe[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<pe.length&&(e=pe[0],e.blockedOn===null);)pm(e),e.blockedOn===null&&pe.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var n=e[a],u=e[a+1],i=n[qt]||null;if(typeof u=="function")i||xm(e);else if(i){var c=null;if(u&&u.hasAttribute("formAction")){if(n=u,i=u[qt]||null)c=i.formAction;else if(Us(n)!==null)continue}else c=i.action;typeof c=="function"?e[a+1]=c:(e.splice(a,3),a-=3),xm(e)}}}function Em(){function t(u){u.canIntercept&&u.info==="react-transition"&&u.intercept({handler:function(){return new Promise(function(i){return n=i})},focusReset:"manual",scroll:"manual"})}function l(){n!==null&&(n(),n=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var u=navigation.currentEntry;u&&u.url!=null&&navigation.navigate(u.url,{state:u.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,n=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),n!==null&&(n(),n=null)}}}function Rs(t){this._internalRoot=t}Zi.prototype.render=Rs.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(x(409));var e=l.current,a=tl();mm(e,a,t,l,null,null)},Zi.prototype.unmount=Rs.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;mm(t.current,2,null,t,null,null),Ti(),l[ea]=null}};function Zi(t){this._internalRoot=t}Zi.prototype.unstable_scheduleHydration=function(t){if(t){var l=Oo();t={blockedOn:null,target:t,priority:l};for(var e=0;e<pe.length&&l!==0&&l<pe[e].priority;e++);pe.splice(e,0,t),e===0&&pm(t)}};var Tm=ho.version;if(Tm!=="19.2.3")throw Error(x(527,Tm,"19.2.3"));W.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(x(188)):(t=Object.keys(t).join(","),Error(x(268,t)));return t=oh(l),t=t!==null?po(t):null,t=t===null?null:t.stateNode,t};var Ng={bundleType:0,version:"19.2.3",rendererPackageName:"react-dom",currentDispatcherRef:Y,reconcilerVersion:"19.2.3"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__!="undefined"){var Li=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Li.isDisabled&&Li.supportsFiber)try{nn=Li.inject(Ng),wt=Li}catch(t){}}Eu.createRoot=function(t,l){if(!yo(t))throw Error(x(299));var e=!1,a="",n=jd,u=Ud,i=Od;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(n=l.onUncaughtError),l.onCaughtError!==void 0&&(u=l.onCaughtError),l.onRecoverableError!==void 0&&(i=l.onRecoverableError)),l=rm(t,1,!1,null,null,e,a,null,n,u,i,Em),t[ea]=l.current,hs(t),new Rs(l)},Eu.hydrateRoot=function(t,l,e){if(!yo(t))throw Error(x(299));var a=!1,n="",u=jd,i=Ud,c=Od,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(n=e.identifierPrefix),e.onUncaughtError!==void 0&&(u=e.onUncaughtError),e.onCaughtError!==void 0&&(i=e.onCaughtError),e.onRecoverableError!==void 0&&(c=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),l=rm(t,1,!0,l,e!=null?e:null,a,n,f,u,i,c,Em),l.context=dm(null),e=l.current,a=tl(),a=Ec(a),n=ne(a),n.callback=null,ue(e,n,a),e=a,l.current.lanes=e,cn(l,e),bl(l),t[ea]=l.current,hs(t),new Zi(l)},Eu.version="19.2.3";function zm(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__=="undefined"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(zm)}catch(t){console.error(t)}}zm(),co.exports=Eu;var Bg=co.exports;const Qs=class Qs{constructor(l,e,a,n,u,i,c,f,s,g){B(this,Ji);B(this,Ve);B(this,Vl);B(this,Qa);B(this,be);B(this,xe);B(this,Pn);B(this,tu);B(this,lu);B(this,eu);B(this,Va,null);B(this,Ze);B(this,au,null);B(this,nu,null);B(this,Zl,null);q(this,Ve,l),q(this,Vl,e),q(this,Qa,a),q(this,be,n),q(this,xe,u),q(this,Pn,i),q(this,tu,c),q(this,lu,f),q(this,eu,s),q(this,Ze,g)}static async create(l){var y;const e=l.attrs,a=e.num_timepoints,n=e.num_channels,u=e.sampling_frequency_hz,i=e.start_time_sec,c=e.data_min,f=e.data_max,s=e.data_median,g=e.num_spikes||0,v=await l.getDataset("raw_data");if(!v)throw new Error("No raw_data dataset found");if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0||f===void 0||s===void 0)throw new Error("Missing required attributes in zarr group");const d=new Qs(l,a,n,u,i,c,f,s,v,g);return g>0&&await $i(y=d,Ji,qm).call(y),d}get numTimepoints(){return z(this,Vl)}get numChannels(){return z(this,Qa)}get samplingFrequencyHz(){return z(this,be)}get startTimeSec(){return z(this,xe)}get dataMin(){return z(this,Pn)}get dataMax(){return z(this,tu)}get dataMedian(){return z(this,lu)}get endTimeSec(){return z(this,xe)+z(this,Vl)/z(this,be)}async getElectrodeCoords(){if(z(this,Va)===null){const l=await z(this,Ve).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const e=await l.getData({});q(this,Va,e)}return z(this,Va)}async getFrameData(l){if(l<0||l>=z(this,Vl))throw new Error(`Time index ${l} out of range [0, ${z(this,Vl)})`);return await z(this,eu).getData({slice:[[l,l+1],[0,z(this,Qa)]]})}getTimeFromIndex(l){return z(this,xe)+l/z(this,be)}getIndexFromTime(l){const e=Math.round((l-z(this,xe))*z(this,be));return Math.max(0,Math.min(z(this,Vl)-1,e))}getSpikingChannels(l){if(!z(this,Zl))return[];const e=z(this,Zl).get(l);return e?Array.from(e):[]}get hasSpikes(){return z(this,Ze)>0}get numSpikes(){return z(this,Ze)}};Ve=new WeakMap,Vl=new WeakMap,Qa=new WeakMap,be=new WeakMap,xe=new WeakMap,Pn=new WeakMap,tu=new WeakMap,lu=new WeakMap,eu=new WeakMap,Va=new WeakMap,Ze=new WeakMap,au=new WeakMap,nu=new WeakMap,Zl=new WeakMap,Ji=new WeakSet,qm=async function(){const l=await z(this,Ve).getDataset("spike_channel_indices");if(!l)throw new Error("No spike_channel_indices dataset found");const e=await l.getData({});q(this,au,e);const a=await z(this,Ve).getDataset("spike_frame_indices");if(!a)throw new Error("No spike_frame_indices dataset found");const n=await a.getData({});q(this,nu,n),q(this,Zl,new Map);for(let u=0;u<z(this,Ze);u++){const i=z(this,nu)[u],c=z(this,au)[u];z(this,Zl).has(i)||z(this,Zl).set(i,new Set),z(this,Zl).get(i).add(c)}};let Hs=Qs;const Am={"blue-red":t=>{const l=Math.round(255*t),e=Math.round(255*(1-t)),a=Math.round(128*(1-Math.abs(t-.5)*2));return`rgb(${l}, ${a}, ${e})`},viridis:t=>{const l=t;let e,a,n;if(l<.25){const u=l/.25;e=68+-9*u,a=1+81*u,n=84+55*u}else if(l<.5){const u=(l-.25)/.25;e=59+-26*u,a=82+62*u,n=139+1*u}else if(l<.75){const u=(l-.5)/.25;e=33+60*u,a=144+57*u,n=140+-41*u}else{const u=(l-.75)/.25;e=93+160*u,a=201+30*u,n=99+-62*u}return`rgb(${Math.round(e)}, ${Math.round(a)}, ${Math.round(n)})`},hot:t=>{const l=t;let e,a,n;return l<.33?(e=255*(l/.33),a=0,n=0):l<.67?(e=255,a=255*((l-.33)/.34),n=0):(e=255,a=255,n=255*((l-.67)/.33)),`rgb(${Math.round(e)}, ${Math.round(a)}, ${Math.round(n)})`},grayscale:t=>{const l=Math.round(255*t);return`rgb(${l}, ${l}, ${l})`},cool:t=>{const l=Math.round(255*t),e=Math.round(255*(1-t));return`rgb(${l}, ${e}, 255)`}},$n=(t,l="grayscale")=>(Am[l]||Am.grayscale)(t),Mm=.5,Yg=({client:t,currentTimeIndex:l,contrast:e,colormap:a,width:n,height:u,isPlaying:i})=>{const c=E.useRef(null),[f,s]=E.useState(null),[g,v]=E.useState(5),[d,y]=E.useState(null),[p,D]=E.useState([]),[O,r]=E.useState(null),o=E.useRef(new Map),h=E.useRef(null);E.useEffect(()=>{(async()=>{try{const A=await t.getElectrodeCoords();s(A);const C=qg(A)*.95/2;v(C)}catch(A){console.error("Error loading electrode coordinates:",A),r(A instanceof Error?A.message:"Unknown error")}})()},[t]),E.useEffect(()=>{(async()=>{try{const A=await t.getFrameData(l);y(A);const T=t.getSpikingChannels(l);if(i){const C=Date.now();for(const j of T)o.current.has(j)||o.current.set(j,C)}else D(T),o.current.clear();i&&S()}catch(A){console.error("Error loading frame data:",A),r(A instanceof Error?A.message:"Unknown error")}})()},[t,l,i]);const S=()=>{const b=Date.now(),A=Mm*1e3,T=[],C=[];o.current.forEach((j,H)=>{b-j>A?T.push(H):C.push(H)});for(const j of T)o.current.delete(j);D(C)};return E.useEffect(()=>(i&&o.current.size>0&&(h.current=window.setInterval(()=>{S()},50)),()=>{h.current!==null&&(clearInterval(h.current),h.current=null)}),[i,p.length]),E.useEffect(()=>{if(!c.current||!f||!d)return;const A=c.current.getContext("2d");if(!A)return;A.fillStyle="#90908b",A.fillRect(0,0,n,u);const T=f.length/2;let C=f[0],j=f[0],H=f[1],L=f[1];for(let ut=0;ut<T;ut++){const El=f[ut*2],hl=f[ut*2+1];El<C&&(C=El),El>j&&(j=El),hl<H&&(H=hl),hl>L&&(L=hl)}const Z=30,tt=j-C,rt=L-H,Mt=(n-2*Z)/tt,_=(u-2*Z)/rt,M=Math.max(0,Math.min(Mt,_)),R=(n-tt*M)/2-C*M,U=(u-rt*M)/2-H*M,N=t.dataMin,G=t.dataMax,X=t.dataMedian,k=2*Math.max(Math.abs(G-X),Math.abs(N-X)),_t=Math.exp((e-40)/10);for(let ut=0;ut<T;ut++){const El=f[ut*2]*M+R,hl=f[ut*2+1]*M+U;let We=(.5+(d[ut]-X)/k-.5)*2*_t;We=Math.max(-1,Math.min(1,We)),We=-We;const Js=(We+1)/2,Bm=$n(Js,a);A.fillStyle=Bm,A.beginPath(),A.arc(El,hl,g*M,0,2*Math.PI),A.fill()}if(p.length>0){const ut=Date.now(),El=Mm*1e3;A.lineWidth=Math.max(3,g*M*.3);for(const hl of p){const Fe=o.current.get(hl);let pu=.9;i&&Fe!==void 0&&(pu=.9*(1-(ut-Fe)/El)),A.strokeStyle=`rgba(255, 0, 0, ${pu})`;const We=f[hl*2]*M+R,Js=f[hl*2+1]*M+U;A.beginPath(),A.arc(We,Js,g*M,0,2*Math.PI),A.stroke()}}},[f,d,p,g,e,a,n,u,t]),O?m.jsxs("div",{style:{width:n,height:u,display:"flex",justifyContent:"center",alignItems:"center",color:"red"},children:["Error: ",O]}):m.jsx("canvas",{ref:c,width:n,height:u,style:{display:"block",imageRendering:"pixelated"}})};function qg(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const _m=uc.createContext(void 0),Gg=()=>{const t=E.useContext(_m);if(!t)throw new Error("useTimeseriesSelection must be used within a TimeseriesSelectionContext");const l=t.dispatch,e=E.useCallback(c=>{l({type:"initializeTimeseries",startTimeSec:c.startTimeSec,endTimeSec:c.endTimeSec,initialVisibleStartTimeSec:c.initialVisibleStartTimeSec,initialVisibleEndTimeSec:c.initialVisibleEndTimeSec})},[l]),a=E.useCallback((c,f)=>{l({type:"setVisibleTimeRange",visibleStartTimeSec:c,visibleEndTimeSec:f})},[l]),n=E.useCallback((c,f)=>{l({type:"setCurrentTime",currentTime:c,ensureVisible:f==null?void 0:f.ensureVisible})},[l]),u=E.useCallback(c=>{l({type:"zoomVisibleTimeRange",factor:c})},[l]),i=E.useCallback(c=>{l({type:"translateVisibleTimeRangeFrac",frac:c})},[l]);if(t===void 0)throw new Error("useTimeseriesSelection must be used within a TimeseriesSelectionContext.Provider");return{initializeTimeseriesSelection:e,setVisibleTimeRange:a,setCurrentTime:n,zoomVisibleTimeRange:u,translateVisibleTimeRangeFrac:i,timeseriesSelection:t.timeseriesSelection,startTimeSec:t.timeseriesSelection.startTimeSec,endTimeSec:t.timeseriesSelection.endTimeSec,visibleStartTimeSec:t.timeseriesSelection.visibleStartTimeSec,visibleEndTimeSec:t.timeseriesSelection.visibleEndTimeSec,currentTime:t.timeseriesSelection.currentTime}},Xg=[1e-4,5e-4,.001,.005,.01,.05,.1,.5,1,2,5,10],Qg=.001,Vg=50,Zg="grayscale",Lg=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(!1),[v,d]=E.useState(Qg),[y,p]=E.useState(Vg),[D,O]=E.useState(Zg),[r,o]=E.useState(null),[h,S]=E.useState(null),{currentTime:b,setCurrentTime:A,initializeTimeseriesSelection:T}=Gg(),C=100,j=e-C;E.useEffect(()=>{(async()=>{try{i(!0),f(null);const N=await Hs.create(t);n(N),T({startTimeSec:N.startTimeSec,endTimeSec:N.endTimeSec,initialVisibleStartTimeSec:N.startTimeSec,initialVisibleEndTimeSec:N.endTimeSec}),A(N.startTimeSec)}catch(N){console.error("Error loading MEA Movie client:",N),f(N instanceof Error?N.message:"Unknown error")}finally{i(!1)}})()},[t,T,A]);const H=E.useMemo(()=>!a||b===void 0?0:a.getIndexFromTime(b),[a,b]);E.useEffect(()=>{if(!s||!a||r===null||h===null)return;let U;const N=()=>{const X=(Date.now()-r)/1e3,k=h+X*v;k>=a.endTimeSec?(g(!1),A(a.endTimeSec),o(null),S(null)):(A(k),U=requestAnimationFrame(N))};return U=requestAnimationFrame(N),()=>{U&&cancelAnimationFrame(U)}},[s,a,v,r,h,A]);const L=E.useCallback(()=>{!a||b===void 0||(s?(g(!1),o(null),S(null)):(b>=a.endTimeSec?(A(a.startTimeSec),o(Date.now()),S(a.startTimeSec)):(o(Date.now()),S(b)),g(!0)))},[s,a,b,A]),Z=E.useCallback(U=>{if(!a)return;const N=parseInt(U.target.value,10),G=a.getTimeFromIndex(N);A(G),s&&(o(Date.now()),S(G))},[a,A,s]),tt=E.useCallback(U=>{p(parseInt(U.target.value,10))},[]),rt=E.useCallback(U=>{const N=parseFloat(U.target.value);d(N),s&&b!==void 0&&(o(Date.now()),S(b))},[s,b]),Mt=E.useCallback(U=>{O(U.target.value)},[]),_=E.useCallback(()=>{if(!a||b===void 0)return;const U=Math.max(b-.001,a.startTimeSec);A(U),s&&(o(Date.now()),S(U))},[a,b,A,s]);if(u)return m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif"},children:"Loading MEA Movie data..."});if(c||!a)return m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load MEA Movie data"]});const M=b!==void 0?b:a.startTimeSec,R=a.endTimeSec-a.startTimeSec;return m.jsxs("div",{style:{display:"flex",flexDirection:"column",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#1a1a1a"},children:[m.jsx("div",{style:{height:j,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#000000"},children:m.jsx(Yg,{client:a,currentTimeIndex:H,contrast:y,colormap:D,width:l,height:j,isPlaying:s})}),m.jsxs("div",{style:{height:C,padding:"15px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"10px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"15px"},children:[m.jsx("button",{onClick:L,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:"pointer",fontWeight:"bold"},children:s?"⏸ Pause":"▶ Play"}),m.jsx("button",{onClick:_,style:{padding:"6px 10px",fontSize:"12px",backgroundColor:"#666",color:"white",border:"none",borderRadius:"4px",cursor:"pointer",fontWeight:"bold"},title:"Rewind 1 millisecond",children:"⏮ -1ms"}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"45px"},children:"Speed:"}),m.jsx("select",{value:v,onChange:rt,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:Xg.map(U=>m.jsxs("option",{value:U,children:[U,"x"]},U))})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Contrast:"}),m.jsx("input",{type:"range",min:0,max:100,value:y,onChange:tt,style:{width:"150px",height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}}),m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"30px",textAlign:"right"},children:y})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Colormap:"}),m.jsxs("select",{value:D,onChange:Mt,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:[m.jsx("option",{value:"grayscale",children:"Grayscale"}),m.jsx("option",{value:"viridis",children:"Viridis"}),m.jsx("option",{value:"hot",children:"Hot"}),m.jsx("option",{value:"blue-red",children:"Blue-Red"}),m.jsx("option",{value:"cool",children:"Cool"})]})]}),m.jsxs("div",{style:{marginLeft:"auto",fontSize:"12px",color:"#ccc"},children:[m.jsxs("span",{children:["Time: ",M.toFixed(3),"s / ",R.toFixed(3),"s"]}),m.jsxs("span",{style:{marginLeft:"15px"},children:["Frame: ",H," / ",a.numTimepoints-1]}),m.jsxs("span",{style:{marginLeft:"15px"},children:["Channels: ",a.numChannels]})]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"40px"},children:"Time:"}),m.jsx("input",{type:"range",min:0,max:a.numTimepoints-1,value:H,onChange:Z,style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]})]})]})},Ki=t=>{const[l,e]=E.useState(t==null?void 0:t.stateRef.current),a=t==null?void 0:t.stateRef,n=t==null?void 0:t.onChange;return E.useEffect(()=>{e(a==null?void 0:a.current);const u=n==null?void 0:n(i=>{e(i)});return()=>{u&&u()}},[n,a]),l===void 0?{state:void 0,dispatch:void 0}:{state:l,dispatch:t==null?void 0:t.dispatch}},Kg=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(wg,{context:a.timeseriesSelection,children:m.jsx(Lg,{zarrGroup:t,width:l,height:e})}),wg=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!e||!a?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(_m.Provider,{value:{timeseriesSelection:e,dispatch:a},children:l})},Vs=class Vs{constructor(l,e,a,n,u,i,c,f){B(this,ki);B(this,Le);B(this,Ll);B(this,Za);B(this,uu);B(this,iu);B(this,cu);B(this,fu);B(this,su);B(this,La,null);B(this,Ka,null);B(this,wa,null);q(this,Le,l),q(this,Ll,e),q(this,Za,a),q(this,uu,n),q(this,iu,u),q(this,cu,i),q(this,fu,c),q(this,su,f)}static async create(l){var v;const e=l.attrs,a=e.num_spikes,n=e.num_channels,u=e.sampling_frequency_hz,i=e.data_min,c=e.data_max,f=e.data_median,s=await l.getDataset("spike_frames_data");if(!s)throw new Error("No spike_frames_data dataset found");if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0||f===void 0)throw new Error("Missing required attributes in zarr group");const g=new Vs(l,a,n,u,i,c,f,s);return await $i(v=g,ki,Gm).call(v),g}get numSpikes(){return z(this,Ll)}get numChannels(){return z(this,Za)}get samplingFrequencyHz(){return z(this,uu)}get dataMin(){return z(this,iu)}get dataMax(){return z(this,cu)}get dataMedian(){return z(this,fu)}async getElectrodeCoords(){if(z(this,La)===null){const l=await z(this,Le).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const e=await l.getData({});q(this,La,e)}return z(this,La)}async getSpikeFrameData(l){if(l<0||l>=z(this,Ll))throw new Error(`Spike index ${l} out of range [0, ${z(this,Ll)})`);return await z(this,su).getData({slice:[[l,l+1],[0,z(this,Za)]]})}getSpikeTime(l){if(!z(this,Ka)||l<0||l>=z(this,Ll))throw new Error(`Invalid spike index: ${l}`);return z(this,Ka)[l]}getSpikeLabel(l){if(!z(this,wa)||l<0||l>=z(this,Ll))throw new Error(`Invalid spike index: ${l}`);return z(this,wa)[l]}};Le=new WeakMap,Ll=new WeakMap,Za=new WeakMap,uu=new WeakMap,iu=new WeakMap,cu=new WeakMap,fu=new WeakMap,su=new WeakMap,La=new WeakMap,Ka=new WeakMap,wa=new WeakMap,ki=new WeakSet,Gm=async function(){const l=await z(this,Le).getDataset("spike_times_sec");if(!l)throw new Error("No spike_times_sec dataset found");const e=await l.getData({});q(this,Ka,e);const a=await z(this,Le).getDataset("spike_labels");if(!a)throw new Error("No spike_labels dataset found");const n=await a.getData({});q(this,wa,n)};let Ns=Vs;const Jg=({electrodeCoords:t,frameData:l,dataMin:e,dataMax:a,dataMedian:n,contrast:u,colormap:i,width:c,height:f})=>{const s=E.useRef(null),g=uc.useMemo(()=>kg(t)*.95/2,[t]);return E.useEffect(()=>{if(!s.current)return;const d=s.current.getContext("2d");if(!d)return;d.fillStyle="#90908b",d.fillRect(0,0,c,f);const y=t.length/2;let p=t[0],D=t[0],O=t[1],r=t[1];for(let Z=0;Z<y;Z++){const tt=t[Z*2],rt=t[Z*2+1];tt<p&&(p=tt),tt>D&&(D=tt),rt<O&&(O=rt),rt>r&&(r=rt)}const o=30,h=D-p,S=r-O,b=(c-2*o)/h,A=(f-2*o)/S,T=Math.max(0,Math.min(b,A)),C=(c-h*T)/2-p*T,j=(f-S*T)/2-O*T,H=2*Math.max(Math.abs(a-n),Math.abs(e-n)),L=Math.exp((u-40)/10);for(let Z=0;Z<y;Z++){const tt=t[Z*2]*T+C,rt=t[Z*2+1]*T+j;let M=(.5+(l[Z]-n)/H-.5)*2*L;M=Math.max(-1,Math.min(1,M)),M=-M;const R=(M+1)/2,U=$n(R,i);d.fillStyle=U,d.beginPath(),d.arc(tt,rt,g*T,0,2*Math.PI),d.fill()}},[t,l,g,u,i,c,f,e,a,n]),m.jsx("canvas",{ref:s,width:c,height:f,style:{display:"block",imageRendering:"pixelated"}})};function kg(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Fg=t=>l=>e=>{$g(l,t,e)},Wg=t=>l=>e=>{Ig(l,t,e)},$g=(t,l,e)=>{const a={type:e.ctrlKey?Dm:e.shiftKey?jm:Cm,targetUnit:t};l(a)},Ig=(t,l,e)=>{const a={type:e.shiftKey?jm:e.ctrlKey?Cm:Dm,targetUnit:t};l(a)},Dm="UNIQUE_SELECT",Cm="TOGGLE_UNIT",jm="TOGGLE_RANGE",Pg={selectedUnitIds:new Set,currentUnitId:void 0,orderedUnitIds:[]},Um=()=>E.useContext(In),In=uc.createContext({unitSelection:Pg,unitSelectionDispatch:()=>{}}),Om=()=>{const{unitSelection:t,unitSelectionDispatch:l}=Um(),e=E.useMemo(()=>Fg(l),[l]),a=E.useMemo(()=>Wg(l),[l]),n=E.useMemo(()=>tv(t.orderedUnitIds,t.restrictedUnitIds),[t.orderedUnitIds,t.restrictedUnitIds]),u=E.useMemo(()=>t.orderedUnitIds.filter(i=>t.selectedUnitIds.has(i)),[t.orderedUnitIds,t.selectedUnitIds]);return{selectedUnitIds:t.selectedUnitIds,currentUnitId:t.currentUnitId,orderedUnitIds:n,allOrderedUnitIds:t.orderedUnitIds,selectedUnitIdsArray:u,visibleUnitIds:t.visibleUnitIds,primarySortRule:t.sortRules&&t.sortRules.length>0?t.sortRules[t.sortRules.length-1]:void 0,page:t.page,unitsPerPage:t.unitsPerPage,checkboxClickHandlerGenerator:e,plotClickHandlerGenerator:a,unitIdSelectionDispatch:l,currentState:t,restrictedUnitIds:t.restrictedUnitIds}},tv=(t,l)=>{if(l===void 0)return t;const e=new Set(l);return t.filter(a=>e.has(a))},lv=50,ev="grayscale",av=({zarrGroup:t,width:l,height:e})=>{var N;const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(0),[v,d]=E.useState(lv),[y,p]=E.useState(ev),[D,O]=E.useState(null),[r,o]=E.useState(null),[h,S]=E.useState(!1),b=E.useContext(In),A=E.useMemo(()=>{var G;return((G=b==null?void 0:b.unitSelection)==null?void 0:G.selectedUnitIds)||new Set},[b]),T=140,C=e-T;E.useEffect(()=>{(async()=>{try{i(!0),f(null);const X=await Ns.create(t);n(X);const k=await X.getElectrodeCoords();O(k),X.numSpikes>0&&g(0)}catch(X){console.error("Error loading MEA Spike Frames Movie client:",X),f(X instanceof Error?X.message:"Unknown error")}finally{i(!1)}})()},[t]);const j=E.useCallback(G=>{const X=parseInt(G.target.value,10);g(X)},[]),H=E.useCallback(G=>{d(parseInt(G.target.value,10))},[]),L=E.useCallback(G=>{p(G.target.value)},[]),Z=E.useCallback(()=>{g(G=>Math.max(0,G-1))},[]),tt=E.useCallback(()=>{a&&g(G=>Math.min(a.numSpikes-1,G+1))},[a]),rt=E.useCallback(G=>{S(G.target.checked),g(0)},[]),Mt=E.useMemo(()=>{if(!a||!h||A.size===0)return Array.from({length:(a==null?void 0:a.numSpikes)||0},(X,k)=>k);const G=[];for(let X=0;X<a.numSpikes;X++){const k=a.getSpikeLabel(X);A.has(String(k))&&G.push(X)}return G},[a,h,A]),_=(N=Mt[s])!=null?N:0;if(E.useEffect(()=>{if(!a)return;(async()=>{try{const X=await a.getSpikeFrameData(_);o(X)}catch(X){console.error("Error loading spike frame data:",X),f(X instanceof Error?X.message:"Unknown error")}})()},[a,_]),u)return m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif"},children:"Loading Spike Frames Movie data..."});if(c||!a||!D||!r)return m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load Spike Frames Movie data"]});const M=a.getSpikeTime(_),R=a.getSpikeLabel(_),U=Mt.length;return m.jsxs("div",{style:{display:"flex",flexDirection:"column",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#1a1a1a"},children:[m.jsx("div",{style:{height:C,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#000000"},children:m.jsx(Jg,{electrodeCoords:D,frameData:r,dataMin:a.dataMin,dataMax:a.dataMax,dataMedian:a.dataMedian,contrast:v,colormap:y,width:l,height:C})}),m.jsxs("div",{style:{height:T,padding:"15px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"10px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"15px"},children:[m.jsx("button",{onClick:Z,disabled:s===0,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:s===0?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===0?"not-allowed":"pointer",fontWeight:"bold"},children:"← Prev"}),m.jsx("button",{onClick:tt,disabled:s>=U-1,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:s>=U-1?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s>=U-1?"not-allowed":"pointer",fontWeight:"bold"},children:"Next →"}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px",marginLeft:"10px"},children:[m.jsx("input",{type:"checkbox",id:"filterBySelectedUnits",checked:h,onChange:rt,style:{cursor:"pointer",width:"16px",height:"16px"}}),m.jsx("label",{htmlFor:"filterBySelectedUnits",style:{fontSize:"12px",color:"#ccc",cursor:"pointer",userSelect:"none"},children:"Filter by selected units"})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Contrast:"}),m.jsx("input",{type:"range",min:0,max:100,value:v,onChange:H,style:{width:"150px",height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}}),m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"30px",textAlign:"right"},children:v})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Colormap:"}),m.jsxs("select",{value:y,onChange:L,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:[m.jsx("option",{value:"grayscale",children:"Grayscale"}),m.jsx("option",{value:"viridis",children:"Viridis"}),m.jsx("option",{value:"hot",children:"Hot"}),m.jsx("option",{value:"blue-red",children:"Blue-Red"}),m.jsx("option",{value:"cool",children:"Cool"})]})]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"50px"},children:"Spike:"}),m.jsx("input",{type:"range",min:0,max:Math.max(0,U-1),value:s,onChange:j,style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"20px",fontSize:"13px",color:"#fff",backgroundColor:"#333",padding:"8px 12px",borderRadius:"4px"},children:[m.jsxs("span",{children:[m.jsx("strong",{children:"Spike:"})," ",s+1," / ",U,h&&A.size>0&&m.jsxs("span",{style:{color:"#aaa",marginLeft:"5px"},children:["(of ",a.numSpikes," total)"]})]}),m.jsxs("span",{children:[m.jsx("strong",{children:"Time:"})," ",M.toFixed(4)," s"]}),m.jsxs("span",{children:[m.jsx("strong",{children:"Unit:"})," ",R]}),m.jsxs("span",{style:{marginLeft:"auto",color:"#aaa"},children:["Channels: ",a.numChannels]})]})]})]})},nv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(uv,{context:a.unitSelection,children:m.jsx(av,{zarrGroup:t,width:l,height:e})}),uv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},Zs=class Zs{constructor(l,e,a){B(this,Fi);B(this,Ke);B(this,Kl);B(this,wl);B(this,Ja,null);B(this,ka,null);B(this,we,null);B(this,ou,0);q(this,Ke,l),q(this,Kl,e),q(this,wl,a)}static async create(l){var i;const e=l.attrs,a=e.num_frames,n=e.num_channels;if(a===void 0||n===void 0)throw new Error("Missing required attributes in zarr group");const u=new Zs(l,a,n);return await $i(i=u,Fi,Xm).call(i),u}get numFrames(){return z(this,Kl)}get numChannels(){return z(this,wl)}get electrodeCoords(){if(!z(this,Ja))throw new Error("Electrode coordinates not loaded");return z(this,Ja)}get maxAmplitude(){return z(this,ou)}getFiringRatesForFrame(l){if(!z(this,ka))throw new Error("Mean firing rates not loaded");if(l<0||l>=z(this,Kl))throw new Error(`Frame index ${l} out of range [0, ${z(this,Kl)})`);const e=l*z(this,wl),a=e+z(this,wl);return z(this,ka).slice(e,a)}getAmplitudesForFrame(l){if(!z(this,we))throw new Error("Mean spike amplitudes not loaded");if(l<0||l>=z(this,Kl))throw new Error(`Frame index ${l} out of range [0, ${z(this,Kl)})`);const e=l*z(this,wl),a=e+z(this,wl);return z(this,we).slice(e,a)}};Ke=new WeakMap,Kl=new WeakMap,wl=new WeakMap,Ja=new WeakMap,ka=new WeakMap,we=new WeakMap,ou=new WeakMap,Fi=new WeakSet,Xm=async function(){const l=await z(this,Ke).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");q(this,Ja,await l.getData({}));const e=await z(this,Ke).getDataset("mean_firing_rates");if(!e)throw new Error("No mean_firing_rates dataset found");q(this,ka,await e.getData({}));const a=await z(this,Ke).getDataset("mean_spike_amplitudes");if(!a)throw new Error("No mean_spike_amplitudes dataset found");q(this,we,await a.getData({})),q(this,ou,Math.max(...Array.from(z(this,we))))};let Bs=Zs;const iv=300,cv=({client:t,frameIndex:l,width:e,height:a})=>{const n=E.useRef(null),[u,i]=E.useState(null),[c,f]=E.useState(null),s=E.useRef([]);E.useEffect(()=>{if(n.current)try{const y=n.current.getContext("2d");if(!y)return;const p=t.electrodeCoords,D=t.getFiringRatesForFrame(l),O=t.getAmplitudesForFrame(l),r=t.maxAmplitude,o=t.numChannels;y.fillStyle="#f5f5f5",y.fillRect(0,0,e,a);let h=p[0],S=p[0],b=p[1],A=p[1];for(let M=0;M<o;M++){const R=p[M*2],U=p[M*2+1];R<h&&(h=R),R>S&&(S=R),U<b&&(b=U),U>A&&(A=U)}const T=fv(p),C=60,j=S-h,H=A-b,L=(e-2*C)/j,Z=(a-2*C)/H,tt=Math.max(0,Math.min(L,Z)),rt=(e-j*tt)/2-h*tt,Mt=(a-H*tt)/2-b*tt,_=T*tt*.9/2;s.current=[];for(let M=0;M<o;M++){const R=p[M*2]*tt+rt,U=p[M*2+1]*tt+Mt,N=D[M],G=O[M],k=Math.min(N/iv,1)*_,_t=r>0?G/r:0,ut=$n(_t,"viridis");s.current.push({x:R,y:U,radius:k,channelIndex:M}),k>0?(y.fillStyle=ut,y.beginPath(),y.arc(R,U,k,0,2*Math.PI),y.fill(),y.strokeStyle="rgba(0, 0, 0, 0.3)",y.lineWidth=1,y.stroke()):(y.fillStyle="#cccccc",y.beginPath(),y.arc(R,U,2,0,2*Math.PI),y.fill())}if(u){const M=s.current.find(R=>R.channelIndex===u.channelIndex);M&&(y.strokeStyle="rgba(255, 0, 0, 0.8)",y.lineWidth=3,y.beginPath(),y.arc(M.x,M.y,Math.max(M.radius,4),0,2*Math.PI),y.stroke())}}catch(d){console.error("Error rendering canvas:",d),f(d instanceof Error?d.message:"Unknown error")}},[t,l,e,a,u]);const g=d=>{const y=n.current;if(!y)return;const p=y.getBoundingClientRect(),D=d.clientX-p.left,O=d.clientY-p.top;let r=null;for(const o of s.current){const h=D-o.x,S=O-o.y;if(Math.sqrt(h*h+S*S)<=Math.max(o.radius,4)){const A=t.getFiringRatesForFrame(l),T=t.getAmplitudesForFrame(l);r={channelIndex:o.channelIndex,firingRate:A[o.channelIndex],amplitude:T[o.channelIndex],x:D,y:O};break}}i(r)},v=()=>{i(null)};return c?m.jsxs("div",{style:{width:e,height:a,display:"flex",justifyContent:"center",alignItems:"center",color:"red"},children:["Error: ",c]}):m.jsxs("div",{style:{position:"relative",width:e,height:a},children:[m.jsx("canvas",{ref:n,width:e,height:a,onMouseMove:g,onMouseLeave:v,style:{display:"block",cursor:u?"pointer":"default"}}),u&&m.jsxs("div",{style:{position:"absolute",left:u.x+15,top:u.y-10,backgroundColor:"rgba(0, 0, 0, 0.85)",color:"white",padding:"8px 12px",borderRadius:"4px",fontSize:"13px",pointerEvents:"none",whiteSpace:"nowrap",boxShadow:"0 2px 8px rgba(0,0,0,0.3)",zIndex:1e3},children:[m.jsx("div",{children:m.jsxs("strong",{children:["Channel ",u.channelIndex]})}),m.jsxs("div",{children:["Firing Rate: ",u.firingRate.toFixed(2)," Hz"]}),m.jsxs("div",{children:["Amplitude: ",u.amplitude.toFixed(2)," μV"]})]})]})};function fv(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Rm=300,sv=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(0),v=250,d=80,y=e,p=l-v,D=a&&a.numFrames>1,O=e-(D?d:0);return E.useEffect(()=>{(async()=>{try{i(!0),f(null);const o=await Bs.create(t);n(o)}catch(o){console.error("Error loading MEA Firing Rates and Amplitudes client:",o),f(o instanceof Error?o.message:"Unknown error")}finally{i(!1)}})()},[t]),u?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#f5f5f5"},children:"Loading Firing Rates and Amplitudes data..."}):c||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red",backgroundColor:"#f5f5f5"},children:["Error: ",c||"Failed to load data"]}):m.jsxs("div",{style:{display:"flex",flexDirection:"row",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#f5f5f5"},children:[m.jsxs("div",{style:{width:p,height:e,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:p,height:O},children:m.jsx(cv,{client:a,frameIndex:s,width:p,height:O})}),D&&m.jsxs("div",{style:{height:d,padding:"15px 20px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"12px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"12px"},children:[m.jsx("button",{onClick:()=>g(Math.max(0,s-1)),disabled:s===0,style:{padding:"6px 14px",fontSize:"13px",backgroundColor:s===0?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===0?"not-allowed":"pointer",fontWeight:"bold"},children:"← Prev"}),m.jsx("button",{onClick:()=>g(Math.min(a.numFrames-1,s+1)),disabled:s===a.numFrames-1,style:{padding:"6px 14px",fontSize:"13px",backgroundColor:s===a.numFrames-1?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===a.numFrames-1?"not-allowed":"pointer",fontWeight:"bold"},children:"Next →"}),m.jsxs("div",{style:{marginLeft:"auto",fontSize:"13px",color:"#ccc",fontWeight:"500"},children:["Frame: ",s+1," / ",a.numFrames]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"12px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"45px"},children:"Frame:"}),m.jsx("input",{type:"range",min:0,max:a.numFrames-1,value:s,onChange:r=>g(parseInt(r.target.value,10)),style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]})]})]}),m.jsxs("div",{style:{width:v,height:y,padding:"20px",backgroundColor:"#ffffff",borderLeft:"1px solid #ddd",overflowY:"auto"},children:[m.jsx("h3",{style:{margin:"0 0 20px 0",fontSize:"16px",fontWeight:"bold",color:"#333"},children:"Legend"}),m.jsxs("div",{style:{marginBottom:"30px"},children:[m.jsx("h4",{style:{margin:"0 0 12px 0",fontSize:"14px",fontWeight:"600",color:"#555"},children:"Circle Size: Firing Rate"}),m.jsx("div",{style:{fontSize:"12px",color:"#666",lineHeight:"1.6"},children:m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",marginBottom:"6px"},children:[m.jsx("div",{style:{width:"30px",height:"30px",borderRadius:"50%",backgroundColor:"#888",marginRight:"10px"}}),m.jsxs("span",{children:[Rm," Hz (max)"]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",marginBottom:"6px"},children:[m.jsx("div",{style:{width:"15px",height:"15px",borderRadius:"50%",backgroundColor:"#888",marginRight:"10px",marginLeft:"7.5px"}}),m.jsxs("span",{children:[Rm/2," Hz"]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center"},children:[m.jsx("div",{style:{width:"4px",height:"4px",borderRadius:"50%",backgroundColor:"#ccc",marginRight:"10px",marginLeft:"13px"}}),m.jsx("span",{children:"0 Hz"})]})]})})]}),m.jsxs("div",{style:{marginBottom:"20px"},children:[m.jsx("h4",{style:{margin:"0 0 12px 0",fontSize:"14px",fontWeight:"600",color:"#555"},children:"Color: Spike Amplitude"}),m.jsxs("div",{style:{fontSize:"12px",color:"#666",lineHeight:"1.6"},children:[m.jsxs("div",{style:{marginBottom:"8px",fontStyle:"italic"},children:["0 to ",a.maxAmplitude.toFixed(1)," μV"]}),m.jsx(ov,{maxAmplitude:a.maxAmplitude})]})]}),m.jsxs("div",{style:{marginTop:"30px",padding:"12px",backgroundColor:"#f8f9fa",borderRadius:"4px",fontSize:"12px",color:"#666"},children:[m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsx("strong",{children:"Total Channels:"})," ",a.numChannels]}),m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsx("strong",{children:"Hover"})," over electrodes to see exact values"]})]})]})]})},ov=({maxAmplitude:t})=>{const n=[];for(let i=0;i<50;i++){const c=i/49,f=$n(c,"viridis");n.push(f)}const u=n.map((i,c)=>{const f=c/49*100;return`${i} ${f}%`}).join(", ");return m.jsxs("div",{style:{display:"flex",alignItems:"center",marginTop:"10px"},children:[m.jsx("div",{style:{width:"30px",height:"120px",background:`linear-gradient(to top, ${u})`,border:"1px solid #ccc",borderRadius:"2px"}}),m.jsxs("div",{style:{marginLeft:"10px",display:"flex",flexDirection:"column",justifyContent:"space-between",height:"120px",fontSize:"11px"},children:[m.jsx("div",{children:t.toFixed(1)}),m.jsx("div",{children:(t/2).toFixed(1)}),m.jsx("div",{children:"0"})]})]})},rv=({zarrGroup:t,width:l,height:e})=>m.jsx(sv,{zarrGroup:t,width:l,height:e}),Ls=class Ls{constructor(l,e,a,n){B(this,ru);B(this,Fa);B(this,Wa);B(this,du);B(this,Je,null);q(this,ru,l),q(this,Fa,e),q(this,Wa,a),q(this,du,n)}static async create(l){const e=l.attrs,a=e.num_templates,n=e.num_channels;if(a===void 0||n===void 0)throw new Error("Missing required attributes in zarr group");const u=await l.getDataset("templates");if(!u)throw new Error("No templates dataset found");return new Ls(l,a,n,u)}get numTemplates(){return z(this,Fa)}get numChannels(){return z(this,Wa)}get numUnits(){return z(this,Fa)}get templatesDataset(){return z(this,du)}async getElectrodeCoords(){if(z(this,Je)===null){const l=await z(this,ru).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const a=await l.getData({});q(this,Je,[]);for(let n=0;n<z(this,Wa);n++)z(this,Je).push([a[n*2],a[n*2+1]])}return z(this,Je)}};ru=new WeakMap,Fa=new WeakMap,Wa=new WeakMap,du=new WeakMap,Je=new WeakMap;let Ys=Ls,dv=0,mv=1,qs;const hv=t=>{qs===void 0&&(qs=Hm.length);const l=(dv+t*mv)%qs;return Hm[l]},Hm=["#00ff00","#ff00ff","#0080ff","#ff8000","#80bf80","#470ba7","#c80b32","#fd7ee5","#027d30","#00ffff","#00ff80","#9c5a86","#808000","#8ed7fa","#80ff00","#6e52ff","#0000ff","#119c9b","#feb982","#56333d","#fb2b97","#8000ff","#c3f1a2","#b3bd25","#45bc2d","#1c4b88","#49f3c0","#a90c9c","#c436ea","#13055b","#7f93d0","#c4552d","#ee7381","#800000","#58fe60","#4f825e","#21bde8","#d7b8e0","#1e40ee","#324a01","#fc2b03","#723cb9","#3a6ac1","#aef14e","#14c568","#bd9c9b","#f9c506","#b579fa","#810e5e","#b38d4d","#854810","#02ea3a","#0b3b3c","#f90161","#07c304","#fe4c54","#be02ea","#0521bb","#338b05","#4989ff","#52b8b3","#be3271","#f1a441","#0b776b","#0ccfac","#cd61bd","#85fc95","#fe43fe","#bd810d","#cce9e6","#644179","#fedfbe","#80bd00","#99c4bd","#48e5fa","#400626","#bcfc01","#866b3f","#5422e9","#ea03bd","#69809a","#bfca76","#40e60e","#f1da52","#3d5f3b","#63b3f8","#7cd83d","#b52f02","#9364ca","#80a740","#3ce183","#a6a9f6","#fba2bb","#e3763f","#ae3cae","#91414a","#1e94cf","#06f6c9"],yv="grayscale",wi=10,gv=({client:t,width:l,height:e,unitId:a,brightness:n,useGlobalScale:u,globalMin:i,globalMax:c})=>{const f=E.useRef(null),[s,g]=E.useState(null),[v,d]=E.useState(5),[y,p]=E.useState(null),[D,O]=E.useState(!0);return E.useEffect(()=>{(async()=>{try{O(!0),p(null);const o=parseInt(a,10)-1;if(o<0||o>=t.numUnits)throw new Error(`Invalid unit index: ${o}`);const h=await t.templatesDataset.getData({slice:[[o,o+1]]});if(!h||h.length!==t.numChannels)throw new Error(`Expected ${t.numChannels} channels, got ${(h==null?void 0:h.length)||0}`);g(h);const S=await t.getElectrodeCoords(),b=new Float32Array(t.numChannels*2);for(let C=0;C<t.numChannels;C++)b[C*2]=S[C][0],b[C*2+1]=S[C][1];const T=vv(b)*.95/2;d(T)}catch(o){console.error("Error loading template data:",o),p(o instanceof Error?o.message:"Unknown error")}finally{O(!1)}})()},[t,a]),E.useEffect(()=>{if(!f.current||!s||u&&(i===void 0||c===void 0))return;const o=f.current.getContext("2d");if(!o)return;const h=l-2*wi,S=e-2*wi-30;o.fillStyle="#f4f4f4",o.fillRect(0,0,l,e);const b=hv(a);o.fillStyle=b,o.font="14px Arial",o.textAlign="center",o.fillText(`Unit ${a}`,l/2,20),(async()=>{const T=await t.getElectrodeCoords(),C=t.numChannels;let j=T[0][0],H=T[0][0],L=T[0][1],Z=T[0][1];for(let k=0;k<C;k++){const _t=T[k][0],ut=T[k][1];_t<j&&(j=_t),_t>H&&(H=_t),ut<L&&(L=ut),ut>Z&&(Z=ut)}const tt=H-j,rt=Z-L,Mt=h/tt,_=S/rt,M=Math.max(0,Math.min(Mt,_)),R=wi+(h-tt*M)/2-j*M,U=wi+30+(S-rt*M)/2-L*M;let N,G;if(u&&i!==void 0&&c!==void 0)N=i,G=c;else{N=s[0],G=s[0];for(let k=1;k<s.length;k++)s[k]<N&&(N=s[k]),s[k]>G&&(G=s[k])}let X=(n-50)/50;X=Math.sign(X)*Math.pow(Math.abs(X),1/4),N+=(G-N)*X;for(let k=0;k<C;k++){const _t=T[k][0]*M+R,ut=T[k][1]*M+U,El=s[k];let Fe=1-(G-N>0?(El-N)/(G-N):.5);Fe=Math.min(1,Math.max(0,Fe));const pu=$n(Fe,yv);o.fillStyle=pu,o.beginPath(),o.arc(_t,ut,v*M,0,2*Math.PI),o.fill()}})()},[s,v,l,e,t,a,n,u,i,c]),D?m.jsx("div",{style:{width:l,height:e,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#f0f0f0",border:"1px solid #ccc"},children:"Loading..."}):y?m.jsxs("div",{style:{width:l,height:e,display:"flex",justifyContent:"center",alignItems:"center",color:"red",backgroundColor:"#f0f0f0",border:"1px solid #ccc"},children:["Error: ",y]}):m.jsx("canvas",{ref:f,width:l,height:e,style:{display:"block",border:"1px solid #ccc"}})};function vv(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Sv=({width:t,height:l,zarrGroup:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),{unitSelectionDispatch:s}=Um();E.useEffect(()=>{(async()=>{try{i(!0),f(null);const M=await Ys.create(e);s({type:"INITIALIZE_UNITS",newUnitOrder:Array.from({length:M.numTemplates},(R,U)=>String(U+1))}),n(M)}catch(M){console.error("Error loading Templates View client:",M),f(M instanceof Error?M.message:"Unknown error")}finally{i(!1)}})()},[e,s]);const{selectedUnitIdsArray:g,allOrderedUnitIds:v}=Om(),[d,y]=E.useState(!1),[p,D]=E.useState(!1),[O,r]=E.useState(50),[o,h]=E.useState(void 0),[S,b]=E.useState(void 0),A=E.useCallback(_=>{s({type:"SET_SELECTION",incomingSelectedUnitIds:[_]})},[s]),T=E.useCallback(_=>{s({type:"TOGGLE_UNIT",targetUnit:_})},[s]),C=20,j=E.useMemo(()=>t<300?t-C*2:t<600?(t-C*3)/2:t<900?(t-C*4)/3:(t-C*5)/4,[t]),L=j/1.6,Z=d?g:v,tt=E.useMemo(()=>new Set(g),[g]);E.useEffect(()=>{if(!p||!a){h(void 0),b(void 0);return}(async()=>{let M=1/0,R=-1/0;for(let U=0;U<a.numTemplates;U++)try{const N=await a.templatesDataset.getData({slice:[[U,U+1]]});if(N){const G=N;for(let X=0;X<G.length;X++)G[X]<M&&(M=G[X]),G[X]>R&&(R=G[X])}}catch(N){console.error(`Error loading template ${U}:`,N)}h(M),b(R)})()},[p,a]);const rt=50,Mt=l-rt;return u?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif"},children:"Loading Templates View data..."}):c||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load Templates View data"]}):g.length===0&&d?m.jsxs("div",{style:{width:t,height:l,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:t,height:Mt,display:"flex",justifyContent:"center",alignItems:"center",fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:"No units selected"}),m.jsx(Nm,{width:t,height:rt,onlyShowSelected:d,onToggle:()=>y(!d),useGlobalScale:p,onToggleGlobalScale:()=>D(!p),brightness:O,onBrightnessChange:r})]}):m.jsxs("div",{style:{width:t,height:l,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:t,height:Mt,overflowY:"auto",overflowX:"hidden",backgroundColor:"#f8f8f8",padding:C},children:m.jsx("div",{style:{display:"flex",flexWrap:"wrap",gap:`${C}px`,alignContent:"flex-start"},children:Z.map(_=>{const M=tt.has(_);return m.jsx("div",{style:{width:j,height:L,flexShrink:0,cursor:"pointer",border:M&&!d?"3px solid #007bff":"3px solid transparent",borderRadius:"4px",boxSizing:"border-box"},onClick:R=>{R.ctrlKey||R.shiftKey?T(String(_)):A(String(_))},children:m.jsx(gv,{client:a,width:j-6,height:L-6,unitId:String(_),brightness:O,useGlobalScale:p,globalMin:o,globalMax:S})},_)})})}),m.jsx(Nm,{width:t,height:rt,onlyShowSelected:d,onToggle:()=>y(!d),useGlobalScale:p,onToggleGlobalScale:()=>D(!p),brightness:O,onBrightnessChange:r})]})},Nm=({width:t,height:l,onlyShowSelected:e,onToggle:a,useGlobalScale:n,onToggleGlobalScale:u,brightness:i,onBrightnessChange:c})=>m.jsxs("div",{style:{width:t,height:l,backgroundColor:"#fff",borderTop:"1px solid #ddd",display:"flex",alignItems:"center",padding:"0 20px",boxSizing:"border-box"},children:[m.jsxs("label",{style:{display:"flex",alignItems:"center",cursor:"pointer",fontFamily:"Arial, sans-serif",fontSize:"14px",userSelect:"none",marginRight:"20px"},children:[m.jsx("input",{type:"checkbox",checked:e,onChange:a,style:{marginRight:"8px",cursor:"pointer"}}),"Only show selected"]}),m.jsxs("label",{style:{display:"flex",alignItems:"center",cursor:"pointer",fontFamily:"Arial, sans-serif",fontSize:"14px",userSelect:"none",marginRight:"20px"},children:[m.jsx("input",{type:"checkbox",checked:n,onChange:u,style:{marginRight:"8px",cursor:"pointer"}}),"Global scale"]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",fontFamily:"Arial, sans-serif",fontSize:"14px"},children:[m.jsx("label",{style:{marginRight:"10px",userSelect:"none"},children:"Brightness:"}),m.jsx("input",{type:"range",min:"0",max:"100",value:i,onChange:f=>c(Number(f.target.value)),style:{width:"150px",marginRight:"10px"}})]})]}),pv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(bv,{context:a.unitSelection,children:m.jsx(Sv,{zarrGroup:t,width:l,height:e})}),bv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},Ks=class Ks{constructor(l,e){B(this,xl);B(this,$a);B(this,ke,null);q(this,xl,l),q(this,$a,e)}static async create(l){const a=l.attrs.num_items;if(a===void 0)throw new Error("Missing num_items attribute in zarr group");return new Ks(l,a)}get numItems(){return z(this,$a)}async getItems(){if(z(this,ke)===null){q(this,ke,[]);const l=await z(this,xl).getDataset("unit_ids_1"),e=await z(this,xl).getDataset("unit_ids_2"),a=await z(this,xl).getDataset("projection_starts_1"),n=await z(this,xl).getDataset("projection_starts_2"),u=await z(this,xl).getDataset("projections_1"),i=await z(this,xl).getDataset("projections_2");if(!l||!e||!a||!n||!u||!i)throw new Error("Missing required datasets");const c=await l.getData({}),f=await e.getData({}),s=await a.getData({}),g=await n.getData({}),v=await u.getData({}),d=await i.getData({});for(let y=0;y<z(this,$a);y++){const p=String(c[y]),D=String(f[y]),O=s[y],r=s[y+1],o=g[y],h=g[y+1],S=v.slice(O,r),b=d.slice(o,h);z(this,ke).push({unit_id_1:p,unit_id_2:D,projections_1:S,projections_2:b})}}return z(this,ke)}async getItem(l){const e=await this.getItems();if(l<0||l>=e.length)throw new Error(`Item index ${l} out of range`);return e[l]}};xl=new WeakMap,$a=new WeakMap,ke=new WeakMap;let Gs=Ks;const xv=({item:t,width:l,height:e,selectedUnitId:a})=>{const n=a===t.unit_id_1,u=n?t.unit_id_2:t.unit_id_1,i=n?t.unit_id_1:t.unit_id_2,c=n?t.projections_2.map(r=>-r):t.projections_1,f=n?t.projections_1.map(r=>-r):t.projections_2,s=E.useMemo(()=>{const r=[...Array.from(c),...Array.from(f)];if(r.length===0)return null;const o=Math.min(...r),h=Math.max(...r),S=h-o;if(S===0)return null;const b=50,A=S/b,T=new Array(b).fill(0),C=new Array(b).fill(0);for(const L of c){const Z=Math.min(Math.floor((L-o)/A),b-1);T[Z]++}for(const L of f){const Z=Math.min(Math.floor((L-o)/A),b-1);C[Z]++}const j=T.map((L,Z)=>L+C[Z]),H=Math.max(...j);return{bins1:T,bins2:C,binsSum:j,minVal:o,maxVal:h,binWidth:A,maxCount:H,numBins:b}},[c,f]);if(!s)return m.jsx("div",{style:{width:l,height:e,display:"flex",alignItems:"center",justifyContent:"center",backgroundColor:"#f8f8f8",fontFamily:"Arial, sans-serif",fontSize:"12px",color:"#666"},children:"No data"});const g={top:20,right:10,bottom:30,left:40},v=l-g.left-g.right,d=e-g.top-g.bottom,y="#4287f5",p="#f54242",O=s.minVal<=0&&s.maxVal>=0?(0-s.minVal)/(s.maxVal-s.minVal)*v:null;return m.jsx("div",{style:{width:l,height:e,position:"relative",backgroundColor:"#fff"},children:m.jsxs("svg",{width:l,height:e,children:[m.jsxs("text",{x:l/2,y:15,textAnchor:"middle",style:{fontFamily:"Arial, sans-serif",fontSize:"12px",fontWeight:"bold"},children:["Unit ",u," vs Unit ",i]}),m.jsxs("g",{transform:`translate(${g.left}, ${g.top})`,children:[m.jsx("line",{x1:0,y1:d,x2:v,y2:d,stroke:"#333",strokeWidth:1}),m.jsx("line",{x1:0,y1:0,x2:0,y2:d,stroke:"#333",strokeWidth:1}),O!==null&&m.jsx("line",{x1:O,y1:0,x2:O,y2:d,stroke:"#999",strokeWidth:1.5,opacity:.5}),s.binsSum.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:"#999",opacity:.3,stroke:"#999",strokeWidth:.5},`barsum-${o}`)}),s.bins1.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:y,opacity:.5,stroke:y,strokeWidth:.5},`bar1-${o}`)}),s.bins2.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:p,opacity:.5,stroke:p,strokeWidth:.5},`bar2-${o}`)}),m.jsx("text",{x:v/2,y:d+25,textAnchor:"middle",style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:"Projection"}),m.jsx("text",{x:-d/2,y:-25,textAnchor:"middle",transform:`rotate(-90, ${-d/2}, -25)`,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:"Count"})]}),m.jsxs("g",{transform:`translate(${l-80}, ${g.top})`,children:[m.jsx("rect",{x:0,y:0,width:12,height:12,fill:y,opacity:.5}),m.jsxs("text",{x:16,y:10,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:["Unit ",u]}),m.jsx("rect",{x:0,y:16,width:12,height:12,fill:p,opacity:.5}),m.jsxs("text",{x:16,y:26,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:["Unit ",i]})]})]})})},Ev=({width:t,height:l,zarrGroup:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState([]),[c,f]=E.useState(!0),[s,g]=E.useState(null),{selectedUnitIdsArray:v}=Om();E.useEffect(()=>{(async()=>{try{f(!0),g(null);const o=await Gs.create(e),h=await o.getItems();n(o),i(h)}catch(o){console.error("Error loading Cluster Separation View client:",o),g(o instanceof Error?o.message:"Unknown error")}finally{f(!1)}})()},[e]);const d=E.useMemo(()=>{if(v.length===0)return[];const r=v[0];return u.filter(o=>o.unit_id_1===r||o.unit_id_2===r)},[u,v]),y=20,p=E.useMemo(()=>t<400?t-y*2:t<800?(t-y*3)/2:t<1200?(t-y*4)/3:(t-y*5)/4,[t]),O=p/1.3;return c?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif"},children:"Loading Cluster Separation View data..."}):s||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",s||"Failed to load Cluster Separation View data"]}):v.length===0?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:"Select a unit to view cluster separation"}):d.length===0?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:["No separation data available for selected unit ",v[0]]}):m.jsxs("div",{style:{width:t,height:l,overflowY:"auto",overflowX:"hidden",backgroundColor:"#f8f8f8",padding:y},children:[m.jsxs("div",{style:{marginBottom:y,fontFamily:"Arial, sans-serif",fontSize:"14px",color:"#333"},children:["Showing separation for Unit ",v[0]," (",d.length," pairs)"]}),m.jsx("div",{style:{display:"flex",flexWrap:"wrap",gap:`${y}px`,alignContent:"flex-start"},children:d.map(r=>m.jsx("div",{style:{width:p,height:O,flexShrink:0,border:"1px solid #ddd",borderRadius:"4px",boxSizing:"border-box",backgroundColor:"#fff"},children:m.jsx(xv,{item:r,width:p,height:O,selectedUnitId:String(v[0])})},`${r.unit_id_1}-${r.unit_id_2}`))})]})},Tv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(zv,{context:a.unitSelection,children:m.jsx(Ev,{zarrGroup:t,width:l,height:e})}),zv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},ws=class ws{constructor(l,e,a,n,u,i,c){B(this,Wi);B(this,mu);B(this,hu);B(this,yu);B(this,gu);B(this,vu);B(this,Su);q(this,Wi,l),q(this,mu,e),q(this,hu,a),q(this,yu,n),q(this,gu,u),q(this,vu,i),q(this,Su,c)}static async create(l){const e=l.attrs,a=e.num_units,n=e.num_timepoints,u=e.width,i=e.height,c=e.num_channels;if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0)throw new Error("Missing required attributes in zarr group");const f=await l.getDataset("receptive_fields");if(!f)throw new Error("No receptive_fields dataset found");return new ws(l,a,n,u,i,c,f)}get numUnits(){return z(this,mu)}get numTimepoints(){return z(this,hu)}get width(){return z(this,yu)}get height(){return z(this,gu)}get numChannels(){return z(this,vu)}get receptiveFieldsDataset(){return z(this,Su)}};Wi=new WeakMap,mu=new WeakMap,hu=new WeakMap,yu=new WeakMap,gu=new WeakMap,vu=new WeakMap,Su=new WeakMap;let Xs=ws;const Av=({width:t,height:l,client:e})=>m.jsx("div",{style:{position:"absolute",width:t,height:l,overflow:"auto",backgroundColor:"#fff"},children:m.jsxs("div",{style:{padding:20},children:[m.jsx("h2",{children:"Receptive Fields (Placeholder)"}),m.jsx("p",{children:"This is a placeholder view for receptive fields visualization. The actual implementation will be filled in by a colleague."}),m.jsxs("div",{style:{marginTop:20},children:[m.jsx("h3",{children:"Data dimensions:"}),m.jsxs("ul",{children:[m.jsxs("li",{children:[m.jsx("strong",{children:"Units:"})," ",e.numUnits]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Timepoints:"})," ",e.numTimepoints]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Spatial dimensions:"})," ",e.width," x"," ",e.height]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Color channels:"})," ",e.numChannels]})]}),m.jsxs("p",{style:{marginTop:20,color:"#666"},children:["Total data shape: (",e.numUnits,", ",e.numTimepoints,","," ",e.width,", ",e.height,", ",e.numChannels,")"]})]})]})}),Mv=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(null);return E.useEffect(()=>{let c=!1;return(async()=>{try{const s=await Xs.create(t);if(c)return;n(s)}catch(s){if(c)return;console.error("Error loading receptive fields data:",s),i(s.message)}})(),()=>{c=!0}},[t]),u?m.jsxs("div",{style:{padding:20},children:[m.jsx("h3",{children:"Error loading receptive fields"}),m.jsx("p",{style:{color:"red"},children:u})]}):a?m.jsx(Av,{width:l,height:e,client:a}):m.jsx("div",{style:{padding:20},children:m.jsx("p",{children:"Loading receptive fields data..."})})},_v=({zarrGroup:t,width:l,height:e,onResize:a,onDataChange:n,contexts:u,component:i,renderFPView:c})=>{const[f,s]=E.useState(l),[g,v]=E.useState(e),[d,y]=E.useState(t);return E.useEffect(()=>{a((p,D)=>{s(p),v(D)}),n(p=>{y(p)})},[a,n]),m.jsx(i,{zarrGroup:d,width:f,height:g,contexts:u,renderFPView:c})},Xa=t=>l=>{const{container:e,zarrGroup:a,width:n,height:u,onResize:i,onDataChange:c,contexts:f,renderFPView:s}=l;Bg.createRoot(e).render(m.jsx(_v,{zarrGroup:a,width:n,height:u,onResize:i,onDataChange:c,contexts:f,component:t,renderFPView:s}))};(()=>{const t=window.figpack_p1.registerFPViewComponent;t({name:"realtime512b.MEAMovie",render:Xa(Kg)}),t({name:"realtime512b.MEASpikeFramesMovie",render:Xa(nv)}),t({name:"realtime512b.TemplatesView",render:Xa(pv)}),t({name:"realtime512b.MEAFiringRatesAndAmplitudes",render:Xa(rv)}),t({name:"realtime512b.ClusterSeparationView",render:Xa(Tv)}),t({name:"realtime512b.ReceptiveFieldsView",render:Xa(Mv)});const l=window.figpack_p1.registerFPExtension;l({name:"figpack-realtime512b"})})()})();
+`).replace(ug,"")}function K0(t,l){return l=L0(l),L0(t)===l}function et(t,l,e,a,n,u){switch(e){case"children":typeof a=="string"?l==="body"||l==="textarea"&&a===""||fa(t,a):(typeof a=="number"||typeof a=="bigint")&&l!=="body"&&fa(t,""+a);break;case"className":Hu(t,"class",a);break;case"tabIndex":Hu(t,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":Hu(t,e,a);break;case"style":Ko(t,a,u);break;case"data":if(l!=="object"){Hu(t,"data",a);break}case"src":case"href":if(a===""&&(l!=="a"||e!=="href")){t.removeAttribute(e);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Bu(""+a),t.setAttribute(e,a);break;case"action":case"formAction":if(typeof a=="function"){t.setAttribute(e,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof u=="function"&&(e==="formAction"?(l!=="input"&&et(t,l,"name",n.name,n,null),et(t,l,"formEncType",n.formEncType,n,null),et(t,l,"formMethod",n.formMethod,n,null),et(t,l,"formTarget",n.formTarget,n,null)):(et(t,l,"encType",n.encType,n,null),et(t,l,"method",n.method,n,null),et(t,l,"target",n.target,n,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){t.removeAttribute(e);break}a=Bu(""+a),t.setAttribute(e,a);break;case"onClick":a!=null&&(t.onclick=Al);break;case"onScroll":a!=null&&w("scroll",t);break;case"onScrollEnd":a!=null&&w("scrollend",t);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(x(61));if(e=a.__html,e!=null){if(n.children!=null)throw Error(x(60));t.innerHTML=e}}break;case"multiple":t.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":t.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){t.removeAttribute("xlink:href");break}e=Bu(""+a),t.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",e);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""+a):t.removeAttribute(e);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,""):t.removeAttribute(e);break;case"capture":case"download":a===!0?t.setAttribute(e,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?t.setAttribute(e,a):t.removeAttribute(e);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?t.setAttribute(e,a):t.removeAttribute(e);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?t.removeAttribute(e):t.setAttribute(e,a);break;case"popover":w("beforetoggle",t),w("toggle",t),Ru(t,"popover",a);break;case"xlinkActuate":zl(t,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":zl(t,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":zl(t,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":zl(t,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":zl(t,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":zl(t,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":zl(t,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":zl(t,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":zl(t,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Ru(t,"is",a);break;case"innerText":case"textContent":break;default:(!(2<e.length)||e[0]!=="o"&&e[0]!=="O"||e[1]!=="n"&&e[1]!=="N")&&(e=Rh.get(e)||e,Ru(t,e,a))}}function gs(t,l,e,a,n,u){switch(e){case"style":Ko(t,a,u);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(x(61));if(e=a.__html,e!=null){if(n.children!=null)throw Error(x(60));t.innerHTML=e}}break;case"children":typeof a=="string"?fa(t,a):(typeof a=="number"||typeof a=="bigint")&&fa(t,""+a);break;case"onScroll":a!=null&&w("scroll",t);break;case"onScrollEnd":a!=null&&w("scrollend",t);break;case"onClick":a!=null&&(t.onclick=Al);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!Bo.hasOwnProperty(e))t:{if(e[0]==="o"&&e[1]==="n"&&(n=e.endsWith("Capture"),l=e.slice(2,n?e.length-7:void 0),u=t[qt]||null,u=u!=null?u[e]:null,typeof u=="function"&&t.removeEventListener(l,u,n),typeof a=="function")){typeof u!="function"&&u!==null&&(e in t?t[e]=null:t.hasAttribute(e)&&t.removeAttribute(e)),t.addEventListener(l,a,n);break t}e in t?t[e]=a:a===!0?t.setAttribute(e,""):Ru(t,e,a)}}}function Ht(t,l,e){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":w("error",t),w("load",t);var a=!1,n=!1,u;for(u in e)if(e.hasOwnProperty(u)){var i=e[u];if(i!=null)switch(u){case"src":a=!0;break;case"srcSet":n=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(x(137,l));default:et(t,l,u,i,e,null)}}n&&et(t,l,"srcSet",e.srcSet,e,null),a&&et(t,l,"src",e.src,e,null);return;case"input":w("invalid",t);var c=u=i=n=null,f=null,s=null;for(a in e)if(e.hasOwnProperty(a)){var g=e[a];if(g!=null)switch(a){case"name":n=g;break;case"type":i=g;break;case"checked":f=g;break;case"defaultChecked":s=g;break;case"value":u=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(x(137,l));break;default:et(t,l,a,g,e,null)}}Qo(t,u,c,f,s,i,n,!1);return;case"select":w("invalid",t),a=i=u=null;for(n in e)if(e.hasOwnProperty(n)&&(c=e[n],c!=null))switch(n){case"value":u=c;break;case"defaultValue":i=c;break;case"multiple":a=c;default:et(t,l,n,c,e,null)}l=u,e=i,t.multiple=!!a,l!=null?ca(t,!!a,l,!1):e!=null&&ca(t,!!a,e,!0);return;case"textarea":w("invalid",t),u=n=a=null;for(i in e)if(e.hasOwnProperty(i)&&(c=e[i],c!=null))switch(i){case"value":a=c;break;case"defaultValue":n=c;break;case"children":u=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(x(91));break;default:et(t,l,i,c,e,null)}Zo(t,a,n,u);return;case"option":for(f in e)if(e.hasOwnProperty(f)&&(a=e[f],a!=null))switch(f){case"selected":t.selected=a&&typeof a!="function"&&typeof a!="symbol";break;default:et(t,l,f,a,e,null)}return;case"dialog":w("beforetoggle",t),w("toggle",t),w("cancel",t),w("close",t);break;case"iframe":case"object":w("load",t);break;case"video":case"audio":for(a=0;a<Vn.length;a++)w(Vn[a],t);break;case"image":w("error",t),w("load",t);break;case"details":w("toggle",t);break;case"embed":case"source":case"link":w("error",t),w("load",t);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(s in e)if(e.hasOwnProperty(s)&&(a=e[s],a!=null))switch(s){case"children":case"dangerouslySetInnerHTML":throw Error(x(137,l));default:et(t,l,s,a,e,null)}return;default:if(Cc(l)){for(g in e)e.hasOwnProperty(g)&&(a=e[g],a!==void 0&&gs(t,l,g,a,e,void 0));return}}for(c in e)e.hasOwnProperty(c)&&(a=e[c],a!=null&&et(t,l,c,a,e,null))}function ig(t,l,e,a){switch(l){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var n=null,u=null,i=null,c=null,f=null,s=null,g=null;for(y in e){var v=e[y];if(e.hasOwnProperty(y)&&v!=null)switch(y){case"checked":break;case"value":break;case"defaultValue":f=v;default:a.hasOwnProperty(y)||et(t,l,y,null,a,v)}}for(var d in a){var y=a[d];if(v=e[d],a.hasOwnProperty(d)&&(y!=null||v!=null))switch(d){case"type":u=y;break;case"name":n=y;break;case"checked":s=y;break;case"defaultChecked":g=y;break;case"value":i=y;break;case"defaultValue":c=y;break;case"children":case"dangerouslySetInnerHTML":if(y!=null)throw Error(x(137,l));break;default:y!==v&&et(t,l,d,y,a,v)}}_c(t,i,c,f,s,g,u,n);return;case"select":y=i=c=d=null;for(u in e)if(f=e[u],e.hasOwnProperty(u)&&f!=null)switch(u){case"value":break;case"multiple":y=f;default:a.hasOwnProperty(u)||et(t,l,u,null,a,f)}for(n in a)if(u=a[n],f=e[n],a.hasOwnProperty(n)&&(u!=null||f!=null))switch(n){case"value":d=u;break;case"defaultValue":c=u;break;case"multiple":i=u;default:u!==f&&et(t,l,n,u,a,f)}l=c,e=i,a=y,d!=null?ca(t,!!e,d,!1):!!a!=!!e&&(l!=null?ca(t,!!e,l,!0):ca(t,!!e,e?[]:"",!1));return;case"textarea":y=d=null;for(c in e)if(n=e[c],e.hasOwnProperty(c)&&n!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:et(t,l,c,null,a,n)}for(i in a)if(n=a[i],u=e[i],a.hasOwnProperty(i)&&(n!=null||u!=null))switch(i){case"value":d=n;break;case"defaultValue":y=n;break;case"children":break;case"dangerouslySetInnerHTML":if(n!=null)throw Error(x(91));break;default:n!==u&&et(t,l,i,n,a,u)}Vo(t,d,y);return;case"option":for(var p in e)if(d=e[p],e.hasOwnProperty(p)&&d!=null&&!a.hasOwnProperty(p))switch(p){case"selected":t.selected=!1;break;default:et(t,l,p,null,a,d)}for(f in a)if(d=a[f],y=e[f],a.hasOwnProperty(f)&&d!==y&&(d!=null||y!=null))switch(f){case"selected":t.selected=d&&typeof d!="function"&&typeof d!="symbol";break;default:et(t,l,f,d,a,y)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var D in e)d=e[D],e.hasOwnProperty(D)&&d!=null&&!a.hasOwnProperty(D)&&et(t,l,D,null,a,d);for(s in a)if(d=a[s],y=e[s],a.hasOwnProperty(s)&&d!==y&&(d!=null||y!=null))switch(s){case"children":case"dangerouslySetInnerHTML":if(d!=null)throw Error(x(137,l));break;default:et(t,l,s,d,a,y)}return;default:if(Cc(l)){for(var O in e)d=e[O],e.hasOwnProperty(O)&&d!==void 0&&!a.hasOwnProperty(O)&&gs(t,l,O,void 0,a,d);for(g in a)d=a[g],y=e[g],!a.hasOwnProperty(g)||d===y||d===void 0&&y===void 0||gs(t,l,g,d,a,y);return}}for(var r in e)d=e[r],e.hasOwnProperty(r)&&d!=null&&!a.hasOwnProperty(r)&&et(t,l,r,null,a,d);for(v in a)d=a[v],y=e[v],!a.hasOwnProperty(v)||d===y||d==null&&y==null||et(t,l,v,d,a,y)}function w0(t){switch(t){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function cg(){if(typeof performance.getEntriesByType=="function"){for(var t=0,l=0,e=performance.getEntriesByType("resource"),a=0;a<e.length;a++){var n=e[a],u=n.transferSize,i=n.initiatorType,c=n.duration;if(u&&c&&w0(i)){for(i=0,c=n.responseEnd,a+=1;a<e.length;a++){var f=e[a],s=f.startTime;if(s>c)break;var g=f.transferSize,v=f.initiatorType;g&&w0(v)&&(f=f.responseEnd,i+=g*(f<c?1:(c-s)/(f-s)))}if(--a,l+=8*(u+i)/(n.duration/1e3),t++,10<t)break}}if(0<t)return l/t/1e6}return navigator.connection&&(t=navigator.connection.downlink,typeof t=="number")?t:5}var vs=null,Ss=null;function Ui(t){return t.nodeType===9?t:t.ownerDocument}function J0(t){switch(t){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function k0(t,l){if(t===0)switch(l){case"svg":return 1;case"math":return 2;default:return 0}return t===1&&l==="foreignObject"?0:t}function ps(t,l){return t==="textarea"||t==="noscript"||typeof l.children=="string"||typeof l.children=="number"||typeof l.children=="bigint"||typeof l.dangerouslySetInnerHTML=="object"&&l.dangerouslySetInnerHTML!==null&&l.dangerouslySetInnerHTML.__html!=null}var bs=null;function fg(){var t=window.event;return t&&t.type==="popstate"?t===bs?!1:(bs=t,!0):(bs=null,!1)}var F0=typeof setTimeout=="function"?setTimeout:void 0,sg=typeof clearTimeout=="function"?clearTimeout:void 0,W0=typeof Promise=="function"?Promise:void 0,og=typeof queueMicrotask=="function"?queueMicrotask:typeof W0!="undefined"?function(t){return W0.resolve(null).then(t).catch(rg)}:F0;function rg(t){setTimeout(function(){throw t})}function ye(t){return t==="head"}function $0(t,l){var e=l,a=0;do{var n=e.nextSibling;if(t.removeChild(e),n&&n.nodeType===8)if(e=n.data,e==="/$"||e==="/&"){if(a===0){t.removeChild(n),Ga(l);return}a--}else if(e==="$"||e==="$?"||e==="$~"||e==="$!"||e==="&")a++;else if(e==="html")Ln(t.ownerDocument.documentElement);else if(e==="head"){e=t.ownerDocument.head,Ln(e);for(var u=e.firstChild;u;){var i=u.nextSibling,c=u.nodeName;u[fn]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&u.rel.toLowerCase()==="stylesheet"||e.removeChild(u),u=i}}else e==="body"&&Ln(t.ownerDocument.body);e=n}while(e);Ga(l)}function I0(t,l){var e=t;t=0;do{var a=e.nextSibling;if(e.nodeType===1?l?(e._stashedDisplay=e.style.display,e.style.display="none"):(e.style.display=e._stashedDisplay||"",e.getAttribute("style")===""&&e.removeAttribute("style")):e.nodeType===3&&(l?(e._stashedText=e.nodeValue,e.nodeValue=""):e.nodeValue=e._stashedText||""),a&&a.nodeType===8)if(e=a.data,e==="/$"){if(t===0)break;t--}else e!=="$"&&e!=="$?"&&e!=="$~"&&e!=="$!"||t++;e=a}while(e)}function xs(t){var l=t.firstChild;for(l&&l.nodeType===10&&(l=l.nextSibling);l;){var e=l;switch(l=l.nextSibling,e.nodeName){case"HTML":case"HEAD":case"BODY":xs(e),Ac(e);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(e.rel.toLowerCase()==="stylesheet")continue}t.removeChild(e)}}function dg(t,l,e,a){for(;t.nodeType===1;){var n=e;if(t.nodeName.toLowerCase()!==l.toLowerCase()){if(!a&&(t.nodeName!=="INPUT"||t.type!=="hidden"))break}else if(a){if(!t[fn])switch(l){case"meta":if(!t.hasAttribute("itemprop"))break;return t;case"link":if(u=t.getAttribute("rel"),u==="stylesheet"&&t.hasAttribute("data-precedence"))break;if(u!==n.rel||t.getAttribute("href")!==(n.href==null||n.href===""?null:n.href)||t.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin)||t.getAttribute("title")!==(n.title==null?null:n.title))break;return t;case"style":if(t.hasAttribute("data-precedence"))break;return t;case"script":if(u=t.getAttribute("src"),(u!==(n.src==null?null:n.src)||t.getAttribute("type")!==(n.type==null?null:n.type)||t.getAttribute("crossorigin")!==(n.crossOrigin==null?null:n.crossOrigin))&&u&&t.hasAttribute("async")&&!t.hasAttribute("itemprop"))break;return t;default:return t}}else if(l==="input"&&t.type==="hidden"){var u=n.name==null?null:""+n.name;if(n.type==="hidden"&&t.getAttribute("name")===u)return t}else return t;if(t=sl(t.nextSibling),t===null)break}return null}function mg(t,l,e){if(l==="")return null;for(;t.nodeType!==3;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!e||(t=sl(t.nextSibling),t===null))return null;return t}function P0(t,l){for(;t.nodeType!==8;)if((t.nodeType!==1||t.nodeName!=="INPUT"||t.type!=="hidden")&&!l||(t=sl(t.nextSibling),t===null))return null;return t}function Es(t){return t.data==="$?"||t.data==="$~"}function Ts(t){return t.data==="$!"||t.data==="$?"&&t.ownerDocument.readyState!=="loading"}function hg(t,l){var e=t.ownerDocument;if(t.data==="$~")t._reactRetry=l;else if(t.data!=="$?"||e.readyState!=="loading")l();else{var a=function(){l(),e.removeEventListener("DOMContentLoaded",a)};e.addEventListener("DOMContentLoaded",a),t._reactRetry=a}}function sl(t){for(;t!=null;t=t.nextSibling){var l=t.nodeType;if(l===1||l===3)break;if(l===8){if(l=t.data,l==="$"||l==="$!"||l==="$?"||l==="$~"||l==="&"||l==="F!"||l==="F")break;if(l==="/$"||l==="/&")return null}}return t}var zs=null;function tm(t){t=t.nextSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="/$"||e==="/&"){if(l===0)return sl(t.nextSibling);l--}else e!=="$"&&e!=="$!"&&e!=="$?"&&e!=="$~"&&e!=="&"||l++}t=t.nextSibling}return null}function lm(t){t=t.previousSibling;for(var l=0;t;){if(t.nodeType===8){var e=t.data;if(e==="$"||e==="$!"||e==="$?"||e==="$~"||e==="&"){if(l===0)return t;l--}else e!=="/$"&&e!=="/&"||l++}t=t.previousSibling}return null}function em(t,l,e){switch(l=Ui(e),t){case"html":if(t=l.documentElement,!t)throw Error(x(452));return t;case"head":if(t=l.head,!t)throw Error(x(453));return t;case"body":if(t=l.body,!t)throw Error(x(454));return t;default:throw Error(x(451))}}function Ln(t){for(var l=t.attributes;l.length;)t.removeAttributeNode(l[0]);Ac(t)}var ol=new Map,am=new Set;function Oi(t){return typeof t.getRootNode=="function"?t.getRootNode():t.nodeType===9?t:t.ownerDocument}var Ql=W.d;W.d={f:yg,r:gg,D:vg,C:Sg,L:pg,m:bg,X:Eg,S:xg,M:Tg};function yg(){var t=Ql.f(),l=Ti();return t||l}function gg(t){var l=na(t);l!==null&&l.tag===5&&l.type==="form"?bd(l):Ql.r(t)}var Ba=typeof document=="undefined"?null:document;function nm(t,l,e){var a=Ba;if(a&&typeof l=="string"&&l){var n=el(l);n='link[rel="'+t+'"][href="'+n+'"]',typeof e=="string"&&(n+='[crossorigin="'+e+'"]'),am.has(n)||(am.add(n),t={rel:t,crossOrigin:e,href:l},a.querySelector(n)===null&&(l=a.createElement("link"),Ht(l,"link",t),zt(l),a.head.appendChild(l)))}}function vg(t){Ql.D(t),nm("dns-prefetch",t,null)}function Sg(t,l){Ql.C(t,l),nm("preconnect",t,l)}function pg(t,l,e){Ql.L(t,l,e);var a=Ba;if(a&&t&&l){var n='link[rel="preload"][as="'+el(l)+'"]';l==="image"&&e&&e.imageSrcSet?(n+='[imagesrcset="'+el(e.imageSrcSet)+'"]',typeof e.imageSizes=="string"&&(n+='[imagesizes="'+el(e.imageSizes)+'"]')):n+='[href="'+el(t)+'"]';var u=n;switch(l){case"style":u=Ya(t);break;case"script":u=qa(t)}ol.has(u)||(t=ct({rel:"preload",href:l==="image"&&e&&e.imageSrcSet?void 0:t,as:l},e),ol.set(u,t),a.querySelector(n)!==null||l==="style"&&a.querySelector(Kn(u))||l==="script"&&a.querySelector(wn(u))||(l=a.createElement("link"),Ht(l,"link",t),zt(l),a.head.appendChild(l)))}}function bg(t,l){Ql.m(t,l);var e=Ba;if(e&&t){var a=l&&typeof l.as=="string"?l.as:"script",n='link[rel="modulepreload"][as="'+el(a)+'"][href="'+el(t)+'"]',u=n;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":u=qa(t)}if(!ol.has(u)&&(t=ct({rel:"modulepreload",href:t},l),ol.set(u,t),e.querySelector(n)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(e.querySelector(wn(u)))return}a=e.createElement("link"),Ht(a,"link",t),zt(a),e.head.appendChild(a)}}}function xg(t,l,e){Ql.S(t,l,e);var a=Ba;if(a&&t){var n=ua(a).hoistableStyles,u=Ya(t);l=l||"default";var i=n.get(u);if(!i){var c={loading:0,preload:null};if(i=a.querySelector(Kn(u)))c.loading=5;else{t=ct({rel:"stylesheet",href:t,"data-precedence":l},e),(e=ol.get(u))&&As(t,e);var f=i=a.createElement("link");zt(f),Ht(f,"link",t),f._p=new Promise(function(s,g){f.onload=s,f.onerror=g}),f.addEventListener("load",function(){c.loading|=1}),f.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Ri(i,l,a)}i={type:"stylesheet",instance:i,count:1,state:c},n.set(u,i)}}}function Eg(t,l){Ql.X(t,l);var e=Ba;if(e&&t){var a=ua(e).hoistableScripts,n=qa(t),u=a.get(n);u||(u=e.querySelector(wn(n)),u||(t=ct({src:t,async:!0},l),(l=ol.get(n))&&Ms(t,l),u=e.createElement("script"),zt(u),Ht(u,"link",t),e.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function Tg(t,l){Ql.M(t,l);var e=Ba;if(e&&t){var a=ua(e).hoistableScripts,n=qa(t),u=a.get(n);u||(u=e.querySelector(wn(n)),u||(t=ct({src:t,async:!0,type:"module"},l),(l=ol.get(n))&&Ms(t,l),u=e.createElement("script"),zt(u),Ht(u,"link",t),e.head.appendChild(u)),u={type:"script",instance:u,count:1,state:null},a.set(n,u))}}function um(t,l,e,a){var n=(n=Fl.current)?Oi(n):null;if(!n)throw Error(x(446));switch(t){case"meta":case"title":return null;case"style":return typeof e.precedence=="string"&&typeof e.href=="string"?(l=Ya(e.href),e=ua(n).hoistableStyles,a=e.get(l),a||(a={type:"style",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(e.rel==="stylesheet"&&typeof e.href=="string"&&typeof e.precedence=="string"){t=Ya(e.href);var u=ua(n).hoistableStyles,i=u.get(t);if(i||(n=n.ownerDocument||n,i={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},u.set(t,i),(u=n.querySelector(Kn(t)))&&!u._p&&(i.instance=u,i.state.loading=5),ol.has(t)||(e={rel:"preload",as:"style",href:e.href,crossOrigin:e.crossOrigin,integrity:e.integrity,media:e.media,hrefLang:e.hrefLang,referrerPolicy:e.referrerPolicy},ol.set(t,e),u||zg(n,t,e,i.state))),l&&a===null)throw Error(x(528,""));return i}if(l&&a!==null)throw Error(x(529,""));return null;case"script":return l=e.async,e=e.src,typeof e=="string"&&l&&typeof l!="function"&&typeof l!="symbol"?(l=qa(e),e=ua(n).hoistableScripts,a=e.get(l),a||(a={type:"script",instance:null,count:0,state:null},e.set(l,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(x(444,t))}}function Ya(t){return'href="'+el(t)+'"'}function Kn(t){return'link[rel="stylesheet"]['+t+"]"}function im(t){return ct({},t,{"data-precedence":t.precedence,precedence:null})}function zg(t,l,e,a){t.querySelector('link[rel="preload"][as="style"]['+l+"]")?a.loading=1:(l=t.createElement("link"),a.preload=l,l.addEventListener("load",function(){return a.loading|=1}),l.addEventListener("error",function(){return a.loading|=2}),Ht(l,"link",e),zt(l),t.head.appendChild(l))}function qa(t){return'[src="'+el(t)+'"]'}function wn(t){return"script[async]"+t}function cm(t,l,e){if(l.count++,l.instance===null)switch(l.type){case"style":var a=t.querySelector('style[data-href~="'+el(e.href)+'"]');if(a)return l.instance=a,zt(a),a;var n=ct({},e,{"data-href":e.href,"data-precedence":e.precedence,href:null,precedence:null});return a=(t.ownerDocument||t).createElement("style"),zt(a),Ht(a,"style",n),Ri(a,e.precedence,t),l.instance=a;case"stylesheet":n=Ya(e.href);var u=t.querySelector(Kn(n));if(u)return l.state.loading|=4,l.instance=u,zt(u),u;a=im(e),(n=ol.get(n))&&As(a,n),u=(t.ownerDocument||t).createElement("link"),zt(u);var i=u;return i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Ht(u,"link",a),l.state.loading|=4,Ri(u,e.precedence,t),l.instance=u;case"script":return u=qa(e.src),(n=t.querySelector(wn(u)))?(l.instance=n,zt(n),n):(a=e,(n=ol.get(u))&&(a=ct({},e),Ms(a,n)),t=t.ownerDocument||t,n=t.createElement("script"),zt(n),Ht(n,"link",a),t.head.appendChild(n),l.instance=n);case"void":return null;default:throw Error(x(443,l.type))}else l.type==="stylesheet"&&!(l.state.loading&4)&&(a=l.instance,l.state.loading|=4,Ri(a,e.precedence,t));return l.instance}function Ri(t,l,e){for(var a=e.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),n=a.length?a[a.length-1]:null,u=n,i=0;i<a.length;i++){var c=a[i];if(c.dataset.precedence===l)u=c;else if(u!==n)break}u?u.parentNode.insertBefore(t,u.nextSibling):(l=e.nodeType===9?e.head:e,l.insertBefore(t,l.firstChild))}function As(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.title==null&&(t.title=l.title)}function Ms(t,l){t.crossOrigin==null&&(t.crossOrigin=l.crossOrigin),t.referrerPolicy==null&&(t.referrerPolicy=l.referrerPolicy),t.integrity==null&&(t.integrity=l.integrity)}var Hi=null;function fm(t,l,e){if(Hi===null){var a=new Map,n=Hi=new Map;n.set(e,a)}else n=Hi,a=n.get(e),a||(a=new Map,n.set(e,a));if(a.has(t))return a;for(a.set(t,null),e=e.getElementsByTagName(t),n=0;n<e.length;n++){var u=e[n];if(!(u[fn]||u[jt]||t==="link"&&u.getAttribute("rel")==="stylesheet")&&u.namespaceURI!=="http://www.w3.org/2000/svg"){var i=u.getAttribute(l)||"";i=t+i;var c=a.get(i);c?c.push(u):a.set(i,[u])}}return a}function sm(t,l,e){t=t.ownerDocument||t,t.head.insertBefore(e,l==="title"?t.querySelector("head > title"):null)}function Ag(t,l,e){if(e===1||l.itemProp!=null)return!1;switch(t){case"meta":case"title":return!0;case"style":if(typeof l.precedence!="string"||typeof l.href!="string"||l.href==="")break;return!0;case"link":if(typeof l.rel!="string"||typeof l.href!="string"||l.href===""||l.onLoad||l.onError)break;switch(l.rel){case"stylesheet":return t=l.disabled,typeof l.precedence=="string"&&t==null;default:return!0}case"script":if(l.async&&typeof l.async!="function"&&typeof l.async!="symbol"&&!l.onLoad&&!l.onError&&l.src&&typeof l.src=="string")return!0}return!1}function om(t){return!(t.type==="stylesheet"&&!(t.state.loading&3))}function Mg(t,l,e,a){if(e.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&!(e.state.loading&4)){if(e.instance===null){var n=Ya(a.href),u=l.querySelector(Kn(n));if(u){l=u._p,l!==null&&typeof l=="object"&&typeof l.then=="function"&&(t.count++,t=Ni.bind(t),l.then(t,t)),e.state.loading|=4,e.instance=u,zt(u);return}u=l.ownerDocument||l,a=im(a),(n=ol.get(n))&&As(a,n),u=u.createElement("link"),zt(u);var i=u;i._p=new Promise(function(c,f){i.onload=c,i.onerror=f}),Ht(u,"link",a),e.instance=u}t.stylesheets===null&&(t.stylesheets=new Map),t.stylesheets.set(e,l),(l=e.state.preload)&&!(e.state.loading&3)&&(t.count++,e=Ni.bind(t),l.addEventListener("load",e),l.addEventListener("error",e))}}var _s=0;function _g(t,l){return t.stylesheets&&t.count===0&&Yi(t,t.stylesheets),0<t.count||0<t.imgCount?function(e){var a=setTimeout(function(){if(t.stylesheets&&Yi(t,t.stylesheets),t.unsuspend){var u=t.unsuspend;t.unsuspend=null,u()}},6e4+l);0<t.imgBytes&&_s===0&&(_s=62500*cg());var n=setTimeout(function(){if(t.waitingForImages=!1,t.count===0&&(t.stylesheets&&Yi(t,t.stylesheets),t.unsuspend)){var u=t.unsuspend;t.unsuspend=null,u()}},(t.imgBytes>_s?50:800)+l);return t.unsuspend=e,function(){t.unsuspend=null,clearTimeout(a),clearTimeout(n)}}:null}function Ni(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Yi(this,this.stylesheets);else if(this.unsuspend){var t=this.unsuspend;this.unsuspend=null,t()}}}var Bi=null;function Yi(t,l){t.stylesheets=null,t.unsuspend!==null&&(t.count++,Bi=new Map,l.forEach(Dg,t),Bi=null,Ni.call(t))}function Dg(t,l){if(!(l.state.loading&4)){var e=Bi.get(t);if(e)var a=e.get(null);else{e=new Map,Bi.set(t,e);for(var n=t.querySelectorAll("link[data-precedence],style[data-precedence]"),u=0;u<n.length;u++){var i=n[u];(i.nodeName==="LINK"||i.getAttribute("media")!=="not all")&&(e.set(i.dataset.precedence,i),a=i)}a&&e.set(null,a)}n=l.instance,i=n.getAttribute("data-precedence"),u=e.get(i)||a,u===a&&e.set(null,n),e.set(i,n),this.count++,a=Ni.bind(this),n.addEventListener("load",a),n.addEventListener("error",a),u?u.parentNode.insertBefore(n,u.nextSibling):(t=t.nodeType===9?t.head:t,t.insertBefore(n,t.firstChild)),l.state.loading|=4}}var Jn={$$typeof:Tl,Provider:null,Consumer:null,_currentValue:Ee,_currentValue2:Ee,_threadCount:0};function Cg(t,l,e,a,n,u,i,c,f){this.tag=1,this.containerInfo=t,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=xc(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=xc(0),this.hiddenUpdates=xc(null),this.identifierPrefix=a,this.onUncaughtError=n,this.onCaughtError=u,this.onRecoverableError=i,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=f,this.incompleteTransitions=new Map}function rm(t,l,e,a,n,u,i,c,f,s,g,v){return t=new Cg(t,l,e,i,f,s,g,v,c),l=1,u===!0&&(l|=24),u=Ft(3,null,null,l),t.current=u,u.stateNode=t,l=uf(),l.refCount++,t.pooledCache=l,l.refCount++,u.memoizedState={element:a,isDehydrated:e,cache:l},of(u),t}function dm(t){return t?(t=ya,t):ya}function mm(t,l,e,a,n,u){n=dm(n),a.context===null?a.context=n:a.pendingContext=n,a=ne(l),a.payload={element:e},u=u===void 0?null:u,u!==null&&(a.callback=u),e=ue(t,a,l),e!==null&&(Lt(e,t,l),An(e,t,l))}function hm(t,l){if(t=t.memoizedState,t!==null&&t.dehydrated!==null){var e=t.retryLane;t.retryLane=e!==0&&e<l?e:l}}function Ds(t,l){hm(t,l),(t=t.alternate)&&hm(t,l)}function ym(t){if(t.tag===13||t.tag===31){var l=Ce(t,67108864);l!==null&&Lt(l,t,67108864),Ds(t,67108864)}}function gm(t){if(t.tag===13||t.tag===31){var l=tl();l=Ec(l);var e=Ce(t,l);e!==null&&Lt(e,t,l),Ds(t,l)}}var qi=!0;function jg(t,l,e,a){var n=Y.T;Y.T=null;var u=W.p;try{W.p=2,Cs(t,l,e,a)}finally{W.p=u,Y.T=n}}function Ug(t,l,e,a){var n=Y.T;Y.T=null;var u=W.p;try{W.p=8,Cs(t,l,e,a)}finally{W.p=u,Y.T=n}}function Cs(t,l,e,a){if(qi){var n=js(a);if(n===null)ys(t,l,a,Gi,e),Sm(t,a);else if(Rg(n,t,l,e,a))a.stopPropagation();else if(Sm(t,a),l&4&&-1<Og.indexOf(t)){for(;n!==null;){var u=na(n);if(u!==null)switch(u.tag){case 3:if(u=u.stateNode,u.current.memoizedState.isDehydrated){var i=ze(u.pendingLanes);if(i!==0){var c=u;for(c.pendingLanes|=2,c.entangledLanes|=2;i;){var f=1<<31-Jt(i);c.entanglements[1]|=f,i&=~f}bl(u),!($&6)&&(xi=Kt()+500,Qn(0))}}break;case 31:case 13:c=Ce(u,2),c!==null&&Lt(c,u,2),Ti(),Ds(u,2)}if(u=js(a),u===null&&ys(t,l,a,Gi,e),u===n)break;n=u}n!==null&&a.stopPropagation()}else ys(t,l,a,null,e)}}function js(t){return t=Uc(t),Us(t)}var Gi=null;function Us(t){if(Gi=null,t=aa(t),t!==null){var l=Pa(t);if(l===null)t=null;else{var e=l.tag;if(e===13){if(t=go(l),t!==null)return t;t=null}else if(e===31){if(t=vo(l),t!==null)return t;t=null}else if(e===3){if(l.stateNode.current.memoizedState.isDehydrated)return l.tag===3?l.stateNode.containerInfo:null;t=null}else l!==t&&(t=null)}}return Gi=t,null}function vm(t){switch(t){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(vh()){case Ao:return 2;case Mo:return 8;case Du:case Sh:return 32;case _o:return 268435456;default:return 32}default:return 32}}var Os=!1,ge=null,ve=null,Se=null,kn=new Map,Fn=new Map,pe=[],Og="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Sm(t,l){switch(t){case"focusin":case"focusout":ge=null;break;case"dragenter":case"dragleave":ve=null;break;case"mouseover":case"mouseout":Se=null;break;case"pointerover":case"pointerout":kn.delete(l.pointerId);break;case"gotpointercapture":case"lostpointercapture":Fn.delete(l.pointerId)}}function Wn(t,l,e,a,n,u){return t===null||t.nativeEvent!==u?(t={blockedOn:l,domEventName:e,eventSystemFlags:a,nativeEvent:u,targetContainers:[n]},l!==null&&(l=na(l),l!==null&&ym(l)),t):(t.eventSystemFlags|=a,l=t.targetContainers,n!==null&&l.indexOf(n)===-1&&l.push(n),t)}function Rg(t,l,e,a,n){switch(l){case"focusin":return ge=Wn(ge,t,l,e,a,n),!0;case"dragenter":return ve=Wn(ve,t,l,e,a,n),!0;case"mouseover":return Se=Wn(Se,t,l,e,a,n),!0;case"pointerover":var u=n.pointerId;return kn.set(u,Wn(kn.get(u)||null,t,l,e,a,n)),!0;case"gotpointercapture":return u=n.pointerId,Fn.set(u,Wn(Fn.get(u)||null,t,l,e,a,n)),!0}return!1}function pm(t){var l=aa(t.target);if(l!==null){var e=Pa(l);if(e!==null){if(l=e.tag,l===13){if(l=go(e),l!==null){t.blockedOn=l,Ro(t.priority,function(){gm(e)});return}}else if(l===31){if(l=vo(e),l!==null){t.blockedOn=l,Ro(t.priority,function(){gm(e)});return}}else if(l===3&&e.stateNode.current.memoizedState.isDehydrated){t.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}t.blockedOn=null}function Xi(t){if(t.blockedOn!==null)return!1;for(var l=t.targetContainers;0<l.length;){var e=js(t.nativeEvent);if(e===null){e=t.nativeEvent;var a=new e.constructor(e.type,e);jc=a,e.target.dispatchEvent(a),jc=null}else return l=na(e),l!==null&&ym(l),t.blockedOn=e,!1;l.shift()}return!0}function bm(t,l,e){Xi(t)&&e.delete(l)}function Hg(){Os=!1,ge!==null&&Xi(ge)&&(ge=null),ve!==null&&Xi(ve)&&(ve=null),Se!==null&&Xi(Se)&&(Se=null),kn.forEach(bm),Fn.forEach(bm)}function Qi(t,l){t.blockedOn===l&&(t.blockedOn=null,Os||(Os=!0,xt.unstable_scheduleCallback(xt.unstable_NormalPriority,Hg)))}var Vi=null;function xm(t){Vi!==t&&(Vi=t,xt.unstable_scheduleCallback(xt.unstable_NormalPriority,function(){Vi===t&&(Vi=null);for(var l=0;l<t.length;l+=3){var e=t[l],a=t[l+1],n=t[l+2];if(typeof a!="function"){if(Us(a||e)===null)continue;break}var u=na(e);u!==null&&(t.splice(l,3),l-=3,jf(u,{pending:!0,data:n,method:e.method,action:a},a,n))}}))}function Ga(t){function l(f){return Qi(f,t)}ge!==null&&Qi(ge,t),ve!==null&&Qi(ve,t),Se!==null&&Qi(Se,t),kn.forEach(l),Fn.forEach(l);for(var e=0;e<pe.length;e++){var a=pe[e];a.blockedOn===t&&(a.blockedOn=null)}for(;0<pe.length&&(e=pe[0],e.blockedOn===null);)pm(e),e.blockedOn===null&&pe.shift();if(e=(t.ownerDocument||t).$$reactFormReplay,e!=null)for(a=0;a<e.length;a+=3){var n=e[a],u=e[a+1],i=n[qt]||null;if(typeof u=="function")i||xm(e);else if(i){var c=null;if(u&&u.hasAttribute("formAction")){if(n=u,i=u[qt]||null)c=i.formAction;else if(Us(n)!==null)continue}else c=i.action;typeof c=="function"?e[a+1]=c:(e.splice(a,3),a-=3),xm(e)}}}function Em(){function t(u){u.canIntercept&&u.info==="react-transition"&&u.intercept({handler:function(){return new Promise(function(i){return n=i})},focusReset:"manual",scroll:"manual"})}function l(){n!==null&&(n(),n=null),a||setTimeout(e,20)}function e(){if(!a&&!navigation.transition){var u=navigation.currentEntry;u&&u.url!=null&&navigation.navigate(u.url,{state:u.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,n=null;return navigation.addEventListener("navigate",t),navigation.addEventListener("navigatesuccess",l),navigation.addEventListener("navigateerror",l),setTimeout(e,100),function(){a=!0,navigation.removeEventListener("navigate",t),navigation.removeEventListener("navigatesuccess",l),navigation.removeEventListener("navigateerror",l),n!==null&&(n(),n=null)}}}function Rs(t){this._internalRoot=t}Zi.prototype.render=Rs.prototype.render=function(t){var l=this._internalRoot;if(l===null)throw Error(x(409));var e=l.current,a=tl();mm(e,a,t,l,null,null)},Zi.prototype.unmount=Rs.prototype.unmount=function(){var t=this._internalRoot;if(t!==null){this._internalRoot=null;var l=t.containerInfo;mm(t.current,2,null,t,null,null),Ti(),l[ea]=null}};function Zi(t){this._internalRoot=t}Zi.prototype.unstable_scheduleHydration=function(t){if(t){var l=Oo();t={blockedOn:null,target:t,priority:l};for(var e=0;e<pe.length&&l!==0&&l<pe[e].priority;e++);pe.splice(e,0,t),e===0&&pm(t)}};var Tm=ho.version;if(Tm!=="19.2.3")throw Error(x(527,Tm,"19.2.3"));W.findDOMNode=function(t){var l=t._reactInternals;if(l===void 0)throw typeof t.render=="function"?Error(x(188)):(t=Object.keys(t).join(","),Error(x(268,t)));return t=oh(l),t=t!==null?po(t):null,t=t===null?null:t.stateNode,t};var Ng={bundleType:0,version:"19.2.3",rendererPackageName:"react-dom",currentDispatcherRef:Y,reconcilerVersion:"19.2.3"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__!="undefined"){var Li=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Li.isDisabled&&Li.supportsFiber)try{nn=Li.inject(Ng),wt=Li}catch(t){}}Eu.createRoot=function(t,l){if(!yo(t))throw Error(x(299));var e=!1,a="",n=jd,u=Ud,i=Od;return l!=null&&(l.unstable_strictMode===!0&&(e=!0),l.identifierPrefix!==void 0&&(a=l.identifierPrefix),l.onUncaughtError!==void 0&&(n=l.onUncaughtError),l.onCaughtError!==void 0&&(u=l.onCaughtError),l.onRecoverableError!==void 0&&(i=l.onRecoverableError)),l=rm(t,1,!1,null,null,e,a,null,n,u,i,Em),t[ea]=l.current,hs(t),new Rs(l)},Eu.hydrateRoot=function(t,l,e){if(!yo(t))throw Error(x(299));var a=!1,n="",u=jd,i=Ud,c=Od,f=null;return e!=null&&(e.unstable_strictMode===!0&&(a=!0),e.identifierPrefix!==void 0&&(n=e.identifierPrefix),e.onUncaughtError!==void 0&&(u=e.onUncaughtError),e.onCaughtError!==void 0&&(i=e.onCaughtError),e.onRecoverableError!==void 0&&(c=e.onRecoverableError),e.formState!==void 0&&(f=e.formState)),l=rm(t,1,!0,l,e!=null?e:null,a,n,f,u,i,c,Em),l.context=dm(null),e=l.current,a=tl(),a=Ec(a),n=ne(a),n.callback=null,ue(e,n,a),e=a,l.current.lanes=e,cn(l,e),bl(l),t[ea]=l.current,hs(t),new Zi(l)},Eu.version="19.2.3";function zm(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__=="undefined"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(zm)}catch(t){console.error(t)}}zm(),co.exports=Eu;var Bg=co.exports;const Qs=class Qs{constructor(l,e,a,n,u,i,c,f,s,g){B(this,Ji);B(this,Ve);B(this,Vl);B(this,Qa);B(this,be);B(this,xe);B(this,Pn);B(this,tu);B(this,lu);B(this,eu);B(this,Va,null);B(this,Ze);B(this,au,null);B(this,nu,null);B(this,Zl,null);q(this,Ve,l),q(this,Vl,e),q(this,Qa,a),q(this,be,n),q(this,xe,u),q(this,Pn,i),q(this,tu,c),q(this,lu,f),q(this,eu,s),q(this,Ze,g)}static async create(l){var y;const e=l.attrs,a=e.num_timepoints,n=e.num_channels,u=e.sampling_frequency_hz,i=e.start_time_sec,c=e.data_min,f=e.data_max,s=e.data_median,g=e.num_spikes||0,v=await l.getDataset("raw_data");if(!v)throw new Error("No raw_data dataset found");if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0||f===void 0||s===void 0)throw new Error("Missing required attributes in zarr group");const d=new Qs(l,a,n,u,i,c,f,s,v,g);return g>0&&await $i(y=d,Ji,qm).call(y),d}get numTimepoints(){return z(this,Vl)}get numChannels(){return z(this,Qa)}get samplingFrequencyHz(){return z(this,be)}get startTimeSec(){return z(this,xe)}get dataMin(){return z(this,Pn)}get dataMax(){return z(this,tu)}get dataMedian(){return z(this,lu)}get endTimeSec(){return z(this,xe)+z(this,Vl)/z(this,be)}async getElectrodeCoords(){if(z(this,Va)===null){const l=await z(this,Ve).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const e=await l.getData({});q(this,Va,e)}return z(this,Va)}async getFrameData(l){if(l<0||l>=z(this,Vl))throw new Error(`Time index ${l} out of range [0, ${z(this,Vl)})`);return await z(this,eu).getData({slice:[[l,l+1],[0,z(this,Qa)]]})}getTimeFromIndex(l){return z(this,xe)+l/z(this,be)}getIndexFromTime(l){const e=Math.round((l-z(this,xe))*z(this,be));return Math.max(0,Math.min(z(this,Vl)-1,e))}getSpikingChannels(l){if(!z(this,Zl))return[];const e=z(this,Zl).get(l);return e?Array.from(e):[]}get hasSpikes(){return z(this,Ze)>0}get numSpikes(){return z(this,Ze)}};Ve=new WeakMap,Vl=new WeakMap,Qa=new WeakMap,be=new WeakMap,xe=new WeakMap,Pn=new WeakMap,tu=new WeakMap,lu=new WeakMap,eu=new WeakMap,Va=new WeakMap,Ze=new WeakMap,au=new WeakMap,nu=new WeakMap,Zl=new WeakMap,Ji=new WeakSet,qm=async function(){const l=await z(this,Ve).getDataset("spike_channel_indices");if(!l)throw new Error("No spike_channel_indices dataset found");const e=await l.getData({});q(this,au,e);const a=await z(this,Ve).getDataset("spike_frame_indices");if(!a)throw new Error("No spike_frame_indices dataset found");const n=await a.getData({});q(this,nu,n),q(this,Zl,new Map);for(let u=0;u<z(this,Ze);u++){const i=z(this,nu)[u],c=z(this,au)[u];z(this,Zl).has(i)||z(this,Zl).set(i,new Set),z(this,Zl).get(i).add(c)}};let Hs=Qs;const Am={"blue-red":t=>{const l=Math.round(255*t),e=Math.round(255*(1-t)),a=Math.round(128*(1-Math.abs(t-.5)*2));return`rgb(${l}, ${a}, ${e})`},viridis:t=>{const l=t;let e,a,n;if(l<.25){const u=l/.25;e=68+-9*u,a=1+81*u,n=84+55*u}else if(l<.5){const u=(l-.25)/.25;e=59+-26*u,a=82+62*u,n=139+1*u}else if(l<.75){const u=(l-.5)/.25;e=33+60*u,a=144+57*u,n=140+-41*u}else{const u=(l-.75)/.25;e=93+160*u,a=201+30*u,n=99+-62*u}return`rgb(${Math.round(e)}, ${Math.round(a)}, ${Math.round(n)})`},hot:t=>{const l=t;let e,a,n;return l<.33?(e=255*(l/.33),a=0,n=0):l<.67?(e=255,a=255*((l-.33)/.34),n=0):(e=255,a=255,n=255*((l-.67)/.33)),`rgb(${Math.round(e)}, ${Math.round(a)}, ${Math.round(n)})`},grayscale:t=>{const l=Math.round(255*t);return`rgb(${l}, ${l}, ${l})`},cool:t=>{const l=Math.round(255*t),e=Math.round(255*(1-t));return`rgb(${l}, ${e}, 255)`}},$n=(t,l="grayscale")=>(Am[l]||Am.grayscale)(t),Mm=.5,Yg=({client:t,currentTimeIndex:l,contrast:e,colormap:a,width:n,height:u,isPlaying:i})=>{const c=E.useRef(null),[f,s]=E.useState(null),[g,v]=E.useState(5),[d,y]=E.useState(null),[p,D]=E.useState([]),[O,r]=E.useState(null),o=E.useRef(new Map),h=E.useRef(null);E.useEffect(()=>{(async()=>{try{const A=await t.getElectrodeCoords();s(A);const C=qg(A)*.95/2;v(C)}catch(A){console.error("Error loading electrode coordinates:",A),r(A instanceof Error?A.message:"Unknown error")}})()},[t]),E.useEffect(()=>{(async()=>{try{const A=await t.getFrameData(l);y(A);const T=t.getSpikingChannels(l);if(i){const C=Date.now();for(const j of T)o.current.has(j)||o.current.set(j,C)}else D(T),o.current.clear();i&&S()}catch(A){console.error("Error loading frame data:",A),r(A instanceof Error?A.message:"Unknown error")}})()},[t,l,i]);const S=()=>{const b=Date.now(),A=Mm*1e3,T=[],C=[];o.current.forEach((j,H)=>{b-j>A?T.push(H):C.push(H)});for(const j of T)o.current.delete(j);D(C)};return E.useEffect(()=>(i&&o.current.size>0&&(h.current=window.setInterval(()=>{S()},50)),()=>{h.current!==null&&(clearInterval(h.current),h.current=null)}),[i,p.length]),E.useEffect(()=>{if(!c.current||!f||!d)return;const A=c.current.getContext("2d");if(!A)return;A.fillStyle="#90908b",A.fillRect(0,0,n,u);const T=f.length/2;let C=f[0],j=f[0],H=f[1],L=f[1];for(let ut=0;ut<T;ut++){const El=f[ut*2],hl=f[ut*2+1];El<C&&(C=El),El>j&&(j=El),hl<H&&(H=hl),hl>L&&(L=hl)}const Z=30,tt=j-C,rt=L-H,Mt=(n-2*Z)/tt,_=(u-2*Z)/rt,M=Math.max(0,Math.min(Mt,_)),R=(n-tt*M)/2-C*M,U=(u-rt*M)/2-H*M,N=t.dataMin,G=t.dataMax,X=t.dataMedian,k=2*Math.max(Math.abs(G-X),Math.abs(N-X)),_t=Math.exp((e-40)/10);for(let ut=0;ut<T;ut++){const El=f[ut*2]*M+R,hl=f[ut*2+1]*M+U;let We=(.5+(d[ut]-X)/k-.5)*2*_t;We=Math.max(-1,Math.min(1,We)),We=-We;const Js=(We+1)/2,Bm=$n(Js,a);A.fillStyle=Bm,A.beginPath(),A.arc(El,hl,g*M,0,2*Math.PI),A.fill()}if(p.length>0){const ut=Date.now(),El=Mm*1e3;A.lineWidth=Math.max(3,g*M*.3);for(const hl of p){const Fe=o.current.get(hl);let pu=.9;i&&Fe!==void 0&&(pu=.9*(1-(ut-Fe)/El)),A.strokeStyle=`rgba(255, 0, 0, ${pu})`;const We=f[hl*2]*M+R,Js=f[hl*2+1]*M+U;A.beginPath(),A.arc(We,Js,g*M,0,2*Math.PI),A.stroke()}}},[f,d,p,g,e,a,n,u,t]),O?m.jsxs("div",{style:{width:n,height:u,display:"flex",justifyContent:"center",alignItems:"center",color:"red"},children:["Error: ",O]}):m.jsx("canvas",{ref:c,width:n,height:u,style:{display:"block",imageRendering:"pixelated"}})};function qg(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const _m=uc.createContext(void 0),Gg=()=>{const t=E.useContext(_m);if(!t)throw new Error("useTimeseriesSelection must be used within a TimeseriesSelectionContext");const l=t.dispatch,e=E.useCallback(c=>{l({type:"initializeTimeseries",startTimeSec:c.startTimeSec,endTimeSec:c.endTimeSec,initialVisibleStartTimeSec:c.initialVisibleStartTimeSec,initialVisibleEndTimeSec:c.initialVisibleEndTimeSec})},[l]),a=E.useCallback((c,f)=>{l({type:"setVisibleTimeRange",visibleStartTimeSec:c,visibleEndTimeSec:f})},[l]),n=E.useCallback((c,f)=>{l({type:"setCurrentTime",currentTime:c,ensureVisible:f==null?void 0:f.ensureVisible})},[l]),u=E.useCallback(c=>{l({type:"zoomVisibleTimeRange",factor:c})},[l]),i=E.useCallback(c=>{l({type:"translateVisibleTimeRangeFrac",frac:c})},[l]);if(t===void 0)throw new Error("useTimeseriesSelection must be used within a TimeseriesSelectionContext.Provider");return{initializeTimeseriesSelection:e,setVisibleTimeRange:a,setCurrentTime:n,zoomVisibleTimeRange:u,translateVisibleTimeRangeFrac:i,timeseriesSelection:t.timeseriesSelection,startTimeSec:t.timeseriesSelection.startTimeSec,endTimeSec:t.timeseriesSelection.endTimeSec,visibleStartTimeSec:t.timeseriesSelection.visibleStartTimeSec,visibleEndTimeSec:t.timeseriesSelection.visibleEndTimeSec,currentTime:t.timeseriesSelection.currentTime}},Xg=[1e-4,5e-4,.001,.005,.01,.05,.1,.5,1,2,5,10],Qg=.001,Vg=50,Zg="grayscale",Lg=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(!1),[v,d]=E.useState(Qg),[y,p]=E.useState(Vg),[D,O]=E.useState(Zg),[r,o]=E.useState(null),[h,S]=E.useState(null),{currentTime:b,setCurrentTime:A,initializeTimeseriesSelection:T}=Gg(),C=100,j=e-C;E.useEffect(()=>{(async()=>{try{i(!0),f(null);const N=await Hs.create(t);n(N),T({startTimeSec:N.startTimeSec,endTimeSec:N.endTimeSec,initialVisibleStartTimeSec:N.startTimeSec,initialVisibleEndTimeSec:N.endTimeSec}),A(N.startTimeSec)}catch(N){console.error("Error loading MEA Movie client:",N),f(N instanceof Error?N.message:"Unknown error")}finally{i(!1)}})()},[t,T,A]);const H=E.useMemo(()=>!a||b===void 0?0:a.getIndexFromTime(b),[a,b]);E.useEffect(()=>{if(!s||!a||r===null||h===null)return;let U;const N=()=>{const X=(Date.now()-r)/1e3,k=h+X*v;k>=a.endTimeSec?(g(!1),A(a.endTimeSec),o(null),S(null)):(A(k),U=requestAnimationFrame(N))};return U=requestAnimationFrame(N),()=>{U&&cancelAnimationFrame(U)}},[s,a,v,r,h,A]);const L=E.useCallback(()=>{!a||b===void 0||(s?(g(!1),o(null),S(null)):(b>=a.endTimeSec?(A(a.startTimeSec),o(Date.now()),S(a.startTimeSec)):(o(Date.now()),S(b)),g(!0)))},[s,a,b,A]),Z=E.useCallback(U=>{if(!a)return;const N=parseInt(U.target.value,10),G=a.getTimeFromIndex(N);A(G),s&&(o(Date.now()),S(G))},[a,A,s]),tt=E.useCallback(U=>{p(parseInt(U.target.value,10))},[]),rt=E.useCallback(U=>{const N=parseFloat(U.target.value);d(N),s&&b!==void 0&&(o(Date.now()),S(b))},[s,b]),Mt=E.useCallback(U=>{O(U.target.value)},[]),_=E.useCallback(()=>{if(!a||b===void 0)return;const U=Math.max(b-.001,a.startTimeSec);A(U),s&&(o(Date.now()),S(U))},[a,b,A,s]);if(u)return m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif"},children:"Loading MEA Movie data..."});if(c||!a)return m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load MEA Movie data"]});const M=b!==void 0?b:a.startTimeSec,R=a.endTimeSec-a.startTimeSec;return m.jsxs("div",{style:{display:"flex",flexDirection:"column",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#1a1a1a"},children:[m.jsx("div",{style:{height:j,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#000000"},children:m.jsx(Yg,{client:a,currentTimeIndex:H,contrast:y,colormap:D,width:l,height:j,isPlaying:s})}),m.jsxs("div",{style:{height:C,padding:"15px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"10px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"15px"},children:[m.jsx("button",{onClick:L,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:"pointer",fontWeight:"bold"},children:s?"⏸ Pause":"▶ Play"}),m.jsx("button",{onClick:_,style:{padding:"6px 10px",fontSize:"12px",backgroundColor:"#666",color:"white",border:"none",borderRadius:"4px",cursor:"pointer",fontWeight:"bold"},title:"Rewind 1 millisecond",children:"⏮ -1ms"}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"45px"},children:"Speed:"}),m.jsx("select",{value:v,onChange:rt,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:Xg.map(U=>m.jsxs("option",{value:U,children:[U,"x"]},U))})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Contrast:"}),m.jsx("input",{type:"range",min:0,max:100,value:y,onChange:tt,style:{width:"150px",height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}}),m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"30px",textAlign:"right"},children:y})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Colormap:"}),m.jsxs("select",{value:D,onChange:Mt,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:[m.jsx("option",{value:"grayscale",children:"Grayscale"}),m.jsx("option",{value:"viridis",children:"Viridis"}),m.jsx("option",{value:"hot",children:"Hot"}),m.jsx("option",{value:"blue-red",children:"Blue-Red"}),m.jsx("option",{value:"cool",children:"Cool"})]})]}),m.jsxs("div",{style:{marginLeft:"auto",fontSize:"12px",color:"#ccc"},children:[m.jsxs("span",{children:["Time: ",M.toFixed(3),"s / ",R.toFixed(3),"s"]}),m.jsxs("span",{style:{marginLeft:"15px"},children:["Frame: ",H," / ",a.numTimepoints-1]}),m.jsxs("span",{style:{marginLeft:"15px"},children:["Channels: ",a.numChannels]})]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"40px"},children:"Time:"}),m.jsx("input",{type:"range",min:0,max:a.numTimepoints-1,value:H,onChange:Z,style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]})]})]})},Ki=t=>{const[l,e]=E.useState(t==null?void 0:t.stateRef.current),a=t==null?void 0:t.stateRef,n=t==null?void 0:t.onChange;return E.useEffect(()=>{e(a==null?void 0:a.current);const u=n==null?void 0:n(i=>{e(i)});return()=>{u&&u()}},[n,a]),l===void 0?{state:void 0,dispatch:void 0}:{state:l,dispatch:t==null?void 0:t.dispatch}},Kg=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(wg,{context:a.timeseriesSelection,children:m.jsx(Lg,{zarrGroup:t,width:l,height:e})}),wg=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!e||!a?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(_m.Provider,{value:{timeseriesSelection:e,dispatch:a},children:l})},Vs=class Vs{constructor(l,e,a,n,u,i,c,f){B(this,ki);B(this,Le);B(this,Ll);B(this,Za);B(this,uu);B(this,iu);B(this,cu);B(this,fu);B(this,su);B(this,La,null);B(this,Ka,null);B(this,wa,null);q(this,Le,l),q(this,Ll,e),q(this,Za,a),q(this,uu,n),q(this,iu,u),q(this,cu,i),q(this,fu,c),q(this,su,f)}static async create(l){var v;const e=l.attrs,a=e.num_spikes,n=e.num_channels,u=e.sampling_frequency_hz,i=e.data_min,c=e.data_max,f=e.data_median,s=await l.getDataset("spike_frames_data");if(!s)throw new Error("No spike_frames_data dataset found");if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0||f===void 0)throw new Error("Missing required attributes in zarr group");const g=new Vs(l,a,n,u,i,c,f,s);return await $i(v=g,ki,Gm).call(v),g}get numSpikes(){return z(this,Ll)}get numChannels(){return z(this,Za)}get samplingFrequencyHz(){return z(this,uu)}get dataMin(){return z(this,iu)}get dataMax(){return z(this,cu)}get dataMedian(){return z(this,fu)}async getElectrodeCoords(){if(z(this,La)===null){const l=await z(this,Le).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const e=await l.getData({});q(this,La,e)}return z(this,La)}async getSpikeFrameData(l){if(l<0||l>=z(this,Ll))throw new Error(`Spike index ${l} out of range [0, ${z(this,Ll)})`);return await z(this,su).getData({slice:[[l,l+1],[0,z(this,Za)]]})}getSpikeTime(l){if(!z(this,Ka)||l<0||l>=z(this,Ll))throw new Error(`Invalid spike index: ${l}`);return z(this,Ka)[l]}getSpikeLabel(l){if(!z(this,wa)||l<0||l>=z(this,Ll))throw new Error(`Invalid spike index: ${l}`);return z(this,wa)[l]}};Le=new WeakMap,Ll=new WeakMap,Za=new WeakMap,uu=new WeakMap,iu=new WeakMap,cu=new WeakMap,fu=new WeakMap,su=new WeakMap,La=new WeakMap,Ka=new WeakMap,wa=new WeakMap,ki=new WeakSet,Gm=async function(){const l=await z(this,Le).getDataset("spike_sample_deltas");if(l){const d=await l.getData({}),t=new Float32Array(d.length);let r=0;for(let o=0;o<d.length;o++)r+=d[o],t[o]=r/z(this,uu);q(this,Ka,t)}else{const d=await z(this,Le).getDataset("spike_times_sec");if(!d)throw new Error("No spike_sample_deltas or spike_times_sec dataset found");const t=await d.getData({});q(this,Ka,t)}const a=await z(this,Le).getDataset("spike_labels");if(!a)throw new Error("No spike_labels dataset found");const n=await a.getData({});q(this,wa,n)};let Ns=Vs;const Jg=({electrodeCoords:t,frameData:l,dataMin:e,dataMax:a,dataMedian:n,contrast:u,colormap:i,width:c,height:f})=>{const s=E.useRef(null),g=uc.useMemo(()=>kg(t)*.95/2,[t]);return E.useEffect(()=>{if(!s.current)return;const d=s.current.getContext("2d");if(!d)return;d.fillStyle="#90908b",d.fillRect(0,0,c,f);const y=t.length/2;let p=t[0],D=t[0],O=t[1],r=t[1];for(let Z=0;Z<y;Z++){const tt=t[Z*2],rt=t[Z*2+1];tt<p&&(p=tt),tt>D&&(D=tt),rt<O&&(O=rt),rt>r&&(r=rt)}const o=30,h=D-p,S=r-O,b=(c-2*o)/h,A=(f-2*o)/S,T=Math.max(0,Math.min(b,A)),C=(c-h*T)/2-p*T,j=(f-S*T)/2-O*T,H=2*Math.max(Math.abs(a-n),Math.abs(e-n)),L=Math.exp((u-40)/10);for(let Z=0;Z<y;Z++){const tt=t[Z*2]*T+C,rt=t[Z*2+1]*T+j;let M=(.5+(l[Z]-n)/H-.5)*2*L;M=Math.max(-1,Math.min(1,M)),M=-M;const R=(M+1)/2,U=$n(R,i);d.fillStyle=U,d.beginPath(),d.arc(tt,rt,g*T,0,2*Math.PI),d.fill()}},[t,l,g,u,i,c,f,e,a,n]),m.jsx("canvas",{ref:s,width:c,height:f,style:{display:"block",imageRendering:"pixelated"}})};function kg(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Fg=t=>l=>e=>{$g(l,t,e)},Wg=t=>l=>e=>{Ig(l,t,e)},$g=(t,l,e)=>{const a={type:e.ctrlKey?Dm:e.shiftKey?jm:Cm,targetUnit:t};l(a)},Ig=(t,l,e)=>{const a={type:e.shiftKey?jm:e.ctrlKey?Cm:Dm,targetUnit:t};l(a)},Dm="UNIQUE_SELECT",Cm="TOGGLE_UNIT",jm="TOGGLE_RANGE",Pg={selectedUnitIds:new Set,currentUnitId:void 0,orderedUnitIds:[]},Um=()=>E.useContext(In),In=uc.createContext({unitSelection:Pg,unitSelectionDispatch:()=>{}}),Om=()=>{const{unitSelection:t,unitSelectionDispatch:l}=Um(),e=E.useMemo(()=>Fg(l),[l]),a=E.useMemo(()=>Wg(l),[l]),n=E.useMemo(()=>tv(t.orderedUnitIds,t.restrictedUnitIds),[t.orderedUnitIds,t.restrictedUnitIds]),u=E.useMemo(()=>t.orderedUnitIds.filter(i=>t.selectedUnitIds.has(i)),[t.orderedUnitIds,t.selectedUnitIds]);return{selectedUnitIds:t.selectedUnitIds,currentUnitId:t.currentUnitId,orderedUnitIds:n,allOrderedUnitIds:t.orderedUnitIds,selectedUnitIdsArray:u,visibleUnitIds:t.visibleUnitIds,primarySortRule:t.sortRules&&t.sortRules.length>0?t.sortRules[t.sortRules.length-1]:void 0,page:t.page,unitsPerPage:t.unitsPerPage,checkboxClickHandlerGenerator:e,plotClickHandlerGenerator:a,unitIdSelectionDispatch:l,currentState:t,restrictedUnitIds:t.restrictedUnitIds}},tv=(t,l)=>{if(l===void 0)return t;const e=new Set(l);return t.filter(a=>e.has(a))},lv=50,ev="grayscale",av=({zarrGroup:t,width:l,height:e})=>{var N;const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(0),[v,d]=E.useState(lv),[y,p]=E.useState(ev),[D,O]=E.useState(null),[r,o]=E.useState(null),[h,S]=E.useState(!1),b=E.useContext(In),A=E.useMemo(()=>{var G;return((G=b==null?void 0:b.unitSelection)==null?void 0:G.selectedUnitIds)||new Set},[b]),T=140,C=e-T;E.useEffect(()=>{(async()=>{try{i(!0),f(null);const X=await Ns.create(t);n(X);const k=await X.getElectrodeCoords();O(k),X.numSpikes>0&&g(0)}catch(X){console.error("Error loading MEA Spike Frames Movie client:",X),f(X instanceof Error?X.message:"Unknown error")}finally{i(!1)}})()},[t]);const j=E.useCallback(G=>{const X=parseInt(G.target.value,10);g(X)},[]),H=E.useCallback(G=>{d(parseInt(G.target.value,10))},[]),L=E.useCallback(G=>{p(G.target.value)},[]),Z=E.useCallback(()=>{g(G=>Math.max(0,G-1))},[]),tt=E.useCallback(()=>{a&&g(G=>Math.min(a.numSpikes-1,G+1))},[a]),rt=E.useCallback(G=>{S(G.target.checked),g(0)},[]),Mt=E.useMemo(()=>{if(!a||!h||A.size===0)return Array.from({length:(a==null?void 0:a.numSpikes)||0},(X,k)=>k);const G=[];for(let X=0;X<a.numSpikes;X++){const k=a.getSpikeLabel(X);A.has(String(k))&&G.push(X)}return G},[a,h,A]),_=(N=Mt[s])!=null?N:0;if(E.useEffect(()=>{if(!a)return;(async()=>{try{const X=await a.getSpikeFrameData(_);o(X)}catch(X){console.error("Error loading spike frame data:",X),f(X instanceof Error?X.message:"Unknown error")}})()},[a,_]),u)return m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif"},children:"Loading Spike Frames Movie data..."});if(c||!a||!D||!r)return m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load Spike Frames Movie data"]});const M=a.getSpikeTime(_),R=a.getSpikeLabel(_),U=Mt.length;return m.jsxs("div",{style:{display:"flex",flexDirection:"column",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#1a1a1a"},children:[m.jsx("div",{style:{height:C,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#000000"},children:m.jsx(Jg,{electrodeCoords:D,frameData:r,dataMin:a.dataMin,dataMax:a.dataMax,dataMedian:a.dataMedian,contrast:v,colormap:y,width:l,height:C})}),m.jsxs("div",{style:{height:T,padding:"15px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"10px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"15px"},children:[m.jsx("button",{onClick:Z,disabled:s===0,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:s===0?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===0?"not-allowed":"pointer",fontWeight:"bold"},children:"← Prev"}),m.jsx("button",{onClick:tt,disabled:s>=U-1,style:{padding:"8px 16px",fontSize:"14px",backgroundColor:s>=U-1?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s>=U-1?"not-allowed":"pointer",fontWeight:"bold"},children:"Next →"}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px",marginLeft:"10px"},children:[m.jsx("input",{type:"checkbox",id:"filterBySelectedUnits",checked:h,onChange:rt,style:{cursor:"pointer",width:"16px",height:"16px"}}),m.jsx("label",{htmlFor:"filterBySelectedUnits",style:{fontSize:"12px",color:"#ccc",cursor:"pointer",userSelect:"none"},children:"Filter by selected units"})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Contrast:"}),m.jsx("input",{type:"range",min:0,max:100,value:v,onChange:H,style:{width:"150px",height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}}),m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"30px",textAlign:"right"},children:v})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"8px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"70px"},children:"Colormap:"}),m.jsxs("select",{value:y,onChange:L,style:{padding:"6px",fontSize:"12px",backgroundColor:"#3a3a3a",color:"#fff",border:"1px solid #555",borderRadius:"4px",cursor:"pointer"},children:[m.jsx("option",{value:"grayscale",children:"Grayscale"}),m.jsx("option",{value:"viridis",children:"Viridis"}),m.jsx("option",{value:"hot",children:"Hot"}),m.jsx("option",{value:"blue-red",children:"Blue-Red"}),m.jsx("option",{value:"cool",children:"Cool"})]})]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"50px"},children:"Spike:"}),m.jsx("input",{type:"range",min:0,max:Math.max(0,U-1),value:s,onChange:j,style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"20px",fontSize:"13px",color:"#fff",backgroundColor:"#333",padding:"8px 12px",borderRadius:"4px"},children:[m.jsxs("span",{children:[m.jsx("strong",{children:"Spike:"})," ",s+1," / ",U,h&&A.size>0&&m.jsxs("span",{style:{color:"#aaa",marginLeft:"5px"},children:["(of ",a.numSpikes," total)"]})]}),m.jsxs("span",{children:[m.jsx("strong",{children:"Time:"})," ",M.toFixed(4)," s"]}),m.jsxs("span",{children:[m.jsx("strong",{children:"Unit:"})," ",R]}),m.jsxs("span",{style:{marginLeft:"auto",color:"#aaa"},children:["Channels: ",a.numChannels]})]})]})]})},nv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(uv,{context:a.unitSelection,children:m.jsx(av,{zarrGroup:t,width:l,height:e})}),uv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},Zs=class Zs{constructor(l,e,a){B(this,Fi);B(this,Ke);B(this,Kl);B(this,wl);B(this,Ja,null);B(this,ka,null);B(this,we,null);B(this,ou,0);q(this,Ke,l),q(this,Kl,e),q(this,wl,a)}static async create(l){var i;const e=l.attrs,a=e.num_frames,n=e.num_channels;if(a===void 0||n===void 0)throw new Error("Missing required attributes in zarr group");const u=new Zs(l,a,n);return await $i(i=u,Fi,Xm).call(i),u}get numFrames(){return z(this,Kl)}get numChannels(){return z(this,wl)}get electrodeCoords(){if(!z(this,Ja))throw new Error("Electrode coordinates not loaded");return z(this,Ja)}get maxAmplitude(){return z(this,ou)}getFiringRatesForFrame(l){if(!z(this,ka))throw new Error("Mean firing rates not loaded");if(l<0||l>=z(this,Kl))throw new Error(`Frame index ${l} out of range [0, ${z(this,Kl)})`);const e=l*z(this,wl),a=e+z(this,wl);return z(this,ka).slice(e,a)}getAmplitudesForFrame(l){if(!z(this,we))throw new Error("Mean spike amplitudes not loaded");if(l<0||l>=z(this,Kl))throw new Error(`Frame index ${l} out of range [0, ${z(this,Kl)})`);const e=l*z(this,wl),a=e+z(this,wl);return z(this,we).slice(e,a)}};Ke=new WeakMap,Kl=new WeakMap,wl=new WeakMap,Ja=new WeakMap,ka=new WeakMap,we=new WeakMap,ou=new WeakMap,Fi=new WeakSet,Xm=async function(){const l=await z(this,Ke).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");q(this,Ja,await l.getData({}));const e=await z(this,Ke).getDataset("mean_firing_rates");if(!e)throw new Error("No mean_firing_rates dataset found");q(this,ka,await e.getData({}));const a=await z(this,Ke).getDataset("mean_spike_amplitudes");if(!a)throw new Error("No mean_spike_amplitudes dataset found");q(this,we,await a.getData({})),q(this,ou,Math.max(...Array.from(z(this,we))))};let Bs=Zs;const iv=300,cv=({client:t,frameIndex:l,width:e,height:a})=>{const n=E.useRef(null),[u,i]=E.useState(null),[c,f]=E.useState(null),s=E.useRef([]);E.useEffect(()=>{if(n.current)try{const y=n.current.getContext("2d");if(!y)return;const p=t.electrodeCoords,D=t.getFiringRatesForFrame(l),O=t.getAmplitudesForFrame(l),r=t.maxAmplitude,o=t.numChannels;y.fillStyle="#f5f5f5",y.fillRect(0,0,e,a);let h=p[0],S=p[0],b=p[1],A=p[1];for(let M=0;M<o;M++){const R=p[M*2],U=p[M*2+1];R<h&&(h=R),R>S&&(S=R),U<b&&(b=U),U>A&&(A=U)}const T=fv(p),C=60,j=S-h,H=A-b,L=(e-2*C)/j,Z=(a-2*C)/H,tt=Math.max(0,Math.min(L,Z)),rt=(e-j*tt)/2-h*tt,Mt=(a-H*tt)/2-b*tt,_=T*tt*.9/2;s.current=[];for(let M=0;M<o;M++){const R=p[M*2]*tt+rt,U=p[M*2+1]*tt+Mt,N=D[M],G=O[M],k=Math.min(N/iv,1)*_,_t=r>0?G/r:0,ut=$n(_t,"viridis");s.current.push({x:R,y:U,radius:k,channelIndex:M}),k>0?(y.fillStyle=ut,y.beginPath(),y.arc(R,U,k,0,2*Math.PI),y.fill(),y.strokeStyle="rgba(0, 0, 0, 0.3)",y.lineWidth=1,y.stroke()):(y.fillStyle="#cccccc",y.beginPath(),y.arc(R,U,2,0,2*Math.PI),y.fill())}if(u){const M=s.current.find(R=>R.channelIndex===u.channelIndex);M&&(y.strokeStyle="rgba(255, 0, 0, 0.8)",y.lineWidth=3,y.beginPath(),y.arc(M.x,M.y,Math.max(M.radius,4),0,2*Math.PI),y.stroke())}}catch(d){console.error("Error rendering canvas:",d),f(d instanceof Error?d.message:"Unknown error")}},[t,l,e,a,u]);const g=d=>{const y=n.current;if(!y)return;const p=y.getBoundingClientRect(),D=d.clientX-p.left,O=d.clientY-p.top;let r=null;for(const o of s.current){const h=D-o.x,S=O-o.y;if(Math.sqrt(h*h+S*S)<=Math.max(o.radius,4)){const A=t.getFiringRatesForFrame(l),T=t.getAmplitudesForFrame(l);r={channelIndex:o.channelIndex,firingRate:A[o.channelIndex],amplitude:T[o.channelIndex],x:D,y:O};break}}i(r)},v=()=>{i(null)};return c?m.jsxs("div",{style:{width:e,height:a,display:"flex",justifyContent:"center",alignItems:"center",color:"red"},children:["Error: ",c]}):m.jsxs("div",{style:{position:"relative",width:e,height:a},children:[m.jsx("canvas",{ref:n,width:e,height:a,onMouseMove:g,onMouseLeave:v,style:{display:"block",cursor:u?"pointer":"default"}}),u&&m.jsxs("div",{style:{position:"absolute",left:u.x+15,top:u.y-10,backgroundColor:"rgba(0, 0, 0, 0.85)",color:"white",padding:"8px 12px",borderRadius:"4px",fontSize:"13px",pointerEvents:"none",whiteSpace:"nowrap",boxShadow:"0 2px 8px rgba(0,0,0,0.3)",zIndex:1e3},children:[m.jsx("div",{children:m.jsxs("strong",{children:["Channel ",u.channelIndex]})}),m.jsxs("div",{children:["Firing Rate: ",u.firingRate.toFixed(2)," Hz"]}),m.jsxs("div",{children:["Amplitude: ",u.amplitude.toFixed(2)," μV"]})]})]})};function fv(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Rm=300,sv=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),[s,g]=E.useState(0),v=250,d=80,y=e,p=l-v,D=a&&a.numFrames>1,O=e-(D?d:0);return E.useEffect(()=>{(async()=>{try{i(!0),f(null);const o=await Bs.create(t);n(o)}catch(o){console.error("Error loading MEA Firing Rates and Amplitudes client:",o),f(o instanceof Error?o.message:"Unknown error")}finally{i(!1)}})()},[t]),u?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#f5f5f5"},children:"Loading Firing Rates and Amplitudes data..."}):c||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:l,height:e,fontFamily:"Arial, sans-serif",color:"red",backgroundColor:"#f5f5f5"},children:["Error: ",c||"Failed to load data"]}):m.jsxs("div",{style:{display:"flex",flexDirection:"row",width:l,height:e,fontFamily:"Arial, sans-serif",backgroundColor:"#f5f5f5"},children:[m.jsxs("div",{style:{width:p,height:e,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:p,height:O},children:m.jsx(cv,{client:a,frameIndex:s,width:p,height:O})}),D&&m.jsxs("div",{style:{height:d,padding:"15px 20px",backgroundColor:"#2a2a2a",borderTop:"1px solid #444",display:"flex",flexDirection:"column",gap:"12px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"12px"},children:[m.jsx("button",{onClick:()=>g(Math.max(0,s-1)),disabled:s===0,style:{padding:"6px 14px",fontSize:"13px",backgroundColor:s===0?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===0?"not-allowed":"pointer",fontWeight:"bold"},children:"← Prev"}),m.jsx("button",{onClick:()=>g(Math.min(a.numFrames-1,s+1)),disabled:s===a.numFrames-1,style:{padding:"6px 14px",fontSize:"13px",backgroundColor:s===a.numFrames-1?"#555":"#4a90e2",color:"white",border:"none",borderRadius:"4px",cursor:s===a.numFrames-1?"not-allowed":"pointer",fontWeight:"bold"},children:"Next →"}),m.jsxs("div",{style:{marginLeft:"auto",fontSize:"13px",color:"#ccc",fontWeight:"500"},children:["Frame: ",s+1," / ",a.numFrames]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"12px"},children:[m.jsx("span",{style:{fontSize:"12px",color:"#ccc",minWidth:"45px"},children:"Frame:"}),m.jsx("input",{type:"range",min:0,max:a.numFrames-1,value:s,onChange:r=>g(parseInt(r.target.value,10)),style:{flex:1,height:"6px",background:"#4a4a4a",outline:"none",borderRadius:"3px",cursor:"pointer"}})]})]})]}),m.jsxs("div",{style:{width:v,height:y,padding:"20px",backgroundColor:"#ffffff",borderLeft:"1px solid #ddd",overflowY:"auto"},children:[m.jsx("h3",{style:{margin:"0 0 20px 0",fontSize:"16px",fontWeight:"bold",color:"#333"},children:"Legend"}),m.jsxs("div",{style:{marginBottom:"30px"},children:[m.jsx("h4",{style:{margin:"0 0 12px 0",fontSize:"14px",fontWeight:"600",color:"#555"},children:"Circle Size: Firing Rate"}),m.jsx("div",{style:{fontSize:"12px",color:"#666",lineHeight:"1.6"},children:m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsxs("div",{style:{display:"flex",alignItems:"center",marginBottom:"6px"},children:[m.jsx("div",{style:{width:"30px",height:"30px",borderRadius:"50%",backgroundColor:"#888",marginRight:"10px"}}),m.jsxs("span",{children:[Rm," Hz (max)"]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",marginBottom:"6px"},children:[m.jsx("div",{style:{width:"15px",height:"15px",borderRadius:"50%",backgroundColor:"#888",marginRight:"10px",marginLeft:"7.5px"}}),m.jsxs("span",{children:[Rm/2," Hz"]})]}),m.jsxs("div",{style:{display:"flex",alignItems:"center"},children:[m.jsx("div",{style:{width:"4px",height:"4px",borderRadius:"50%",backgroundColor:"#ccc",marginRight:"10px",marginLeft:"13px"}}),m.jsx("span",{children:"0 Hz"})]})]})})]}),m.jsxs("div",{style:{marginBottom:"20px"},children:[m.jsx("h4",{style:{margin:"0 0 12px 0",fontSize:"14px",fontWeight:"600",color:"#555"},children:"Color: Spike Amplitude"}),m.jsxs("div",{style:{fontSize:"12px",color:"#666",lineHeight:"1.6"},children:[m.jsxs("div",{style:{marginBottom:"8px",fontStyle:"italic"},children:["0 to ",a.maxAmplitude.toFixed(1)," μV"]}),m.jsx(ov,{maxAmplitude:a.maxAmplitude})]})]}),m.jsxs("div",{style:{marginTop:"30px",padding:"12px",backgroundColor:"#f8f9fa",borderRadius:"4px",fontSize:"12px",color:"#666"},children:[m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsx("strong",{children:"Total Channels:"})," ",a.numChannels]}),m.jsxs("div",{style:{marginBottom:"8px"},children:[m.jsx("strong",{children:"Hover"})," over electrodes to see exact values"]})]})]})]})},ov=({maxAmplitude:t})=>{const n=[];for(let i=0;i<50;i++){const c=i/49,f=$n(c,"viridis");n.push(f)}const u=n.map((i,c)=>{const f=c/49*100;return`${i} ${f}%`}).join(", ");return m.jsxs("div",{style:{display:"flex",alignItems:"center",marginTop:"10px"},children:[m.jsx("div",{style:{width:"30px",height:"120px",background:`linear-gradient(to top, ${u})`,border:"1px solid #ccc",borderRadius:"2px"}}),m.jsxs("div",{style:{marginLeft:"10px",display:"flex",flexDirection:"column",justifyContent:"space-between",height:"120px",fontSize:"11px"},children:[m.jsx("div",{children:t.toFixed(1)}),m.jsx("div",{children:(t/2).toFixed(1)}),m.jsx("div",{children:"0"})]})]})},rv=({zarrGroup:t,width:l,height:e})=>m.jsx(sv,{zarrGroup:t,width:l,height:e}),Ls=class Ls{constructor(l,e,a,n){B(this,ru);B(this,Fa);B(this,Wa);B(this,du);B(this,Je,null);q(this,ru,l),q(this,Fa,e),q(this,Wa,a),q(this,du,n)}static async create(l){const e=l.attrs,a=e.num_templates,n=e.num_channels;if(a===void 0||n===void 0)throw new Error("Missing required attributes in zarr group");const u=await l.getDataset("templates");if(!u)throw new Error("No templates dataset found");return new Ls(l,a,n,u)}get numTemplates(){return z(this,Fa)}get numChannels(){return z(this,Wa)}get numUnits(){return z(this,Fa)}get templatesDataset(){return z(this,du)}async getElectrodeCoords(){if(z(this,Je)===null){const l=await z(this,ru).getDataset("electrode_coords");if(!l)throw new Error("No electrode_coords dataset found");const a=await l.getData({});q(this,Je,[]);for(let n=0;n<z(this,Wa);n++)z(this,Je).push([a[n*2],a[n*2+1]])}return z(this,Je)}};ru=new WeakMap,Fa=new WeakMap,Wa=new WeakMap,du=new WeakMap,Je=new WeakMap;let Ys=Ls,dv=0,mv=1,qs;const hv=t=>{qs===void 0&&(qs=Hm.length);const l=(dv+t*mv)%qs;return Hm[l]},Hm=["#00ff00","#ff00ff","#0080ff","#ff8000","#80bf80","#470ba7","#c80b32","#fd7ee5","#027d30","#00ffff","#00ff80","#9c5a86","#808000","#8ed7fa","#80ff00","#6e52ff","#0000ff","#119c9b","#feb982","#56333d","#fb2b97","#8000ff","#c3f1a2","#b3bd25","#45bc2d","#1c4b88","#49f3c0","#a90c9c","#c436ea","#13055b","#7f93d0","#c4552d","#ee7381","#800000","#58fe60","#4f825e","#21bde8","#d7b8e0","#1e40ee","#324a01","#fc2b03","#723cb9","#3a6ac1","#aef14e","#14c568","#bd9c9b","#f9c506","#b579fa","#810e5e","#b38d4d","#854810","#02ea3a","#0b3b3c","#f90161","#07c304","#fe4c54","#be02ea","#0521bb","#338b05","#4989ff","#52b8b3","#be3271","#f1a441","#0b776b","#0ccfac","#cd61bd","#85fc95","#fe43fe","#bd810d","#cce9e6","#644179","#fedfbe","#80bd00","#99c4bd","#48e5fa","#400626","#bcfc01","#866b3f","#5422e9","#ea03bd","#69809a","#bfca76","#40e60e","#f1da52","#3d5f3b","#63b3f8","#7cd83d","#b52f02","#9364ca","#80a740","#3ce183","#a6a9f6","#fba2bb","#e3763f","#ae3cae","#91414a","#1e94cf","#06f6c9"],yv="grayscale",wi=10,gv=({client:t,width:l,height:e,unitId:a,brightness:n,useGlobalScale:u,globalMin:i,globalMax:c})=>{const f=E.useRef(null),[s,g]=E.useState(null),[v,d]=E.useState(5),[y,p]=E.useState(null),[D,O]=E.useState(!0);return E.useEffect(()=>{(async()=>{try{O(!0),p(null);const o=parseInt(a,10)-1;if(o<0||o>=t.numUnits)throw new Error(`Invalid unit index: ${o}`);const h=await t.templatesDataset.getData({slice:[[o,o+1]]});if(!h||h.length!==t.numChannels)throw new Error(`Expected ${t.numChannels} channels, got ${(h==null?void 0:h.length)||0}`);g(h);const S=await t.getElectrodeCoords(),b=new Float32Array(t.numChannels*2);for(let C=0;C<t.numChannels;C++)b[C*2]=S[C][0],b[C*2+1]=S[C][1];const T=vv(b)*.95/2;d(T)}catch(o){console.error("Error loading template data:",o),p(o instanceof Error?o.message:"Unknown error")}finally{O(!1)}})()},[t,a]),E.useEffect(()=>{if(!f.current||!s||u&&(i===void 0||c===void 0))return;const o=f.current.getContext("2d");if(!o)return;const h=l-2*wi,S=e-2*wi-30;o.fillStyle="#f4f4f4",o.fillRect(0,0,l,e);const b=hv(a);o.fillStyle=b,o.font="14px Arial",o.textAlign="center",o.fillText(`Unit ${a}`,l/2,20),(async()=>{const T=await t.getElectrodeCoords(),C=t.numChannels;let j=T[0][0],H=T[0][0],L=T[0][1],Z=T[0][1];for(let k=0;k<C;k++){const _t=T[k][0],ut=T[k][1];_t<j&&(j=_t),_t>H&&(H=_t),ut<L&&(L=ut),ut>Z&&(Z=ut)}const tt=H-j,rt=Z-L,Mt=h/tt,_=S/rt,M=Math.max(0,Math.min(Mt,_)),R=wi+(h-tt*M)/2-j*M,U=wi+30+(S-rt*M)/2-L*M;let N,G;if(u&&i!==void 0&&c!==void 0)N=i,G=c;else{N=s[0],G=s[0];for(let k=1;k<s.length;k++)s[k]<N&&(N=s[k]),s[k]>G&&(G=s[k])}let X=(n-50)/50;X=Math.sign(X)*Math.pow(Math.abs(X),1/4),N+=(G-N)*X;for(let k=0;k<C;k++){const _t=T[k][0]*M+R,ut=T[k][1]*M+U,El=s[k];let Fe=1-(G-N>0?(El-N)/(G-N):.5);Fe=Math.min(1,Math.max(0,Fe));const pu=$n(Fe,yv);o.fillStyle=pu,o.beginPath(),o.arc(_t,ut,v*M,0,2*Math.PI),o.fill()}})()},[s,v,l,e,t,a,n,u,i,c]),D?m.jsx("div",{style:{width:l,height:e,display:"flex",justifyContent:"center",alignItems:"center",backgroundColor:"#f0f0f0",border:"1px solid #ccc"},children:"Loading..."}):y?m.jsxs("div",{style:{width:l,height:e,display:"flex",justifyContent:"center",alignItems:"center",color:"red",backgroundColor:"#f0f0f0",border:"1px solid #ccc"},children:["Error: ",y]}):m.jsx("canvas",{ref:f,width:l,height:e,style:{display:"block",border:"1px solid #ccc"}})};function vv(t){const l=t.length/2;let e=1/0;for(let a=0;a<l;a++){const n=t[a*2],u=t[a*2+1];for(let i=a+1;i<l;i++){const c=t[i*2],f=t[i*2+1],s=Math.sqrt((c-n)**2+(f-u)**2);s>0&&s<e&&(e=s)}}return e===1/0?10:e}const Sv=({width:t,height:l,zarrGroup:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(!0),[c,f]=E.useState(null),{unitSelectionDispatch:s}=Um();E.useEffect(()=>{(async()=>{try{i(!0),f(null);const M=await Ys.create(e);s({type:"INITIALIZE_UNITS",newUnitOrder:Array.from({length:M.numTemplates},(R,U)=>String(U+1))}),n(M)}catch(M){console.error("Error loading Templates View client:",M),f(M instanceof Error?M.message:"Unknown error")}finally{i(!1)}})()},[e,s]);const{selectedUnitIdsArray:g,allOrderedUnitIds:v}=Om(),[d,y]=E.useState(!1),[p,D]=E.useState(!1),[O,r]=E.useState(50),[o,h]=E.useState(void 0),[S,b]=E.useState(void 0),A=E.useCallback(_=>{s({type:"SET_SELECTION",incomingSelectedUnitIds:[_]})},[s]),T=E.useCallback(_=>{s({type:"TOGGLE_UNIT",targetUnit:_})},[s]),C=20,j=E.useMemo(()=>t<300?t-C*2:t<600?(t-C*3)/2:t<900?(t-C*4)/3:(t-C*5)/4,[t]),L=j/1.6,Z=d?g:v,tt=E.useMemo(()=>new Set(g),[g]);E.useEffect(()=>{if(!p||!a){h(void 0),b(void 0);return}(async()=>{let M=1/0,R=-1/0;for(let U=0;U<a.numTemplates;U++)try{const N=await a.templatesDataset.getData({slice:[[U,U+1]]});if(N){const G=N;for(let X=0;X<G.length;X++)G[X]<M&&(M=G[X]),G[X]>R&&(R=G[X])}}catch(N){console.error(`Error loading template ${U}:`,N)}h(M),b(R)})()},[p,a]);const rt=50,Mt=l-rt;return u?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif"},children:"Loading Templates View data..."}):c||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",c||"Failed to load Templates View data"]}):g.length===0&&d?m.jsxs("div",{style:{width:t,height:l,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:t,height:Mt,display:"flex",justifyContent:"center",alignItems:"center",fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:"No units selected"}),m.jsx(Nm,{width:t,height:rt,onlyShowSelected:d,onToggle:()=>y(!d),useGlobalScale:p,onToggleGlobalScale:()=>D(!p),brightness:O,onBrightnessChange:r})]}):m.jsxs("div",{style:{width:t,height:l,display:"flex",flexDirection:"column"},children:[m.jsx("div",{style:{width:t,height:Mt,overflowY:"auto",overflowX:"hidden",backgroundColor:"#f8f8f8",padding:C},children:m.jsx("div",{style:{display:"flex",flexWrap:"wrap",gap:`${C}px`,alignContent:"flex-start"},children:Z.map(_=>{const M=tt.has(_);return m.jsx("div",{style:{width:j,height:L,flexShrink:0,cursor:"pointer",border:M&&!d?"3px solid #007bff":"3px solid transparent",borderRadius:"4px",boxSizing:"border-box"},onClick:R=>{R.ctrlKey||R.shiftKey?T(String(_)):A(String(_))},children:m.jsx(gv,{client:a,width:j-6,height:L-6,unitId:String(_),brightness:O,useGlobalScale:p,globalMin:o,globalMax:S})},_)})})}),m.jsx(Nm,{width:t,height:rt,onlyShowSelected:d,onToggle:()=>y(!d),useGlobalScale:p,onToggleGlobalScale:()=>D(!p),brightness:O,onBrightnessChange:r})]})},Nm=({width:t,height:l,onlyShowSelected:e,onToggle:a,useGlobalScale:n,onToggleGlobalScale:u,brightness:i,onBrightnessChange:c})=>m.jsxs("div",{style:{width:t,height:l,backgroundColor:"#fff",borderTop:"1px solid #ddd",display:"flex",alignItems:"center",padding:"0 20px",boxSizing:"border-box"},children:[m.jsxs("label",{style:{display:"flex",alignItems:"center",cursor:"pointer",fontFamily:"Arial, sans-serif",fontSize:"14px",userSelect:"none",marginRight:"20px"},children:[m.jsx("input",{type:"checkbox",checked:e,onChange:a,style:{marginRight:"8px",cursor:"pointer"}}),"Only show selected"]}),m.jsxs("label",{style:{display:"flex",alignItems:"center",cursor:"pointer",fontFamily:"Arial, sans-serif",fontSize:"14px",userSelect:"none",marginRight:"20px"},children:[m.jsx("input",{type:"checkbox",checked:n,onChange:u,style:{marginRight:"8px",cursor:"pointer"}}),"Global scale"]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",fontFamily:"Arial, sans-serif",fontSize:"14px"},children:[m.jsx("label",{style:{marginRight:"10px",userSelect:"none"},children:"Brightness:"}),m.jsx("input",{type:"range",min:"0",max:"100",value:i,onChange:f=>c(Number(f.target.value)),style:{width:"150px",marginRight:"10px"}})]})]}),pv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(bv,{context:a.unitSelection,children:m.jsx(Sv,{zarrGroup:t,width:l,height:e})}),bv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},Ks=class Ks{constructor(l,e){B(this,xl);B(this,$a);B(this,ke,null);q(this,xl,l),q(this,$a,e)}static async create(l){const a=l.attrs.num_items;if(a===void 0)throw new Error("Missing num_items attribute in zarr group");return new Ks(l,a)}get numItems(){return z(this,$a)}async getItems(){if(z(this,ke)===null){q(this,ke,[]);const l=await z(this,xl).getDataset("unit_ids_1"),e=await z(this,xl).getDataset("unit_ids_2"),a=await z(this,xl).getDataset("projection_starts_1"),n=await z(this,xl).getDataset("projection_starts_2"),u=await z(this,xl).getDataset("projections_1"),i=await z(this,xl).getDataset("projections_2");if(!l||!e||!a||!n||!u||!i)throw new Error("Missing required datasets");const c=await l.getData({}),f=await e.getData({}),s=await a.getData({}),g=await n.getData({}),v=await u.getData({}),d=await i.getData({});for(let y=0;y<z(this,$a);y++){const p=String(c[y]),D=String(f[y]),O=s[y],r=s[y+1],o=g[y],h=g[y+1],S=v.slice(O,r),b=d.slice(o,h);z(this,ke).push({unit_id_1:p,unit_id_2:D,projections_1:S,projections_2:b})}}return z(this,ke)}async getItem(l){const e=await this.getItems();if(l<0||l>=e.length)throw new Error(`Item index ${l} out of range`);return e[l]}};xl=new WeakMap,$a=new WeakMap,ke=new WeakMap;let Gs=Ks;const xv=({item:t,width:l,height:e,selectedUnitId:a})=>{const n=a===t.unit_id_1,u=n?t.unit_id_2:t.unit_id_1,i=n?t.unit_id_1:t.unit_id_2,c=n?t.projections_2.map(r=>-r):t.projections_1,f=n?t.projections_1.map(r=>-r):t.projections_2,s=E.useMemo(()=>{const r=[...Array.from(c),...Array.from(f)];if(r.length===0)return null;const o=Math.min(...r),h=Math.max(...r),S=h-o;if(S===0)return null;const b=50,A=S/b,T=new Array(b).fill(0),C=new Array(b).fill(0);for(const L of c){const Z=Math.min(Math.floor((L-o)/A),b-1);T[Z]++}for(const L of f){const Z=Math.min(Math.floor((L-o)/A),b-1);C[Z]++}const j=T.map((L,Z)=>L+C[Z]),H=Math.max(...j);return{bins1:T,bins2:C,binsSum:j,minVal:o,maxVal:h,binWidth:A,maxCount:H,numBins:b}},[c,f]);if(!s)return m.jsx("div",{style:{width:l,height:e,display:"flex",alignItems:"center",justifyContent:"center",backgroundColor:"#f8f8f8",fontFamily:"Arial, sans-serif",fontSize:"12px",color:"#666"},children:"No data"});const g={top:20,right:10,bottom:30,left:40},v=l-g.left-g.right,d=e-g.top-g.bottom,y="#4287f5",p="#f54242",O=s.minVal<=0&&s.maxVal>=0?(0-s.minVal)/(s.maxVal-s.minVal)*v:null;return m.jsx("div",{style:{width:l,height:e,position:"relative",backgroundColor:"#fff"},children:m.jsxs("svg",{width:l,height:e,children:[m.jsxs("text",{x:l/2,y:15,textAnchor:"middle",style:{fontFamily:"Arial, sans-serif",fontSize:"12px",fontWeight:"bold"},children:["Unit ",u," vs Unit ",i]}),m.jsxs("g",{transform:`translate(${g.left}, ${g.top})`,children:[m.jsx("line",{x1:0,y1:d,x2:v,y2:d,stroke:"#333",strokeWidth:1}),m.jsx("line",{x1:0,y1:0,x2:0,y2:d,stroke:"#333",strokeWidth:1}),O!==null&&m.jsx("line",{x1:O,y1:0,x2:O,y2:d,stroke:"#999",strokeWidth:1.5,opacity:.5}),s.binsSum.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:"#999",opacity:.3,stroke:"#999",strokeWidth:.5},`barsum-${o}`)}),s.bins1.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:y,opacity:.5,stroke:y,strokeWidth:.5},`bar1-${o}`)}),s.bins2.map((r,o)=>{const h=r/s.maxCount*d,S=o/s.numBins*v,b=v/s.numBins;return m.jsx("rect",{x:S,y:d-h,width:b,height:h,fill:p,opacity:.5,stroke:p,strokeWidth:.5},`bar2-${o}`)}),m.jsx("text",{x:v/2,y:d+25,textAnchor:"middle",style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:"Projection"}),m.jsx("text",{x:-d/2,y:-25,textAnchor:"middle",transform:`rotate(-90, ${-d/2}, -25)`,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:"Count"})]}),m.jsxs("g",{transform:`translate(${l-80}, ${g.top})`,children:[m.jsx("rect",{x:0,y:0,width:12,height:12,fill:y,opacity:.5}),m.jsxs("text",{x:16,y:10,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:["Unit ",u]}),m.jsx("rect",{x:0,y:16,width:12,height:12,fill:p,opacity:.5}),m.jsxs("text",{x:16,y:26,style:{fontFamily:"Arial, sans-serif",fontSize:"10px"},children:["Unit ",i]})]})]})})},Ev=({width:t,height:l,zarrGroup:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState([]),[c,f]=E.useState(!0),[s,g]=E.useState(null),{selectedUnitIdsArray:v}=Om();E.useEffect(()=>{(async()=>{try{f(!0),g(null);const o=await Gs.create(e),h=await o.getItems();n(o),i(h)}catch(o){console.error("Error loading Cluster Separation View client:",o),g(o instanceof Error?o.message:"Unknown error")}finally{f(!1)}})()},[e]);const d=E.useMemo(()=>{if(v.length===0)return[];const r=v[0];return u.filter(o=>o.unit_id_1===r||o.unit_id_2===r)},[u,v]),y=20,p=E.useMemo(()=>t<400?t-y*2:t<800?(t-y*3)/2:t<1200?(t-y*4)/3:(t-y*5)/4,[t]),O=p/1.3;return c?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif"},children:"Loading Cluster Separation View data..."}):s||!a?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"red"},children:["Error: ",s||"Failed to load Cluster Separation View data"]}):v.length===0?m.jsx("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:"Select a unit to view cluster separation"}):d.length===0?m.jsxs("div",{style:{display:"flex",justifyContent:"center",alignItems:"center",width:t,height:l,fontFamily:"Arial, sans-serif",color:"#666",backgroundColor:"#f8f8f8"},children:["No separation data available for selected unit ",v[0]]}):m.jsxs("div",{style:{width:t,height:l,overflowY:"auto",overflowX:"hidden",backgroundColor:"#f8f8f8",padding:y},children:[m.jsxs("div",{style:{marginBottom:y,fontFamily:"Arial, sans-serif",fontSize:"14px",color:"#333"},children:["Showing separation for Unit ",v[0]," (",d.length," pairs)"]}),m.jsx("div",{style:{display:"flex",flexWrap:"wrap",gap:`${y}px`,alignContent:"flex-start"},children:d.map(r=>m.jsx("div",{style:{width:p,height:O,flexShrink:0,border:"1px solid #ddd",borderRadius:"4px",boxSizing:"border-box",backgroundColor:"#fff"},children:m.jsx(xv,{item:r,width:p,height:O,selectedUnitId:String(v[0])})},`${r.unit_id_1}-${r.unit_id_2}`))})]})},Tv=({zarrGroup:t,width:l,height:e,contexts:a})=>m.jsx(zv,{context:a.unitSelection,children:m.jsx(Ev,{zarrGroup:t,width:l,height:e})}),zv=({context:t,children:l})=>{const{state:e,dispatch:a}=Ki(t);return!a||!e?m.jsx(m.Fragment,{children:"Waiting for context..."}):m.jsx(In.Provider,{value:{unitSelection:e,unitSelectionDispatch:a},children:l})},ws=class ws{constructor(l,e,a,n,u,i,c){B(this,Wi);B(this,mu);B(this,hu);B(this,yu);B(this,gu);B(this,vu);B(this,Su);q(this,Wi,l),q(this,mu,e),q(this,hu,a),q(this,yu,n),q(this,gu,u),q(this,vu,i),q(this,Su,c)}static async create(l){const e=l.attrs,a=e.num_units,n=e.num_timepoints,u=e.width,i=e.height,c=e.num_channels;if(a===void 0||n===void 0||u===void 0||i===void 0||c===void 0)throw new Error("Missing required attributes in zarr group");const f=await l.getDataset("receptive_fields");if(!f)throw new Error("No receptive_fields dataset found");return new ws(l,a,n,u,i,c,f)}get numUnits(){return z(this,mu)}get numTimepoints(){return z(this,hu)}get width(){return z(this,yu)}get height(){return z(this,gu)}get numChannels(){return z(this,vu)}get receptiveFieldsDataset(){return z(this,Su)}};Wi=new WeakMap,mu=new WeakMap,hu=new WeakMap,yu=new WeakMap,gu=new WeakMap,vu=new WeakMap,Su=new WeakMap;let Xs=ws;const Av=({width:t,height:l,client:e})=>m.jsx("div",{style:{position:"absolute",width:t,height:l,overflow:"auto",backgroundColor:"#fff"},children:m.jsxs("div",{style:{padding:20},children:[m.jsx("h2",{children:"Receptive Fields (Placeholder)"}),m.jsx("p",{children:"This is a placeholder view for receptive fields visualization. The actual implementation will be filled in by a colleague."}),m.jsxs("div",{style:{marginTop:20},children:[m.jsx("h3",{children:"Data dimensions:"}),m.jsxs("ul",{children:[m.jsxs("li",{children:[m.jsx("strong",{children:"Units:"})," ",e.numUnits]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Timepoints:"})," ",e.numTimepoints]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Spatial dimensions:"})," ",e.width," x"," ",e.height]}),m.jsxs("li",{children:[m.jsx("strong",{children:"Color channels:"})," ",e.numChannels]})]}),m.jsxs("p",{style:{marginTop:20,color:"#666"},children:["Total data shape: (",e.numUnits,", ",e.numTimepoints,","," ",e.width,", ",e.height,", ",e.numChannels,")"]})]})]})}),Mv=({zarrGroup:t,width:l,height:e})=>{const[a,n]=E.useState(null),[u,i]=E.useState(null);return E.useEffect(()=>{let c=!1;return(async()=>{try{const s=await Xs.create(t);if(c)return;n(s)}catch(s){if(c)return;console.error("Error loading receptive fields data:",s),i(s.message)}})(),()=>{c=!0}},[t]),u?m.jsxs("div",{style:{padding:20},children:[m.jsx("h3",{children:"Error loading receptive fields"}),m.jsx("p",{style:{color:"red"},children:u})]}):a?m.jsx(Av,{width:l,height:e,client:a}):m.jsx("div",{style:{padding:20},children:m.jsx("p",{children:"Loading receptive fields data..."})})},_v=({zarrGroup:t,width:l,height:e,onResize:a,onDataChange:n,contexts:u,component:i,renderFPView:c})=>{const[f,s]=E.useState(l),[g,v]=E.useState(e),[d,y]=E.useState(t);return E.useEffect(()=>{a((p,D)=>{s(p),v(D)}),n(p=>{y(p)})},[a,n]),m.jsx(i,{zarrGroup:d,width:f,height:g,contexts:u,renderFPView:c})},Xa=t=>l=>{const{container:e,zarrGroup:a,width:n,height:u,onResize:i,onDataChange:c,contexts:f,renderFPView:s}=l;Bg.createRoot(e).render(m.jsx(_v,{zarrGroup:a,width:n,height:u,onResize:i,onDataChange:c,contexts:f,component:t,renderFPView:s}))};(()=>{const t=window.figpack_p1.registerFPViewComponent;t({name:"realtime512b.MEAMovie",render:Xa(Kg)}),t({name:"realtime512b.MEASpikeFramesMovie",render:Xa(nv)}),t({name:"realtime512b.TemplatesView",render:Xa(pv)}),t({name:"realtime512b.MEAFiringRatesAndAmplitudes",render:Xa(rv)}),t({name:"realtime512b.ClusterSeparationView",render:Xa(Tv)}),t({name:"realtime512b.ReceptiveFieldsView",render:Xa(Mv)});const l=window.figpack_p1.registerFPExtension;l({name:"figpack-realtime512b"})})()})();
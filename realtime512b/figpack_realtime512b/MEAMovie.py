@@ -6,6 +6,7 @@ import numpy as np
 
 import figpack
 from .figpack_realtime512b_extension import figpack_realtime512b_extension
+from .data_stats import compute_int16_min_max_median
 
 
 class MEAMovie(figpack.ExtensionView):
@@ -92,7 +93,7 @@ class MEAMovie(figpack.ExtensionView):
             self.spike_channel_indices = None
             self.spike_frame_indices = None
 
-        self.raw_data = raw_data.astype(np.int16)
+        self.raw_data = np.asarray(raw_data, dtype=np.int16)
         self.electrode_coords = electrode_coords_array
         self.start_time_sec = start_time_sec
         self.sampling_frequency_hz = sampling_frequency_hz
@@ -100,9 +101,9 @@ class MEAMovie(figpack.ExtensionView):
         self.num_channels = num_channels
 
         # Calculate global min/max/median for normalization
-        self.data_min = float(np.min(self.raw_data))
-        self.data_max = float(np.max(self.raw_data))
-        self.data_median = float(np.median(self.raw_data))
+        self.data_min, self.data_max, self.data_median = compute_int16_min_max_median(
+            [self.raw_data]
+        )
 
     def write_to_zarr_group(self, group: figpack.Group) -> None:
         """
@@ -130,7 +131,17 @@ class MEAMovie(figpack.ExtensionView):
         num_timepoints_per_chunk = min(200, self.num_timepoints)
         chunks = (num_timepoints_per_chunk, self.num_channels)
 
-        group.create_dataset("raw_data", data=self.raw_data, chunks=chunks)
+        # Write in blocks of whole chunks so a memory-mapped recording is
+        # streamed through the page cache rather than read in all at once
+        block_size = num_timepoints_per_chunk * 50
+        group.create_dataset(
+            "raw_data", data=np.ascontiguousarray(self.raw_data[:block_size]), chunks=chunks
+        )
+        raw_data_dataset = group["raw_data"]
+        for start in range(block_size, self.num_timepoints, block_size):
+            raw_data_dataset.append(
+                np.ascontiguousarray(self.raw_data[start:start + block_size]), axis=0
+            )
 
         # Store spike data if provided
         if (
@@ -1,42 +1,48 @@
 """MEA Spike Frames Movie view for realtime512b."""
 
-from typing import Union
+from typing import Callable, Optional, Union
 
 import numpy as np
+from numcodecs import Blosc
 
 import figpack
 from .figpack_realtime512b_extension import figpack_realtime512b_extension
+from .data_stats import Int16Histogram
 
 
 class MEASpikeFramesMovie(figpack.ExtensionView):
     def __init__(
         self,
-        spike_frames_data: np.ndarray,
+        spike_frames_data: Optional[np.ndarray],
         electrode_coords: Union[np.ndarray, list[list[float]]],
         spike_times_sec: np.ndarray,
         spike_labels: np.ndarray,
         sampling_frequency_hz: float,
+        spike_frames_source: Optional[Callable[[int, int], np.ndarray]] = None,
     ):
         """
         Initialize an MEA Spike Frames Movie view
-        
+
         This view shows only frames that contain spikes, allowing users to step through
         detected spike events. Each frame is associated with a spike time and unit label.
 
         Args:
-            spike_frames_data: Spike frame data with shape (num_spikes, num_channels), dtype int16
+            spike_frames_data: Spike frame data with shape (num_spikes, num_channels), dtype int16.
+                Pass None when providing spike_frames_source instead.
             electrode_coords: Electrode coordinates with shape (num_channels, 2)
             spike_times_sec: Spike times in seconds with shape (num_spikes,), dtype float32
             spike_labels: Unit labels for each spike with shape (num_spikes,), dtype int32
             sampling_frequency_hz: Sampling frequency in Hz
+            spike_frames_source: Optional callable (start, stop) returning the spike frames
+                for spikes start..stop-1 with shape (stop - start, num_channels). When given,
+                frames are pulled one chunk at a time so the full array is never held in memory.
         """
         super().__init__(
             extension=figpack_realtime512b_extension, view_type="realtime512b.MEASpikeFramesMovie"
         )
 
-        # Validate inputs
-        if spike_frames_data.ndim != 2:
-            raise ValueError(f"spike_frames_data must be 2D array, got shape {spike_frames_data.shape}")
+        if (spike_frames_data is None) == (spike_frames_source is None):
+            raise ValueError("Exactly one of spike_frames_data and spike_frames_source must be provided")
 
         # Convert electrode_coords to numpy array if needed
         electrode_coords_array = np.array(electrode_coords, dtype=np.float32)
@@ -45,20 +51,31 @@ class MEASpikeFramesMovie(figpack.ExtensionView):
                 f"electrode_coords must have shape (num_channels, 2), got {electrode_coords_array.shape}"
             )
 
-        num_spikes, num_channels = spike_frames_data.shape
+        # Validate spike times and labels
+        spike_times_sec_array = np.asarray(spike_times_sec, dtype=np.float32)
+        spike_labels_array = np.asarray(spike_labels, dtype=np.int32)
+
+        if spike_times_sec_array.ndim != 1 or spike_labels_array.ndim != 1:
+            raise ValueError("Spike times and labels arrays must be 1-dimensional")
+
+        if spike_frames_data is not None:
+            # Validate inputs
+            if spike_frames_data.ndim != 2:
+                raise ValueError(f"spike_frames_data must be 2D array, got shape {spike_frames_data.shape}")
+
+            num_spikes, num_channels = spike_frames_data.shape
+            spike_frames_data = np.asarray(spike_frames_data, dtype=np.int16)
+            spike_frames_source = lambda start, stop: spike_frames_data[start:stop]
+        else:
+            num_spikes = len(spike_times_sec_array)
+            num_channels = electrode_coords_array.shape[0]
+
         if electrode_coords_array.shape[0] != num_channels:
             raise ValueError(
                 f"Number of electrode coordinates ({electrode_coords_array.shape[0]}) "
                 f"must match number of channels ({num_channels})"
             )
 
-        # Validate spike times and labels
-        spike_times_sec_array = np.array(spike_times_sec, dtype=np.float32)
-        spike_labels_array = np.array(spike_labels, dtype=np.int32)
-
-        if spike_times_sec_array.ndim != 1 or spike_labels_array.ndim != 1:
-            raise ValueError("Spike times and labels arrays must be 1-dimensional")
-
         if len(spike_times_sec_array) != num_spikes:
             raise ValueError(
                 f"spike_times_sec length ({len(spike_times_sec_array)}) "
@@ -71,7 +88,7 @@ class MEASpikeFramesMovie(figpack.ExtensionView):
                 f"must match number of spikes ({num_spikes})"
             )
 
-        self.spike_frames_data = spike_frames_data.astype(np.int16)
+        self.spike_frames_source = spike_frames_source
         self.electrode_coords = electrode_coords_array
         self.spike_times_sec = spike_times_sec_array
         self.spike_labels = spike_labels_array
@@ -79,10 +96,20 @@ class MEASpikeFramesMovie(figpack.ExtensionView):
         self.num_spikes = num_spikes
         self.num_channels = num_channels
 
-        # Calculate global min/max/median for normalization
-        self.data_min = float(np.min(self.spike_frames_data))
-        self.data_max = float(np.max(self.spike_frames_data))
-        self.data_median = float(np.median(self.spike_frames_data))
+        # Chunk by a reasonable number of spikes (100-200)
+        self.num_spikes_per_chunk = max(1, min(200, self.num_spikes))
+
+    def _iter_spike_frame_chunks(self):
+        """Yield int16 spike frame chunks of num_spikes_per_chunk spikes each"""
+        for start in range(0, self.num_spikes, self.num_spikes_per_chunk):
+            stop = min(start + self.num_spikes_per_chunk, self.num_spikes)
+            chunk = np.asarray(self.spike_frames_source(start, stop), dtype=np.int16)
+            if chunk.shape != (stop - start, self.num_channels):
+                raise ValueError(
+                    f"spike_frames_source returned shape {chunk.shape}, "
+                    f"expected {(stop - start, self.num_channels)}"
+                )
+            yield chunk
 
     def write_to_zarr_group(self, group: figpack.Group) -> None:
         """
@@ -97,30 +124,69 @@ class MEASpikeFramesMovie(figpack.ExtensionView):
         group.attrs["sampling_frequency_hz"] = self.sampling_frequency_hz
         group.attrs["num_spikes"] = self.num_spikes
         group.attrs["num_channels"] = self.num_channels
-        group.attrs["data_min"] = self.data_min
-        group.attrs["data_max"] = self.data_max
-        group.attrs["data_median"] = self.data_median
 
         # Store electrode coordinates
         group.create_dataset("electrode_coords", data=self.electrode_coords)
 
         # Store spike frames data with chunking optimized for sequential access
-        # Chunk by a reasonable number of spikes (100-200)
-        num_spikes_per_chunk = min(200, self.num_spikes)
-        chunks = (num_spikes_per_chunk, self.num_channels)
+        # Chunk by a reasonable number of spikes (100-200) and blocks of channels
+        chunks = (self.num_spikes_per_chunk, min(128, self.num_channels))
+
+        # Bitshuffle exploits the byte-level correlation of int16 samples
+        compressor = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
+
+        # Write one chunk of spikes at a time; appends stay aligned with the
+        # Zarr chunk boundaries so each chunk is encoded exactly once. The
+        # normalization statistics are collected from the same chunks, so
+        # each spike frame is gathered from the source only once
+        histogram = Int16Histogram()
+        spike_frames_dataset = None
+        for chunk in self._iter_spike_frame_chunks():
+            histogram.add(chunk)
+            if spike_frames_dataset is None:
+                group.create_dataset(
+                    "spike_frames_data",
+                    data=chunk,
+                    chunks=chunks,
+                    compressor=compressor,
+                )
+                spike_frames_dataset = group["spike_frames_data"]
+            else:
+                spike_frames_dataset.append(chunk, axis=0)
+        if spike_frames_dataset is None:
+            group.create_dataset(
+                "spike_frames_data",
+                data=np.zeros((0, self.num_channels), dtype=np.int16),
+                chunks=chunks,
+                compressor=compressor,
+            )
 
-        group.create_dataset("spike_frames_data", data=self.spike_frames_data, chunks=chunks)
+        # Global min/max/median for normalization
+        data_min, data_max, data_median = histogram.min_max_median()
+        group.attrs["data_min"] = data_min
+        group.attrs["data_max"] = data_max
+        group.attrs["data_median"] = data_median
 
         # Store spike times and labels with reasonable chunking
         spike_chunk_size = min(1000, max(1, self.num_spikes))
 
+        # Spike times are stored as deltas between consecutive sample indices;
+        # the small, repetitive gaps compress far better than float32 seconds
+        # and the frontend recovers exact sample indices with a cumulative sum
+        spike_samples = np.rint(
+            self.spike_times_sec.astype(np.float64) * self.sampling_frequency_hz
+        ).astype(np.int64)
+        spike_sample_deltas = np.diff(spike_samples, prepend=0).astype(np.int32)
+
         group.create_dataset(
-            "spike_times_sec",
-            data=self.spike_times_sec,
+            "spike_sample_deltas",
+            data=spike_sample_deltas,
             chunks=(spike_chunk_size,),
+            compressor=compressor,
         )
         group.create_dataset(
             "spike_labels",
             data=self.spike_labels,
             chunks=(spike_chunk_size,),
         )
+
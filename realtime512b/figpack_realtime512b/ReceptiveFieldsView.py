@@ -3,6 +3,7 @@
 from typing import Union
 
 import numpy as np
+from numcodecs import Blosc
 
 import figpack
 from .figpack_realtime512b_extension import figpack_realtime512b_extension
@@ -37,7 +38,7 @@ class ReceptiveFieldsView(figpack.ExtensionView):
         if num_channels != 3:
             raise ValueError(f"Expected 3 color channels, got {num_channels}")
         
-        self.receptive_fields = receptive_fields.astype(np.float32)
+        self.receptive_fields = np.asarray(receptive_fields, dtype=np.float32)
         self.num_units = num_units
         self.num_timepoints = num_timepoints
         self.width = width
@@ -61,7 +62,22 @@ class ReceptiveFieldsView(figpack.ExtensionView):
         group.attrs["num_channels"] = self.num_channels
         
         # Store receptive fields data with chunking optimized for unit-based access
-        # Chunk by one unit at a time, all timepoints, and reasonable spatial chunks
-        chunks = (1, self.num_timepoints, min(64, self.width), min(64, self.height), self.num_channels)
+        # Chunk by one unit at a time, a short run of timepoints, and reasonable
+        # spatial chunks, so scrubbing to one timepoint fetches a small chunk
+        chunks = (
+            1,
+            min(8, self.num_timepoints),
+            min(64, self.width),
+            min(64, self.height),
+            self.num_channels,
+        )
         
-        group.create_dataset("receptive_fields", data=self.receptive_fields, chunks=chunks)
+        # Byte shuffle groups the exponent bytes of the smooth float32 fields
+        compressor = Blosc(cname="zstd", clevel=3, shuffle=Blosc.SHUFFLE)
+
+        group.create_dataset(
+            "receptive_fields",
+            data=self.receptive_fields,
+            chunks=chunks,
+            compressor=compressor,
+        )
@@ -1,11 +1,18 @@
 """Figpack realtime512b extension views."""
 
-from .MEAMovie import MEAMovie
-from .MEAFiringRatesAndAmplitudes import MEAFiringRatesAndAmplitudes
-from .TemplatesView import TemplatesView
-from .ClusterSeparationView import ClusterSeparationView, ClusterSeparationViewItem
-from .MEASpikeFramesMovie import MEASpikeFramesMovie
-from .ReceptiveFieldsView import ReceptiveFieldsView
+import importlib
+
+# View classes are imported on first access (PEP 562) so importing this
+# package, or one of its submodules, does not load every view up front.
+_LAZY_IMPORTS = {
+    'MEAMovie': '.MEAMovie',
+    'MEAFiringRatesAndAmplitudes': '.MEAFiringRatesAndAmplitudes',
+    'TemplatesView': '.TemplatesView',
+    'ClusterSeparationView': '.ClusterSeparationView',
+    'ClusterSeparationViewItem': '.ClusterSeparationView',
+    'MEASpikeFramesMovie': '.MEASpikeFramesMovie',
+    'ReceptiveFieldsView': '.ReceptiveFieldsView',
+}
 
 __all__ = [
     'MEAMovie',
@@ -16,3 +23,19 @@ __all__ = [
     'MEASpikeFramesMovie',
     'ReceptiveFieldsView',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        # Importing a submodule binds it as a package attribute under its own
+        # name (e.g. ClusterSeparationView), so rebind every class it provides
+        for attr, module_name in _LAZY_IMPORTS.items():
+            if module_name == _LAZY_IMPORTS[name]:
+                globals()[attr] = getattr(module, attr)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -0,0 +1,69 @@
+"""Normalization statistics for int16 MEA data."""
+
+import numpy as np
+
+
+class Int16Histogram:
+    """
+    Histogram over the 65536 possible int16 values, filled one chunk at a time
+
+    Lets a single pass over the data that is also doing other work (such as
+    writing it out) collect the min, max and median on the way.
+    """
+
+    def __init__(self):
+        self.hist = np.zeros(65536, dtype=np.int64)
+
+    def add(self, chunk):
+        """
+        Add an int16 array of any shape to the histogram
+
+        Values are offset to non-negative bin indices in bounded pieces so the
+        int32 intermediate stays small regardless of the input size.
+        """
+        piece_size = 1 << 20
+        flat = chunk.ravel()
+        for i in range(0, flat.size, piece_size):
+            bins = np.add(flat[i:i + piece_size], 32768, dtype=np.int32)
+            self.hist += np.bincount(bins, minlength=65536)
+
+    def min_max_median(self):
+        """
+        Returns:
+            Tuple (data_min, data_max, data_median) as floats, all 0.0 if no data was added
+        """
+        hist = self.hist
+        size = int(hist.sum())
+        if size == 0:
+            return 0.0, 0.0, 0.0
+
+        nonzero_bins = np.flatnonzero(hist)
+        data_min = float(nonzero_bins[0] - 32768)
+        data_max = float(nonzero_bins[-1] - 32768)
+
+        # The value of rank r (0-based) sits in the first bin whose cumulative count exceeds r
+        cum = np.cumsum(hist)
+        lower = np.searchsorted(cum, (size - 1) // 2 + 1)
+        upper = np.searchsorted(cum, size // 2 + 1)
+        data_median = (float(lower) + float(upper)) / 2 - 32768
+
+        return data_min, data_max, data_median
+
+
+def compute_int16_min_max_median(chunks):
+    """
+    Compute min, max and median of int16 data in a single pass
+
+    Uses a histogram over the 65536 possible int16 values, which is linear
+    in the data size and avoids the partition done by np.median.
+
+    Args:
+        chunks: Iterable of int16 arrays of any shape
+
+    Returns:
+        Tuple (data_min, data_max, data_median) as floats
+    """
+    histogram = Int16Histogram()
+    for chunk in chunks:
+        histogram.add(chunk)
+    return histogram.min_max_median()
@@ -2,6 +2,12 @@
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 
 def compute_epoch_block_spike_sorting(
     segment_sortings,
@@ -49,29 +55,29 @@ def compute_epoch_block_spike_sorting(
     # Sort segments by segment number
     segment_sortings = sorted(segment_sortings, key=lambda x: x['segment_num'])
     
-    # Collect all spike data with offsets
-    all_spike_times = []
-    all_spike_labels = []
-    all_spike_amplitudes = []
+    # Preallocate combined spike data and copy each segment into its slice
+    total_num_spikes = sum(len(seg_data['spike_times']) for seg_data in segment_sortings)
+    spike_times = np.empty(total_num_spikes, dtype=np.float32)
+    spike_labels = np.empty(total_num_spikes, dtype=np.int32)
+    spike_amplitudes = np.empty(total_num_spikes, dtype=np.float32)
     
+    seg_bounds = []
+    offset = 0
     for seg_data in segment_sortings:
         segment_num = seg_data['segment_num']
         segment_offset_sec = (segment_num - 1) * segment_duration_sec
+        n = len(seg_data['spike_times'])
         
         # Add time offset to spike times
-        offset_spike_times = seg_data['spike_times'] + segment_offset_sec
-        
-        all_spike_times.append(offset_spike_times)
-        all_spike_labels.append(seg_data['spike_labels'])
-        all_spike_amplitudes.append(seg_data['spike_amplitudes'])
+        np.add(seg_data['spike_times'], segment_offset_sec, out=spike_times[offset:offset + n])
+        spike_labels[offset:offset + n] = seg_data['spike_labels']
+        spike_amplitudes[offset:offset + n] = seg_data['spike_amplitudes']
+        seg_bounds.append((offset, offset + n))
+        offset += n
     
-    # Concatenate all spike data
-    spike_times = np.concatenate(all_spike_times)
-    spike_labels = np.concatenate(all_spike_labels)
-    spike_amplitudes = np.concatenate(all_spike_amplitudes)
-    
-    # Get unique labels to determine number of units
-    unique_labels = np.unique(spike_labels)
+    # Get unique labels to determine number of units, along with each
+    # spike's unit row for the per-segment counts below
+    unique_labels, spike_unit_rows = np.unique(spike_labels, return_inverse=True)
     num_units = len(unique_labels)
     
     if num_units == 0:
@@ -82,36 +88,61 @@ def compute_epoch_block_spike_sorting(
             spike_amplitudes
         )
     
-    # Compute weighted mean templates for each unit
-    templates = np.zeros((num_units, num_channels), dtype=np.float32)
+    # Compute weighted mean templates for each unit, adding one segment at a
+    # time so memory stays at one (num_units, num_channels) accumulator
+    template_sums = np.zeros((num_units, num_channels), dtype=np.float64)
+    total_spike_counts = np.zeros(num_units, dtype=np.int64)
     
-    for i, label in enumerate(unique_labels):
-        # Collect templates and spike counts for this label from each segment
-        template_sum = np.zeros(num_channels, dtype=np.float32)
-        total_spike_count = 0
+    for seg_data, (seg_start, seg_stop) in zip(segment_sortings, seg_bounds):
+        seg_templates = np.asarray(seg_data['templates'], dtype=np.float32)
         
-        for seg_data in segment_sortings:
-            seg_spike_labels = seg_data['spike_labels']
-            seg_templates = seg_data['templates']
-            
-            # Count spikes with this label in this segment
-            spike_count = np.sum(seg_spike_labels == label)
-            
-            if spike_count > 0:
-                # Find which template index corresponds to this label in this segment
-                # The templates are ordered by sorted unique labels
-                seg_unique_labels = np.unique(seg_spike_labels)
-                if label in seg_unique_labels:
-                    label_idx = np.where(seg_unique_labels == label)[0][0]
-                    if label_idx < len(seg_templates):
-                        # Weight this segment's template by its spike count
-                        template_sum += seg_templates[label_idx] * spike_count
-                        total_spike_count += spike_count
+        # Count spikes per unit in this segment
+        seg_counts = np.bincount(spike_unit_rows[seg_start:seg_stop], minlength=num_units)
         
-        # Compute weighted mean
-        if total_spike_count > 0:
-            templates[i] = template_sum / total_spike_count
+        # The templates are ordered by sorted unique labels, so the k-th unit
+        # present in this segment corresponds to seg_templates[k]
+        present_rows = np.flatnonzero(seg_counts)[:len(seg_templates)]
+        present_counts = seg_counts[present_rows]
+        _add_segment_templates(template_sums, present_rows, seg_templates[:len(present_rows)], present_counts)
+        total_spike_counts[present_rows] += present_counts
+    
+    # Compute weighted mean
+    templates = np.zeros((num_units, num_channels), dtype=np.float32)
+    has_spikes = total_spike_counts > 0
+    templates[has_spikes] = template_sums[has_spikes] / total_spike_counts[has_spikes, None]
     
     print(f'Combined {len(spike_times)} spikes from {len(segment_sortings)} segments into {num_units} units')
     
     return templates, spike_times, spike_labels, spike_amplitudes
+
+
+def _add_segment_templates(template_sums, present_rows, seg_templates, present_counts):
+    """
+    Add one segment's templates, weighted by their spike counts, into template_sums.
+    
+    Parameters
+    ----------
+    template_sums : np.ndarray
+        Weighted template sums of shape (num_units, num_channels), updated in place
+    present_rows : np.ndarray
+        Distinct unit rows of template_sums that this segment's templates belong to
+    seg_templates : np.ndarray
+        Templates of shape (len(present_rows), num_channels)
+    present_counts : np.ndarray
+        Spike counts of shape (len(present_rows),)
+    """
+    if HAVE_NUMBA:
+        _add_segment_templates_numba(template_sums, present_rows, seg_templates, present_counts)
+    else:
+        template_sums[present_rows] += seg_templates * present_counts[:, None]
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _add_segment_templates_numba(template_sums, present_rows, seg_templates, present_counts):
+        num_channels = seg_templates.shape[1]
+        for k in prange(len(present_rows)):
+            u = present_rows[k]
+            count = present_counts[k]
+            for ch in range(num_channels):
+                template_sums[u, ch] += seg_templates[k, ch] * count
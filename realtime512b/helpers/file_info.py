@@ -1,8 +1,9 @@
 """Helper functions for creating and managing .info files."""
 
 import json
+import os
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 def create_info_file(filepath, elapsed_time_sec):
@@ -19,9 +20,15 @@ def create_info_file(filepath, elapsed_time_sec):
     info_path = filepath + ".info"
     
     info_data = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
         "elapsed_time_sec": elapsed_time_sec
     }
     
-    with open(info_path, 'w') as f:
-        json.dump(info_data, f, indent=2)
+    # Serialize first and write with a single unbuffered system call, which
+    # skips the buffered text layer that open() sets up for every file
+    content = json.dumps(info_data, separators=(',', ':')).encode('utf-8')
+    fd = os.open(info_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
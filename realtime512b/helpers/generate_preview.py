@@ -2,19 +2,36 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 import figpack.views as vv
 import figpack_spike_sorting.views as ssv
 
-from ..figpack_realtime512b.MEAMovie import MEAMovie
-from ..figpack_realtime512b.MEASpikeFramesMovie import MEASpikeFramesMovie
-from ..figpack_realtime512b.MEAFiringRatesAndAmplitudes import MEAFiringRatesAndAmplitudes
-from ..figpack_realtime512b.TemplatesView import TemplatesView
-from ..figpack_realtime512b.ClusterSeparationView import ClusterSeparationView, ClusterSeparationViewItem
-from ..figpack_realtime512b.ReceptiveFieldsView import ReceptiveFieldsView
+from ..figpack_realtime512b import (
+    MEAMovie,
+    MEASpikeFramesMovie,
+    MEAFiringRatesAndAmplitudes,
+    TemplatesView,
+    ClusterSeparationView,
+    ClusterSeparationViewItem,
+    ReceptiveFieldsView,
+)
 from .coarse_sorting import find_nearest_neighbors
+from .spike_times import spike_times_to_frames
+
+
+# The preview's cluster separation views project each pair of units only on
+# the channels where either template exceeds this fraction of its peak
+# amplitude; a spike's signal is local, so this is a small patch of the array
+CLUSTER_SEPARATION_CHANNEL_THRESHOLD = 0.15
 
 
 def generate_preview(
@@ -85,7 +102,7 @@ def generate_preview(
 
     # Movie preview for filtered data
     filt_movie = MEAMovie(
-        raw_data=np.fromfile(filt_path, dtype=np.int16).reshape(-1, n_channels),
+        raw_data=_memmap_int16(filt_path, n_channels),
         electrode_coords=electrode_coords,
         start_time_sec=0,
         sampling_frequency_hz=sampling_frequency
@@ -110,187 +127,43 @@ def generate_preview(
         )
     ]
 
+    # Memory-map the shifted data once; it is shared by the reference and
+    # spike sorting views, which only touch the rows at spike times
+    shifted_data = _memmap_int16(shift_path, n_channels) if os.path.exists(shift_path) else None
+
     # Add reference sorting views if this is the reference segment
     if reference_sorting_path is not None and os.path.exists(reference_sorting_path):
-        # Templates view
-        templates_path = os.path.join(reference_sorting_path, "templates.npy")
-        if os.path.exists(templates_path):
-            templates = np.load(templates_path)
-            templates_view = TemplatesView(
-                templates=templates,
-                electrode_coords=electrode_coords
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=templates_view,
-                label="Ref Templates"
-            ))
-        else:
-            templates_view = vv.Markdown(
-                content="Templates file not found."
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=templates_view,
-                label="Ref Templates"
-            ))
-        
-        # Autocorrelograms, Cluster Separation, and Spike Frames Movie
-        spike_times_path = os.path.join(reference_sorting_path, "spike_times.npy")
-        spike_labels_path = os.path.join(reference_sorting_path, "spike_labels.npy")
-        if os.path.exists(spike_times_path) and os.path.exists(spike_labels_path):
-            spike_times = np.load(spike_times_path)
-            spike_labels = np.load(spike_labels_path)
-            autocorrelograms_view = create_autocorrelograms_view(
-                spike_times=spike_times,
-                spike_labels=spike_labels
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=autocorrelograms_view,
-                label="Ref Autocorrelograms"
-            ))
-            
-            # Create cluster separation view and spike frames movie
-            if os.path.exists(templates_path) and os.path.exists(shift_path):
-                print('Creating cluster separation view...')
-                shifted_data = np.fromfile(shift_path, dtype=np.int16).reshape(-1, n_channels)
-                cluster_separation_view = create_cluster_separation_view(
-                    templates=templates,
-                    shifted_data=shifted_data,
-                    spike_times=spike_times,
-                    spike_labels=spike_labels,
-                    sampling_frequency=sampling_frequency,
-                    num_neighbors=10
-                )
-                tab_items.append(vv.TabLayoutItem(
-                    view=cluster_separation_view,
-                    label="Cluster Separation"
-                ))
-                
-                # Create spike frames movie
-                print('Creating spike frames movie...')
-                spike_frames_movie = create_spike_frames_movie(
-                    shifted_data=shifted_data,
-                    spike_times=spike_times,
-                    spike_labels=spike_labels,
-                    electrode_coords=electrode_coords,
-                    sampling_frequency=sampling_frequency
-                )
-                tab_items.append(vv.TabLayoutItem(
-                    view=spike_frames_movie,
-                    label="Spike Frames"
-                ))
-            else:
-                tab_items.append(vv.TabLayoutItem(
-                    view=vv.Markdown(content="Templates or shifted data not found."),
-                    label="Cluster Separation"
-                ))
-                tab_items.append(vv.TabLayoutItem(
-                    view=vv.Markdown(content="Shifted data not found."),
-                    label="Spike Frames"
-                ))
-        else:
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="Ref Autocorrelograms"
-            ))
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="Cluster Separation"
-            ))
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="Spike Frames"
-            ))
+        _append_sorting_tab_items(
+            tab_items,
+            sorting_path=reference_sorting_path,
+            labels={
+                'templates': "Ref Templates",
+                'autocorrelograms': "Ref Autocorrelograms",
+                'cluster_separation': "Cluster Separation (local channels)",
+                'spike_frames': "Spike Frames",
+            },
+            description="",
+            shifted_data=shifted_data,
+            electrode_coords=electrode_coords,
+            sampling_frequency=sampling_frequency
+        )
     
     # Add spike sorting views if this segment has spike sorting
     if spike_sorting_path is not None and os.path.exists(spike_sorting_path):
-        # Templates view
-        templates_path = os.path.join(spike_sorting_path, "templates.npy")
-        if os.path.exists(templates_path):
-            templates = np.load(templates_path)
-            templates_view = TemplatesView(
-                templates=templates,
-                electrode_coords=electrode_coords
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=templates_view,
-                label="SS Templates"
-            ))
-        else:
-            templates_view = vv.Markdown(
-                content="Templates file not found."
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=templates_view,
-                label="SS Templates"
-            ))
-        
-        # Autocorrelograms, Cluster Separation, and Spike Frames Movie
-        spike_times_path = os.path.join(spike_sorting_path, "spike_times.npy")
-        spike_labels_path = os.path.join(spike_sorting_path, "spike_labels.npy")
-        if os.path.exists(spike_times_path) and os.path.exists(spike_labels_path):
-            spike_times = np.load(spike_times_path)
-            spike_labels = np.load(spike_labels_path)
-            autocorrelograms_view = create_autocorrelograms_view(
-                spike_times=spike_times,
-                spike_labels=spike_labels
-            )
-            tab_items.append(vv.TabLayoutItem(
-                view=autocorrelograms_view,
-                label="SS Autocorrelograms"
-            ))
-            
-            # Create cluster separation view and spike frames movie
-            if os.path.exists(templates_path) and os.path.exists(shift_path):
-                print('Creating spike sorting cluster separation view...')
-                shifted_data = np.fromfile(shift_path, dtype=np.int16).reshape(-1, n_channels)
-                cluster_separation_view = create_cluster_separation_view(
-                    templates=templates,
-                    shifted_data=shifted_data,
-                    spike_times=spike_times,
-                    spike_labels=spike_labels,
-                    sampling_frequency=sampling_frequency,
-                    num_neighbors=10
-                )
-                tab_items.append(vv.TabLayoutItem(
-                    view=cluster_separation_view,
-                    label="SS Cluster Sep"
-                ))
-                
-                # Create spike frames movie
-                print('Creating spike sorting spike frames movie...')
-                spike_frames_movie = create_spike_frames_movie(
-                    shifted_data=shifted_data,
-                    spike_times=spike_times,
-                    spike_labels=spike_labels,
-                    electrode_coords=electrode_coords,
-                    sampling_frequency=sampling_frequency
-                )
-                tab_items.append(vv.TabLayoutItem(
-                    view=spike_frames_movie,
-                    label="SS Spike Frames"
-                ))
-            else:
-                tab_items.append(vv.TabLayoutItem(
-                    view=vv.Markdown(content="Templates or shifted data not found."),
-                    label="SS Cluster Sep"
-                ))
-                tab_items.append(vv.TabLayoutItem(
-                    view=vv.Markdown(content="Shifted data not found."),
-                    label="SS Spike Frames"
-                ))
-        else:
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="SS Autocorrelograms"
-            ))
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="SS Cluster Sep"
-            ))
-            tab_items.append(vv.TabLayoutItem(
-                view=vv.Markdown(content="Spike times or labels file not found."),
-                label="SS Spike Frames"
-            ))
+        _append_sorting_tab_items(
+            tab_items,
+            sorting_path=spike_sorting_path,
+            labels={
+                'templates': "SS Templates",
+                'autocorrelograms': "SS Autocorrelograms",
+                'cluster_separation': "SS Cluster Sep (local channels)",
+                'spike_frames': "SS Spike Frames",
+            },
+            description="spike sorting ",
+            shifted_data=shifted_data,
+            electrode_coords=electrode_coords,
+            sampling_frequency=sampling_frequency
+        )
 
     # Add movie and timeseries views at the end
     tab_items.extend([
@@ -315,6 +188,140 @@ def generate_preview(
     )
 
 
+def _append_sorting_tab_items(
+    tab_items: list,
+    *,
+    sorting_path: str,
+    labels: dict,
+    description: str,
+    shifted_data: np.ndarray | None,
+    electrode_coords: np.ndarray,
+    sampling_frequency: float
+):
+    """
+    Append templates, autocorrelograms, cluster separation and spike frames tabs for a sorting.
+    
+    Each sorting file is loaded once and shared by all views built from it.
+    
+    Parameters
+    ----------
+    tab_items : list
+        Tab layout items to append to
+    sorting_path : str
+        Path to the sorting directory
+    labels : dict
+        Tab labels keyed by 'templates', 'autocorrelograms',
+        'cluster_separation' and 'spike_frames'
+    description : str
+        Prefix for progress messages (e.g., 'spike sorting ')
+    shifted_data : np.ndarray | None
+        Shifted data array of shape (num_frames, num_channels), or None if not available
+    electrode_coords : np.ndarray
+        Electrode coordinates array of shape (n_channels, 2)
+    sampling_frequency : float
+        Sampling frequency in Hz
+    """
+    # List the sorting directory once rather than stat'ing each file
+    sorting_files = set(os.listdir(sorting_path))
+    
+    # Templates view
+    templates = None
+    if "templates.npy" in sorting_files:
+        templates = np.load(os.path.join(sorting_path, "templates.npy"), mmap_mode='r')
+        templates_view = TemplatesView(
+            templates=templates,
+            electrode_coords=electrode_coords
+        )
+    else:
+        templates_view = vv.Markdown(
+            content="Templates file not found."
+        )
+    tab_items.append(vv.TabLayoutItem(
+        view=templates_view,
+        label=labels['templates']
+    ))
+    
+    # Autocorrelograms, Cluster Separation, and Spike Frames Movie
+    if not ("spike_times.npy" in sorting_files and "spike_labels.npy" in sorting_files):
+        for key in ('autocorrelograms', 'cluster_separation', 'spike_frames'):
+            tab_items.append(vv.TabLayoutItem(
+                view=vv.Markdown(content="Spike times or labels file not found."),
+                label=labels[key]
+            ))
+        return
+    
+    spike_times = np.load(os.path.join(sorting_path, "spike_times.npy"), mmap_mode='r')
+    spike_labels = np.load(os.path.join(sorting_path, "spike_labels.npy"), mmap_mode='r')
+    
+    # Sort spikes by label once; every per-unit view slices this grouping
+    num_units = max(
+        int(np.max(spike_labels)) if len(spike_labels) > 0 else 0,
+        templates.shape[0] if templates is not None else 0
+    )
+    spike_groups = _group_spikes_by_label(spike_labels, num_units)
+    
+    autocorrelograms_view = create_autocorrelograms_view(
+        spike_times=spike_times,
+        spike_labels=spike_labels,
+        spike_groups=spike_groups
+    )
+    tab_items.append(vv.TabLayoutItem(
+        view=autocorrelograms_view,
+        label=labels['autocorrelograms']
+    ))
+    
+    # Create cluster separation view and spike frames movie
+    if templates is None or shifted_data is None:
+        tab_items.append(vv.TabLayoutItem(
+            view=vv.Markdown(content="Templates or shifted data not found."),
+            label=labels['cluster_separation']
+        ))
+        tab_items.append(vv.TabLayoutItem(
+            view=vv.Markdown(content="Shifted data not found."),
+            label=labels['spike_frames']
+        ))
+        return
+    
+    # Frame indices are shared by the cluster separation view and spike frames movie
+    spike_frames, valid_mask = _compute_spike_frames(
+        spike_times, sampling_frequency, shifted_data.shape[0]
+    )
+    
+    print(f'Creating {description}cluster separation view...')
+    cluster_separation_view = create_cluster_separation_view(
+        templates=templates,
+        shifted_data=shifted_data,
+        spike_times=spike_times,
+        spike_labels=spike_labels,
+        sampling_frequency=sampling_frequency,
+        num_neighbors=10,
+        spike_frames=spike_frames,
+        valid_mask=valid_mask,
+        channel_threshold=CLUSTER_SEPARATION_CHANNEL_THRESHOLD,
+        spike_groups=spike_groups
+    )
+    tab_items.append(vv.TabLayoutItem(
+        view=cluster_separation_view,
+        label=labels['cluster_separation']
+    ))
+    
+    # Create spike frames movie
+    print(f'Creating {description}spike frames movie...')
+    spike_frames_movie = create_spike_frames_movie(
+        shifted_data=shifted_data,
+        spike_times=spike_times,
+        spike_labels=spike_labels,
+        electrode_coords=electrode_coords,
+        sampling_frequency=sampling_frequency,
+        spike_frames=spike_frames,
+        valid_mask=valid_mask
+    )
+    tab_items.append(vv.TabLayoutItem(
+        view=spike_frames_movie,
+        label=labels['spike_frames']
+    ))
+
+
 def create_cluster_separation_view(
     *,
     templates: np.ndarray,
@@ -322,7 +329,11 @@ def create_cluster_separation_view(
     spike_times: np.ndarray,
     spike_labels: np.ndarray,
     sampling_frequency: float,
-    num_neighbors: int = 5
+    num_neighbors: int = 5,
+    spike_frames: np.ndarray | None = None,
+    valid_mask: np.ndarray | None = None,
+    channel_threshold: float = 0.0,
+    spike_groups: tuple | None = None
 ):
     """
     Create a cluster separation view showing discriminant projections.
@@ -341,105 +352,232 @@ def create_cluster_separation_view(
         Sampling frequency in Hz
     num_neighbors : int
         Number of nearest neighbors to compute for each unit
+    spike_frames : np.ndarray | None
+        Precomputed frame index of each spike (see _compute_spike_frames)
+    valid_mask : np.ndarray | None
+        Precomputed mask of spikes whose frame lies inside shifted_data
+    channel_threshold : float
+        Each pair is projected only on the channels where either template's
+        amplitude exceeds this fraction of that template's peak amplitude.
+        The default of 0 keeps every channel where either template is nonzero,
+        which gives the same projections as using all channels.
+    spike_groups : tuple | None
+        Precomputed (spike_order, unit_offsets) from _group_spikes_by_label
+        covering at least num_units units
     
     Returns
     -------
     ClusterSeparationView
     """
     num_units = templates.shape[0]
+    if spike_frames is None or valid_mask is None:
+        spike_frames, valid_mask = _compute_spike_frames(
+            spike_times, sampling_frequency, shifted_data.shape[0]
+        )
     
     # Find nearest neighbors in template space
     print(f'Finding {num_neighbors} nearest neighbors for each unit in template space...')
     neighbor_indices = find_nearest_neighbors(templates, num_neighbors=num_neighbors + 1)
     
-    # Build separation items for each unit and its neighbors
-    # Track processed pairs to avoid redundancy
-    processed_pairs = set()
-    separation_items = []
-    
+    # Group spike indices by unit once instead of scanning labels per pair
+    if spike_groups is None:
+        spike_groups = _group_spikes_by_label(spike_labels, num_units)
+    spike_order, unit_offsets = spike_groups
+    unit_offsets = unit_offsets[:num_units + 1]
+    unit_spike_counts = np.diff(unit_offsets)
+
+    # Valid spike frame indices for each unit; units with fewer than two
+    # spikes never form a pair, so skip them up front
+    empty_frames = np.zeros(0, dtype=spike_frames.dtype)
+    unit_spike_frames = []
     for unit_idx in range(num_units):
-        unit_id = unit_idx + 1  # 1-based
+        if unit_spike_counts[unit_idx] < 2:
+            unit_spike_frames.append(empty_frames)
+            continue
+        spike_inds = spike_order[unit_offsets[unit_idx]:unit_offsets[unit_idx + 1]]
+        unit_spike_frames.append(spike_frames[spike_inds[valid_mask[spike_inds]]])
+
+    # Significant channels of each template; a spike's signal is local, so
+    # the discriminant of two units lives on a small patch of the array
+    abs_templates = np.abs(templates)
+    template_channel_masks = abs_templates > channel_threshold * np.max(abs_templates, axis=1, keepdims=True)
+
+    # Enumerate each unordered (unit, neighbor) pair once, keeping the
+    # orientation and order in which it is first seen (neighbor lists
+    # exclude self at index 0)
+    neighbor_unit_indices = neighbor_indices[:, 1:]
+    candidate_pairs = np.stack([
+        np.repeat(np.arange(num_units), neighbor_unit_indices.shape[1]),
+        neighbor_unit_indices.ravel()
+    ], axis=1)
+    _, first_seen = np.unique(np.sort(candidate_pairs, axis=1), axis=0, return_index=True)
+    candidate_pairs = candidate_pairs[np.sort(first_seen)]
+    
+    # Select the unit pairs to compare and their discriminant directions
+    pair_units = []
+    pair_directions = []
+    pair_channel_masks = []
+    
+    for unit_idx, neighbor_idx in candidate_pairs:
+        if unit_spike_counts[unit_idx] < 2 or unit_spike_counts[neighbor_idx] < 2:
+            continue
         
-        # Get neighbor indices (excluding self at index 0)
-        neighbor_unit_indices = neighbor_indices[unit_idx, 1:]
+        # Compute discriminant direction (difference of template means),
+        # restricted to the significant channels of either template
+        template_1 = templates[unit_idx, :]
+        template_2 = templates[neighbor_idx, :]
+        channel_mask = template_channel_masks[unit_idx] | template_channel_masks[neighbor_idx]
+        discriminant_direction = np.where(channel_mask, template_2 - template_1, 0)
+        norm = np.linalg.norm(discriminant_direction)
+        if norm > 0:
+            discriminant_direction = discriminant_direction / norm
+        else:
+            continue
         
-        for neighbor_idx in neighbor_unit_indices:
-            neighbor_id = neighbor_idx + 1  # 1-based
-            
-            # Skip if we've already processed this pair (in either order)
-            pair_key = tuple(sorted([unit_id, neighbor_id]))
-            if pair_key in processed_pairs:
-                continue
-            processed_pairs.add(pair_key)
-            
-            # Get spike indices for both units
-            spike_inds_1 = np.where(spike_labels == unit_id)[0]
-            spike_inds_2 = np.where(spike_labels == neighbor_id)[0]
-            
-            if len(spike_inds_1) < 2 or len(spike_inds_2) < 2:
-                continue
-            
-            # Compute discriminant direction (difference of template means)
-            template_1 = templates[unit_idx, :]
-            template_2 = templates[neighbor_idx, :]
-            discriminant_direction = template_2 - template_1
-            norm = np.linalg.norm(discriminant_direction)
-            if norm > 0:
-                discriminant_direction = discriminant_direction / norm
-            else:
-                continue
-            
-            # Get spike frame indices
-            spike_frames_1 = (spike_times[spike_inds_1] * sampling_frequency).astype(int)
-            spike_frames_2 = (spike_times[spike_inds_2] * sampling_frequency).astype(int)
-            
-            # Filter out invalid frame indices
-            valid_frames_1 = (spike_frames_1 >= 0) & (spike_frames_1 < shifted_data.shape[0])
-            valid_frames_2 = (spike_frames_2 >= 0) & (spike_frames_2 < shifted_data.shape[0])
-            spike_frames_1 = spike_frames_1[valid_frames_1]
-            spike_frames_2 = spike_frames_2[valid_frames_2]
-            
-            if len(spike_frames_1) == 0 or len(spike_frames_2) == 0:
-                continue
-            
-            # Extract spike waveforms and project onto discriminant direction
-            spike_waveforms_1 = shifted_data[spike_frames_1, :]
-            spike_waveforms_2 = shifted_data[spike_frames_2, :]
-            
-            projections_1 = np.dot(spike_waveforms_1, discriminant_direction)
-            projections_2 = np.dot(spike_waveforms_2, discriminant_direction)
-            
-            # Create separation item
-            item = ClusterSeparationViewItem(
-                unit_id_1=unit_id,
-                unit_id_2=neighbor_id,
-                projections_1=projections_1,
-                projections_2=projections_2
-            )
-            separation_items.append(item)
+        if len(unit_spike_frames[unit_idx]) == 0 or len(unit_spike_frames[neighbor_idx]) == 0:
+            continue
+        
+        pair_units.append((unit_idx, neighbor_idx))
+        pair_directions.append(discriminant_direction)
+        pair_channel_masks.append(channel_mask)
+
+    # Project each unit's spike waveforms onto all of its pair directions with
+    # one matrix product, so every unit's rows are gathered from shifted_data
+    # only once rather than once per pair, and only on the channels its
+    # pairs use
+    pair_projections = [[None, None] for _ in pair_units]
+    if len(pair_units) > 0:
+        pair_units_array = np.array(pair_units)
+        pair_directions = np.stack(pair_directions, axis=1)  # (num_channels, num_pairs)
+        pair_channel_masks = np.stack(pair_channel_masks, axis=1)  # (num_channels, num_pairs)
+        projection_dtype = np.result_type(shifted_data.dtype, pair_directions.dtype)
+
+        def project_unit(unit_idx):
+            pairs_as_1 = np.flatnonzero(pair_units_array[:, 0] == unit_idx)
+            pairs_as_2 = np.flatnonzero(pair_units_array[:, 1] == unit_idx)
+            unit_pairs = np.concatenate([pairs_as_1, pairs_as_2])
+            unit_channels = np.flatnonzero(pair_channel_masks[:, unit_pairs].any(axis=1))
+            spike_waveforms = shifted_data[np.ix_(unit_spike_frames[unit_idx], unit_channels)].astype(projection_dtype)
+            unit_directions = pair_directions[np.ix_(unit_channels, unit_pairs)]
+            return pairs_as_1, unit_pairs, spike_waveforms @ unit_directions
+
+        # Units are independent; the gathers and matrix products release the
+        # GIL, so threads overlap page-ins from the memmap with BLAS work
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            for pairs_as_1, unit_pairs, unit_projections in executor.map(
+                project_unit, np.unique(pair_units_array)
+            ):
+                for k, pair_idx in enumerate(unit_pairs):
+                    side = 0 if k < len(pairs_as_1) else 1
+                    pair_projections[pair_idx][side] = unit_projections[:, k]
+
+    # Create separation items
+    separation_items = []
+    for (unit_idx, neighbor_idx), (projections_1, projections_2) in zip(pair_units, pair_projections):
+        item = ClusterSeparationViewItem(
+            unit_id_1=unit_idx + 1,
+            unit_id_2=neighbor_idx + 1,
+            projections_1=projections_1,
+            projections_2=projections_2
+        )
+        separation_items.append(item)
     
     print(f'Created {len(separation_items)} separation items')
     
     return ClusterSeparationView(separation_items=separation_items)
 
 
+def _compute_spike_frames(spike_times, sampling_frequency, num_frames):
+    """
+    Convert spike times to frame indices and flag the ones inside the data.
+
+    Parameters
+    ----------
+    spike_times : np.ndarray
+        Spike times in seconds
+    sampling_frequency : float
+        Sampling frequency in Hz
+    num_frames : int
+        Number of frames in the data
+
+    Returns
+    -------
+    spike_frames : np.ndarray
+        Frame index of each spike (int32), rounded to the nearest sample
+    valid_mask : np.ndarray
+        Boolean mask of spikes with 0 <= frame < num_frames
+    """
+    spike_frames = spike_times_to_frames(spike_times, sampling_frequency)
+    valid_mask = (spike_frames >= 0) & (spike_frames < num_frames)
+    # Only in-range frames are used, so clamp the rest before narrowing to int32
+    spike_frames = np.clip(spike_frames, -1, num_frames).astype(np.int32)
+    return spike_frames, valid_mask
+
+
+def _group_spikes_by_label(spike_labels, num_units):
+    """
+    Group spike indices by unit label with a single stable sort.
+
+    Parameters
+    ----------
+    spike_labels : np.ndarray
+        Spike labels (1-based)
+    num_units : int
+        Number of units
+
+    Returns
+    -------
+    spike_order : np.ndarray
+        Spike indices sorted by label, in increasing order within each unit
+    unit_offsets : np.ndarray
+        Array of length num_units + 1; the spikes of unit u are
+        spike_order[unit_offsets[u - 1]:unit_offsets[u]]
+    """
+    spike_order = np.argsort(spike_labels, kind='stable')
+    unit_offsets = np.searchsorted(spike_labels[spike_order], np.arange(num_units + 1), side='right')
+    return spike_order, unit_offsets
+
+
 def create_autocorrelograms_view(
     *,
     spike_times: np.ndarray,
-    spike_labels: np.ndarray
+    spike_labels: np.ndarray,
+    spike_groups: tuple | None = None
 ):
-    """Create a view with autocorrelograms for each unit."""
+    """
+    Create a view with autocorrelograms for each unit.
+    
+    spike_groups optionally passes a (spike_order, unit_offsets) grouping from
+    _group_spikes_by_label covering at least max(spike_labels) units.
+    """
     num_units = np.max(spike_labels)
+    if spike_groups is None:
+        spike_groups = _group_spikes_by_label(spike_labels, num_units)
+    spike_order, unit_offsets = spike_groups
+    unit_spike_counts = np.diff(unit_offsets[:num_units + 1])
+    if HAVE_NUMBA:
+        # One parallel pass computes the autocorrelograms of all units
+        bin_edges_sec, all_bin_counts = compute_all_unit_autocorrelograms(
+            spike_times,
+            spike_labels,
+            num_units,
+            bin_size_ms=1,
+            window_ms=100,
+            spike_groups=spike_groups
+        )
     autocorrelograms = []
     for unit_id in range(1, num_units + 1):
-        spike_train_sec = spike_times[spike_labels == unit_id]
-        if len(spike_train_sec) < 2:
+        if unit_spike_counts[unit_id - 1] < 2:
             continue
-        bin_edges_sec, bin_counts = compute_unit_autocorrelogram(
-            spike_train_sec,
-            bin_size_ms=1,
-            window_ms=100
-        )
+        if HAVE_NUMBA:
+            bin_counts = all_bin_counts[unit_id - 1]
+        else:
+            spike_train_sec = spike_times[spike_order[unit_offsets[unit_id - 1]:unit_offsets[unit_id]]]
+            bin_edges_sec, bin_counts = compute_unit_autocorrelogram(
+                spike_train_sec,
+                bin_size_ms=1,
+                window_ms=100
+            )
         autocorrelogram = ssv.AutocorrelogramItem(
             unit_id=str(unit_id),
             bin_edges_sec=bin_edges_sec,
@@ -465,6 +603,97 @@ def compute_unit_autocorrelogram(spike_train, bin_size_ms=1.0, window_ms=100.0):
         bin_edges_sec: 1D numpy array of bin edges in seconds
         bin_counts: 1D numpy array of spike counts per bin
     """
+    num_bins, num_bins_half, bin_edges_msec = _autocorrelogram_bin_edges_msec(
+        bin_size_ms, window_ms
+    )
+    bin_counts = np.zeros((num_bins,), dtype=np.int32)
+    times1 = np.sort(spike_train)
+
+    # For each spike, find the later spikes that may fall inside the window,
+    # then enumerate all of those (earlier, later) pairs at once. The window
+    # is padded by a bin so the exact cut below matches the per-lag filter.
+    max_lag_sec = (float(bin_edges_msec[-1]) + bin_size_ms) / 1000.0
+    ends = np.searchsorted(times1, times1 + max_lag_sec, side='right')
+    num_later = ends - np.arange(len(times1)) - 1
+    total_pairs = int(np.sum(num_later))
+    if total_pairs == 0:
+        return (bin_edges_msec / 1000).astype(np.float32), bin_counts
+    first_inds = np.repeat(np.arange(len(times1)), num_later)
+    pair_starts = np.cumsum(num_later) - num_later
+    second_inds = first_inds + 1 + (np.arange(total_pairs) - np.repeat(pair_starts, num_later))
+    deltas_msec = (times1[second_inds] - times1[first_inds]) * 1000.0
+    deltas_msec = deltas_msec[deltas_msec <= bin_edges_msec[-1]]
+
+    # Bin the non-negative lags and mirror them onto the negative side
+    positive_edges_msec = bin_edges_msec[num_bins_half - 1:]
+    bin_inds = np.searchsorted(positive_edges_msec, deltas_msec, side='right') - 1
+    bin_inds = bin_inds[(bin_inds >= 0) & (bin_inds < num_bins_half)]
+    counts = np.bincount(bin_inds, minlength=num_bins_half).astype(np.int32)
+    bin_counts[num_bins_half - 1:] += counts
+    bin_counts[num_bins_half - 1::-1] += counts
+    return (bin_edges_msec / 1000).astype(np.float32), bin_counts
+
+
+def compute_all_unit_autocorrelograms(
+    spike_times, spike_labels, num_units, bin_size_ms=1.0, window_ms=100.0, spike_groups=None
+):
+    """
+    Compute the autocorrelograms of all units at once with a parallel Numba kernel.
+
+    Gives the same bins and counts as calling compute_unit_autocorrelogram on
+    each unit's spike train. Requires numba.
+
+    Args:
+        spike_times: 1D numpy array of spike times in seconds
+        spike_labels: 1D numpy array of 1-based unit labels
+        num_units: Number of units; labels outside 1..num_units are ignored
+        bin_size_ms: Size of each bin in milliseconds
+        window_ms: Total window size in milliseconds (centered around zero)
+        spike_groups: Optional (spike_order, unit_offsets) from _group_spikes_by_label
+            covering at least num_units units
+
+    Returns:
+        bin_edges_sec: 1D numpy array of bin edges in seconds
+        bin_counts: 2D numpy array of shape (num_units, num_bins); row u
+            holds the counts for unit u + 1
+    """
+    num_bins, num_bins_half, bin_edges_msec = _autocorrelogram_bin_edges_msec(
+        bin_size_ms, window_ms
+    )
+
+    # Group spike times by unit, sorted in time within each unit
+    spike_times = np.asarray(spike_times)
+    if spike_times.dtype != np.float32:
+        spike_times = spike_times.astype(np.float64)
+    if spike_groups is None:
+        spike_groups = _group_spikes_by_label(spike_labels, num_units)
+    spike_order, unit_offsets = spike_groups
+    unit_offsets = np.asarray(unit_offsets[:num_units + 1], dtype=np.int64)
+    unit_times = spike_times[spike_order[unit_offsets[0]:unit_offsets[-1]]]
+    unit_offsets = unit_offsets - unit_offsets[0]
+    unit_counts = np.diff(unit_offsets)
+    # The grouping keeps spikes in index order within a unit, which is time
+    # order whenever the spike times are sorted; otherwise sort within units
+    within_unit = np.ones(len(unit_times), dtype=bool)
+    within_unit[unit_offsets[:-1][unit_counts > 0]] = False
+    if np.any(np.diff(unit_times, prepend=unit_times[:1])[within_unit] < 0):
+        unit_ids = np.repeat(np.arange(num_units), unit_counts)
+        unit_times = unit_times[np.lexsort((unit_times, unit_ids))]
+
+    # Lags are computed and compared in the dtype of the spike times, as in
+    # compute_unit_autocorrelogram, so both paths bin identically
+    bin_counts = _autocorrelograms_numba(
+        unit_times,
+        unit_offsets,
+        bin_edges_msec[num_bins_half - 1:].astype(unit_times.dtype),
+        unit_times.dtype.type(1000.0),
+        num_bins,
+    )
+    return (bin_edges_msec / 1000).astype(np.float32), bin_counts
+
+
+def _autocorrelogram_bin_edges_msec(bin_size_ms, window_ms):
+    """Return (num_bins, num_bins_half, bin_edges_msec) for an autocorrelogram."""
     # based off of compute_correlogram_data below
     num_bins = int(window_ms / bin_size_ms)
     if num_bins % 2 == 0:
@@ -473,29 +702,29 @@ def compute_unit_autocorrelogram(spike_train, bin_size_ms=1.0, window_ms=100.0):
     bin_edges_msec = np.array(
         (np.arange(num_bins + 1) - num_bins / 2) * bin_size_ms, dtype=np.float32
     )
-    bin_counts = np.zeros((num_bins,), dtype=np.int32)
-    times1 = spike_train
-    offset = 1
-    while True:
-        if offset >= len(times1):
-            break
-        deltas_msec = (
-            (times1[offset:] - times1[:-offset])
-            * 1000.0
-        )
-        deltas_msec = deltas_msec[deltas_msec <= bin_edges_msec[-1]]
-        if len(deltas_msec) == 0:
-            break
-        for i in range(num_bins_half):
-            start_msec = bin_edges_msec[num_bins_half - 1 + i]
-            end_msec = bin_edges_msec[num_bins_half + i]
-            ct = len(
-                deltas_msec[(start_msec <= deltas_msec) & (deltas_msec < end_msec)]
-            )
-            bin_counts[num_bins_half - 1 + i] += ct
-            bin_counts[num_bins_half - 1 - i] += ct
-        offset = offset + 1
-    return (bin_edges_msec / 1000).astype(np.float32), bin_counts
+    return num_bins, num_bins_half, bin_edges_msec
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _autocorrelograms_numba(unit_times, unit_offsets, positive_edges_msec, msec_per_sec, num_bins):
+        num_units = unit_offsets.shape[0] - 1
+        num_bins_half = positive_edges_msec.shape[0] - 1
+        max_lag_msec = positive_edges_msec[-1]
+        bin_counts = np.zeros((num_units, num_bins), dtype=np.int32)
+        for u in prange(num_units):
+            start = unit_offsets[u]
+            stop = unit_offsets[u + 1]
+            for i in range(start, stop):
+                for j in range(i + 1, stop):
+                    delta_msec = (unit_times[j] - unit_times[i]) * msec_per_sec
+                    if delta_msec > max_lag_msec:
+                        break
+                    b = np.searchsorted(positive_edges_msec, delta_msec, side='right') - 1
+                    if b >= 0 and b < num_bins_half:
+                        bin_counts[u, num_bins_half - 1 + b] += 1
+                        bin_counts[u, num_bins_half - 1 - b] += 1
+        return bin_counts
 
 
 def create_spike_frames_movie(
@@ -504,7 +733,9 @@ def create_spike_frames_movie(
     spike_times: np.ndarray,
     spike_labels: np.ndarray,
     electrode_coords: np.ndarray,
-    sampling_frequency: float
+    sampling_frequency: float,
+    spike_frames: np.ndarray | None = None,
+    valid_mask: np.ndarray | None = None
 ):
     """
     Create a spike frames movie view showing only frames that contain spikes.
@@ -521,19 +752,31 @@ def create_spike_frames_movie(
         Electrode coordinates array of shape (num_channels, 2)
     sampling_frequency : float
         Sampling frequency in Hz
+    spike_frames : np.ndarray | None
+        Precomputed frame index of each spike (see _compute_spike_frames)
+    valid_mask : np.ndarray | None
+        Precomputed mask of spikes whose frame lies inside shifted_data
     
     Returns
     -------
     MEASpikeFramesMovie
     """
-    # Convert spike times to frame indices
-    spike_frame_indices = (spike_times * sampling_frequency).astype(int)
+    if spike_frames is None or valid_mask is None:
+        spike_frames, valid_mask = _compute_spike_frames(
+            spike_times, sampling_frequency, shifted_data.shape[0]
+        )
     
-    # Filter out invalid frame indices
-    valid_mask = (spike_frame_indices >= 0) & (spike_frame_indices < shifted_data.shape[0])
-    spike_frame_indices = spike_frame_indices[valid_mask]
-    spike_times_valid = spike_times[valid_mask]
-    spike_labels_valid = spike_labels[valid_mask]
+    # Filter out invalid frame indices with one integer index shared by the
+    # frames, times and labels; nothing is copied when every spike is valid
+    if valid_mask.all():
+        spike_frame_indices = spike_frames
+        spike_times_valid = spike_times
+        spike_labels_valid = spike_labels
+    else:
+        keep = np.flatnonzero(valid_mask)
+        spike_frame_indices = spike_frames[keep]
+        spike_times_valid = spike_times[keep]
+        spike_labels_valid = spike_labels[keep]
     
     if len(spike_frame_indices) == 0:
         # Return empty view
@@ -545,13 +788,12 @@ def create_spike_frames_movie(
             sampling_frequency_hz=sampling_frequency
         )
     
-    # Extract spike frames
-    spike_frames_data = shifted_data[spike_frame_indices, :]
-    
     print(f'Created spike frames movie with {len(spike_frame_indices)} frames')
     
+    # Extract spike frames lazily, one chunk at a time, as the view consumes them
     return MEASpikeFramesMovie(
-        spike_frames_data=spike_frames_data,
+        spike_frames_data=None,
+        spike_frames_source=lambda start, stop: shifted_data[spike_frame_indices[start:stop], :],
         electrode_coords=electrode_coords,
         spike_times_sec=spike_times_valid,
         spike_labels=spike_labels_valid,
@@ -574,7 +816,7 @@ def generate_time_series_preview(
         name=name,
         start_time_sec=0,
         sampling_frequency_hz=sampling_frequency,
-        data=np.fromfile(data_path, dtype=np.int16).reshape(-1, num_channels)[:, channel_indices],
+        data=_memmap_int16(data_path, num_channels)[:, channel_indices],
         auto_channel_spacing=50
     )
     t_start = np.array([i[0] for i in high_activity_intervals], dtype=np.float32)
@@ -633,11 +875,11 @@ def generate_epoch_block_preview(
     preview_path : str
         Output path for the preview figpack
     """
-    # Load epoch block spike sorting data
-    templates = np.load(os.path.join(epoch_block_sorting_path, "templates.npy"))
-    spike_times = np.load(os.path.join(epoch_block_sorting_path, "spike_times.npy"))
-    spike_labels = np.load(os.path.join(epoch_block_sorting_path, "spike_labels.npy"))
-    spike_amplitudes = np.load(os.path.join(epoch_block_sorting_path, "spike_amplitudes.npy"))
+    # Load epoch block spike sorting data (memory-mapped; pages are read on use)
+    templates = np.load(os.path.join(epoch_block_sorting_path, "templates.npy"), mmap_mode='r')
+    spike_times = np.load(os.path.join(epoch_block_sorting_path, "spike_times.npy"), mmap_mode='r')
+    spike_labels = np.load(os.path.join(epoch_block_sorting_path, "spike_labels.npy"), mmap_mode='r')
+    spike_amplitudes = np.load(os.path.join(epoch_block_sorting_path, "spike_amplitudes.npy"), mmap_mode='r')
     
     print(f"Generating epoch block preview for {epoch_block_name}...")
     print(f"  {len(templates)} units, {len(spike_times)} spikes")
@@ -680,7 +922,7 @@ def generate_epoch_block_preview(
     # Receptive Fields
     receptive_fields_path = os.path.join(computed_dir, 'receptive_fields', epoch_block_name, 'receptive_fields.npy')
     if os.path.exists(receptive_fields_path):
-        receptive_fields = np.load(receptive_fields_path)
+        receptive_fields = np.load(receptive_fields_path, mmap_mode='r')
         receptive_fields_view = ReceptiveFieldsView(
             receptive_fields=receptive_fields
         )
@@ -725,7 +967,9 @@ def load_spike_waveforms_and_project(
     projections : np.ndarray
         Projected values
     """
-    projections_list = []
+    # First pass: map each segment's shifted data and find its valid spike
+    # frames, so the output can be allocated once at its final size
+    segment_frames = []
     
     # Group spikes by segment
     unique_segments = np.unique(spike_segment_indices)
@@ -738,7 +982,6 @@ def load_spike_waveforms_and_project(
         # Compute frame indices within this segment
         segment_start_time = seg_idx * segment_duration_sec
         relative_times = segment_spike_times - segment_start_time
-        spike_frames = (relative_times * sampling_frequency).astype(int)
         
         # Load shifted data for this segment
         segment_name = f"segment_{seg_idx + 1:03d}.bin"
@@ -747,23 +990,55 @@ def load_spike_waveforms_and_project(
         if not os.path.exists(shifted_path):
             continue
         
-        # Load shifted data
-        shifted_data = np.fromfile(shifted_path, dtype=np.int16).reshape(-1, n_channels)
+        # Memory-map shifted data; only the rows at spike times are read
+        shifted_data = _memmap_int16(shifted_path, n_channels)
         
         # Filter out invalid frame indices
-        valid_mask = (spike_frames >= 0) & (spike_frames < shifted_data.shape[0])
+        spike_frames, valid_mask = _compute_spike_frames(
+            relative_times, sampling_frequency, shifted_data.shape[0]
+        )
         valid_spike_frames = spike_frames[valid_mask]
         
         if len(valid_spike_frames) == 0:
             continue
         
-        # Extract spike waveforms and project
-        spike_waveforms = shifted_data[valid_spike_frames, :]
-        projections = np.dot(spike_waveforms, discriminant_direction)
-        projections_list.append(projections)
+        segment_frames.append((shifted_data, valid_spike_frames))
     
-    if len(projections_list) == 0:
+    if len(segment_frames) == 0:
         return np.array([], dtype=np.float32)
     
-    return np.concatenate(projections_list)
+    # Second pass: project each segment's waveforms straight into its slice
+    total_spikes = sum(len(frames) for _, frames in segment_frames)
+    projections = np.empty(
+        total_spikes, dtype=np.result_type(np.int16, discriminant_direction.dtype)
+    )
+    start = 0
+    for shifted_data, valid_spike_frames in segment_frames:
+        stop = start + len(valid_spike_frames)
+        spike_waveforms = shifted_data[valid_spike_frames, :]
+        np.matmul(spike_waveforms, discriminant_direction, out=projections[start:stop])
+        start = stop
+    
+    return projections
+
+
+def _memmap_int16(path: str, n_channels: int) -> np.ndarray:
+    """
+    Memory-map an int16 binary file as an array of shape (num_frames, n_channels).
+
+    Parameters
+    ----------
+    path : str
+        Path to the binary file
+    n_channels : int
+        Number of channels
 
+    Returns
+    -------
+    np.ndarray
+        Read-only memmap, or an empty array if the file is empty
+    """
+    if os.path.getsize(path) == 0:
+        # np.memmap cannot map an empty file
+        return np.zeros((0, n_channels), dtype=np.int16)
+    return np.memmap(path, dtype=np.int16, mode='r').reshape(-1, n_channels)
@@ -10,6 +10,23 @@ def detect_high_activity_intervals(data_path, *, num_channels: int, num_frames:
     # Memory-map the file instead of loading it all into memory
     filtered_data = np.memmap(data_path, dtype=np.int16, mode='r', shape=(num_frames, num_channels))
 
+    return detect_high_activity_intervals_in_data(
+        filtered_data,
+        sampling_frequency_hz=sampling_frequency_hz,
+        high_activity_threshold=high_activity_threshold,
+        baseline_percentile=baseline_percentile
+    )
+
+def detect_high_activity_intervals_in_data(filtered_data, *, sampling_frequency_hz: float, high_activity_threshold=3, baseline_percentile=10):
+    """
+    Same as detect_high_activity_intervals, for filtered data of shape
+    (num_frames, num_channels) that is already loaded or memory-mapped.
+    """
+    if high_activity_threshold == 0:
+        return []
+    
+    num_frames = filtered_data.shape[0]
+
     segment_duration_ms = 20.0
     fs = sampling_frequency_hz
     num_timesteps = num_frames
@@ -45,12 +45,17 @@ def compute_receptive_fields(
     
     # Placeholder: generate random noise
     # Shape: (units, timepoints, x, y, channels)
-    receptive_fields = np.random.randn(
-        num_units, num_timepoints, width, height, num_channels
-    ).astype(np.float32)
+    # Drawn directly as float32 and scaled in place so no float64 or
+    # intermediate copies of the (large) array are allocated
+    rng = np.random.default_rng()
+    receptive_fields = rng.standard_normal(
+        (num_units, num_timepoints, width, height, num_channels), dtype=np.float32
+    )
     
     # Scale to a reasonable range for visualization (0-255)
-    receptive_fields = (receptive_fields * 50 + 128).clip(0, 255).astype(np.float32)
+    receptive_fields *= 50
+    receptive_fields += 128
+    np.clip(receptive_fields, 0, 255, out=receptive_fields)
     
     print(f"Generated receptive fields with shape {receptive_fields.shape}")
     
@@ -1,8 +1,18 @@
 """Helper functions for spike sorting using nearest neighbor matching to reference."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
 from .coarse_sorting import detect_spikes_single_channel, compute_template_peak_channel_x_coordinate
-from .unit_matching import match_spikes_to_reference
+from .unit_matching import SpikeMatcher
 
 
 def compute_spike_sorting(
@@ -12,7 +22,8 @@ def compute_spike_sorting(
     reference_spike_labels,
     sampling_frequency_hz,
     electrode_coords,
-    detect_threshold=-80
+    detect_threshold=-80,
+    spike_matcher=None
 ):
     """
     Perform spike sorting by detecting spikes and matching them to reference sorting.
@@ -33,6 +44,9 @@ def compute_spike_sorting(
         Electrode coordinates array of shape (num_channels, 2)
     detect_threshold : float
         Spike detection threshold (default: -80)
+    spike_matcher : SpikeMatcher, optional
+        Matcher already fitted to the reference spike frames and labels; pass
+        one to reuse its index across segments (default: built on each call)
         
     Returns
     -------
@@ -47,21 +61,25 @@ def compute_spike_sorting(
     """
     num_frames, num_channels = shifted_data.shape
     
-    # Create mask for low activity frames
-    low_activity_mask = np.ones(num_frames, dtype=bool)
+    # Frame ranges of the high activity periods
+    high_activity_frame_ranges = []
     for start_sec, end_sec in high_activity_intervals:
         start_frame = int(start_sec * sampling_frequency_hz)
         end_frame = int(end_sec * sampling_frequency_hz)
         start_frame = max(0, start_frame)
         end_frame = min(num_frames, end_frame)
-        low_activity_mask[start_frame:end_frame] = False
-    
-    # Set high activity frames to zero
-    shifted_data_low_activity = shifted_data.copy()
-    shifted_data_low_activity[~low_activity_mask, :] = 0
-    
-    # Detect spikes on minimum across channels
-    data_min = np.min(shifted_data_low_activity, axis=1)
+        if start_frame < end_frame:
+            high_activity_frame_ranges.append((start_frame, end_frame))
+    
+    # Detect spikes on minimum across channels, with high activity frames set
+    # to zero (only the 1-D minimum is zeroed, never the full data array)
+    if HAVE_NUMBA:
+        data_min = np.empty(num_frames, dtype=shifted_data.dtype)
+        _row_min_numba(shifted_data, data_min)
+    else:
+        data_min = np.min(shifted_data, axis=1)
+    for start_frame, end_frame in high_activity_frame_ranges:
+        data_min[start_frame:end_frame] = 0
     spike_inds = detect_spikes_single_channel(
         data=data_min,
         threshold=detect_threshold,
@@ -80,20 +98,22 @@ def compute_spike_sorting(
             np.array([], dtype=np.float32)
         )
     
-    # Extract spike frames
-    frames = shifted_data_low_activity[spike_inds, :].astype(np.float32)
+    # Extract spike frames (rows in high activity periods read as zero)
+    frames = gather_frames_float32(shifted_data, spike_inds)
+    for start_frame, end_frame in high_activity_frame_ranges:
+        # spike_inds is sorted, so the spikes in a range are a contiguous run
+        i0, i1 = np.searchsorted(spike_inds, (start_frame, end_frame))
+        frames[i0:i1, :] = 0
     
     # Match spikes to reference sorting
-    print(f'Matching {len(frames)} spikes to {len(reference_spike_frames)} reference spikes...')
-    spike_labels = match_spikes_to_reference(
-        spike_frames=frames,
-        reference_frames=reference_spike_frames,
-        reference_labels=reference_spike_labels,
-        n_neighbors=10
-    )
-    
-    # Get unique labels to determine number of units
-    unique_labels = np.unique(spike_labels)
+    if spike_matcher is None:
+        spike_matcher = SpikeMatcher(reference_spike_frames, reference_spike_labels, n_neighbors=10)
+    print(f'Matching {len(frames)} spikes to {spike_matcher.num_reference_spikes} reference spikes...')
+    spike_labels = spike_matcher.match(frames)
+    
+    # Get unique labels to determine number of units; label_inds maps each
+    # spike to the index of its label in unique_labels
+    unique_labels, label_inds = np.unique(spike_labels, return_inverse=True)
     num_units = len(unique_labels)
     
     print(f'Matched spikes to {num_units} units')
@@ -102,15 +122,26 @@ def compute_spike_sorting(
     spike_amplitudes = -np.min(frames, axis=1).astype(np.float32)
     
     # Compute templates for each unit
-    # Create a mapping from label to index for template array
-    label_to_idx = {label: idx for idx, label in enumerate(sorted(unique_labels))}
-    templates = np.zeros((num_units, num_channels), dtype=np.float32)
-    
-    for label in unique_labels:
-        idx = label_to_idx[label]
-        label_mask = spike_labels == label
-        # Use median like in coarse_sorting
-        templates[idx, :] = np.median(frames[label_mask, :], axis=0)
+    # Group spikes by label with one sort; group idx holds the spikes of
+    # unique_labels[idx]
+    spike_order = np.argsort(label_inds, kind='stable')
+    label_bounds = np.zeros(num_units + 1, dtype=np.int64)
+    np.cumsum(np.bincount(label_inds, minlength=num_units), out=label_bounds[1:])
+    
+    # Use median like in coarse_sorting
+    if HAVE_NUMBA:
+        templates = _median_templates_numba(frames, spike_order, label_bounds)
+    else:
+        def unit_median(idx):
+            unit_spike_inds = spike_order[label_bounds[idx]:label_bounds[idx + 1]]
+            return _median_axis0(frames[unit_spike_inds, :])
+        
+        # Units are independent and the gather/partition work runs without
+        # the GIL, so spread the units over threads
+        templates = np.zeros((num_units, num_channels), dtype=np.float32)
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            for idx, unit_template in enumerate(executor.map(unit_median, range(num_units))):
+                templates[idx, :] = unit_template
     
     # Sort templates by peak channel x-coordinate to match reference ordering
     if num_units > 0:
@@ -118,17 +149,93 @@ def compute_spike_sorting(
         sorted_indices = np.argsort(template_x_coords[:, 0])
         templates = templates[sorted_indices, :]
         
-        # Create mapping from old labels to new sorted labels
-        sorted_labels = sorted(unique_labels)
-        old_to_new = np.zeros(int(np.max(spike_labels)) + 1, dtype=np.int32)
-        for new_idx, old_idx in enumerate(sorted_indices):
-            old_label = sorted_labels[old_idx]
-            old_to_new[old_label] = sorted_labels[new_idx]
+        # Label unique_labels[old_idx] becomes unique_labels[new_idx], where
+        # sorted_indices[new_idx] == old_idx
+        new_idx_of_old = np.empty(num_units, dtype=np.intp)
+        new_idx_of_old[sorted_indices] = np.arange(num_units)
         
         # Remap spike labels to sorted order
-        spike_labels = old_to_new[spike_labels].astype(np.int32)
+        spike_labels = unique_labels[new_idx_of_old[label_inds]].astype(np.int32)
     
     # Convert spike times to seconds
     spike_times = spike_inds.astype(np.float32) / sampling_frequency_hz
     
     return templates, spike_times, spike_labels, spike_amplitudes
+
+
+def gather_frames_float32(data, frame_inds):
+    """
+    Gather rows of int16 data as float32, i.e. data[frame_inds, :].astype(np.float32).
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data array of shape (num_frames, num_channels), possibly memory-mapped
+    frame_inds : np.ndarray
+        Indices of the rows to gather
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(frame_inds), num_channels), dtype float32
+    """
+    frame_inds = np.asarray(frame_inds, dtype=np.int64)
+    if not HAVE_NUMBA or len(frame_inds) == 0:
+        return data[frame_inds, :].astype(np.float32)
+    # The kernel does not bounds-check, so check the indices here
+    if frame_inds.min() < 0 or frame_inds.max() >= data.shape[0]:
+        raise IndexError(f"Frame indices out of range for data with {data.shape[0]} frames")
+    out = np.empty((len(frame_inds), data.shape[1]), dtype=np.float32)
+    # Gather and cast in one pass rather than copying the rows twice
+    _gather_rows_float32_numba(data, frame_inds, out)
+    return out
+
+
+def _median_axis0(values):
+    """Median of values along axis 0, selecting only the middle element(s) with np.partition."""
+    n = values.shape[0]
+    k = n // 2
+    if n % 2 == 1:
+        return np.partition(values, k, axis=0)[k]
+    partitioned = np.partition(values, (k - 1, k), axis=0)
+    return (partitioned[k - 1] + partitioned[k]) / 2
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _row_min_numba(data, out):
+        """Write the minimum of each row of data to out in a single parallel pass."""
+        num_channels = data.shape[1]
+        for i in prange(data.shape[0]):
+            m = data[i, 0]
+            for j in range(1, num_channels):
+                v = data[i, j]
+                if v < m:
+                    m = v
+            out[i] = m
+
+    @njit(parallel=True, cache=True)
+    def _gather_rows_float32_numba(data, frame_inds, out):
+        """Write data[frame_inds[i], :] cast to float32 to out[i, :], parallel over rows."""
+        num_channels = data.shape[1]
+        for i in prange(frame_inds.shape[0]):
+            idx = frame_inds[i]
+            for c in range(num_channels):
+                out[i, c] = np.float32(data[idx, c])
+
+    @njit(parallel=True, cache=True)
+    def _median_templates_numba(frames, spike_order, label_bounds):
+        """Per-unit, per-channel median of frames; unit u owns spike_order[label_bounds[u]:label_bounds[u + 1]]."""
+        num_units = label_bounds.shape[0] - 1
+        num_channels = frames.shape[1]
+        templates = np.zeros((num_units, num_channels), dtype=np.float32)
+        for u in prange(num_units):
+            start = label_bounds[u]
+            stop = label_bounds[u + 1]
+            values = np.empty(stop - start, dtype=frames.dtype)
+            for c in range(num_channels):
+                for k in range(stop - start):
+                    values[k] = frames[spike_order[start + k], c]
+                # np.median selects (quickselect) rather than fully sorting
+                templates[u, c] = np.median(values)
+        return templates
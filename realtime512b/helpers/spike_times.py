@@ -0,0 +1,28 @@
+"""Helper functions for converting spike times to frame indices."""
+
+import numpy as np
+
+
+def spike_times_to_frames(spike_times, sampling_frequency):
+    """
+    Convert spike times to frame indices, rounding to the nearest sample.
+
+    Truncation would drop times like 0.99999 samples to the previous frame,
+    so every place that turns spike times back into frames uses this function
+    and they all agree on the frame of each spike.
+
+    Parameters
+    ----------
+    spike_times : np.ndarray
+        Spike times in seconds
+    sampling_frequency : float
+        Sampling frequency in Hz
+
+    Returns
+    -------
+    spike_frames : np.ndarray
+        Frame index of each spike (int64)
+    """
+    spike_frames = np.multiply(spike_times, sampling_frequency, dtype=np.float64)
+    np.rint(spike_frames, out=spike_frames)
+    return spike_frames.astype(np.int64)
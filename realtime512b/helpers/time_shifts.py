@@ -182,8 +182,8 @@ def _compute_score_worker(combination, data_segment, electrode_coords, sampling_
         (c_x, c_y) tuple
     data_segment : np.ndarray
         Data segment to process
-    electrode_coords : list
-        Electrode coordinates
+    electrode_coords : np.ndarray
+        Electrode coordinates array of shape (num_channels, 2)
     sampling_frequency_hz : float
         Sampling frequency
         
@@ -230,8 +230,9 @@ def apply_time_shifts_for_optimization(
     min_shift = min(time_shifts_samples)
     max_shift = max(time_shifts_samples)
 
-    # Allocate output array (same size initially)
-    shifted_data = np.zeros_like(data, dtype=data.dtype)
+    # Allocate output array (same size initially); a plain ndarray even when
+    # data is a memmap
+    shifted_data = np.zeros(data.shape, dtype=data.dtype)
 
     # Apply shifts by rolling each channel
     for ch in range(num_channels):
@@ -253,7 +254,7 @@ def apply_time_shifts_for_optimization(
     return cropped_data
 
 
-def apply_time_shifts(data, electrode_coords, sampling_frequency_hz, c_x, c_y):
+def apply_time_shifts(data, electrode_coords, sampling_frequency_hz, c_x, c_y, out=None):
     """
     Apply time shifts to channels based on electrode coordinates.
     Time shift formula: t = c_x * x + c_y * y (in seconds)
@@ -265,19 +266,22 @@ def apply_time_shifts(data, electrode_coords, sampling_frequency_hz, c_x, c_y):
     -----------
     data : np.ndarray
         Input data of shape (num_timesteps, num_channels)
-    electrode_coords : list of tuples
-        List of (x, y) coordinates for each electrode
+    electrode_coords : np.ndarray
+        Electrode coordinates array of shape (num_channels, 2)
     sampling_frequency_hz : float
         Sampling frequency in Hz
     c_x : float
         Coefficient for x coordinate
     c_y : float
         Coefficient for y coordinate
+    out : np.ndarray, optional
+        Array of the same shape and dtype as data to write the result into,
+        e.g. a writable memmap of the output file
 
     Returns:
     --------
     np.ndarray
-        Time-shifted data with adjusted shape to avoid edge effects
+        Time-shifted data with adjusted shape to avoid edge effects (out, if given)
     """
     num_timesteps, num_channels = data.shape
 
@@ -300,8 +304,14 @@ def apply_time_shifts(data, electrode_coords, sampling_frequency_hz, c_x, c_y):
         f"([{min_shift/sampling_frequency_hz:.6f}, {max_shift/sampling_frequency_hz:.6f}] seconds)"
     )
 
-    # Allocate output array (same size initially)
-    shifted_data = np.zeros_like(data, dtype=data.dtype)
+    # Allocate output array (same size initially); a plain ndarray even when
+    # data is a memmap
+    if out is None:
+        shifted_data = np.zeros(data.shape, dtype=data.dtype)
+    else:
+        if out.shape != data.shape or out.dtype != data.dtype:
+            raise ValueError(f"out must have shape {data.shape} and dtype {data.dtype}")
+        shifted_data = out
 
     # Apply shifts by rolling each channel
     for ch in range(num_channels):
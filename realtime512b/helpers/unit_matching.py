@@ -3,6 +3,65 @@
 import numpy as np
 from sklearn.neighbors import NearestNeighbors
 
+try:
+    import hnswlib
+    HAVE_HNSWLIB = True
+except ImportError:
+    HAVE_HNSWLIB = False
+
+# Reference sizes from which an approximate HNSW index (when hnswlib is
+# installed) beats the exact brute force search
+HNSW_MIN_REFERENCE_POINTS = 5000
+
+
+def _fit_nearest_neighbors(data1: np.ndarray, *, n_neighbors: int):
+    """
+    Build a nearest neighbor index over data1.
+    
+    Parameters
+    ----------
+    data1 : np.ndarray
+        Reference data array of shape (num_points_1, num_features)
+    n_neighbors : int
+        Number of nearest neighbors to find per query point
+    
+    Returns
+    -------
+    callable
+        Function mapping a query array of shape (num_points_2, num_features)
+        to an array of shape (num_points_2, n_neighbors) with indices into data1
+    """
+    # Both backends compute distances in float32 at best; converting once here
+    # keeps float64 inputs from doubling the memory traffic of the search
+    data1 = np.ascontiguousarray(data1, dtype=np.float32)
+    
+    if HAVE_HNSWLIB and len(data1) >= HNSW_MIN_REFERENCE_POINTS:
+        # Approximate search; the occasional missed neighbor has negligible
+        # effect on the majority vote over n_neighbors labels
+        index = hnswlib.Index(space='l2', dim=data1.shape[1])
+        index.init_index(max_elements=len(data1), ef_construction=200, M=16)
+        index.add_items(data1, num_threads=-1)
+        index.set_ef(max(50, n_neighbors * 4))
+        
+        def query(data2):
+            data2 = np.ascontiguousarray(data2, dtype=np.float32)
+            indices, distances = index.knn_query(data2, k=n_neighbors, num_threads=-1)
+            return indices.astype(np.intp)
+        return query
+    
+    # Spike frames have one feature per channel (hundreds); at that
+    # dimensionality trees degrade to scanning, so use a BLAS-backed brute
+    # force search, with the query split across all cores
+    nbrs = NearestNeighbors(
+        n_neighbors=n_neighbors, algorithm='brute', metric='euclidean', n_jobs=-1
+    ).fit(data1)
+    
+    def query(data2):
+        data2 = np.ascontiguousarray(data2, dtype=np.float32)
+        distances, indices = nbrs.kneighbors(data2)
+        return indices
+    return query
+
 
 def nearest_neighbors(data1: np.ndarray, data2: np.ndarray, *, n_neighbors: int):
     """
@@ -22,9 +81,75 @@ def nearest_neighbors(data1: np.ndarray, data2: np.ndarray, *, n_neighbors: int)
     np.ndarray
         Array of shape (num_points_2, n_neighbors) with indices into data1
     """
-    nbrs = NearestNeighbors(n_neighbors=n_neighbors, algorithm='auto').fit(data1)
-    distances, indices = nbrs.kneighbors(data2)
-    return indices
+    return _fit_nearest_neighbors(data1, n_neighbors=n_neighbors)(data2)
+
+
+class SpikeMatcher:
+    """
+    Match detected spikes to a reference sorting using nearest neighbors.
+    
+    The nearest neighbor index over the reference spike frames is built once
+    on construction, so the same matcher can label the spikes of many
+    segments without refitting.
+    
+    Parameters
+    ----------
+    reference_frames : np.ndarray
+        Reference spike frames, shape (num_ref_spikes, num_channels)
+    reference_labels : np.ndarray
+        Reference spike labels, shape (num_ref_spikes,)
+    n_neighbors : int
+        Number of nearest neighbors to use (default: 10)
+    """
+    
+    def __init__(self, reference_frames: np.ndarray, reference_labels: np.ndarray, n_neighbors: int = 10):
+        if len(reference_frames) == 0:
+            raise ValueError("Reference frames cannot be empty")
+        
+        self.num_reference_spikes = len(reference_frames)
+        self.n_neighbors = min(n_neighbors, self.num_reference_spikes)
+        self._query = _fit_nearest_neighbors(reference_frames, n_neighbors=self.n_neighbors)
+        
+        # Labels are mapped to 0..num_labels-1 so votes can be counted with bincount
+        self._unique_labels, reference_label_inds = np.unique(reference_labels, return_inverse=True)
+        self._reference_label_inds = reference_label_inds.reshape(-1)
+    
+    def match(self, spike_frames: np.ndarray) -> np.ndarray:
+        """
+        Assign each spike the most common label among its nearest reference spikes.
+        
+        Parameters
+        ----------
+        spike_frames : np.ndarray
+            Detected spike frames, shape (num_spikes, num_channels)
+        
+        Returns
+        -------
+        np.ndarray
+            Matched labels for each spike, shape (num_spikes,)
+        """
+        if len(spike_frames) == 0:
+            return np.array([], dtype=np.int32)
+        
+        # Find nearest neighbors in reference for each spike
+        nearest_inds = self._query(spike_frames)
+        
+        # For each spike, find the most common label among its nearest neighbors.
+        # The votes of a block of spikes are counted with one bincount over
+        # (spike, label) cells; argmax breaks ties toward the smallest label,
+        # as np.unique + argmax did.
+        num_labels = len(self._unique_labels)
+        neighbor_label_inds = self._reference_label_inds[nearest_inds]
+        matched_labels = np.zeros(len(spike_frames), dtype=np.int32)
+        block_size = max(1, (1 << 22) // num_labels)
+        for start in range(0, len(spike_frames), block_size):
+            block = neighbor_label_inds[start:start + block_size]
+            cells = block + (np.arange(len(block)) * num_labels)[:, None]
+            counts = np.bincount(cells.ravel(), minlength=len(block) * num_labels)
+            best = counts.reshape(len(block), num_labels).argmax(axis=1)
+            matched_labels[start:start + len(block)] = self._unique_labels[best]
+        
+        return matched_labels
 
 
 def match_spikes_to_reference(
@@ -37,7 +162,9 @@ def match_spikes_to_reference(
     Match detected spikes to reference sorting using nearest neighbor approach.
     
     For each spike, find the k nearest neighbors in the reference spike frames,
-    and assign the most common label among those neighbors.
+    and assign the most common label among those neighbors. To match several
+    batches of spikes against the same reference, build a SpikeMatcher once
+    instead.
     
     Parameters
     ----------
@@ -58,22 +185,4 @@ def match_spikes_to_reference(
     if len(spike_frames) == 0:
         return np.array([], dtype=np.int32)
     
-    if len(reference_frames) == 0:
-        raise ValueError("Reference frames cannot be empty")
-    
-    # Find nearest neighbors in reference for each spike
-    nearest_inds = nearest_neighbors(
-        reference_frames, 
-        spike_frames, 
-        n_neighbors=min(n_neighbors, len(reference_frames))
-    )
-    
-    # For each spike, find the most common label among its nearest neighbors
-    matched_labels = np.zeros(len(spike_frames), dtype=np.int32)
-    for i in range(len(spike_frames)):
-        neighbor_labels = reference_labels[nearest_inds[i]]
-        unique, counts = np.unique(neighbor_labels, return_counts=True)
-        best_label = unique[np.argmax(counts)]
-        matched_labels[i] = best_label
-    
-    return matched_labels
+    return SpikeMatcher(reference_frames, reference_labels, n_neighbors=n_neighbors).match(spike_frames)
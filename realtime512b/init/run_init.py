@@ -3,6 +3,7 @@
 import os
 import sys
 import yaml
+import numpy as np
 
 
 def run_init():
@@ -122,32 +123,22 @@ def run_init():
 def _validate_electrode_coords(filepath, expected_channels):
     """Validate electrode_coords.txt file."""
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-        
-        # Remove empty lines
-        lines = [line.strip() for line in lines if line.strip()]
-        
-        if len(lines) != expected_channels:
-            print(f"❌ Error: electrode_coords.txt has {len(lines)} lines, "
-                  f"expected {expected_channels}")
-            return False
-        
-        # Validate each line has two numbers
-        for i, line in enumerate(lines, 1):
-            parts = line.split()
-            if len(parts) != 2:
-                print(f"❌ Error: Line {i} does not have exactly 2 values: {line}")
-                return False
-            try:
-                float(parts[0])
-                float(parts[1])
-            except ValueError:
-                print(f"❌ Error: Line {i} does not contain valid numbers: {line}")
-                return False
-        
-        return True
-        
+        # Parse the whole file in one C-level pass; blank lines are skipped
+        coords = np.loadtxt(filepath, dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        print(f"❌ Error: electrode_coords.txt does not contain exactly 2 valid numbers per line: {e}")
+        return False
     except Exception as e:
         print(f"❌ Error validating electrode_coords.txt: {e}")
         return False
+    
+    if coords.shape[0] != expected_channels:
+        print(f"❌ Error: electrode_coords.txt has {coords.shape[0]} lines, "
+              f"expected {expected_channels}")
+        return False
+    
+    if coords.shape[1] != 2:
+        print(f"❌ Error: electrode_coords.txt has {coords.shape[1]} values per line, expected 2")
+        return False
+    
+    return True
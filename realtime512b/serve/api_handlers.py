@@ -2,19 +2,138 @@
 
 import os
 import json
+import mmap
+import time
+import functools
 import yaml
-from flask import jsonify, request, Response, send_from_directory
+import numpy as np
+from flask import jsonify, request, Response, send_file, send_from_directory
+
+
+def _get_mtime_ns(path):
+    """Returns the modification time of path in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+# libyaml's C loader parses several times faster than the pure Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml_cached(path, mtime_ns):
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_yaml(path):
+    """Returns the parsed YAML file at path (None if missing), re-read only when the file changes.
+
+    The returned object is shared between requests and must not be modified.
+    """
+    mtime_ns = _get_mtime_ns(path)
+    if mtime_ns is None:
+        return None
+    return _read_yaml_cached(path, mtime_ns)
+
+
+def _load_config():
+    """Returns the experiment configuration, or None if realtime512b.yaml is missing."""
+    return _load_yaml(os.path.join(os.getcwd(), "realtime512b.yaml"))
+
+
+# Listings taken within this long of the directory's mtime are not cached,
+# since an entry added in the same filesystem timestamp tick would leave the
+# mtime as it was and the cached listing would miss it
+_RACY_LISTING_NS = 1_000_000_000
+
+
+def _list_dir(path):
+    with os.scandir(path) as it:
+        return {entry.name: entry.is_dir() for entry in it}
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_dir_cached(path, mtime_ns):
+    return _list_dir(path)
+
+
+def _scan_dir(path):
+    """Returns a {name: is_dir} dict of the entries of path (empty if it does not exist).
+
+    The listing is rescanned only when the directory's mtime changes, i.e. when
+    entries are added, removed or renamed, and is not cached until at least
+    one timestamp tick has passed since that mtime. The returned dict is
+    shared between requests and must not be modified.
+    """
+    mtime_ns = _get_mtime_ns(path)
+    if mtime_ns is None:
+        return {}
+    try:
+        if time.time_ns() - mtime_ns <= _RACY_LISTING_NS:
+            return _list_dir(path)
+        return _scan_dir_cached(path, mtime_ns)
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+_SORTING_OUTPUT_FILES = frozenset(("templates.npy", "spike_times.npy", "spike_labels.npy", "spike_amplitudes.npy"))
+
+
+def _has_sorting_outputs(sorting_dir):
+    """Returns True if sorting_dir contains all spike sorting output files."""
+    return _SORTING_OUTPUT_FILES <= _scan_dir(sorting_dir).keys()
+
+
+@functools.lru_cache(maxsize=64)
+def _open_mmap_cached(path, mtime_ns, size):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _open_mmap(path):
+    """Returns a read-only mmap of path, or None if the file is missing or empty.
+
+    Maps are cached so range reads of recently served files reuse the same
+    mapping; a file that is rewritten or grows (new mtime or size) is mapped
+    afresh. Evicted maps are not closed explicitly, they are released once no
+    in-progress response still refers to them.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if st.st_size == 0:
+        return None
+    return _open_mmap_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _iter_file_range(path, byte_offset, num_bytes, block_size=1 << 20):
+    """Yields num_bytes of path starting at byte_offset in blocks of at most block_size bytes.
+
+    Blocks are sliced from a cached read-only mmap of the file (see _open_mmap),
+    so only one block is held in memory at a time. The blocks are bytes rather
+    than memoryviews because WSGI servers (including the Werkzeug development
+    server) require bytes.
+    """
+    if num_bytes <= 0:
+        return
+    mm = _open_mmap(path)
+    if mm is None:
+        return
+    stop = min(byte_offset + num_bytes, len(mm))
+    for start in range(byte_offset, stop, block_size):
+        yield mm[start:min(start + block_size, stop)]
 
 
 def get_config_handler():
     """Returns the experiment configuration."""
-    config_path = os.path.join(os.getcwd(), "realtime512b.yaml")
-    if not os.path.exists(config_path):
+    config = _load_config()
+    if config is None:
         return jsonify({"error": "Configuration file not found"}), 404
     
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    
     return jsonify(config)
 
 
@@ -27,21 +146,16 @@ def get_epoch_blocks_handler():
         return jsonify({"error": "raw/ directory not found"}), 404
     
     epoch_blocks_info = []
-    for item in sorted(os.listdir(raw_dir)):
+    for item, is_dir in sorted(_scan_dir(raw_dir).items()):
         item_path = os.path.join(raw_dir, item)
-        if os.path.isdir(item_path):
+        if is_dir:
             # Get number of segments in this epoch_block
-            segment_files = [f for f in os.listdir(item_path) if f.endswith(".bin")]
+            segment_files = [f for f in _scan_dir(item_path) if f.endswith(".bin")]
             num_segments = len(segment_files)
             
             # Check for epoch block spike sorting
             epoch_block_sorting_dir = os.path.join(computed_dir, "epoch_block_spike_sorting", item)
-            has_epoch_block_sorting = (
-                os.path.exists(os.path.join(epoch_block_sorting_dir, "templates.npy")) and
-                os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_times.npy")) and
-                os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_labels.npy")) and
-                os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_amplitudes.npy"))
-            )
+            has_epoch_block_sorting = _has_sorting_outputs(epoch_block_sorting_dir)
             
             # Check for epoch block preview
             epoch_block_preview_dir = os.path.join(computed_dir, "epoch_block_preview", item, "epoch_block.figpack")
@@ -54,14 +168,11 @@ def get_epoch_blocks_handler():
             # Count how many segments have spike sorting completed
             spike_sorting_dir = os.path.join(computed_dir, "spike_sorting", item)
             num_segments_sorted = 0
-            if os.path.exists(spike_sorting_dir):
-                for segment_file in segment_files:
-                    segment_sorting_path = os.path.join(spike_sorting_dir, segment_file)
-                    if (os.path.exists(os.path.join(segment_sorting_path, "templates.npy")) and
-                        os.path.exists(os.path.join(segment_sorting_path, "spike_times.npy")) and
-                        os.path.exists(os.path.join(segment_sorting_path, "spike_labels.npy")) and
-                        os.path.exists(os.path.join(segment_sorting_path, "spike_amplitudes.npy"))):
-                        num_segments_sorted += 1
+            # Only segments with a sorting directory can have completed sorting
+            sorted_segment_dirs = _scan_dir(spike_sorting_dir)
+            for segment_file in segment_files:
+                if sorted_segment_dirs.get(segment_file) and _has_sorting_outputs(os.path.join(spike_sorting_dir, segment_file)):
+                    num_segments_sorted += 1
             
             epoch_blocks_info.append({
                 "name": item,
@@ -83,37 +194,37 @@ def get_segments_handler(epoch_block_id):
     if not os.path.exists(raw_dir):
         return jsonify({"error": f"EpochBlock {epoch_block_id} not found"}), 404
     
-    bin_files = [fname for fname in os.listdir(raw_dir) if fname.endswith(".bin")]
+    bin_files = [fname for fname in _scan_dir(raw_dir) if fname.endswith(".bin")]
+    
+    # List each computed directory once rather than testing every file separately
+    filt_names = _scan_dir(os.path.join(computed_dir, "filt", epoch_block_id))
+    shifted_names = _scan_dir(os.path.join(computed_dir, "shifted", epoch_block_id))
+    high_activity_names = _scan_dir(os.path.join(computed_dir, "high_activity", epoch_block_id))
+    stats_names = _scan_dir(os.path.join(computed_dir, "stats", epoch_block_id))
+    preview_names = _scan_dir(os.path.join(computed_dir, "preview", epoch_block_id))
+    
+    # Load config to get n_channels and sampling_frequency
+    config = _load_config()
     
     segments_info = []
     for fname in sorted(bin_files):
         segment_info = {
             "filename": fname,
-            "has_filt": os.path.exists(os.path.join(computed_dir, "filt", epoch_block_id, fname + ".filt")),
-            "has_shifted": os.path.exists(os.path.join(computed_dir, "shifted", epoch_block_id, fname + ".filt.shifted")),
-            "has_high_activity": os.path.exists(os.path.join(computed_dir, "high_activity", epoch_block_id, fname + ".high_activity.json")),
-            "has_stats": os.path.exists(os.path.join(computed_dir, "stats", epoch_block_id, fname + ".stats.json")),
-            "has_preview": os.path.exists(os.path.join(computed_dir, "preview", epoch_block_id, fname + ".figpack")),
+            "has_filt": fname + ".filt" in filt_names,
+            "has_shifted": fname + ".filt.shifted" in shifted_names,
+            "has_high_activity": fname + ".high_activity.json" in high_activity_names,
+            "has_stats": fname + ".stats.json" in stats_names,
+            "has_preview": fname + ".figpack" in preview_names,
         }
         
         # Check for reference sorting
         reference_sorting_dir = os.path.join(computed_dir, "reference_sorting", epoch_block_id, fname)
-        has_reference_sorting = (
-            os.path.exists(os.path.join(reference_sorting_dir, "templates.npy")) and
-            os.path.exists(os.path.join(reference_sorting_dir, "spike_times.npy")) and
-            os.path.exists(os.path.join(reference_sorting_dir, "spike_labels.npy")) and
-            os.path.exists(os.path.join(reference_sorting_dir, "spike_amplitudes.npy"))
-        )
+        has_reference_sorting = _has_sorting_outputs(reference_sorting_dir)
         segment_info["has_reference_sorting"] = has_reference_sorting
         
         # Check for spike sorting
         spike_sorting_dir = os.path.join(computed_dir, "spike_sorting", epoch_block_id, fname)
-        has_spike_sorting = (
-            os.path.exists(os.path.join(spike_sorting_dir, "templates.npy")) and
-            os.path.exists(os.path.join(spike_sorting_dir, "spike_times.npy")) and
-            os.path.exists(os.path.join(spike_sorting_dir, "spike_labels.npy")) and
-            os.path.exists(os.path.join(spike_sorting_dir, "spike_amplitudes.npy"))
-        )
+        has_spike_sorting = _has_sorting_outputs(spike_sorting_dir)
         segment_info["has_spike_sorting"] = has_spike_sorting
         
         # Get file size and duration
@@ -122,11 +233,7 @@ def get_segments_handler(epoch_block_id):
             file_size = os.path.getsize(raw_path)
             segment_info["size_bytes"] = file_size
             
-            # Load config to get n_channels and sampling_frequency
-            config_path = os.path.join(os.getcwd(), "realtime512b.yaml")
-            if os.path.exists(config_path):
-                with open(config_path, "r") as f:
-                    config = yaml.safe_load(f)
+            if config is not None:
                 n_channels = config.get("n_channels", 512)
                 sampling_frequency = config.get("sampling_frequency", 20000)
                 
@@ -145,37 +252,38 @@ def get_shift_coefficients_handler():
     computed_dir = os.path.join(os.getcwd(), "computed")
     shift_coeffs_path = os.path.join(computed_dir, "shift_coeffs.yaml")
     
-    if not os.path.exists(shift_coeffs_path):
+    shift_coeffs = _load_yaml(shift_coeffs_path)
+    if shift_coeffs is None:
         return jsonify({"error": "Shift coefficients not found"}), 404
     
-    with open(shift_coeffs_path, "r") as f:
-        shift_coeffs = yaml.safe_load(f)
-    
     return jsonify(shift_coeffs)
 
 
+# Location of each binary data type: (directory parts under the experiment
+# directory, suffix appended to the segment filename)
+_BINARY_DATA_LOCATIONS = {
+    "raw": (("raw",), ""),
+    "filt": (("computed", "filt"), ".filt"),
+    "shifted": (("computed", "shifted"), ".filt.shifted"),
+}
+
+
 def get_binary_data_handler(data_type, epoch_block_id, filename):
     """Returns binary data (raw, filt, or shifted) for a time range."""
     # Load configuration
-    config_path = os.path.join(os.getcwd(), "realtime512b.yaml")
-    if not os.path.exists(config_path):
+    config = _load_config()
+    if config is None:
         return jsonify({"error": "Configuration file not found"}), 404
     
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-    
     n_channels = config.get("n_channels", 512)
     sampling_frequency = config.get("sampling_frequency", 20000)
     
     # Determine file path based on data type
-    if data_type == "raw":
-        data_path = os.path.join(os.getcwd(), "raw", epoch_block_id, filename)
-    elif data_type == "filt":
-        data_path = os.path.join(os.getcwd(), "computed", "filt", epoch_block_id, filename + ".filt")
-    elif data_type == "shifted":
-        data_path = os.path.join(os.getcwd(), "computed", "shifted", epoch_block_id, filename + ".filt.shifted")
-    else:
+    location = _BINARY_DATA_LOCATIONS.get(data_type)
+    if location is None:
         return jsonify({"error": "Invalid data type"}), 400
+    data_dir_parts, data_suffix = location
+    data_path = os.path.join(os.getcwd(), *data_dir_parts, epoch_block_id, filename + data_suffix)
     
     if not os.path.exists(data_path):
         return jsonify({"error": f"{data_type} file not found"}), 404
@@ -189,19 +297,18 @@ def get_binary_data_handler(data_type, epoch_block_id, filename):
     start_sec = request.args.get("start_sec", type=float)
     end_sec = request.args.get("end_sec", type=float)
     
-    # If no time range specified, return entire file
+    # If no time range specified, return entire file (streamed by the server
+    # rather than read into memory)
     if start_sec is None and end_sec is None:
-        with open(data_path, "rb") as f:
-            data_bytes = f.read()
-        return Response(
-            data_bytes,
+        response = send_file(
+            data_path,
             mimetype="application/octet-stream",
-            headers={
-                "X-Num-Frames": str(total_frames),
-                "X-Num-Channels": str(n_channels),
-                "X-Sampling-Frequency": str(sampling_frequency)
-            }
+            conditional=True
         )
+        response.headers["X-Num-Frames"] = str(total_frames)
+        response.headers["X-Num-Channels"] = str(n_channels)
+        response.headers["X-Sampling-Frequency"] = str(sampling_frequency)
+        return response
     
     # Validate time range
     if start_sec is None:
@@ -227,14 +334,9 @@ def get_binary_data_handler(data_type, epoch_block_id, filename):
     byte_offset = start_frame * bytes_per_frame
     num_bytes = num_frames * bytes_per_frame
     
-    # Read the data segment
-    with open(data_path, "rb") as f:
-        f.seek(byte_offset)
-        data_bytes = f.read(num_bytes)
-    
-    # Return as binary response
+    # Stream the data segment straight from a memory map of the file
     return Response(
-        data_bytes,
+        _iter_file_range(data_path, byte_offset, num_bytes),
         mimetype="application/octet-stream",
         headers={
             "X-Start-Sec": str(start_sec),
@@ -299,17 +401,12 @@ def get_epoch_block_detail_handler(epoch_block_id):
         return jsonify({"error": f"EpochBlock {epoch_block_id} not found"}), 404
     
     # Get segment list
-    segment_files = sorted([f for f in os.listdir(raw_dir) if f.endswith(".bin")])
+    segment_files = sorted([f for f in _scan_dir(raw_dir) if f.endswith(".bin")])
     num_segments = len(segment_files)
     
     # Check epoch block spike sorting status
     epoch_block_sorting_dir = os.path.join(computed_dir, "epoch_block_spike_sorting", epoch_block_id)
-    has_epoch_block_sorting = (
-        os.path.exists(os.path.join(epoch_block_sorting_dir, "templates.npy")) and
-        os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_times.npy")) and
-        os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_labels.npy")) and
-        os.path.exists(os.path.join(epoch_block_sorting_dir, "spike_amplitudes.npy"))
-    )
+    has_epoch_block_sorting = _has_sorting_outputs(epoch_block_sorting_dir)
     
     # Check epoch block preview status
     epoch_block_preview_dir = os.path.join(computed_dir, "epoch_block_preview", epoch_block_id, "epoch_block.figpack")
@@ -322,16 +419,15 @@ def get_epoch_block_detail_handler(epoch_block_id):
     # Get epoch block sorting statistics if available
     epoch_block_sorting_stats = None
     if has_epoch_block_sorting:
-        import numpy as np
-        spike_times = np.load(os.path.join(epoch_block_sorting_dir, "spike_times.npy"))
-        spike_labels = np.load(os.path.join(epoch_block_sorting_dir, "spike_labels.npy"))
-        templates = np.load(os.path.join(epoch_block_sorting_dir, "templates.npy"))
+        # Mapped read-only: only the templates count is needed, so the
+        # (largest) templates array is never read beyond its header
+        spike_times = np.load(os.path.join(epoch_block_sorting_dir, "spike_times.npy"), mmap_mode='r')
+        spike_labels = np.load(os.path.join(epoch_block_sorting_dir, "spike_labels.npy"), mmap_mode='r')
+        templates = np.load(os.path.join(epoch_block_sorting_dir, "templates.npy"), mmap_mode='r')
         
         # Load config to get segment duration
-        config_path = os.path.join(os.getcwd(), "realtime512b.yaml")
-        if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+        config = _load_config()
+        if config is not None:
             segment_duration_sec = config.get("raw_segment_duration_sec", 30)
             epoch_block_duration_sec = num_segments * segment_duration_sec
         else:
@@ -350,14 +446,11 @@ def get_epoch_block_detail_handler(epoch_block_id):
     # Count segments with spike sorting
     spike_sorting_dir = os.path.join(computed_dir, "spike_sorting", epoch_block_id)
     num_segments_sorted = 0
-    if os.path.exists(spike_sorting_dir):
-        for segment_file in segment_files:
-            segment_sorting_path = os.path.join(spike_sorting_dir, segment_file)
-            if (os.path.exists(os.path.join(segment_sorting_path, "templates.npy")) and
-                os.path.exists(os.path.join(segment_sorting_path, "spike_times.npy")) and
-                os.path.exists(os.path.join(segment_sorting_path, "spike_labels.npy")) and
-                os.path.exists(os.path.join(segment_sorting_path, "spike_amplitudes.npy"))):
-                num_segments_sorted += 1
+    # Only segments with a sorting directory can have completed sorting
+    sorted_segment_dirs = _scan_dir(spike_sorting_dir)
+    for segment_file in segment_files:
+        if sorted_segment_dirs.get(segment_file) and _has_sorting_outputs(os.path.join(spike_sorting_dir, segment_file)):
+            num_segments_sorted += 1
     
     return jsonify({
         "epoch_block": epoch_block_id,
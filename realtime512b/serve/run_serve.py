@@ -4,6 +4,12 @@ import os
 from flask import Flask
 from flask_cors import CORS
 
+try:
+    import waitress
+    HAVE_WAITRESS = True
+except ImportError:
+    HAVE_WAITRESS = False
+
 from .api_handlers import (
     get_config_handler,
     get_epoch_blocks_handler,
@@ -20,6 +26,26 @@ from .api_handlers import (
 )
 
 
+# API routes: (rule, endpoint, handler, methods, defaults). Defaults are passed
+# to the handler as keyword arguments along with the URL variables
+ROUTES = [
+    ("/api/config", "get_config", get_config_handler, ["GET"], None),
+    ("/api/epoch_blocks", "get_epoch_blocks", get_epoch_blocks_handler, ["GET"], None),
+    ("/api/epoch_blocks/<epoch_block_id>", "get_epoch_block_detail", get_epoch_block_detail_handler, ["GET"], None),
+    ("/api/epoch_blocks/<epoch_block_id>/segments", "get_segments", get_segments_handler, ["GET"], None),
+    ("/api/shift_coefficients", "get_shift_coefficients", get_shift_coefficients_handler, ["GET"], None),
+    ("/api/raw/<epoch_block_id>/<filename>", "get_raw", get_binary_data_handler, ["GET"], {"data_type": "raw"}),
+    ("/api/filt/<epoch_block_id>/<filename>", "get_filt", get_binary_data_handler, ["GET"], {"data_type": "filt"}),
+    ("/api/shifted/<epoch_block_id>/<filename>", "get_shifted", get_binary_data_handler, ["GET"], {"data_type": "shifted"}),
+    ("/api/high_activity/<epoch_block_id>/<filename>", "get_high_activity", get_high_activity_handler, ["GET"], None),
+    ("/api/stats/<epoch_block_id>/<filename>", "get_stats", get_stats_handler, ["GET"], None),
+    ("/api/preview/<epoch_block_id>/<filename>/<path:filepath>", "get_preview_file", get_preview_file_handler, ["GET"], None),
+    ("/api/epoch_block_preview/<epoch_block_id>/<path:filepath>", "get_epoch_block_preview_file", get_epoch_block_preview_file_handler, ["GET"], None),
+    ("/api/reference_segment", "get_reference_segment", get_reference_segment_handler, ["GET"], None),
+    ("/api/reference_segment", "set_reference_segment", set_reference_segment_handler, ["POST"], None),
+]
+
+
 def run_serve(host="0.0.0.0", port=5000):
     """Main entry point for realtime512b serve."""
     # Check if we're in an experiment directory
@@ -70,61 +96,13 @@ def run_serve(host="0.0.0.0", port=5000):
     ])
     
     # Register routes
-    @app.route("/api/config", methods=["GET"])
-    def get_config():
-        return get_config_handler()
-    
-    @app.route("/api/epoch_blocks", methods=["GET"])
-    def get_epoch_blocks():
-        return get_epoch_blocks_handler()
-    
-    @app.route("/api/epoch_blocks/<epoch_block_id>", methods=["GET"])
-    def get_epoch_block_detail(epoch_block_id):
-        return get_epoch_block_detail_handler(epoch_block_id)
-    
-    @app.route("/api/epoch_blocks/<epoch_block_id>/segments", methods=["GET"])
-    def get_segments(epoch_block_id):
-        return get_segments_handler(epoch_block_id)
-    
-    @app.route("/api/shift_coefficients", methods=["GET"])
-    def get_shift_coefficients():
-        return get_shift_coefficients_handler()
-    
-    @app.route("/api/raw/<epoch_block_id>/<filename>", methods=["GET"])
-    def get_raw(epoch_block_id, filename):
-        return get_binary_data_handler("raw", epoch_block_id, filename)
-    
-    @app.route("/api/filt/<epoch_block_id>/<filename>", methods=["GET"])
-    def get_filt(epoch_block_id, filename):
-        return get_binary_data_handler("filt", epoch_block_id, filename)
-    
-    @app.route("/api/shifted/<epoch_block_id>/<filename>", methods=["GET"])
-    def get_shifted(epoch_block_id, filename):
-        return get_binary_data_handler("shifted", epoch_block_id, filename)
-    
-    @app.route("/api/high_activity/<epoch_block_id>/<filename>", methods=["GET"])
-    def get_high_activity(epoch_block_id, filename):
-        return get_high_activity_handler(epoch_block_id, filename)
-    
-    @app.route("/api/stats/<epoch_block_id>/<filename>", methods=["GET"])
-    def get_stats(epoch_block_id, filename):
-        return get_stats_handler(epoch_block_id, filename)
-    
-    @app.route("/api/preview/<epoch_block_id>/<filename>/<path:filepath>", methods=["GET"])
-    def get_preview_file(epoch_block_id, filename, filepath):
-        return get_preview_file_handler(epoch_block_id, filename, filepath)
-    
-    @app.route("/api/epoch_block_preview/<epoch_block_id>/<path:filepath>", methods=["GET"])
-    def get_epoch_block_preview_file(epoch_block_id, filepath):
-        return get_epoch_block_preview_file_handler(epoch_block_id, filepath)
-    
-    @app.route("/api/reference_segment", methods=["GET"])
-    def get_reference_segment():
-        return get_reference_segment_handler()
-    
-    @app.route("/api/reference_segment", methods=["POST"])
-    def set_reference_segment():
-        return set_reference_segment_handler()
-    
-    # Run the server
-    app.run(host=host, port=port, debug=False)
+    for rule, endpoint, view_func, methods, defaults in ROUTES:
+        app.add_url_rule(rule, endpoint=endpoint, view_func=view_func, methods=methods, defaults=defaults)
+    
+    # Run the server. The handlers mostly wait on disk reads, so requests are
+    # served concurrently: by waitress's thread pool when it is installed,
+    # otherwise by the threaded Werkzeug server
+    if HAVE_WAITRESS:
+        waitress.serve(app, host=host, port=port, threads=16)
+    else:
+        app.run(host=host, port=port, debug=False, threaded=True)
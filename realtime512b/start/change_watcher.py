@@ -0,0 +1,94 @@
+"""Wake the processing loop when files change in the experiment directory."""
+
+import threading
+import time
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    HAVE_WATCHDOG = True
+except ImportError:
+    HAVE_WATCHDOG = False
+
+
+# Polling interval used when watchdog is not installed
+POLL_INTERVAL_SEC = 5
+
+# With file events, a full pass still runs at this interval as a safety net
+HEARTBEAT_INTERVAL_SEC = 30
+
+
+if HAVE_WATCHDOG:
+    class _ChangeHandler(FileSystemEventHandler):
+        """Set an event whenever a file is created, written, moved or deleted."""
+
+        def __init__(self, changed):
+            super().__init__()
+            self._changed = changed
+
+        def on_any_event(self, event):
+            if event.event_type in ('created', 'modified', 'moved', 'deleted', 'closed'):
+                self._changed.set()
+
+
+class ChangeWatcher:
+    """
+    Block between processing passes until something may have changed.
+
+    With watchdog installed, the watched directories are observed
+    recursively and wait() returns as soon as a file event arrives, or
+    after HEARTBEAT_INTERVAL_SEC at the latest. Without watchdog, wait()
+    sleeps for POLL_INTERVAL_SEC.
+
+    Parameters
+    ----------
+    recursive_dirs : list of str
+        Directories watched together with everything below them
+    flat_dirs : list of str
+        Directories watched for changes to their direct entries only
+    """
+
+    def __init__(self, recursive_dirs, flat_dirs=()):
+        self._changed = threading.Event()
+        self._observer = None
+        if HAVE_WATCHDOG:
+            handler = _ChangeHandler(self._changed)
+            self._observer = Observer()
+            for path in recursive_dirs:
+                self._observer.schedule(handler, path, recursive=True)
+            for path in flat_dirs:
+                self._observer.schedule(handler, path, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+
+    @property
+    def event_driven(self):
+        """True when wait() is woken by file events rather than a timer."""
+        return self._observer is not None
+
+    def begin_pass(self):
+        """Forget earlier events; call before a pass starts scanning."""
+        self._changed.clear()
+
+    def wait(self, timeout=None):
+        """
+        Wait until a file event arrives or the fallback interval elapses.
+        A timeout shorter than the fallback interval ends the wait sooner.
+        """
+        if self._observer is None:
+            interval = POLL_INTERVAL_SEC
+        else:
+            interval = HEARTBEAT_INTERVAL_SEC
+        if timeout is not None:
+            interval = max(0, min(interval, timeout))
+        if self._observer is None:
+            time.sleep(interval)
+        else:
+            self._changed.wait(interval)
+
+    def stop(self):
+        """Stop the observer thread, if any."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
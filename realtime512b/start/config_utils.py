@@ -3,6 +3,15 @@
 import os
 import sys
 import yaml
+import numpy as np
+
+# libyaml's C loader parses several times faster than the pure Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _is_verbose():
+    """Returns True if REALTIME512B_VERBOSE is set to a non-empty value other than 0."""
+    return os.environ.get("REALTIME512B_VERBOSE", "") not in ("", "0")
 
 
 def load_config():
@@ -15,10 +24,11 @@ def load_config():
         sys.exit(1)
     
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_LOADER)
     
-    print("Configuration loaded:")
-    print(yaml.dump(config, default_flow_style=False))
+    print(f"✓ Configuration loaded: {config_path}")
+    if _is_verbose():
+        print(yaml.dump(config, default_flow_style=False))
     
     # Validate required fields
     _validate_config(config)
@@ -79,35 +89,27 @@ def _validate_config(config):
 
 
 def load_electrode_coords(n_channels):
-    """Load and validate electrode coordinates."""
+    """Load and validate electrode coordinates as an array of shape (n_channels, 2)."""
     coords_path = os.path.join(os.getcwd(), "electrode_coords.txt")
     
     if not os.path.exists(coords_path):
         print("❌ Error: electrode_coords.txt not found.")
         sys.exit(1)
     
-    coords = []
-    with open(coords_path, 'r') as f:
-        lines = f.readlines()
-    
-    lines = [line.strip() for line in lines if line.strip()]
+    # Parse the whole file in one C-level pass; blank lines are skipped
+    try:
+        coords = np.loadtxt(coords_path, dtype=np.float64, ndmin=2)
+    except ValueError as e:
+        print(f"❌ Error: electrode_coords.txt does not contain exactly 2 valid numbers per line: {e}")
+        sys.exit(1)
     
-    if len(lines) != n_channels:
-        print(f"❌ Error: electrode_coords.txt has {len(lines)} lines, expected {n_channels}")
+    if coords.shape[0] != n_channels:
+        print(f"❌ Error: electrode_coords.txt has {coords.shape[0]} lines, expected {n_channels}")
         sys.exit(1)
     
-    for i, line in enumerate(lines, 1):
-        parts = line.split()
-        if len(parts) != 2:
-            print(f"❌ Error: Line {i} does not have exactly 2 values")
-            sys.exit(1)
-        try:
-            x = float(parts[0])
-            y = float(parts[1])
-            coords.append((x, y))
-        except ValueError:
-            print(f"❌ Error: Line {i} does not contain valid numbers")
-            sys.exit(1)
+    if coords.shape[1] != 2:
+        print(f"❌ Error: electrode_coords.txt has {coords.shape[1]} values per line, expected 2")
+        sys.exit(1)
     
     print(f"✓ Loaded {len(coords)} electrode coordinates")
     return coords
@@ -1,10 +1,26 @@
 """EpochBlock processor for converting acquisition epoch blocks into raw segments."""
 
+import mmap
 import os
+import sys
 import time
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# os.sendfile can copy between regular files on Linux only
+HAVE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
 from ..helpers.file_info import create_info_file
+from .process_pool import run_in_process_pool
+
+
+# An epoch block is converted once all its files are at least this old
+MIN_FILE_AGE_SEC = 5
 
 
 class EpochBlockProcessor:
@@ -25,6 +41,9 @@ class EpochBlockProcessor:
         self.use_bin2py = use_bin2py
         self.samples_per_segment = int(sampling_frequency * segment_duration_sec)
         self.bytes_per_sample = 2 * n_channels  # int16 format
+        # Seconds until the next pending epoch block may become old enough to
+        # convert, as of the last call to process_epoch_blocks (None if none)
+        self.next_ready_in_sec = None
     
     def process_epoch_blocks(self):
         """
@@ -36,69 +55,98 @@ class EpochBlockProcessor:
         if not valid_epoch_blocks:
             return False
         
-        something_processed = False
+        if len(valid_epoch_blocks) == 1:
+            return self._process_epoch_block(valid_epoch_blocks[0])
         
-        for epoch_block_name in valid_epoch_blocks:
-            # Check if this epoch block has already been processed
-            raw_epoch_block_dir = os.path.join(self.raw_dir, epoch_block_name)
-            if os.path.exists(raw_epoch_block_dir):
-                # EpochBlock already processed, skip
-                continue
-            
-            print(f"Processing epoch_block: {epoch_block_name}")
-            
-            # Read epoch block data
-            print(f"  Reading data from {epoch_block_name}...")
-            epoch_block_path = os.path.join(self.acquisition_dir, epoch_block_name)
-            data = self._read_epoch_block_data(epoch_block_path)
-            print(f"  Read data from {epoch_block_name}: {data.shape} shape" if data is not None else f"  Failed to read data from {epoch_block_name}")
-            
-            if data is None:
-                print(f"  Warning: Could not read data from {epoch_block_name}, skipping")
-                continue
-            
-            # Create output directory
-            os.makedirs(raw_epoch_block_dir, exist_ok=True)
-            
-            # Chunk into segments
-            num_segments = self._chunk_to_segments(data, raw_epoch_block_dir)
-            
-            print(f"  Created {num_segments} segments in {raw_epoch_block_dir}")
-            something_processed = True
+        # Epoch blocks are independent, so several pending ones (e.g. after a
+        # restart) are converted concurrently in the shared worker pool
+        results = run_in_process_pool(
+            _process_epoch_block,
+            [(self, epoch_block_name) for epoch_block_name in valid_epoch_blocks]
+        )
         
-        return something_processed
+        return any(results)
+    
+    def _process_epoch_block(self, epoch_block_name):
+        """
+        Convert one acquisition epoch block into raw segments.
+        Returns True if the epoch block was processed.
+        """
+        # Check if this epoch block has already been processed
+        raw_epoch_block_dir = os.path.join(self.raw_dir, epoch_block_name)
+        if os.path.exists(raw_epoch_block_dir):
+            # EpochBlock already processed, skip
+            return False
+        
+        print(f"Processing epoch_block: {epoch_block_name}")
+        
+        # Read epoch block data
+        print(f"  Reading data from {epoch_block_name}...")
+        epoch_block_path = os.path.join(self.acquisition_dir, epoch_block_name)
+        data_parts = self._read_epoch_block_data(epoch_block_path)
+        if data_parts is not None:
+            n_samples = sum(part.shape[0] for part in data_parts)
+            print(f"  Read data from {epoch_block_name}: ({n_samples}, {self.n_channels}) shape")
+        else:
+            print(f"  Failed to read data from {epoch_block_name}")
+        
+        if data_parts is None:
+            print(f"  Warning: Could not read data from {epoch_block_name}, skipping")
+            return False
+        
+        # Create output directory
+        os.makedirs(raw_epoch_block_dir, exist_ok=True)
+        
+        # Chunk into segments
+        num_segments = self._chunk_to_segments(data_parts, raw_epoch_block_dir)
+        
+        print(f"  Created {num_segments} segments in {raw_epoch_block_dir}")
+        return True
     
     def _get_valid_epoch_blocks(self):
         """
-        Get list of valid epoch block directories.
-        An epoch block is valid if all its files are more than 5 seconds old.
+        Get list of valid epoch block directories that have not been processed yet.
+        An epoch block is valid if all its files are more than MIN_FILE_AGE_SEC old.
+        Sets next_ready_in_sec for epoch blocks that are still too new.
         """
+        self.next_ready_in_sec = None
         if not os.path.exists(self.acquisition_dir):
             return []
         
-        # Get all directories in acquisition/
-        all_epoch_blocks = sorted([
-            name for name in os.listdir(self.acquisition_dir)
-            if os.path.isdir(os.path.join(self.acquisition_dir, name))
-        ])
+        # Get all directories in acquisition/; scandir entries know whether
+        # they are directories without a stat call per entry
+        with os.scandir(self.acquisition_dir) as it:
+            all_epoch_blocks = sorted(
+                (entry for entry in it if entry.is_dir()),
+                key=lambda entry: entry.name
+            )
+        
+        # Already processed epoch blocks are skipped before walking their
+        # files, so polling costs nothing for the epoch blocks that are done
+        processed_epoch_blocks = set(os.listdir(self.raw_dir)) if os.path.isdir(self.raw_dir) else set()
 
         valid_epoch_blocks = []
         current_time = time.time()
         
-        for epoch_block_name in all_epoch_blocks:
-            epoch_block_path = os.path.join(self.acquisition_dir, epoch_block_name)
+        for epoch_block_entry in all_epoch_blocks:
+            epoch_block_name = epoch_block_entry.name
+            if epoch_block_name in processed_epoch_blocks:
+                continue
             
             # Check all files in the epoch block directory
             all_files_old = True
             has_files = False
             
-            for root, dirs, files in os.walk(epoch_block_path):
+            for root, dirs, files in os.walk(epoch_block_entry.path):
                 for filename in files:
                     has_files = True
                     filepath = os.path.join(root, filename)
                     mtime = os.path.getmtime(filepath)
-                    if current_time - mtime < 5:
+                    if current_time - mtime < MIN_FILE_AGE_SEC:
                         all_files_old = False
+                        ready_in_sec = MIN_FILE_AGE_SEC - (current_time - mtime)
+                        if self.next_ready_in_sec is None or ready_in_sec < self.next_ready_in_sec:
+                            self.next_ready_in_sec = ready_in_sec
                         break
                 if not all_files_old:
                     break
@@ -112,7 +160,8 @@ class EpochBlockProcessor:
     def _read_epoch_block_data(self, epoch_block_path):
         """
         Read data from an epoch block directory.
-        Returns numpy array of shape (n_samples, n_channels) or None if error.
+        Returns a list of consecutive numpy arrays of shape (n_part_samples, n_channels)
+        or None if error.
         """
         if self.use_bin2py:
             return self._read_epoch_block_bin2py(epoch_block_path)
@@ -132,8 +181,12 @@ class EpochBlockProcessor:
                 n_electrodes = pbfr.num_electrodes
                 
                 # Preallocate array (excluding channel 0 which is TTL)
-                # We expect n_electrodes channels, where channel 0 is TTL
-                data = np.zeros((total_samples, n_electrodes), dtype=np.float32)
+                # We expect n_electrodes channels, where channel 0 is TTL.
+                # Samples are stored as int16, the format of the raw segments,
+                # so they are converted once here rather than per segment.
+                # bin2py chunks are [electrodes, samples], so the array is kept
+                # electrode-major and every chunk row is a contiguous copy
+                data = np.empty((n_electrodes, total_samples), dtype=np.int16)
                 
                 # Read data in chunks
                 data_offset = 0
@@ -141,14 +194,22 @@ class EpochBlockProcessor:
                     n_samples_to_get = min(RW_BLOCKSIZE, total_samples - chunk_start)
                     chunk = pbfr.get_data(chunk_start, n_samples_to_get)
                     
-                    # chunk is [electrodes, samples], skip channel 0 and transpose
-                    chunk_data = chunk[1:, :].T  # Now [samples, electrodes]
-                    
-                    data[data_offset:data_offset + n_samples_to_get, :] = chunk_data
+                    # chunk is [electrodes, samples], skip channel 0 and clip to
+                    # the int16 range so out-of-range samples saturate instead
+                    # of wrapping around
+                    if HAVE_NUMBA:
+                        # The kernel does not bounds-check, so check the shape here
+                        if chunk.shape != (n_electrodes + 1, n_samples_to_get):
+                            raise ValueError(f"Unexpected bin2py chunk shape {chunk.shape}")
+                        _pack_chunk_int16_numba(chunk, data, data_offset)
+                    else:
+                        data[:, data_offset:data_offset + n_samples_to_get] = np.clip(chunk[1:, :], -32768, 32767)
                     data_offset += n_samples_to_get
                 
                 print(f"  Read {total_samples} samples from bin2py folder")
-                return data
+                # Transposed view of shape [samples, electrodes]; each segment
+                # is transposed into sample-major order only as it is written
+                return [data.T]
                 
         except Exception as e:
             print(f"  Error reading bin2py folder: {e}")
@@ -167,60 +228,142 @@ class EpochBlockProcessor:
                 print(f"  No .bin files found in {epoch_block_path}")
                 return None
             
-            # Read and concatenate all .bin files
+            # Memory-map all .bin files; they are not loaded or concatenated,
+            # segments are written straight from the mapped files
             data_parts = []
             for bin_file in bin_files:
                 filepath = os.path.join(epoch_block_path, bin_file)
-                file_data = np.fromfile(filepath, dtype=np.int16)
+                n_values = os.path.getsize(filepath) // 2
                 
-                # Reshape to (n_samples, n_channels)
-                if len(file_data) % self.n_channels != 0:
+                # Map as (n_samples, n_channels)
+                if n_values % self.n_channels != 0:
                     print(f"  Warning: {bin_file} size is not a multiple of n_channels")
                     continue
                 
-                file_data = file_data.reshape(-1, self.n_channels)
+                n_file_samples = n_values // self.n_channels
+                if n_file_samples == 0:
+                    # Empty files cannot be memory-mapped and hold no samples
+                    continue
+                
+                file_data = np.memmap(filepath, dtype=np.int16, mode='r',
+                                      shape=(n_file_samples, self.n_channels))
                 data_parts.append(file_data)
             
             if not data_parts:
                 return None
             
-            # Concatenate all parts
-            data = np.concatenate(data_parts, axis=0)
-            print(f"  Read {data.shape[0]} samples from {len(bin_files)} .bin files")
-            return data
+            n_samples = sum(part.shape[0] for part in data_parts)
+            print(f"  Read {n_samples} samples from {len(bin_files)} .bin files")
+            return data_parts
             
         except Exception as e:
             print(f"  Error reading binary files: {e}")
             return None
     
-    def _chunk_to_segments(self, data, output_dir):
+    def _chunk_to_segments(self, data_parts, output_dir):
         """
         Chunk data into fixed-duration segments and save them.
+        data_parts is a list of consecutive int16 arrays of shape (n_part_samples, n_channels);
+        a segment may span several parts.
         Returns the number of segments created.
         """
-        n_samples = data.shape[0]
+        # Sample index at which each part starts
+        part_starts = np.cumsum([0] + [part.shape[0] for part in data_parts])
+        n_samples = int(part_starts[-1])
         n_segments = n_samples // self.samples_per_segment
         
-        for i in range(n_segments):
-            segment_num = i + 1
-            start_idx = i * self.samples_per_segment
-            end_idx = start_idx + self.samples_per_segment
-            
-            segment_data = data[start_idx:end_idx, :]
-            
-            # Convert to int16 if needed
-            if segment_data.dtype != np.int16:
-                segment_data = segment_data.astype(np.int16)
-            
-            # Save segment with timing
-            segment_filename = f"segment_{segment_num:03d}.bin"
-            segment_path = os.path.join(output_dir, segment_filename)
-            
-            start_time = time.time()
-            segment_data.tofile(segment_path)
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file
-            create_info_file(segment_path, elapsed_time)
+        # Save all segments, timing the writes once as a whole
+        segment_paths = []
+        source_files = {}  # memmap filename -> open file, for in-kernel copies
+        start_time = time.perf_counter()
+        try:
+            for i in range(n_segments):
+                segment_num = i + 1
+                start_idx = i * self.samples_per_segment
+                end_idx = start_idx + self.samples_per_segment
+                
+                segment_filename = f"segment_{segment_num:03d}.bin"
+                segment_path = os.path.join(output_dir, segment_filename)
+                segment_paths.append(segment_path)
+                
+                with open(segment_path, 'wb') as f:
+                    # Write the slice of each part overlapping [start_idx, end_idx)
+                    first_part = int(np.searchsorted(part_starts, start_idx, side='right')) - 1
+                    for part_idx in range(first_part, len(data_parts)):
+                        part_start = part_starts[part_idx]
+                        if part_start >= end_idx:
+                            break
+                        part = data_parts[part_idx]
+                        row_start = max(start_idx - part_start, 0)
+                        row_end = min(end_idx - part_start, part.shape[0])
+                        # Memory-mapped .bin files hold the samples exactly as they
+                        # are written, so the kernel copies the byte range between
+                        # the files without it passing through user space
+                        if self._copy_memmap_rows(part, row_start, row_end, f, source_files):
+                            continue
+                        # Row slices of sample-major parts are contiguous and written
+                        # as is (without the per-call stdio setup of ndarray.tofile);
+                        # electrode-major parts are transposed one segment at a time
+                        f.write(memoryview(np.ascontiguousarray(part[row_start:row_end, :])))
+        finally:
+            for source_file in source_files.values():
+                source_file.close()
+        elapsed_time_per_segment = (time.perf_counter() - start_time) / max(n_segments, 1)
+        
+        # Create .info files, recording the mean write time per segment
+        for segment_path in segment_paths:
+            create_info_file(segment_path, elapsed_time_per_segment)
         
         return n_segments
+    
+    def _copy_memmap_rows(self, part, row_start, row_end, f, source_files):
+        """
+        Copy rows row_start..row_end-1 of part into f with os.sendfile.
+        Returns False (having written nothing) if part is not a whole mapped file or
+        the platform cannot sendfile between regular files.
+        """
+        if not HAVE_SENDFILE or not isinstance(part, np.memmap) or part.filename is None:
+            return False
+        # Views of a memmap keep the offset of the map they were taken from
+        if not isinstance(part.base, mmap.mmap):
+            return False
+        if part.dtype != np.int16 or not part.flags.c_contiguous or part.shape[1] != self.n_channels:
+            return False
+        
+        source_file = source_files.get(part.filename)
+        if source_file is None:
+            source_file = open(part.filename, 'rb')
+            source_files[part.filename] = source_file
+        
+        offset = part.offset + row_start * self.bytes_per_sample
+        remaining = (row_end - row_start) * self.bytes_per_sample
+        f.flush()
+        while remaining > 0:
+            try:
+                sent = os.sendfile(f.fileno(), source_file.fileno(), offset, remaining)
+            except OSError:
+                if remaining == (row_end - row_start) * self.bytes_per_sample:
+                    return False
+                raise
+            if sent == 0:
+                raise IOError(f"Unexpected end of file reading {part.filename}")
+            offset += sent
+            remaining -= sent
+        # sendfile writes at the descriptor's position, bypassing the file object
+        f.seek(0, os.SEEK_END)
+        return True
+
+
+def _process_epoch_block(processor, epoch_block_name):
+    """Module-level entry point so epoch blocks can be converted in pool workers."""
+    return processor._process_epoch_block(epoch_block_name)
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _pack_chunk_int16_numba(chunk, out, offset):
+        """Clip rows 1.. of chunk to int16 into out[:, offset:offset + n] in one pass, parallel over electrodes."""
+        n_samples = chunk.shape[1]
+        for e in prange(chunk.shape[0] - 1):
+            for i in range(n_samples):
+                out[e, offset + i] = np.int16(min(32767, max(-32768, chunk[e + 1, i])))
@@ -3,19 +3,28 @@
 import os
 import json
 import time
+import queue
+import atexit
+import functools
+import collections
+import threading
 import yaml
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 from ..helpers.bandpass_filter import apply_bandpass_filter
 from ..helpers.time_shifts import optimize_time_shift, apply_time_shifts
-from ..helpers.high_activity_intervals import detect_high_activity_intervals
+from ..helpers.high_activity_intervals import detect_high_activity_intervals_in_data
 from ..helpers.channel_spike_stats import compute_channel_spike_stats
 from ..helpers.coarse_sorting import compute_coarse_sorting
-from ..helpers.spike_sorting import compute_spike_sorting
+from ..helpers.spike_sorting import compute_spike_sorting, gather_frames_float32
+from ..helpers.spike_times import spike_times_to_frames
+from ..helpers.unit_matching import SpikeMatcher
 from ..helpers.epoch_block_spike_sorting import compute_epoch_block_spike_sorting
 from ..helpers.receptive_fields import compute_receptive_fields
 from ..helpers.file_info import create_info_file
 from ..helpers.generate_preview import generate_preview, generate_epoch_block_preview
+from .process_pool import MAX_WORKERS, run_in_process_pool
 
 
 def get_reference_segment():
@@ -25,7 +34,7 @@ def get_reference_segment():
     """
     ref_path = os.path.join(os.getcwd(), "reference_segment.txt")
     
-    if not os.path.exists(ref_path):
+    if not _exists(ref_path):
         return None
     
     with open(ref_path, 'r') as f:
@@ -46,61 +55,258 @@ def is_reference_segment(epoch_block_name, segment_name, reference_segment):
     return segment_path == reference_segment
 
 
+# Segments are independent in the per-segment stages, so up to this many are
+# processed concurrently in the worker processes of the shared pool
+MAX_SEGMENT_WORKERS = MAX_WORKERS
+
+
+# Directory listings made during the current pass of the processing loop
+_dir_listings = {}
+
+# Listings kept across passes: path -> (dir mtime_ns, listed_at_ns, entries).
+# A directory's mtime changes whenever an entry is added, removed or renamed,
+# so an unchanged mtime means the old listing still holds. Listings taken
+# within _RACY_LISTING_NS of the mtime are not trusted, since a change in the
+# same filesystem timestamp tick would leave the mtime as it was
+_dir_snapshots = {}
+_RACY_LISTING_NS = 1_000_000_000
+
+
+def clear_directory_listings():
+    """
+    Forget all cached directory listings.
+    Must be called at the start of every pass of the processing loop, so that
+    each pass sees the files created since the previous one.
+    """
+    _dir_listings.clear()
+
+
+def _scan_dir(path):
+    """
+    Return a {name: is_dir} dict of the entries of path (empty if it does not exist).
+    Each directory is listed at most once per pass of the processing loop, so
+    the existence checks of all the stages cost at most one scandir per directory
+    instead of a stat call per candidate file. The dict must not be modified.
+    """
+    entries = _dir_listings.get(path)
+    if entries is None:
+        entries = _list_dir(path)
+        _dir_listings[path] = entries
+    return entries
+
+
+def _list_dir(path):
+    """
+    List path as a {name: is_dir} dict, reusing the previous listing when the
+    directory's mtime shows it has not changed since (one stat instead of a scandir).
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        _dir_snapshots.pop(path, None)
+        return {}
+    snapshot = _dir_snapshots.get(path)
+    if snapshot is not None:
+        snapshot_mtime_ns, listed_at_ns, entries = snapshot
+        if snapshot_mtime_ns == mtime_ns and listed_at_ns - mtime_ns > _RACY_LISTING_NS:
+            return entries
+    listed_at_ns = time.time_ns()
+    try:
+        with os.scandir(path) as it:
+            entries = {entry.name: entry.is_dir() for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    _dir_snapshots[path] = (mtime_ns, listed_at_ns, entries)
+    return entries
+
+
+def _exists(path):
+    """Check whether path existed when its parent directory was listed in this pass."""
+    parent, name = os.path.split(path)
+    return name in _scan_dir(parent)
+
+
+def _is_dir(path):
+    """Check whether path was a directory when its parent directory was listed in this pass."""
+    parent, name = os.path.split(path)
+    return _scan_dir(parent).get(name, False)
+
+
+# Epoch blocks found complete by the epoch block stages, keyed by the stage's
+# output directory. Outputs are never removed while the loop runs, so a
+# completed epoch block is skipped without listing its directories again
+_completed_epoch_blocks = collections.defaultdict(set)
+
+
+def _run_segment_tasks(task, tasks_args):
+    """
+    Run task(*args) for each args tuple in tasks_args, in the worker pool when there are several.
+    Returns True if any task was run.
+    """
+    if not tasks_args:
+        return False
+    
+    if len(tasks_args) == 1:
+        task(*tasks_args[0])
+        return True
+    
+    run_in_process_pool(task, tasks_args)
+    return True
+
+
+def _iter_segment_files(data_dir, suffix):
+    """
+    Yield (epoch_block_name, file_name, file_path) for every file ending with suffix
+    in the epoch block directories of data_dir, in sorted order.
+    """
+    for epoch_block_name in sorted(_scan_dir(data_dir)):
+        epoch_block_path = os.path.join(data_dir, epoch_block_name)
+        if not _is_dir(epoch_block_path):
+            continue
+        
+        for file_name in sorted(_scan_dir(epoch_block_path)):
+            if file_name.endswith(suffix):
+                yield epoch_block_name, file_name, os.path.join(epoch_block_path, file_name)
+
+
+def _write_json_atomic(path, data):
+    """Write data as compact JSON to path via a temporary file, so readers never see a partial file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        # No indentation: the files are read by the serve API and the
+        # preview, never by hand, and per-channel arrays dominate their size
+        json.dump(data, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def _save_npy_atomic(path, array):
+    """Save array to the .npy file path via a temporary file, so a crash never leaves a truncated output."""
+    tmp_path = path[:-len('.npy')] + '.tmp.npy'
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+# Epoch block outputs are written by a background thread so the loop can move
+# on to the next stage meanwhile. Output directories stay in
+# _pending_write_dirs until their files are in place
+_background_writes = queue.Queue()
+_pending_write_dirs = set()
+_background_writer = None
+
+
+def _save_arrays_in_background(out_dir, arrays, info_path, elapsed_time):
+    """
+    Queue arrays ({file_name: array}) to be saved in out_dir, followed by the .info file.
+    Each file is written under a temporary name and renamed into place, so
+    readers never see a partial file.
+    """
+    global _background_writer
+    if _background_writer is None:
+        _background_writer = threading.Thread(target=_run_background_writer, daemon=True)
+        _background_writer.start()
+        # Let queued writes finish when the process exits
+        atexit.register(_background_writes.join)
+    _pending_write_dirs.add(out_dir)
+    _background_writes.put((out_dir, arrays, info_path, elapsed_time))
+
+
+def _run_background_writer():
+    """Write the outputs queued by _save_arrays_in_background, one output directory at a time."""
+    while True:
+        out_dir, arrays, info_path, elapsed_time = _background_writes.get()
+        try:
+            for file_name, array in arrays.items():
+                _save_npy_atomic(os.path.join(out_dir, file_name), array)
+            create_info_file(info_path, elapsed_time)
+        except Exception as e:
+            print(f"Error writing {out_dir}: {e}")
+        finally:
+            _pending_write_dirs.discard(out_dir)
+            _background_writes.task_done()
+
+
+def _prefetch_file(path):
+    """
+    Ask the kernel to start reading path into the page cache in the background.
+    Does nothing on platforms without posix_fadvise.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _memmap_int16(path, n_channels):
+    """
+    Memory-map an int16 data file as a read-only array of shape (num_frames, n_channels).
+    Pages are read on demand as the data is used, so the whole file is not
+    loaded up front. Empty files (which cannot be mapped) give an empty array.
+    """
+    if os.path.getsize(path) == 0:
+        return np.zeros((0, n_channels), dtype=np.int16)
+    return np.memmap(path, dtype=np.int16, mode='r').reshape(-1, n_channels)
+
+
 def process_filtering(raw_dir, computed_dir, n_channels, filter_params, sampling_frequency):
     """
     Create filtered versions of raw segments.
     Applies bandpass filter to raw data.
     Returns True if any processing was done.
     """
-    something_processed = False
+    # Find the next two raw segments without a filtered version
+    pending = []
+    for epoch_block_name, segment_name, raw_path in _iter_segment_files(raw_dir, '.bin'):
+        # Check if filtered version exists
+        filt_dir = os.path.join(computed_dir, 'filt', epoch_block_name)
+        filt_path = os.path.join(filt_dir, f"{segment_name}.filt")
+        
+        if _exists(filt_path):
+            continue
+        
+        pending.append((epoch_block_name, segment_name, raw_path, filt_dir, filt_path))
+        if len(pending) == 2:
+            break
     
-    # Find all raw segments
-    if not os.path.exists(raw_dir):
+    if not pending:
         return False
     
-    for epoch_block_name in sorted(os.listdir(raw_dir)):
-        epoch_block_path = os.path.join(raw_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
-            continue
-        
-        for segment_name in sorted(os.listdir(epoch_block_path)):
-            if not segment_name.endswith('.bin'):
-                continue
-            
-            # Check if filtered version exists
-            filt_dir = os.path.join(computed_dir, 'filt', epoch_block_name)
-            filt_path = os.path.join(filt_dir, f"{segment_name}.filt")
-            
-            if os.path.exists(filt_path):
-                continue
-            
-            # Create filtered version
-            os.makedirs(filt_dir, exist_ok=True)
-            
-            raw_path = os.path.join(epoch_block_path, segment_name)
-            
-            # Apply bandpass filter with timing
-            print(f"Filtering {epoch_block_name}/{segment_name}...")
-            start_time = time.time()
-            apply_bandpass_filter(
-                input_path=raw_path,
-                output_path=filt_path,
-                num_channels=n_channels,
-                lowcust=filter_params['lowcut'],
-                highcut=filter_params['highcut'],
-                fs=sampling_frequency,
-                order=filter_params['order']
-            )
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file
-            create_info_file(filt_path, elapsed_time)
-            
-            print(f"Created filtered: {epoch_block_name}/{segment_name}.filt")
-            something_processed = True
-            return True  # Process one at a time
+    if len(pending) == 2:
+        # The next call filters the second segment; have the kernel read it
+        # in the background while this one is being filtered
+        _prefetch_file(pending[1][2])
     
-    return something_processed
+    epoch_block_name, segment_name, raw_path, filt_dir, filt_path = pending[0]
+    
+    # Create filtered version
+    os.makedirs(filt_dir, exist_ok=True)
+    
+    # Apply bandpass filter with timing
+    print(f"Filtering {epoch_block_name}/{segment_name}...")
+    start_time = time.time()
+    apply_bandpass_filter(
+        input_path=raw_path,
+        output_path=filt_path,
+        num_channels=n_channels,
+        lowcust=filter_params['lowcut'],
+        highcut=filter_params['highcut'],
+        fs=sampling_frequency,
+        order=filter_params['order']
+    )
+    elapsed_time = time.time() - start_time
+    
+    # Create .info file
+    create_info_file(filt_path, elapsed_time)
+    
+    print(f"Created filtered: {epoch_block_name}/{segment_name}.filt")
+    return True  # Process one at a time
 
 
 def process_shift_coeffs(computed_dir, reference_segment, electrode_coords, sampling_frequency):
@@ -114,13 +320,13 @@ def process_shift_coeffs(computed_dir, reference_segment, electrode_coords, samp
     
     coeffs_path = os.path.join(computed_dir, "shift_coeffs.yaml")
     
-    if os.path.exists(coeffs_path):
+    if _exists(coeffs_path):
         return False
     
     # Check if reference segment filtered version exists
     ref_filt_path = os.path.join(computed_dir, 'filt', f"{reference_segment}.filt")
     
-    if not os.path.exists(ref_filt_path):
+    if not _exists(ref_filt_path):
         return False
     
     # Optimize shift coefficients
@@ -145,209 +351,191 @@ def process_shift_coeffs(computed_dir, reference_segment, electrode_coords, samp
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _load_shift_coeffs(coeffs_path, mtime_ns):
+    """
+    Return (c_x, c_y) from shift_coeffs.yaml.
+    Cached across calls of process_shifting; mtime_ns invalidates the cache if
+    the file is rewritten.
+    """
+    with open(coeffs_path, 'r') as f:
+        coeffs = yaml.safe_load(f)
+    return coeffs['c_x'], coeffs['c_y']
+
+
 def process_shifting(computed_dir, n_channels, electrode_coords, sampling_frequency):
     """
     Create shifted versions of filtered segments.
     Applies time shifts based on optimized coefficients.
+    Up to MAX_SEGMENT_WORKERS pending segments are shifted concurrently.
     Returns True if any processing was done.
     """
     # Check if shift coeffs exist
     coeffs_path = os.path.join(computed_dir, "shift_coeffs.yaml")
-    if not os.path.exists(coeffs_path):
+    if not _exists(coeffs_path):
         return False
     
     # Load shift coefficients
-    with open(coeffs_path, 'r') as f:
-        coeffs = yaml.safe_load(f)
-    c_x = coeffs['c_x']
-    c_y = coeffs['c_y']
+    c_x, c_y = _load_shift_coeffs(coeffs_path, os.stat(coeffs_path).st_mtime_ns)
     
-    something_processed = False
-    
-    filt_dir = os.path.join(computed_dir, 'filt')
-    if not os.path.exists(filt_dir):
-        return False
-    
-    for epoch_block_name in sorted(os.listdir(filt_dir)):
-        epoch_block_path = os.path.join(filt_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
+    pending = []
+    for epoch_block_name, filt_name, filt_path in _iter_segment_files(os.path.join(computed_dir, 'filt'), '.filt'):
+        # Check if shifted version exists
+        shifted_dir = os.path.join(computed_dir, 'shifted', epoch_block_name)
+        shifted_path = os.path.join(shifted_dir, f"{filt_name}.shifted")
+        
+        if _exists(shifted_path):
             continue
         
-        for filt_name in sorted(os.listdir(epoch_block_path)):
-            if not filt_name.endswith('.filt'):
-                continue
-            
-            # Check if shifted version exists
-            shifted_dir = os.path.join(computed_dir, 'shifted', epoch_block_name)
-            shifted_path = os.path.join(shifted_dir, f"{filt_name}.shifted")
-            
-            if os.path.exists(shifted_path):
-                continue
-            
-            # Create shifted version
-            os.makedirs(shifted_dir, exist_ok=True)
-            
-            filt_path = os.path.join(epoch_block_path, filt_name)
-            
-            # Apply time shifts with timing
-            segment_name = filt_name.replace('.filt', '')
-            print(f"Applying time shifts to {epoch_block_name}/{segment_name}...")
-            start_time = time.time()
-            filt_data = np.fromfile(filt_path, dtype=np.int16).reshape(-1, n_channels)
-            shifted_data = apply_time_shifts(
-                data=filt_data,
-                electrode_coords=electrode_coords,
-                sampling_frequency_hz=sampling_frequency,
-                c_x=c_x,
-                c_y=c_y
-            )
-            shifted_data.astype(np.int16).tofile(shifted_path)
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file
-            create_info_file(shifted_path, elapsed_time)
-            
-            print(f"Created shifted: {epoch_block_name}/{segment_name}.shifted")
-            something_processed = True
-            return True  # Process one at a time
+        # Create shifted version
+        os.makedirs(shifted_dir, exist_ok=True)
+        
+        segment_label = f"{epoch_block_name}/{filt_name.replace('.filt', '')}"
+        pending.append((filt_path, shifted_path, segment_label, n_channels,
+                        electrode_coords, sampling_frequency, c_x, c_y))
+        if len(pending) == MAX_SEGMENT_WORKERS:
+            break
     
-    return something_processed
+    return _run_segment_tasks(_compute_shifted_file, pending)
+
+
+def _compute_shifted_file(filt_path, shifted_path, segment_label, n_channels,
+                          electrode_coords, sampling_frequency, c_x, c_y):
+    """Apply time shifts to one filtered segment and write it to shifted_path."""
+    # Apply time shifts with timing
+    print(f"Applying time shifts to {segment_label}...")
+    start_time = time.time()
+    filt_data = _memmap_int16(filt_path, n_channels)
+    tmp_path = shifted_path + '.tmp'
+    if filt_data.shape[0] == 0:
+        # np.memmap cannot create an empty file
+        open(tmp_path, 'wb').close()
+    else:
+        # The shifted channels are written straight into a map of the output
+        # file, so no full-size result array is held in memory
+        shifted_data = np.memmap(tmp_path, dtype=np.int16, mode='w+', shape=filt_data.shape)
+        apply_time_shifts(
+            data=filt_data,
+            electrode_coords=electrode_coords,
+            sampling_frequency_hz=sampling_frequency,
+            c_x=c_x,
+            c_y=c_y,
+            out=shifted_data
+        )
+        shifted_data.flush()
+        del shifted_data
+    os.replace(tmp_path, shifted_path)
+    elapsed_time = time.time() - start_time
+    
+    # Create .info file
+    create_info_file(shifted_path, elapsed_time)
+    
+    print(f"Created shifted: {segment_label}.shifted")
 
 
-def process_stats(computed_dir, n_channels, sampling_frequency, detect_threshold_for_spike_stats):
+def process_stats_and_high_activity(computed_dir, n_channels, sampling_frequency,
+                                    detect_threshold_for_spike_stats, high_activity_threshold):
     """
-    Create stats files from filtered segments.
-    Computes channel spike statistics (firing rates and amplitudes).
+    Create stats and high_activity files from filtered segments.
+    Computes channel spike statistics (firing rates and amplitudes) and detects
+    periods of high activity using variance thresholding, in a single read of
+    each filtered segment.
+    Up to MAX_SEGMENT_WORKERS pending segments are processed concurrently.
     Returns True if any processing was done.
     """
-    something_processed = False
-    
-    filt_dir = os.path.join(computed_dir, 'filt')
-    if not os.path.exists(filt_dir):
-        return False
-    
-    for epoch_block_name in sorted(os.listdir(filt_dir)):
-        epoch_block_path = os.path.join(filt_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
-            continue
+    pending = []
+    for epoch_block_name, filt_name, filt_path in _iter_segment_files(os.path.join(computed_dir, 'filt'), '.filt'):
+        # Check which of the stats and high_activity files exist
+        stats_dir = os.path.join(computed_dir, 'stats', epoch_block_name)
+        stats_path = os.path.join(stats_dir, filt_name.replace('.filt', '.stats.json'))
+        ha_dir = os.path.join(computed_dir, 'high_activity', epoch_block_name)
+        ha_path = os.path.join(ha_dir, filt_name.replace('.filt', '.high_activity.json'))
         
-        for filt_name in sorted(os.listdir(epoch_block_path)):
-            if not filt_name.endswith('.filt'):
-                continue
-            
-            # Check if stats file exists
-            stats_dir = os.path.join(computed_dir, 'stats', epoch_block_name)
-            stats_name = filt_name.replace('.filt', '.stats.json')
-            stats_path = os.path.join(stats_dir, stats_name)
-            
-            if os.path.exists(stats_path):
-                continue
-            
-            # Create stats file
+        if _exists(stats_path):
+            stats_path = None
+        else:
             os.makedirs(stats_dir, exist_ok=True)
-            
-            filt_path = os.path.join(epoch_block_path, filt_name)
-            segment_name = filt_name.replace('.bin.filt', '')
-            
-            print(f"Computing channel spike stats: {epoch_block_name}/{segment_name}.stats.json")
-            start_time = time.time()
-            filt_data = np.fromfile(filt_path, dtype=np.int16).reshape(-1, n_channels)
-            mean_firing_rates, mean_spike_amplitudes = compute_channel_spike_stats(
-                data=filt_data,
-                sampling_frequency_hz=sampling_frequency,
-                threshold=detect_threshold_for_spike_stats
-            )
-            
-            stats_data = {
-                "mean_firing_rates": mean_firing_rates.tolist(),
-                "mean_spike_amplitudes": mean_spike_amplitudes.tolist()
-            }
-            
-            with open(stats_path, 'w') as f:
-                json.dump(stats_data, f, indent=2)
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file
-            create_info_file(stats_path, elapsed_time)
-            
-            print(f"Created stats: {epoch_block_name}/{segment_name}.stats.json")
-            something_processed = True
-            return True  # Process one at a time
+        if _exists(ha_path):
+            ha_path = None
+        else:
+            os.makedirs(ha_dir, exist_ok=True)
+        
+        if stats_path is None and ha_path is None:
+            continue
+        
+        segment_label = f"{epoch_block_name}/{filt_name.replace('.bin.filt', '')}"
+        pending.append((filt_path, stats_path, ha_path, segment_label, n_channels, sampling_frequency,
+                        detect_threshold_for_spike_stats, high_activity_threshold))
+        if len(pending) == MAX_SEGMENT_WORKERS:
+            break
     
-    return something_processed
+    return _run_segment_tasks(_compute_stats_and_high_activity_files, pending)
 
 
-def process_high_activity(computed_dir, n_channels, sampling_frequency, high_activity_threshold):
+def _compute_stats_and_high_activity_files(filt_path, stats_path, ha_path, segment_label, n_channels,
+                                           sampling_frequency, detect_threshold_for_spike_stats,
+                                           high_activity_threshold):
     """
-    Create high_activity files from filtered segments.
-    Detects periods of high activity using variance thresholding.
-    Returns True if any processing was done.
+    Compute the channel spike stats and the high activity intervals of one filtered
+    segment from a single mapping of the file, writing them to stats_path and ha_path.
+    Either path may be None if that output already exists.
     """
-    something_processed = False
-    
-    filt_dir = os.path.join(computed_dir, 'filt')
-    if not os.path.exists(filt_dir):
-        return False
+    filt_data = _memmap_int16(filt_path, n_channels)
     
-    for epoch_block_name in sorted(os.listdir(filt_dir)):
-        epoch_block_path = os.path.join(filt_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
-            continue
+    if stats_path is not None:
+        print(f"Computing channel spike stats: {segment_label}.stats.json")
+        start_time = time.time()
+        mean_firing_rates, mean_spike_amplitudes = compute_channel_spike_stats(
+            data=filt_data,
+            sampling_frequency_hz=sampling_frequency,
+            threshold=detect_threshold_for_spike_stats
+        )
         
-        for filt_name in sorted(os.listdir(epoch_block_path)):
-            if not filt_name.endswith('.filt'):
-                continue
-            
-            # Check if high_activity file exists
-            ha_dir = os.path.join(computed_dir, 'high_activity', epoch_block_name)
-            ha_name = filt_name.replace('.filt', '.high_activity.json')
-            ha_path = os.path.join(ha_dir, ha_name)
-            
-            if os.path.exists(ha_path):
-                continue
-            
-            # Create high_activity file
-            os.makedirs(ha_dir, exist_ok=True)
-            
-            filt_path = os.path.join(epoch_block_path, filt_name)
-            segment_name = filt_name.replace('.bin.filt', '')
-            
-            print(f"Computing high activity intervals: {epoch_block_name}/{segment_name}.high_activity.json")
-            start_time = time.time()
-            num_frames = os.path.getsize(filt_path) // (2 * n_channels)
-            high_activity_intervals = detect_high_activity_intervals(
-                data_path=filt_path,
-                num_channels=n_channels,
-                num_frames=num_frames,
-                sampling_frequency_hz=sampling_frequency,
-                high_activity_threshold=high_activity_threshold
-            )
-            
-            num_intervals = len(high_activity_intervals)
-            print(f"  Found {num_intervals} high activity intervals.")
-            if num_intervals > 0:
-                total_high_activity_duration_sec = sum(end - start for start, end in high_activity_intervals)
-                total_duration_sec = num_frames / sampling_frequency
-                print(f"  Total high activity duration: {total_high_activity_duration_sec:.2f} sec out of {total_duration_sec:.2f} sec.")
-            
-            ha_data = {
-                "high_activity_intervals": [
-                    {"start_sec": start, "end_sec": end} for start, end in high_activity_intervals
-                ]
-            }
-            
-            with open(ha_path, 'w') as f:
-                json.dump(ha_data, f, indent=2)
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file
-            create_info_file(ha_path, elapsed_time)
-            
-            print(f"Created high_activity: {epoch_block_name}/{segment_name}.high_activity.json")
-            something_processed = True
-            return True  # Process one at a time
+        stats_data = {
+            "mean_firing_rates": mean_firing_rates.tolist(),
+            "mean_spike_amplitudes": mean_spike_amplitudes.tolist()
+        }
+        
+        _write_json_atomic(stats_path, stats_data)
+        elapsed_time = time.time() - start_time
+        
+        # Create .info file
+        create_info_file(stats_path, elapsed_time)
+        
+        print(f"Created stats: {segment_label}.stats.json")
     
-    return something_processed
+    if ha_path is not None:
+        # The pages of filt_data read for the stats are still resident, so
+        # this second pass is served from memory rather than from disk
+        print(f"Computing high activity intervals: {segment_label}.high_activity.json")
+        start_time = time.time()
+        num_frames = filt_data.shape[0]
+        high_activity_intervals = detect_high_activity_intervals_in_data(
+            filt_data,
+            sampling_frequency_hz=sampling_frequency,
+            high_activity_threshold=high_activity_threshold
+        )
+        
+        num_intervals = len(high_activity_intervals)
+        print(f"  Found {num_intervals} high activity intervals.")
+        if num_intervals > 0:
+            total_high_activity_duration_sec = sum(end - start for start, end in high_activity_intervals)
+            total_duration_sec = num_frames / sampling_frequency
+            print(f"  Total high activity duration: {total_high_activity_duration_sec:.2f} sec out of {total_duration_sec:.2f} sec.")
+        
+        ha_data = {
+            "high_activity_intervals": [
+                {"start_sec": start, "end_sec": end} for start, end in high_activity_intervals
+            ]
+        }
+        
+        _write_json_atomic(ha_path, ha_data)
+        elapsed_time = time.time() - start_time
+        
+        # Create .info file
+        create_info_file(ha_path, elapsed_time)
+        
+        print(f"Created high_activity: {segment_label}.high_activity.json")
 
 
 def process_reference_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold):
@@ -362,22 +550,22 @@ def process_reference_sorting(computed_dir, reference_segment, n_channels, sampl
     # Check if shifted version of reference exists
     shifted_path = os.path.join(computed_dir, 'shifted', f"{reference_segment}.filt.shifted")
     
-    if not os.path.exists(shifted_path):
+    if not _exists(shifted_path):
         return False
     
     # Check if high activity file exists
     high_activity_path = os.path.join(computed_dir, 'high_activity', f"{reference_segment}.high_activity.json")
-    if not os.path.exists(high_activity_path):
+    if not _exists(high_activity_path):
         return False
     
     # Check if sorting directory exists
     sorting_dir = os.path.join(computed_dir, 'reference_sorting', reference_segment)
     
-    if os.path.exists(sorting_dir):
+    if _exists(sorting_dir):
         # Check if all files exist
         required_files = ['spike_times.npy', 'spike_labels.npy', 
                          'spike_amplitudes.npy', 'templates.npy']
-        all_exist = all(os.path.exists(os.path.join(sorting_dir, f)) for f in required_files)
+        all_exist = all(_exists(os.path.join(sorting_dir, f)) for f in required_files)
         if all_exist:
             return False
     
@@ -387,7 +575,7 @@ def process_reference_sorting(computed_dir, reference_segment, n_channels, sampl
     # Load shifted data
     print(f"Computing coarse sorting: {reference_segment}")
     start_time = time.time()
-    shifted_data = np.fromfile(shifted_path, dtype=np.int16).reshape(-1, n_channels)
+    shifted_data = _memmap_int16(shifted_path, n_channels)
     
     # Load high activity intervals
     with open(high_activity_path, 'r') as f:
@@ -414,10 +602,13 @@ def process_reference_sorting(computed_dir, reference_segment, n_channels, sampl
     spike_labels_path = os.path.join(sorting_dir, 'spike_labels.npy')
     spike_amplitudes_path = os.path.join(sorting_dir, 'spike_amplitudes.npy')
     
-    np.save(templates_path, templates)
-    np.save(spike_times_path, spike_times)
-    np.save(spike_labels_path, spike_labels)
-    np.save(spike_amplitudes_path, spike_amplitudes)
+    _save_npy_atomic(templates_path, templates)
+    _save_npy_atomic(spike_times_path, spike_times)
+    _save_npy_atomic(spike_labels_path, spike_labels)
+    _save_npy_atomic(spike_amplitudes_path, spike_amplitudes)
+    
+    # Save the reference spike frames for matching, while the shifted data is mapped
+    _save_reference_spike_frames(sorting_dir, shifted_data, spike_times, sampling_frequency)
     
     # Create .info file for the sorting directory (corresponds to the segment .bin file)
     create_info_file(sorting_dir.rstrip('/') + '.bin', elapsed_time)
@@ -427,6 +618,44 @@ def process_reference_sorting(computed_dir, reference_segment, n_channels, sampl
     return True
 
 
+def _save_reference_spike_frames(reference_sorting_dir, ref_shifted_data, ref_spike_times, sampling_frequency):
+    """
+    Extract the reference spike frames (float32, one row per reference spike) from the
+    reference shifted data and save them as ref_spike_frames.npy in reference_sorting_dir.
+    Returns the frames.
+    """
+    ref_spike_inds = spike_times_to_frames(ref_spike_times, sampling_frequency)
+    ref_spike_frames = gather_frames_float32(ref_shifted_data, ref_spike_inds)
+    
+    _save_npy_atomic(os.path.join(reference_sorting_dir, 'ref_spike_frames.npy'), ref_spike_frames)
+    return ref_spike_frames
+
+
+@functools.lru_cache(maxsize=1)
+def _load_reference_matcher(reference_sorting_dir, ref_shifted_path, n_channels, sampling_frequency,
+                            ref_spike_labels_mtime_ns):
+    """
+    Load the reference spike frames and labels and fit a SpikeMatcher on them.
+    Cached across calls of process_spike_sorting, which sorts one segment per
+    call, so the matcher is fitted once per reference sorting rather than once
+    per segment. ref_spike_labels_mtime_ns invalidates the cache when the
+    reference sorting is recomputed.
+    Returns (ref_spike_frames, ref_spike_labels, spike_matcher).
+    """
+    ref_spike_labels = np.load(os.path.join(reference_sorting_dir, 'spike_labels.npy'))
+    ref_spike_frames_path = os.path.join(reference_sorting_dir, 'ref_spike_frames.npy')
+    if os.path.exists(ref_spike_frames_path):
+        ref_spike_frames = np.load(ref_spike_frames_path)
+    else:
+        ref_spike_times = np.load(os.path.join(reference_sorting_dir, 'spike_times.npy'))
+        ref_spike_frames = _save_reference_spike_frames(
+            reference_sorting_dir, _memmap_int16(ref_shifted_path, n_channels),
+            ref_spike_times, sampling_frequency
+        )
+    spike_matcher = SpikeMatcher(ref_spike_frames, ref_spike_labels, n_neighbors=10)
+    return ref_spike_frames, ref_spike_labels, spike_matcher
+
+
 def process_spike_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold):
     """
     Create spike sorting data for all segments by matching to reference sorting.
@@ -439,108 +668,102 @@ def process_spike_sorting(computed_dir, reference_segment, n_channels, sampling_
     # Check if reference sorting exists
     reference_sorting_dir = os.path.join(computed_dir, 'reference_sorting', reference_segment)
     required_ref_files = ['spike_times.npy', 'spike_labels.npy', 'spike_amplitudes.npy', 'templates.npy']
-    all_ref_exist = all(os.path.exists(os.path.join(reference_sorting_dir, f)) for f in required_ref_files)
+    all_ref_exist = all(_exists(os.path.join(reference_sorting_dir, f)) for f in required_ref_files)
     
     if not all_ref_exist:
         # Reference sorting not ready yet
         return False
     
-    # Load reference sorting data
-    ref_spike_times = np.load(os.path.join(reference_sorting_dir, 'spike_times.npy'))
-    ref_spike_labels = np.load(os.path.join(reference_sorting_dir, 'spike_labels.npy'))
-    
-    # Load reference shifted data to extract spike frames
+    # Reference spike frames are saved alongside older reference sortings on
+    # first use; without them the reference shifted data is needed
+    ref_spike_frames_path = os.path.join(reference_sorting_dir, 'ref_spike_frames.npy')
     ref_shifted_path = os.path.join(computed_dir, 'shifted', f"{reference_segment}.filt.shifted")
-    if not os.path.exists(ref_shifted_path):
+    if not _exists(ref_spike_frames_path) and not _exists(ref_shifted_path):
         return False
     
-    ref_shifted_data = np.fromfile(ref_shifted_path, dtype=np.int16).reshape(-1, n_channels)
-    
-    # Extract reference spike frames
-    ref_spike_inds = (ref_spike_times * sampling_frequency).astype(int)
-    ref_spike_frames = ref_shifted_data[ref_spike_inds, :].astype(np.float32)
+    # The reference data and the matcher are loaded on first use, so nothing
+    # is read when every segment is already sorted
+    ref_spike_labels_path = os.path.join(reference_sorting_dir, 'spike_labels.npy')
+    spike_matcher = None
     
     something_processed = False
     
     # Find all shifted files
     shifted_dir = os.path.join(computed_dir, 'shifted')
-    if not os.path.exists(shifted_dir):
+    if not _exists(shifted_dir):
         return False
     
-    for epoch_block_name in sorted(os.listdir(shifted_dir)):
-        epoch_block_path = os.path.join(shifted_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
-            continue
+    for epoch_block_name, shifted_name, shifted_path in _iter_segment_files(shifted_dir, '.shifted'):
+        # Extract segment name
+        segment_name = shifted_name.replace('.filt.shifted', '')
         
-        for shifted_name in sorted(os.listdir(epoch_block_path)):
-            if not shifted_name.endswith('.shifted'):
-                continue
-            
-            # Extract segment name
-            segment_name = shifted_name.replace('.filt.shifted', '')
-            
-            # Check if spike sorting already exists
-            sorting_dir = os.path.join(computed_dir, 'spike_sorting', epoch_block_name, segment_name)
-            
-            if os.path.exists(sorting_dir):
-                # Check if all files exist
-                required_files = ['spike_times.npy', 'spike_labels.npy',
-                                 'spike_amplitudes.npy', 'templates.npy']
-                all_exist = all(os.path.exists(os.path.join(sorting_dir, f)) for f in required_files)
-                if all_exist:
-                    continue
-            
-            # Check if high activity file exists
-            high_activity_path = os.path.join(computed_dir, 'high_activity', epoch_block_name, segment_name + '.high_activity.json')
-            if not os.path.exists(high_activity_path):
+        # Check if spike sorting already exists
+        sorting_dir = os.path.join(computed_dir, 'spike_sorting', epoch_block_name, segment_name)
+        
+        if _exists(sorting_dir):
+            # Check if all files exist
+            required_files = ['spike_times.npy', 'spike_labels.npy',
+                             'spike_amplitudes.npy', 'templates.npy']
+            all_exist = all(_exists(os.path.join(sorting_dir, f)) for f in required_files)
+            if all_exist:
                 continue
-            
-            # Create spike sorting directory
-            os.makedirs(sorting_dir, exist_ok=True)
-            
-            # Load shifted data
-            shifted_path = os.path.join(epoch_block_path, shifted_name)
-            print(f"Computing spike sorting: {epoch_block_name}/{segment_name}")
-            start_time = time.time()
-            shifted_data = np.fromfile(shifted_path, dtype=np.int16).reshape(-1, n_channels)
-            
-            # Load high activity intervals
-            with open(high_activity_path, 'r') as f:
-                high_activity_data = json.load(f)
-            high_activity_intervals = [
-                (item['start_sec'], item['end_sec']) for item in high_activity_data['high_activity_intervals']
-            ]
-            
-            # Perform spike sorting
-            templates, spike_times, spike_labels, spike_amplitudes = compute_spike_sorting(
-                shifted_data=shifted_data,
-                high_activity_intervals=high_activity_intervals,
-                reference_spike_frames=ref_spike_frames,
-                reference_spike_labels=ref_spike_labels,
-                sampling_frequency_hz=sampling_frequency,
-                electrode_coords=electrode_coords,
-                detect_threshold=coarse_sorting_detect_threshold
+        
+        # Check if high activity file exists
+        high_activity_path = os.path.join(computed_dir, 'high_activity', epoch_block_name, segment_name + '.high_activity.json')
+        if not _exists(high_activity_path):
+            continue
+        
+        # Create spike sorting directory
+        os.makedirs(sorting_dir, exist_ok=True)
+        
+        # Load shifted data
+        print(f"Computing spike sorting: {epoch_block_name}/{segment_name}")
+        start_time = time.time()
+        shifted_data = _memmap_int16(shifted_path, n_channels)
+        
+        # Load high activity intervals
+        with open(high_activity_path, 'r') as f:
+            high_activity_data = json.load(f)
+        high_activity_intervals = [
+            (item['start_sec'], item['end_sec']) for item in high_activity_data['high_activity_intervals']
+        ]
+        
+        # Perform spike sorting
+        if spike_matcher is None:
+            ref_spike_frames, ref_spike_labels, spike_matcher = _load_reference_matcher(
+                reference_sorting_dir, ref_shifted_path, n_channels, sampling_frequency,
+                os.stat(ref_spike_labels_path).st_mtime_ns
             )
-            elapsed_time = time.time() - start_time
-            
-            # Save outputs
-            templates_path = os.path.join(sorting_dir, 'templates.npy')
-            spike_times_path = os.path.join(sorting_dir, 'spike_times.npy')
-            spike_labels_path = os.path.join(sorting_dir, 'spike_labels.npy')
-            spike_amplitudes_path = os.path.join(sorting_dir, 'spike_amplitudes.npy')
-            
-            np.save(templates_path, templates)
-            np.save(spike_times_path, spike_times)
-            np.save(spike_labels_path, spike_labels)
-            np.save(spike_amplitudes_path, spike_amplitudes)
-            
-            # Create .info file for the sorting directory (corresponds to the segment .bin file)
-            create_info_file(sorting_dir.rstrip('/') + '.bin', elapsed_time)
-            
-            print(f"  Saved {len(spike_times)} spikes with {len(templates)} templates")
-            print(f"Created spike_sorting: {epoch_block_name}/{segment_name}")
-            something_processed = True
-            return True  # Process one at a time
+        templates, spike_times, spike_labels, spike_amplitudes = compute_spike_sorting(
+            shifted_data=shifted_data,
+            high_activity_intervals=high_activity_intervals,
+            reference_spike_frames=ref_spike_frames,
+            reference_spike_labels=ref_spike_labels,
+            sampling_frequency_hz=sampling_frequency,
+            electrode_coords=electrode_coords,
+            detect_threshold=coarse_sorting_detect_threshold,
+            spike_matcher=spike_matcher
+        )
+        elapsed_time = time.time() - start_time
+        
+        # Save outputs
+        templates_path = os.path.join(sorting_dir, 'templates.npy')
+        spike_times_path = os.path.join(sorting_dir, 'spike_times.npy')
+        spike_labels_path = os.path.join(sorting_dir, 'spike_labels.npy')
+        spike_amplitudes_path = os.path.join(sorting_dir, 'spike_amplitudes.npy')
+        
+        _save_npy_atomic(templates_path, templates)
+        _save_npy_atomic(spike_times_path, spike_times)
+        _save_npy_atomic(spike_labels_path, spike_labels)
+        _save_npy_atomic(spike_amplitudes_path, spike_amplitudes)
+        
+        # Create .info file for the sorting directory (corresponds to the segment .bin file)
+        create_info_file(sorting_dir.rstrip('/') + '.bin', elapsed_time)
+        
+        print(f"  Saved {len(spike_times)} spikes with {len(templates)} templates")
+        print(f"Created spike_sorting: {epoch_block_name}/{segment_name}")
+        something_processed = True
+        return True  # Process one at a time
     
     return something_processed
 
@@ -555,108 +778,121 @@ def process_preview(computed_dir, reference_segment, n_channels, sampling_freque
     something_processed = False
     
     filt_dir = os.path.join(computed_dir, 'filt')
-    if not os.path.exists(filt_dir):
+    if not _exists(filt_dir):
         return False
     
-    for epoch_block_name in sorted(os.listdir(filt_dir)):
-        epoch_block_path = os.path.join(filt_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
+    for epoch_block_name, filt_name, filt_path in _iter_segment_files(filt_dir, '.filt'):
+        # Extract segment name (remove .bin.filt suffix)
+        segment_name = filt_name.replace('.bin.filt', '.bin')
+        
+        # Check if preview exists
+        preview_dir = os.path.join(computed_dir, 'preview', epoch_block_name)
+        preview_name = segment_name + '.figpack'
+        preview_path = os.path.join(preview_dir, preview_name)
+        
+        if _exists(preview_path):
             continue
         
-        for filt_name in sorted(os.listdir(epoch_block_path)):
-            if not filt_name.endswith('.filt'):
-                continue
-            
-            # Extract segment name (remove .bin.filt suffix)
-            segment_name = filt_name.replace('.bin.filt', '.bin')
-            
-            # Check if preview exists
-            preview_dir = os.path.join(computed_dir, 'preview', epoch_block_name)
-            preview_name = segment_name + '.figpack'
-            preview_path = os.path.join(preview_dir, preview_name)
-            
-            if os.path.exists(preview_path):
-                continue
-            
-            # Check dependencies
-            filt_path = os.path.join(epoch_block_path, filt_name)
-            shifted_path = os.path.join(computed_dir, 'shifted', epoch_block_name, filt_name + '.shifted')
-            stats_path = os.path.join(computed_dir, 'stats', epoch_block_name, segment_name + '.stats.json')
-            high_activity_path = os.path.join(computed_dir, 'high_activity', epoch_block_name, segment_name + '.high_activity.json')
-            
-            if not os.path.exists(filt_path):
-                continue
-            if not os.path.exists(shifted_path):
-                continue
-            if not os.path.exists(stats_path):
-                continue
-            if not os.path.exists(high_activity_path):
-                continue
-            
-            # Check if this is the reference segment
-            reference_sorting_path = None
-            spike_sorting_path = None
-            segment_path = f"{epoch_block_name}/{segment_name}"
-            
-            if reference_segment == segment_path:
-                # This is the reference segment - check for sorting data
-                potential_sorting_dir = os.path.join(computed_dir, 'reference_sorting', segment_path)
-                required_files = ['templates.npy', 'spike_times.npy',
-                                'spike_labels.npy', 'spike_amplitudes.npy']
-                all_exist = all(os.path.exists(os.path.join(potential_sorting_dir, f)) for f in required_files)
-                if all_exist:
-                    reference_sorting_path = potential_sorting_dir
-                else:
-                    # Reference segment but sorting not ready yet
-                    continue
-            
-            # Check for spike sorting data (for all segments)
-            potential_spike_sorting_dir = os.path.join(computed_dir, 'spike_sorting', segment_path)
+        # Check dependencies
+        shifted_path = os.path.join(computed_dir, 'shifted', epoch_block_name, filt_name + '.shifted')
+        stats_path = os.path.join(computed_dir, 'stats', epoch_block_name, segment_name + '.stats.json')
+        high_activity_path = os.path.join(computed_dir, 'high_activity', epoch_block_name, segment_name + '.high_activity.json')
+        
+        if not _exists(filt_path):
+            continue
+        if not _exists(shifted_path):
+            continue
+        if not _exists(stats_path):
+            continue
+        if not _exists(high_activity_path):
+            continue
+        
+        # Check if this is the reference segment
+        reference_sorting_path = None
+        spike_sorting_path = None
+        segment_path = f"{epoch_block_name}/{segment_name}"
+        
+        if reference_segment == segment_path:
+            # This is the reference segment - check for sorting data
+            potential_sorting_dir = os.path.join(computed_dir, 'reference_sorting', segment_path)
             required_files = ['templates.npy', 'spike_times.npy',
                             'spike_labels.npy', 'spike_amplitudes.npy']
-            all_ss_exist = all(os.path.exists(os.path.join(potential_spike_sorting_dir, f)) for f in required_files)
-            if all_ss_exist:
-                spike_sorting_path = potential_spike_sorting_dir
-            
-            # Load high activity intervals
-            with open(high_activity_path, 'r') as f:
-                high_activity_data = json.load(f)
-            high_activity_intervals = [
-                (item['start_sec'], item['end_sec']) for item in high_activity_data['high_activity_intervals']
-            ]
-            
-            # Create preview directory
-            os.makedirs(preview_dir, exist_ok=True)
-            
-            # Generate preview
-            print(f"Generating preview figpack: {epoch_block_name}/{segment_name}.figpack")
-            start_time = time.time()
-            generate_preview(
-                epoch_block_name=epoch_block_name,
-                segment_name=segment_name,
-                filt_path=filt_path,
-                shift_path=shifted_path,
-                high_activity_intervals=high_activity_intervals,
-                stats_path=stats_path,
-                reference_sorting_path=reference_sorting_path,
-                spike_sorting_path=spike_sorting_path,
-                n_channels=n_channels,
-                sampling_frequency=sampling_frequency,
-                electrode_coords=electrode_coords,
-                preview_path=preview_path
-            )
-            elapsed_time = time.time() - start_time
-            
-            # Create .info file for the preview directory (corresponds to the segment .bin file)
-            create_info_file(os.path.join(preview_dir, segment_name), elapsed_time)
-            
-            print(f"Created preview: {epoch_block_name}/{segment_name}.figpack")
-            something_processed = True
-            return True  # Process one at a time
+            all_exist = all(_exists(os.path.join(potential_sorting_dir, f)) for f in required_files)
+            if all_exist:
+                reference_sorting_path = potential_sorting_dir
+            else:
+                # Reference segment but sorting not ready yet
+                continue
+        
+        # Check for spike sorting data (for all segments)
+        potential_spike_sorting_dir = os.path.join(computed_dir, 'spike_sorting', segment_path)
+        required_files = ['templates.npy', 'spike_times.npy',
+                        'spike_labels.npy', 'spike_amplitudes.npy']
+        all_ss_exist = all(_exists(os.path.join(potential_spike_sorting_dir, f)) for f in required_files)
+        if all_ss_exist:
+            spike_sorting_path = potential_spike_sorting_dir
+        
+        # Load high activity intervals
+        with open(high_activity_path, 'r') as f:
+            high_activity_data = json.load(f)
+        high_activity_intervals = [
+            (item['start_sec'], item['end_sec']) for item in high_activity_data['high_activity_intervals']
+        ]
+        
+        # Create preview directory
+        os.makedirs(preview_dir, exist_ok=True)
+        
+        # Generate preview
+        print(f"Generating preview figpack: {epoch_block_name}/{segment_name}.figpack")
+        start_time = time.time()
+        generate_preview(
+            epoch_block_name=epoch_block_name,
+            segment_name=segment_name,
+            filt_path=filt_path,
+            shift_path=shifted_path,
+            high_activity_intervals=high_activity_intervals,
+            stats_path=stats_path,
+            reference_sorting_path=reference_sorting_path,
+            spike_sorting_path=spike_sorting_path,
+            n_channels=n_channels,
+            sampling_frequency=sampling_frequency,
+            electrode_coords=electrode_coords,
+            preview_path=preview_path
+        )
+        elapsed_time = time.time() - start_time
+        
+        # Create .info file for the preview directory (corresponds to the segment .bin file)
+        create_info_file(os.path.join(preview_dir, segment_name), elapsed_time)
+        
+        print(f"Created preview: {epoch_block_name}/{segment_name}.figpack")
+        something_processed = True
+        return True  # Process one at a time
     
     return something_processed
 
 
+def _segment_sorting_files(segment_sorting_path):
+    """Return {array_name: path} for the sorting arrays of one segment."""
+    return {
+        name: os.path.join(segment_sorting_path, name + '.npy')
+        for name in ('spike_times', 'spike_labels', 'spike_amplitudes', 'templates')
+    }
+
+
+def _load_segment_sorting(segment):
+    """Memory-map the sorting arrays of one (segment_num, sorting_path) pair."""
+    segment_num, segment_sorting_path = segment
+    paths = _segment_sorting_files(segment_sorting_path)
+    # The arrays are read in full when they are combined, so start reading
+    # all four files at once rather than faulting their pages in one by one
+    for path in paths.values():
+        _prefetch_file(path)
+    segment_sorting = {'segment_num': segment_num}
+    for name, path in paths.items():
+        segment_sorting[name] = np.load(path, mmap_mode='r', allow_pickle=False)
+    return segment_sorting
+
+
 def process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment_duration_sec):
     """
     Create epoch_block-level spike sorting by combining segment spike sortings.
@@ -665,45 +901,57 @@ def process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment
     Only processes epoch blocks where all segments have completed spike sorting.
     Returns True if any processing was done.
     """
-    something_processed = False
-    
     # Check if raw directory exists
-    if not os.path.exists(raw_dir):
+    if not _exists(raw_dir):
         return False
     
     # Check if spike_sorting directory exists
     spike_sorting_dir = os.path.join(computed_dir, 'spike_sorting')
-    if not os.path.exists(spike_sorting_dir):
+    if not _exists(spike_sorting_dir):
         return False
     
+    completed = _completed_epoch_blocks[os.path.join(computed_dir, 'epoch_block_spike_sorting')]
+    
+    # Find the first two epoch blocks whose segments are all sorted: the
+    # first is combined now, the second is prefetched for the next call
+    ready = []
+    
     # Iterate through epoch blocks in raw/ directory
-    for epoch_block_name in sorted(os.listdir(raw_dir)):
+    for epoch_block_name in sorted(_scan_dir(raw_dir)):
+        if epoch_block_name in completed:
+            continue
         epoch_block_path = os.path.join(raw_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_path):
+        if not _is_dir(epoch_block_path):
             continue
         
         # Check if epoch block spike sorting already exists
         epoch_block_sorting_dir = os.path.join(computed_dir, 'epoch_block_spike_sorting', epoch_block_name)
         
-        if os.path.exists(epoch_block_sorting_dir):
+        # Skip epoch blocks whose outputs are still being written
+        if epoch_block_sorting_dir in _pending_write_dirs:
+            continue
+        
+        if _exists(epoch_block_sorting_dir):
             # Check if all files exist
             required_files = ['spike_times.npy', 'spike_labels.npy',
                              'spike_amplitudes.npy', 'templates.npy']
-            all_exist = all(os.path.exists(os.path.join(epoch_block_sorting_dir, f)) for f in required_files)
+            all_exist = all(_exists(os.path.join(epoch_block_sorting_dir, f)) for f in required_files)
             if all_exist:
+                completed.add(epoch_block_name)
                 continue
         
         # Get all segments in this epoch_block
         segment_files = sorted([
-            f for f in os.listdir(epoch_block_path)
+            f for f in _scan_dir(epoch_block_path)
             if f.endswith('.bin')
         ])
         
         if not segment_files:
             continue
         
-        # Check if all segments have spike sorting completed
-        segment_sortings = []
+        # Check if all segments have spike sorting completed before loading
+        # anything, so an incomplete epoch block costs no reads on each pass
+        segment_paths = []
         all_segments_ready = True
         
         for segment_file in segment_files:
@@ -713,7 +961,7 @@ def process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment
             # Check if sorting exists for this segment
             required_files = ['spike_times.npy', 'spike_labels.npy',
                              'spike_amplitudes.npy', 'templates.npy']
-            all_files_exist = all(os.path.exists(os.path.join(segment_sorting_path, f)) for f in required_files)
+            all_files_exist = all(_exists(os.path.join(segment_sorting_path, f)) for f in required_files)
             
             if not all_files_exist:
                 all_segments_ready = False
@@ -726,57 +974,63 @@ def process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment
                 all_segments_ready = False
                 break
             
-            # Load sorting data for this segment
-            spike_times = np.load(os.path.join(segment_sorting_path, 'spike_times.npy'))
-            spike_labels = np.load(os.path.join(segment_sorting_path, 'spike_labels.npy'))
-            spike_amplitudes = np.load(os.path.join(segment_sorting_path, 'spike_amplitudes.npy'))
-            templates = np.load(os.path.join(segment_sorting_path, 'templates.npy'))
-            
-            segment_sortings.append({
-                'spike_times': spike_times,
-                'spike_labels': spike_labels,
-                'spike_amplitudes': spike_amplitudes,
-                'templates': templates,
-                'segment_num': segment_num
-            })
+            segment_paths.append((segment_num, segment_sorting_path))
         
         if not all_segments_ready:
             continue
         
-        # All segments ready - compute epoch block spike sorting
-        print(f"Computing epoch block spike sorting: {epoch_block_name}")
-        start_time = time.time()
-        
-        templates, spike_times, spike_labels, spike_amplitudes = compute_epoch_block_spike_sorting(
-            segment_sortings=segment_sortings,
-            segment_duration_sec=segment_duration_sec,
-            num_channels=n_channels
-        )
-        
-        elapsed_time = time.time() - start_time
-        
-        # Save outputs
-        os.makedirs(epoch_block_sorting_dir, exist_ok=True)
-        
-        templates_path = os.path.join(epoch_block_sorting_dir, 'templates.npy')
-        spike_times_path = os.path.join(epoch_block_sorting_dir, 'spike_times.npy')
-        spike_labels_path = os.path.join(epoch_block_sorting_dir, 'spike_labels.npy')
-        spike_amplitudes_path = os.path.join(epoch_block_sorting_dir, 'spike_amplitudes.npy')
-        
-        np.save(templates_path, templates)
-        np.save(spike_times_path, spike_times)
-        np.save(spike_labels_path, spike_labels)
-        np.save(spike_amplitudes_path, spike_amplitudes)
-        
-        # Create .info file
-        create_info_file(epoch_block_sorting_dir.rstrip('/') + '.bin', elapsed_time)
-        
-        print(f"  Saved {len(spike_times)} spikes with {len(templates)} templates")
-        print(f"Created epoch_block_spike_sorting: {epoch_block_name}")
-        something_processed = True
-        return True  # Process one at a time
+        ready.append((epoch_block_name, epoch_block_sorting_dir, segment_paths))
+        if len(ready) == 2:
+            break
     
-    return something_processed
+    if not ready:
+        return False
+    
+    # The combined outputs are written in the background, so the next call
+    # follows right after this one; have its inputs read in the meantime
+    if len(ready) == 2:
+        for _, segment_sorting_path in ready[1][2]:
+            for path in _segment_sorting_files(segment_sorting_path).values():
+                _prefetch_file(path)
+    
+    epoch_block_name, epoch_block_sorting_dir, segment_paths = ready[0]
+    
+    # Map the sorting arrays read-only; compute_epoch_block_spike_sorting
+    # copies them into fresh output arrays, so only the pages it touches
+    # are read and nothing is held beyond this call. The opens overlap in
+    # threads since each one is a few small blocking reads.
+    with ThreadPoolExecutor(max_workers=min(16, len(segment_paths))) as executor:
+        segment_sortings = list(executor.map(_load_segment_sorting, segment_paths))
+    
+    # All segments ready - compute epoch block spike sorting
+    print(f"Computing epoch block spike sorting: {epoch_block_name}")
+    start_time = time.time()
+    
+    templates, spike_times, spike_labels, spike_amplitudes = compute_epoch_block_spike_sorting(
+        segment_sortings=segment_sortings,
+        segment_duration_sec=segment_duration_sec,
+        num_channels=n_channels
+    )
+    
+    elapsed_time = time.time() - start_time
+    
+    # Save outputs (and the .info file) in the background
+    os.makedirs(epoch_block_sorting_dir, exist_ok=True)
+    _save_arrays_in_background(
+        epoch_block_sorting_dir,
+        {
+            'templates.npy': templates,
+            'spike_times.npy': spike_times,
+            'spike_labels.npy': spike_labels,
+            'spike_amplitudes.npy': spike_amplitudes,
+        },
+        epoch_block_sorting_dir.rstrip('/') + '.bin',
+        elapsed_time
+    )
+    
+    print(f"  Saving {len(spike_times)} spikes with {len(templates)} templates")
+    print(f"Created epoch_block_spike_sorting: {epoch_block_name}")
+    return True  # Process one at a time
 
 
 def process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
@@ -788,23 +1042,27 @@ def process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
     something_processed = False
     
     # Check if raw directory exists
-    if not os.path.exists(raw_dir):
+    if not _exists(raw_dir):
         return False
     
     # Check if epoch_block_spike_sorting directory exists
     epoch_block_sorting_dir = os.path.join(computed_dir, 'epoch_block_spike_sorting')
-    if not os.path.exists(epoch_block_sorting_dir):
+    if not _exists(epoch_block_sorting_dir):
         return False
     
+    completed = _completed_epoch_blocks[os.path.join(computed_dir, 'receptive_fields')]
+    
     # Iterate through epoch blocks with completed spike sorting
-    for epoch_block_name in sorted(os.listdir(epoch_block_sorting_dir)):
+    for epoch_block_name in sorted(_scan_dir(epoch_block_sorting_dir)):
+        if epoch_block_name in completed:
+            continue
         epoch_block_sorting_path = os.path.join(epoch_block_sorting_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_sorting_path):
+        if not _is_dir(epoch_block_sorting_path):
             continue
         
         # Check if all required sorting files exist
         required_files = ['spike_times.npy', 'spike_labels.npy']
-        all_exist = all(os.path.exists(os.path.join(epoch_block_sorting_path, f)) for f in required_files)
+        all_exist = all(_exists(os.path.join(epoch_block_sorting_path, f)) for f in required_files)
         if not all_exist:
             continue
         
@@ -812,7 +1070,8 @@ def process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
         receptive_fields_dir = os.path.join(computed_dir, 'receptive_fields', epoch_block_name)
         receptive_fields_path = os.path.join(receptive_fields_dir, 'receptive_fields.npy')
         
-        if os.path.exists(receptive_fields_path):
+        if _exists(receptive_fields_path):
+            completed.add(epoch_block_name)
             continue
         
         # Load spike data
@@ -822,7 +1081,7 @@ def process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
         # Construct acquisition directory path for this epoch block
         epoch_block_acquisition_dir = os.path.join(acquisition_dir, epoch_block_name)
         
-        if not os.path.exists(epoch_block_acquisition_dir):
+        if not _exists(epoch_block_acquisition_dir):
             print(f"  Warning: Acquisition directory not found: {epoch_block_acquisition_dir}")
             continue
         
@@ -840,7 +1099,7 @@ def process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
         
         # Save receptive fields
         os.makedirs(receptive_fields_dir, exist_ok=True)
-        np.save(receptive_fields_path, receptive_fields)
+        _save_npy_atomic(receptive_fields_path, receptive_fields)
         
         # Create .info file
         create_info_file(receptive_fields_path, elapsed_time)
@@ -863,24 +1122,28 @@ def process_epoch_block_preview(raw_dir, computed_dir, acquisition_dir, n_channe
     something_processed = False
     
     # Check if raw directory exists
-    if not os.path.exists(raw_dir):
+    if not _exists(raw_dir):
         return False
     
     # Check if epoch_block_spike_sorting directory exists
     epoch_block_sorting_dir = os.path.join(computed_dir, 'epoch_block_spike_sorting')
-    if not os.path.exists(epoch_block_sorting_dir):
+    if not _exists(epoch_block_sorting_dir):
         return False
     
+    completed = _completed_epoch_blocks[os.path.join(computed_dir, 'epoch_block_preview')]
+    
     # Iterate through epoch blocks with completed spike sorting
-    for epoch_block_name in sorted(os.listdir(epoch_block_sorting_dir)):
+    for epoch_block_name in sorted(_scan_dir(epoch_block_sorting_dir)):
+        if epoch_block_name in completed:
+            continue
         epoch_block_sorting_path = os.path.join(epoch_block_sorting_dir, epoch_block_name)
-        if not os.path.isdir(epoch_block_sorting_path):
+        if not _is_dir(epoch_block_sorting_path):
             continue
         
         # Check if all required sorting files exist
         required_files = ['spike_times.npy', 'spike_labels.npy',
                          'spike_amplitudes.npy', 'templates.npy']
-        all_exist = all(os.path.exists(os.path.join(epoch_block_sorting_path, f)) for f in required_files)
+        all_exist = all(_exists(os.path.join(epoch_block_sorting_path, f)) for f in required_files)
         if not all_exist:
             continue
         
@@ -888,15 +1151,16 @@ def process_epoch_block_preview(raw_dir, computed_dir, acquisition_dir, n_channe
         epoch_block_preview_dir = os.path.join(computed_dir, 'epoch_block_preview', epoch_block_name)
         preview_path = os.path.join(epoch_block_preview_dir, 'epoch_block.figpack')
         
-        if os.path.exists(preview_path):
+        if _exists(preview_path):
+            completed.add(epoch_block_name)
             continue
         
         # Get number of segments in this epoch_block
         raw_epoch_block_dir = os.path.join(raw_dir, epoch_block_name)
-        if not os.path.exists(raw_epoch_block_dir):
+        if not _exists(raw_epoch_block_dir):
             continue
         
-        segment_files = sorted([f for f in os.listdir(raw_epoch_block_dir) if f.endswith('.bin')])
+        segment_files = sorted([f for f in _scan_dir(raw_epoch_block_dir) if f.endswith('.bin')])
         num_segments = len(segment_files)
         
         if num_segments == 0:
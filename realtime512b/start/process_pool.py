@@ -0,0 +1,55 @@
+"""Long-lived worker process pool shared by the processing stages."""
+
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+# Each worker holds a whole segment or epoch block (and its intermediates)
+# in memory, hence the small cap
+MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+_pool = None
+
+
+def _get_pool():
+    """
+    Return the worker pool, creating it on first use.
+    Workers are started by a fork server (or spawned where that is unavailable)
+    rather than forked from the processing loop, which runs the file watcher,
+    background writer and preload threads; forking while one of them holds a
+    lock can deadlock the child. The pool lives as long as the loop, so worker
+    start-up is paid once rather than on every pass.
+    """
+    global _pool
+    if _pool is None:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=context)
+        atexit.register(_pool.shutdown)
+    return _pool
+
+
+def run_in_process_pool(task, tasks_args):
+    """
+    Run task(*args) for each args tuple in tasks_args in the worker pool.
+    task must be a module-level function. Returns the results in order.
+    """
+    pool = _get_pool()
+    try:
+        futures = [pool.submit(task, *args) for args in tasks_args]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory); start a fresh pool next time
+        _discard_pool()
+        raise
+
+
+def _discard_pool():
+    global _pool
+    if _pool is not None:
+        atexit.unregister(_pool.shutdown)
+        _pool.shutdown(wait=False)
+        _pool = None
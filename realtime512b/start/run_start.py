@@ -2,17 +2,49 @@
 
 import os
 import sys
-import time
 import shutil
+import importlib
+import threading
 
 from .config_utils import load_config, load_electrode_coords
 from .epoch_block_processor import EpochBlockProcessor
+from .change_watcher import ChangeWatcher
 from .build_utils import build_ui_components, BuildError
 
 
+# Modules imported by file_processors that do not depend on the built UI
+# bundle (the figpack extension reads figpack_realtime512b.js at import time,
+# so generate_preview itself must wait for the build)
+_PRELOAD_MODULES = [
+    'scipy.signal',
+    'figpack.views',
+    'figpack_spike_sorting.views',
+    '..helpers.bandpass_filter',
+    '..helpers.time_shifts',
+    '..helpers.coarse_sorting',
+    '..helpers.spike_sorting',
+    '..helpers.unit_matching',
+    '..helpers.epoch_block_spike_sorting',
+    '..helpers.receptive_fields',
+]
+
+
+def _preload_modules():
+    """Import _PRELOAD_MODULES; failures are left for the real import to report."""
+    for name in _PRELOAD_MODULES:
+        try:
+            importlib.import_module(name, package=__package__)
+        except Exception:
+            pass
+
+
 def run_start():
     """Main entry point for realtime512b processing."""
 
+    # Import the heavy processing dependencies while the UI builds
+    preload_thread = threading.Thread(target=_preload_modules, daemon=True)
+    preload_thread.start()
+
     # Build UI components first
     print("=" * 60)
     print("Building UI components...")
@@ -52,13 +84,14 @@ def run_start():
     print()
 
     # Import these after building UI
+    preload_thread.join()
     from .file_processors import (
+        clear_directory_listings,
         get_reference_segment,
         process_filtering,
         process_shift_coeffs,
         process_shifting,
-        process_stats,
-        process_high_activity,
+        process_stats_and_high_activity,
         process_reference_sorting,
         process_spike_sorting,
         process_epoch_block_spike_sorting,
@@ -88,7 +121,9 @@ def run_start():
     raw_dir = os.path.join(os.getcwd(), "raw")
     computed_dir = os.path.join(os.getcwd(), "computed")
     
-    # Create directories if they don't exist
+    # Create directories if they don't exist; acquisition/ is created too so
+    # that the change watcher below can observe it from the start
+    os.makedirs(acquisition_dir, exist_ok=True)
     os.makedirs(raw_dir, exist_ok=True)
     os.makedirs(computed_dir, exist_ok=True)
     
@@ -102,6 +137,31 @@ def run_start():
         use_bin2py=use_bin2py
     )
     
+    # Processing stages, run in this order on every pass once the reference
+    # segment is in raw/. Each is called with the reference segment, handles
+    # at most one item per call and returns True if it did any processing
+    stages = [
+        lambda reference_segment: process_filtering(raw_dir, computed_dir, n_channels, filter_params, sampling_frequency),
+        # Shift coefficients are computed only for the reference segment
+        lambda reference_segment: process_shift_coeffs(computed_dir, reference_segment, electrode_coords, sampling_frequency),
+        lambda reference_segment: process_shifting(computed_dir, n_channels, electrode_coords, sampling_frequency),
+        # Stats and high activity share one read of each filtered segment
+        lambda reference_segment: process_stats_and_high_activity(computed_dir, n_channels, sampling_frequency, detect_threshold_for_spike_stats, high_activity_threshold),
+        lambda reference_segment: process_reference_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold),
+        lambda reference_segment: process_spike_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold),
+        lambda reference_segment: process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment_duration_sec),
+        lambda reference_segment: process_receptive_fields(raw_dir, computed_dir, acquisition_dir),
+        lambda reference_segment: process_epoch_block_preview(raw_dir, computed_dir, acquisition_dir, n_channels, sampling_frequency, segment_duration_sec, electrode_coords),
+        lambda reference_segment: process_preview(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords),
+    ]
+    
+    # Wake up on file changes under the experiment directory (the top level
+    # holds reference_segment.txt); falls back to polling without watchdog
+    watcher = ChangeWatcher(
+        recursive_dirs=[acquisition_dir, raw_dir, computed_dir],
+        flat_dirs=[os.getcwd()]
+    )
+    
     print("=" * 60)
     print("Monitoring for data...")
     print("=" * 60)
@@ -113,12 +173,16 @@ def run_start():
     
     while True:
         something_processed = False
+        watcher.begin_pass()
         
         # Process acquisition epoch blocks-> raw segments
         if epoch_block_processor.process_epoch_blocks():
             something_processed = True
             up_to_date_printed = False
         
+        # Start a new pass: the stages below list each directory afresh
+        clear_directory_listings()
+        
         # Get reference segment
         reference_segment = get_reference_segment()
         
@@ -139,60 +203,10 @@ def run_start():
                 if not up_to_date_printed:
                     print(f"Reference segment {reference_segment} not yet in raw/, waiting...")
             else:
-                # Process filtering
-                if process_filtering(raw_dir, computed_dir, n_channels, filter_params, sampling_frequency):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process shift coefficients (only for reference)
-                if process_shift_coeffs(computed_dir, reference_segment, electrode_coords, sampling_frequency):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process shifting
-                if process_shifting(computed_dir, n_channels, electrode_coords, sampling_frequency):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process stats
-                if process_stats(computed_dir, n_channels, sampling_frequency, detect_threshold_for_spike_stats):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process high activity
-                if process_high_activity(computed_dir, n_channels, sampling_frequency, high_activity_threshold):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process reference sorting
-                if process_reference_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process spike sorting
-                if process_spike_sorting(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords, coarse_sorting_detect_threshold):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process epoch block spike sorting
-                if process_epoch_block_spike_sorting(raw_dir, computed_dir, n_channels, segment_duration_sec):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process receptive fields
-                if process_receptive_fields(raw_dir, computed_dir, acquisition_dir):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process epoch block preview generation
-                if process_epoch_block_preview(raw_dir, computed_dir, acquisition_dir, n_channels, sampling_frequency, segment_duration_sec, electrode_coords):
-                    something_processed = True
-                    up_to_date_printed = False
-                
-                # Process preview generation
-                if process_preview(computed_dir, reference_segment, n_channels, sampling_frequency, electrode_coords):
-                    something_processed = True
-                    up_to_date_printed = False
+                for stage in stages:
+                    if stage(reference_segment):
+                        something_processed = True
+                        up_to_date_printed = False
         
         # Print status
         if not something_processed:
@@ -201,8 +215,12 @@ def run_start():
                 print()
                 up_to_date_printed = True
         
-        # Sleep for 5 seconds
-        time.sleep(5)
+        # Each stage handles one item per call, so go straight into another
+        # pass while there is work; otherwise wait for the next file change,
+        # or until a pending epoch block whose files were too new to convert
+        # becomes old enough (no file event marks that moment)
+        if not something_processed:
+            watcher.wait(timeout=epoch_block_processor.next_ready_in_sec)
 
 
 if __name__ == "__main__":